@@ -10,6 +10,7 @@ Usage:
     ./alu_cli.py --hex XOR 0xAA 0x55
     ./alu_cli.py --binary AND 11110000 00001111
     ./alu_cli.py --list
+    ./alu_cli.py --batch ops.txt
     ./alu_cli.py --help
 
 Author: Tyrone Marhguy
@@ -161,6 +162,15 @@ class ALUInterface:
         else:  # decimal
             return f"{value:3d}"
     
+    def format_batch_line(self, operation: str, a: int, b: int, result: int,
+                          flags: Dict[str, bool], format_type: str = 'decimal') -> str:
+        """One-line result for batch mode"""
+        flag_text = "".join(name if flags.get(flag, False) else "-" for name, flag in
+                            (("N", "negative"), ("Z", "zero"), ("C", "carry"), ("V", "overflow")))
+        return (f"{operation:<5} {self._format_value(a, format_type)} "
+                f"{self._format_value(b, format_type)} -> "
+                f"{self._format_value(result, format_type)}  {flag_text}")
+    
     def _format_flag(self, flag: bool) -> str:
         """Format a flag value"""
         return "1 (SET)" if flag else "0 (CLEAR)"
@@ -223,6 +233,37 @@ def parse_value(value_str: str, input_format: Optional[str] = None) -> int:
         return int(value_str, 10)
 
 
+def run_batch(interface: 'ALUInterface', lines, input_format: Optional[str],
+              output_format: str, quiet: bool) -> int:
+    """
+    Execute one operation per line ("OP A B", blank lines and # comments
+    skipped). Bad lines are reported with their line number and skipped.
+    """
+    errors = 0
+    for number, line in enumerate(lines, 1):
+        fields = line.split('#', 1)[0].split()
+        if not fields:
+            continue
+        try:
+            if len(fields) != 3:
+                raise ValueError("expected: OP A B")
+            operation = fields[0].upper()
+            a = parse_value(fields[1], input_format)
+            b = parse_value(fields[2], input_format)
+            if not (0 <= a <= 255 and 0 <= b <= 255):
+                raise ValueError("operands out of 8-bit range (0-255)")
+            result, flags = interface.execute(operation, a, b)
+        except ValueError as e:
+            print(f"Error: line {number}: {e}", file=sys.stderr)
+            errors += 1
+            continue
+        if quiet:
+            print(result)
+        else:
+            print(interface.format_batch_line(operation, a, b, result, flags, output_format))
+    return 0 if errors == 0 else 1
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -235,6 +276,7 @@ Examples:
   %(prog)s --binary AND 11110000 00001111  # Binary input
   %(prog)s --format all SUB 100 35      # Show all formats
   %(prog)s --list                       # List all operations
+  %(prog)s --batch ops.txt              # One "OP A B" per line (- for stdin)
   %(prog)s --interactive                # Interactive mode
 
 For more information, see: docs/OPCODE_TABLE.md
@@ -271,6 +313,8 @@ For more information, see: docs/OPCODE_TABLE.md
                        help='List all available operations')
     parser.add_argument('--interactive', action='store_true',
                        help='Start interactive mode')
+    parser.add_argument('--batch', metavar='FILE',
+                       help='Execute "OP A B" lines from FILE (- for stdin)')
     parser.add_argument('--quiet', action='store_true',
                        help='Minimal output (result only)')
     
@@ -285,6 +329,18 @@ For more information, see: docs/OPCODE_TABLE.md
         print(interface.list_operations())
         return 0
     
+    # Handle batch mode
+    if args.batch:
+        input_format = 'hex' if args.hex else 'binary' if args.binary else None
+        try:
+            if args.batch == '-':
+                return run_batch(interface, sys.stdin, input_format, args.format, args.quiet)
+            with open(args.batch) as handle:
+                return run_batch(interface, handle, input_format, args.format, args.quiet)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    
     # Handle interactive mode
     if args.interactive:
         print("Interactive mode not yet implemented.")
@@ -52,14 +52,14 @@ case "$MODE" in
             sleep 1
         done
         echo ""
-        python3 tools/run_exhaustive_tests.py
+        python3 tools/run_exhaustive_tests.py "${@:2}"
         ;;
 
     
     pytest)
         print_header "Running Tests with pytest"
         if command -v pytest &> /dev/null || command -v pytest3 &> /dev/null; then
-            cd test && pytest test_alu.py -v
+            cd test && pytest -v
         else
             print_error "pytest not installed. Install with: pip3 install pytest"
             echo -e "${YELLOW}Falling back to quick mode...${NC}\n"
@@ -70,7 +70,7 @@ case "$MODE" in
     verbose)
         print_header "Running Tests with Verbose Output"
         if command -v pytest &> /dev/null || command -v pytest3 &> /dev/null; then
-            cd test && pytest test_alu.py -vv
+            cd test && pytest -vv
         else
             print_error "pytest not installed. Install with: pip3 install pytest"
             echo -e "${YELLOW}Falling back to quick mode...${NC}\n"
@@ -81,7 +81,7 @@ case "$MODE" in
     coverage)
         print_header "Running Tests with Coverage"
         if command -v pytest &> /dev/null || command -v pytest3 &> /dev/null; then
-            cd test && pytest test_alu.py --cov --cov-report=term --cov-report=html
+            cd test && pytest --cov --cov-report=term --cov-report=html
             print_success "Coverage report generated in test/htmlcov/index.html"
         else
             print_error "pytest and pytest-cov required. Install with:"
@@ -102,6 +102,7 @@ case "$MODE" in
         echo "Modes:"
         echo "  quick       - Run tests without pytest (default, no dependencies)"
         echo "  exhaustive  - Run exhaustive JSON vector tests"
+        echo "                (pass --reduce-operands to skip operands an opcode ignores)"
         echo "  pytest      - Run tests with pytest (requires pytest)"
         echo "  verbose   - Run tests with verbose output (requires pytest)"
         echo "  coverage  - Run tests with coverage report (requires pytest & pytest-cov)"
@@ -110,6 +111,7 @@ case "$MODE" in
         echo ""
         echo "Examples:"
         echo "  ./run_tests.sh              # Quick mode (no dependencies)"
+        echo "  ./run_tests.sh exhaustive --reduce-operands --witness-samples 2"
         echo "  ./run_tests.sh pytest       # Standard pytest"
         echo "  ./run_tests.sh verbose      # Verbose output"
         echo "  ./run_tests.sh coverage     # With coverage report"
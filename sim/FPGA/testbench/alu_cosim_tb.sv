@@ -0,0 +1,83 @@
+/******************************************************************************
+ ** Co-Simulation Harness: ALU.sv driven from Python over stdin/stdout
+ **
+ ** Used by tools/rtl_cosim.py; not meant to be run by hand.
+ **
+ ** Protocol (text, one item per line):
+ **   in:  <count>                 batch header, decimal; 0 ends the run
+ **        <op> <a> <b>            count lines, hex
+ **   out: <word>                  count lines, hex
+ **                                {Overflow, Negative, Zero, CarryOut, Result}
+ **
+ ** Output is flushed after every batch, so the driver can keep several
+ ** batches in flight and amortise the pipe round trip.
+ **
+ *****************************************************************************/
+
+`timescale 1ns / 1ps
+
+module alu_cosim_tb;
+
+    parameter WIDTH = 8;
+
+    // ALU ports
+    logic [WIDTH-1:0] A_IN;
+    logic [WIDTH-1:0] B_IN;
+    logic [4:0]       Opcode;
+    logic [WIDTH-1:0] Result;
+    logic             CarryOut;
+    logic             Zero;
+    logic             Negative;
+    logic             Overflow;
+    logic             Equal;
+    logic             Great;
+    logic             Less;
+
+    ALU #(
+        .WIDTH(WIDTH)
+    ) uut (
+        .A(A_IN),
+        .B(B_IN),
+        .Opcode(Opcode),
+        .Result(Result),
+        .CarryOut(CarryOut),
+        .Zero(Zero),
+        .Negative(Negative),
+        .Overflow(Overflow),
+        .Equal(Equal),
+        .Great(Great),
+        .Less(Less)
+    );
+
+    initial begin
+        integer in_fd;
+        integer count;
+        integer i;
+        integer op;
+        integer a;
+        integer b;
+
+        in_fd = $fopen("/dev/stdin", "r");
+        if (in_fd == 0) begin
+            $display("ERROR: cannot open stdin");
+            $finish;
+        end
+
+        forever begin
+            if ($fscanf(in_fd, "%d\n", count) != 1 || count == 0)
+                $finish;
+
+            for (i = 0; i < count; i = i + 1) begin
+                if ($fscanf(in_fd, "%h %h %h\n", op, a, b) != 3)
+                    $finish;
+                Opcode = op[4:0];
+                A_IN = a[WIDTH-1:0];
+                B_IN = b[WIDTH-1:0];
+                #1;
+                $display("%h", {Overflow, Negative, Zero, CarryOut, Result});
+            end
+            $fflush();
+        end
+    end
+
+endmodule
@@ -0,0 +1,162 @@
+/******************************************************************************
+ ** Testbench: File-Driven ALU Vector Sweep
+ **
+ ** Runs vector memories exported by tools/export_hdl_vectors.py against
+ ** ALU.sv, one $readmemh chunk at a time, so even the full 1,245,184-vector
+ ** exhaustive sweep only keeps VEC_CHUNK_SIZE vectors in memory.
+**
+** The vector and chunk counts are read at runtime from <prefix>_count.hex,
+** so +vectors=<prefix> can point at any export whose chunk size fits in
+** VEC_CHUNK_SIZE without recompiling.
+ **
+ ** Checked: Result, CarryOut, Zero, Negative, Equal, Great, Less
+ **
+ ** Known ALU.sv / golden model differences (not counted as failures):
+ **   - CMP: ALU.sv puts A - B on Result, the golden model returns 0
+ **     (Zero and Negative follow A - B in both)
+ **   - Overflow: ALU.sv drives a constant 0 placeholder
+ **
+ ** Usage (Icarus Verilog, from this directory):
+ **   python3 ../../../tools/export_hdl_vectors.py
+ **   iverilog -g2012 -I vectors -o alu_vector_tb ../src/ALU.sv alu_vector_tb.sv
+ **   vvp alu_vector_tb [+max_failures=N] [+vectors=<prefix>]
+ **
+ *****************************************************************************/
+
+`timescale 1ns / 1ps
+
+module alu_vector_tb;
+
+    `include "alu_vectors.svh"
+
+    localparam CMP_OPCODE = 5'd16;
+
+    // ALU ports
+    logic [VEC_WIDTH-1:0] A_IN;
+    logic [VEC_WIDTH-1:0] B_IN;
+    logic [4:0]           Opcode;
+    logic [VEC_WIDTH-1:0] Result;
+    logic                 CarryOut;
+    logic                 Zero;
+    logic                 Negative;
+    logic                 Overflow;
+    logic                 Equal;
+    logic                 Great;
+    logic                 Less;
+
+    // One chunk of vectors
+    alu_vector_t vectors [0:VEC_CHUNK_SIZE-1];
+
+    // <prefix>_count.hex: vector count, chunk size
+    logic [31:0] header [0:1];
+
+    // Test Control
+    integer checked = 0;
+    integer fail_count = 0;
+    integer max_failures = 20;
+    integer vec_count;
+    integer chunk_size;
+    integer chunks;
+    string  prefix = VEC_PREFIX;
+
+    ALU #(
+        .WIDTH(VEC_WIDTH)
+    ) uut (
+        .A(A_IN),
+        .B(B_IN),
+        .Opcode(Opcode),
+        .Result(Result),
+        .CarryOut(CarryOut),
+        .Zero(Zero),
+        .Negative(Negative),
+        .Overflow(Overflow),  // Not checked: constant 0 in ALU.sv
+        .Equal(Equal),
+        .Great(Great),
+        .Less(Less)
+    );
+
+    task automatic check_vector(input integer index, input alu_vector_t v);
+        logic mismatch;
+        begin
+            A_IN = v.a;
+            B_IN = v.b;
+            Opcode = v.opcode;
+            #1;
+
+            mismatch = (v.opcode != CMP_OPCODE && Result !== v.result)
+                    || CarryOut !== v.carry || Zero !== v.zero || Negative !== v.negative
+                    || Equal !== v.equal || Great !== v.great || Less !== v.less;
+            checked = checked + 1;
+
+            if (mismatch) begin
+                fail_count = fail_count + 1;
+                if (fail_count <= max_failures) begin
+                    $display("[FAIL] #%0d op=%b A=0x%h B=0x%h: Result 0x%h (exp 0x%h) C=%b/%b Z=%b/%b N=%b/%b EQ=%b/%b GT=%b/%b LT=%b/%b",
+                             index, v.opcode, v.a, v.b, Result, v.result,
+                             CarryOut, v.carry, Zero, v.zero, Negative, v.negative,
+                             Equal, v.equal, Great, v.great, Less, v.less);
+                end
+            end
+        end
+    endtask
+
+    initial begin
+        integer chunk;
+        integer count;
+        integer i;
+
+        if ($value$plusargs("max_failures=%d", max_failures)) ;
+        if ($value$plusargs("vectors=%s", prefix)) ;
+
+        header[0] = 'x;
+        header[1] = 'x;
+        $readmemh($sformatf("%s_count.hex", prefix), header);
+        if ($isunknown(header[0]) || $isunknown(header[1]) || header[1] == 0) begin
+            $display("ERROR: no vector count in %s_count.hex", prefix);
+            $finish;
+        end
+        vec_count = header[0];
+        chunk_size = header[1];
+        if (chunk_size > VEC_CHUNK_SIZE) begin
+            $display("ERROR: %s uses %0d-vector chunks, this build holds %0d (re-export with --chunk %0d)",
+                     prefix, chunk_size, VEC_CHUNK_SIZE, VEC_CHUNK_SIZE);
+            $finish;
+        end
+        chunks = (vec_count + chunk_size - 1) / chunk_size;
+
+        $display("========================================");
+        $display("ALU File-Driven Vector Sweep");
+        $display("========================================");
+        $display("Vectors: %0d in %0d chunk(s) from %s_*.hex\n", vec_count, chunks, prefix);
+
+        for (chunk = 0; chunk < chunks; chunk = chunk + 1) begin
+            count = vec_count - chunk * chunk_size;
+            if (count > chunk_size)
+                count = chunk_size;
+
+            $readmemh($sformatf("%s_%04d.hex", prefix, chunk), vectors, 0, count - 1);
+            for (i = 0; i < count; i = i + 1)
+                check_vector(chunk * chunk_size + i, vectors[i]);
+
+            $display("Chunk %0d/%0d: %0d vectors, %0d failures so far",
+                     chunk + 1, chunks, count, fail_count);
+        end
+
+        $display("\n========================================");
+        $display("Test Summary");
+        $display("========================================");
+        $display("Checked: %0d", checked);
+        $display("Passed:  %0d", checked - fail_count);
+        $display("Failed:  %0d", fail_count);
+        $display("========================================\n");
+
+        if (fail_count == 0) begin
+            $display("*** ALL TESTS PASSED ***");
+        end else begin
+            $display("*** SOME TESTS FAILED ***");
+        end
+
+        $finish;
+    end
+
+endmodule
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Table-driven batch evaluation of the ALU golden model.
+
+Every opcode has only 256×256 possible inputs, so each opcode's outcomes are
+computed once from `compute_alu_operation` and packed into a lookup table.
+Evaluating a batch of vectors is then a list of table lookups instead of one
+model call (and one flags dict) per vector.
+
+Packed outcome layout (16 bits):
+    bits 0-7   result
+    bit  8     carry
+    bit  9     zero
+    bit  10    overflow
+    bit  11    negative
+
+All 19 tables (2.4 MB) are persisted once to .cache/batch_model/ as raw
+native-order uint16s, in OPERATIONS order, and every later process
+memory-maps that file read-only: startup is an mmap instead of 1.2M model
+calls, and the runner, the CLI and pool workers share the same pages
+through the OS page cache. The file name carries a hash of the golden
+model's source and the packing format, so editing the model makes the next
+process build a fresh file (stale ones are removed). Where the cache
+directory is not writable, tables are built per process as before.
+"""
+
+import hashlib
+import mmap
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import exhaustive_vectors
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+
+
+FLAG_ORDER = ("carry", "zero", "overflow", "negative")
+FLAG_SHIFT = 8
+
+# Below this many vectors, calling the model directly beats building a table.
+TABLE_THRESHOLD = 4096
+
+TABLE_FORMAT = 1
+TABLE_ENTRIES = 65536
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "batch_model"
+
+_TABLES: Dict[str, Sequence[int]] = {}
+# Set once evaluate_batch has looked for persisted tables, found or not, so a
+# process without them does not re-hash the model source on every call.
+_PROBED = False
+
+
+def pack_outcome(result: int, flags: Dict[str, bool]) -> int:
+    """Pack a result byte and its flags into a single table entry."""
+    packed = result & 0xFF
+    for bit, flag in enumerate(FLAG_ORDER):
+        if flags.get(flag, False):
+            packed |= 1 << (FLAG_SHIFT + bit)
+    return packed
+
+
+def unpack_outcome(packed: int) -> Tuple[int, Dict[str, bool]]:
+    """Inverse of `pack_outcome`."""
+    flags = {
+        flag: bool(packed >> (FLAG_SHIFT + bit) & 1)
+        for bit, flag in enumerate(FLAG_ORDER)
+    }
+    return packed & 0xFF, flags
+
+
+def build_table(opcode: str) -> array:
+    """Compute the packed outcome table of one opcode from the golden model."""
+    table = array("H", bytes(2 * TABLE_ENTRIES))
+    index = 0
+    for a in range(256):
+        for b in range(256):
+            table[index] = pack_outcome(*compute_alu_operation(opcode, a, b))
+            index += 1
+    return table
+
+
+def model_key() -> str:
+    """Hash of everything a table entry depends on."""
+    digest = hashlib.sha256(f"batch_model v{TABLE_FORMAT} {sys.byteorder} {FLAG_ORDER}".encode())
+    digest.update(Path(exhaustive_vectors.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def table_path(cache_dir: Optional[Path] = None) -> Path:
+    return (cache_dir or CACHE_DIR) / f"tables-{model_key()[:24]}.bin"
+
+
+def map_tables(cache_dir: Optional[Path] = None,
+               build: bool = True) -> Optional[Dict[str, memoryview]]:
+    """
+    Memory-map the persisted tables, writing the file first if it is missing
+    (or None when it is missing and `build` is False). Raises OSError when
+    the cache directory cannot be written.
+    """
+    path = table_path(cache_dir)
+    size = 2 * TABLE_ENTRIES * len(OPERATIONS)
+    if not path.exists() or path.stat().st_size != size:
+        if not build:
+            return None
+        data = b"".join(build_table(code).tobytes() for _, code, _ in OPERATIONS)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        for stale in path.parent.glob("tables-*.bin"):
+            if stale != path:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass  # still mapped elsewhere (Windows); removed next time
+    with open(path, "rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped).cast("H")
+    return {code: view[k * TABLE_ENTRIES:(k + 1) * TABLE_ENTRIES]
+            for k, (_, code, _) in enumerate(OPERATIONS)}
+
+
+def opcode_table(opcode: str) -> Sequence[int]:
+    """
+    Return the packed outcome table for an opcode, indexed by (A << 8) | B.
+
+    A read-only view of the shared memory-mapped tables (an array built in
+    this process if the cache cannot be written).
+    """
+    if opcode in _TABLES:
+        return _TABLES[opcode]
+    if opcode not in {code for _, code, _ in OPERATIONS}:
+        raise ValueError(f"Unsupported opcode: {opcode}")
+
+    if not _TABLES:
+        try:
+            _TABLES.update(map_tables())
+        except OSError:
+            pass
+    if opcode not in _TABLES:
+        _TABLES[opcode] = build_table(opcode)
+    return _TABLES[opcode]
+
+
+def evaluate_batch(opcode: str, a_values: Sequence[int],
+                   b_values: Sequence[int]) -> List[int]:
+    """Evaluate one opcode over paired A/B sequences, returning packed outcomes."""
+    global _PROBED
+    if not _TABLES and not _PROBED:
+        # Map already-built tables for free; small batches never trigger a build
+        _PROBED = True
+        try:
+            _TABLES.update(map_tables(build=False) or {})
+        except OSError:
+            pass
+    table = _TABLES.get(opcode)
+    if table is None and len(a_values) < TABLE_THRESHOLD:
+        return [
+            pack_outcome(*compute_alu_operation(opcode, a & 0xFF, b & 0xFF))
+            for a, b in zip(a_values, b_values)
+        ]
+    if table is None:
+        table = opcode_table(opcode)
+    return [table[((a & 0xFF) << 8) | (b & 0xFF)] for a, b in zip(a_values, b_values)]
+
+
+def expected_outcomes(vectors: Iterable[Dict]) -> List[int]:
+    """Pack the expected result/flags recorded in JSON vectors."""
+    return [
+        pack_outcome(int(v.get("expected_result", 0)), v.get("expected_flags", {}))
+        for v in vectors
+    ]
+
+
+def find_mismatches(opcode: str, vectors: Sequence[Dict]) -> List[int]:
+    """Return indexes of vectors whose expectations disagree with the model."""
+    actual = evaluate_batch(
+        opcode,
+        [int(v.get("A", 0)) for v in vectors],
+        [int(v.get("B", 0)) for v in vectors],
+    )
+    expected = expected_outcomes(vectors)
+    if actual == expected:
+        return []
+    return [i for i, (act, exp) in enumerate(zip(actual, expected)) if act != exp]
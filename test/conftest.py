@@ -0,0 +1,3 @@
+"""Shared pytest configuration for the ALU test suite."""
+
+pytest_plugins = ("pytest_alu_vectors", "pytester")
@@ -6,6 +6,11 @@
  * 
  * Compile: g++ -std=c++17 -O3 alu_tb.cpp -o alu_tb
  * Run:     ./alu_tb <test_vectors.json>
+ *          ./alu_tb [--range START:STOP] [--quiet] <test_vectors.bin>
+ *
+ * .bin files use the fixed-width format from test/vector_io.py and are
+ * mmapped, so a run (or one shard of it, see tools/run_cpp_testbench.py)
+ * costs evaluation time only.
  * 
  * With Verilator:
  *   verilator --cc --exe --build -j 0 alu.v alu_tb.cpp
@@ -20,6 +25,14 @@
 #include <cassert>
 #include <chrono>
 #include <iomanip>
+#include <cstring>
+#include <stdexcept>
+
+// mmap for binary vector files
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
 
 // JSON parsing (simple manual parser - can use nlohmann/json for production)
 #include <sstream>
@@ -81,37 +94,46 @@ private:
 
 public:
     std::pair<uint8_t, ALUFlags> execute(const std::string& opcode, uint8_t a, uint8_t b) {
+        if (opcode.size() != 5 || opcode.find_first_not_of("01") != std::string::npos) {
+            throw std::runtime_error("Unknown opcode: " + opcode);
+        }
+        return execute(uint8_t(std::stoi(opcode, nullptr, 2)), a, b);
+    }
+    
+    std::pair<uint8_t, ALUFlags> execute(uint8_t opcode, uint8_t a, uint8_t b) {
         a &= mask;
         b &= mask;
         
-        // Arithmetic operations
-        if (opcode == "00000") return add(a, b);
-        if (opcode == "00001") return sub(a, b);
-        if (opcode == "00010") return inc_a(a);
-        if (opcode == "00011") return dec_a(a);
-        
-        // Shift operations
-        if (opcode == "00100") return lsl(a);
-        if (opcode == "00101") return lsr(a);
-        if (opcode == "00110") return asr(a);
-        if (opcode == "00111") return rev_a(a);
-        
-        // Logic operations
-        if (opcode == "01000") return nand_op(a, b);
-        if (opcode == "01001") return nor_op(a, b);
-        if (opcode == "01010") return xor_op(a, b);
-        if (opcode == "01011") return pass_a(a);
-        if (opcode == "01100") return pass_b(b);
-        if (opcode == "01101") return and_op(a, b);
-        if (opcode == "01110") return or_op(a, b);
-        if (opcode == "01111") return xnor_op(a, b);
-        
-        // Special operations
-        if (opcode == "10000") return cmp(a, b);
-        if (opcode == "10001") return not_a(a);
-        if (opcode == "10010") return not_b(b);
+        switch (opcode) {
+            // Arithmetic operations
+            case 0x00: return add(a, b);
+            case 0x01: return sub(a, b);
+            case 0x02: return inc_a(a);
+            case 0x03: return dec_a(a);
+            
+            // Shift operations
+            case 0x04: return lsl(a);
+            case 0x05: return lsr(a);
+            case 0x06: return asr(a);
+            case 0x07: return rev_a(a);
+            
+            // Logic operations
+            case 0x08: return nand_op(a, b);
+            case 0x09: return nor_op(a, b);
+            case 0x0A: return xor_op(a, b);
+            case 0x0B: return pass_a(a);
+            case 0x0C: return pass_b(b);
+            case 0x0D: return and_op(a, b);
+            case 0x0E: return or_op(a, b);
+            case 0x0F: return xnor_op(a, b);
+            
+            // Special operations
+            case 0x10: return cmp(a, b);
+            case 0x11: return not_a(a);
+            case 0x12: return not_b(b);
+        }
         
-        throw std::runtime_error("Unknown opcode: " + opcode);
+        throw std::runtime_error("Unknown opcode: " + std::to_string(opcode));
     }
     
 private:
@@ -305,6 +327,89 @@ private:
     }
 };
 
+/**
+ * Memory-mapped binary vector file (format: test/vector_io.py)
+ *
+ * Header: "ALUV", version u8, width u8, record_size u16, count u64.
+ * Record: opcode u8, flags u8 (C, Z, V, N from bit 0), A, B, result.
+ */
+class BinaryVectorFile {
+public:
+    static constexpr size_t HEADER_SIZE = 16;
+    static constexpr size_t RECORD_SIZE = 5;  // width 8
+    
+    explicit BinaryVectorFile(const std::string& filename) {
+        fd = open(filename.c_str(), O_RDONLY);
+        if (fd < 0) {
+            throw std::runtime_error("Cannot open file: " + filename);
+        }
+        struct stat st;
+        if (fstat(fd, &st) != 0 || size_t(st.st_size) < HEADER_SIZE) {
+            fail("Not an ALU binary vector file: " + filename);
+        }
+        length = size_t(st.st_size);
+        void* mapped = mmap(nullptr, length, PROT_READ, MAP_PRIVATE, fd, 0);
+        if (mapped == MAP_FAILED) {
+            fail("Cannot mmap file: " + filename);
+        }
+        data = static_cast<const uint8_t*>(mapped);
+        madvise(mapped, length, MADV_SEQUENTIAL);
+        
+        uint16_t record_size;
+        std::memcpy(&record_size, data + 6, sizeof(record_size));
+        std::memcpy(&record_count, data + 8, sizeof(record_count));
+        if (std::memcmp(data, "ALUV", 4) != 0 || data[4] != 1) {
+            fail("Not an ALU binary vector file: " + filename);
+        }
+        if (data[5] != 8 || record_size != RECORD_SIZE) {
+            fail("Only 8-bit vector files are supported: " + filename);
+        }
+        if (record_count > (length - HEADER_SIZE) / RECORD_SIZE) {
+            fail("Truncated vector file: " + filename);
+        }
+    }
+    
+    ~BinaryVectorFile() {
+        release();
+    }
+    
+    BinaryVectorFile(const BinaryVectorFile&) = delete;
+    BinaryVectorFile& operator=(const BinaryVectorFile&) = delete;
+    
+    uint64_t count() const { return record_count; }
+    
+    const uint8_t* record(uint64_t index) const {
+        return data + HEADER_SIZE + index * RECORD_SIZE;
+    }
+    
+    static bool is_binary(const std::string& filename) {
+        return filename.size() >= 4 && filename.compare(filename.size() - 4, 4, ".bin") == 0;
+    }
+    
+private:
+    int fd = -1;
+    size_t length = 0;
+    const uint8_t* data = nullptr;
+    uint64_t record_count = 0;
+    
+    void release() {
+        if (data != nullptr) {
+            munmap(const_cast<uint8_t*>(data), length);
+            data = nullptr;
+        }
+        if (fd >= 0) {
+            close(fd);
+            fd = -1;
+        }
+    }
+    
+    // The destructor does not run when the constructor throws, so unmap and close first
+    [[noreturn]] void fail(const std::string& message) {
+        release();
+        throw std::runtime_error(message);
+    }
+};
+
 /**
  * Test runner with statistics
  */
@@ -314,28 +419,79 @@ private:
     int passed = 0;
     int failed = 0;
     int total = 0;
+    bool quiet = false;
     std::chrono::high_resolution_clock::time_point start_time;
     
 public:
+    explicit TestRunner(bool quiet_mode = false) : quiet(quiet_mode) {}
+    
     void run_tests(const std::vector<TestVector>& vectors, bool verbose = false) {
-        std::cout << COLOR_BLUE << "\n";
-        std::cout << "================================================================================\n";
-        std::cout << "C++ ALU TESTBENCH - Industry Standard\n";
-        std::cout << "================================================================================\n";
-        std::cout << COLOR_RESET << "\n";
+        print_banner(vectors.size());
+        start_time = std::chrono::high_resolution_clock::now();
         
-        std::cout << "Total test vectors: " << vectors.size() << "\n\n";
+        for (const auto& test : vectors) {
+            run_single_test(test, verbose);
+        }
         
+        print_summary();
+    }
+    
+    /**
+     * Run records [start, stop) of a mapped binary file.
+     */
+    void run_binary(const BinaryVectorFile& file, uint64_t start, uint64_t stop, bool verbose = false) {
+        print_banner(stop - start);
         start_time = std::chrono::high_resolution_clock::now();
         
-        for (const auto& test : vectors) {
+        TestVector test;
+        for (uint64_t index = start; index < stop; index++) {
+            const uint8_t* record = file.record(index);
+            auto [result, flags] = alu.execute(record[0], record[2], record[3]);
+            ALUFlags expected_flags = {
+                bool(record[1] & 0x01), bool(record[1] & 0x02),
+                bool(record[1] & 0x04), bool(record[1] & 0x08)
+            };
+            if (result == record[4] && flags == expected_flags) {
+                total++;
+                passed++;
+                continue;
+            }
+            // Rebuild the full vector only for reporting
+            test.test_name = "BIN_" + std::to_string(index);
+            test.opcode = opcode_bits(record[0]);
+            test.a = record[2];
+            test.b = record[3];
+            test.expected_result = record[4];
+            test.expected_flags = expected_flags;
             run_single_test(test, verbose);
         }
         
         print_summary();
     }
     
+    int failures() const { return failed; }
+    
 private:
+    static std::string opcode_bits(uint8_t opcode) {
+        std::string bits(5, '0');
+        for (int i = 0; i < 5; i++) {
+            if (opcode & (1 << i)) bits[4 - i] = '1';
+        }
+        return bits;
+    }
+    
+    void print_banner(uint64_t count) {
+        if (quiet) return;
+        std::cout << COLOR_BLUE << "\n";
+        std::cout << "================================================================================\n";
+        std::cout << "C++ ALU TESTBENCH - Industry Standard\n";
+        std::cout << "================================================================================\n";
+        std::cout << COLOR_RESET << "\n";
+        
+        std::cout << "Total test vectors: " << count << "\n\n";
+    }
+    
+
     void run_single_test(const TestVector& test, bool verbose) {
         total++;
         
@@ -379,7 +535,7 @@ private:
             }
             
             // Progress indicator
-            if (total % 10000 == 0) {
+            if (!quiet && total % 10000 == 0) {
                 std::cout << "  Progress: " << total << " tests completed...\r" << std::flush;
             }
             
@@ -394,6 +550,13 @@ private:
         auto end_time = std::chrono::high_resolution_clock::now();
         auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
         
+        if (quiet) {
+            // One machine-readable line for tools/run_cpp_testbench.py
+            std::cout << "SUMMARY total=" << total << " passed=" << passed
+                      << " failed=" << failed << " ms=" << duration.count() << "\n";
+            return;
+        }
+        
         std::cout << "\n";
         std::cout << "================================================================================\n";
         std::cout << "TEST SUMMARY\n";
@@ -406,7 +569,7 @@ private:
                   << " (" << std::fixed << std::setprecision(1) 
                   << (100.0 * failed / total) << "%)" << COLOR_RESET << "\n";
         std::cout << "⏱️  Time:      " << duration.count() << " ms\n";
-        std::cout << "⚡ Speed:     " << (total * 1000 / duration.count()) << " tests/sec\n";
+        std::cout << "⚡ Speed:     " << (total * 1000 / std::max<long long>(duration.count(), 1)) << " tests/sec\n";
         std::cout << "================================================================================\n\n";
         
         if (failed == 0) {
@@ -424,23 +587,51 @@ int main(int argc, char* argv[]) {
     try {
         std::string test_file = "../vectors/demo.json";
         bool verbose = false;
+        bool quiet = false;
+        uint64_t range_start = 0;
+        uint64_t range_stop = UINT64_MAX;
         
         // Parse command line arguments
         for (int i = 1; i < argc; i++) {
             std::string arg = argv[i];
             if (arg == "-v" || arg == "--verbose") {
                 verbose = true;
+            } else if (arg == "-q" || arg == "--quiet") {
+                quiet = true;
+            } else if (arg == "--range" && i + 1 < argc) {
+                std::string range = argv[++i];
+                size_t colon = range.find(':');
+                if (colon == std::string::npos) {
+                    throw std::runtime_error("--range expects START:STOP");
+                }
+                range_start = std::stoull(range.substr(0, colon));
+                range_stop = std::stoull(range.substr(colon + 1));
             } else if (arg == "-h" || arg == "--help") {
                 std::cout << "Usage: " << argv[0] << " [options] [test_file]\n";
                 std::cout << "Options:\n";
-                std::cout << "  -v, --verbose    Verbose output\n";
-                std::cout << "  -h, --help       Show this help\n";
+                std::cout << "  -v, --verbose        Verbose output\n";
+                std::cout << "  -q, --quiet          Failures and one SUMMARY line only\n";
+                std::cout << "  --range START:STOP   Records to run from a .bin file\n";
+                std::cout << "  -h, --help           Show this help\n";
                 return 0;
             } else {
                 test_file = arg;
             }
         }
         
+        if (BinaryVectorFile::is_binary(test_file)) {
+            BinaryVectorFile file(test_file);
+            uint64_t stop = std::min(range_stop, file.count());
+            uint64_t start = std::min(range_start, stop);
+            if (!quiet) {
+                std::cout << "Mapped test vectors from: " << test_file
+                          << " [" << start << ", " << stop << ")\n";
+            }
+            TestRunner runner(quiet);
+            runner.run_binary(file, start, stop, verbose);
+            return runner.failures() == 0 ? 0 : 1;
+        }
+        
         std::cout << "Loading test vectors from: " << test_file << "\n";
         auto vectors = SimpleJSONParser::parse_test_file(test_file);
         
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Energy estimate for a stream of ALU vectors, calibrated from PPA.md.
+
+Each vector applied to the board costs
+
+    static   5 V x (10 mA + 5 mA x fraction of input bits high) x period
+    base     per-opcode energy of one operation
+    toggle   energy per bit that changed since the previous vector
+
+Toggles are counted over the same 33 signals as toggle coverage in
+tools/vector_coverage.py: A, B and the opcode select (driven by the bench)
+plus the result and NZCV flags (driven by the ALU, taken from the golden
+model). The first vector toggles from the all-zero idle state.
+
+Calibration (PPA.md section 2):
+
+    - All inputs 0 / 1: 10 / 15 mA static, 12.5 mA nominal.
+    - At 1 kHz, toggling A[0] draws ~100 mA and toggling everything ~110 mA.
+      Above idle, one toggled input (plus the result bit it drives) costs
+      90 mA and all 33 signals 100 mA, so a vector's fixed cost is ~280x
+      the cost of one extra toggled bit.
+    - Full stress at 1 MHz is 2.5 uJ per instruction. Less the nominal
+      static share, that fixes base + 33 toggles, and with the ratio above
+      the base and per-toggle energies.
+
+PPA.md has one stress figure for the whole ALU, so every opcode starts
+with the same base energy; per-opcode bench measurements go in
+`OP_BASE_ENERGY_J`.
+
+Vectors are turned into packed toggle words through per-opcode tables (built
+once from batch_model's outcome tables), and toggles are counted a chunk at a
+time with `int.bit_count` over XORed neighbours: once the tables exist, a
+million-vector trace takes well under a second.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from itertools import islice
+from operator import and_, xor
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from batch_model import opcode_table
+from exhaustive_vectors import OPERATIONS
+
+
+SUPPLY_V = 5.0
+IDLE_CURRENT_A = 0.010          # all inputs 0
+HIGH_CURRENT_A = 0.015          # all inputs 1
+NOMINAL_CURRENT_A = (IDLE_CURRENT_A + HIGH_CURRENT_A) / 2
+
+# 1 kHz switching rows: (current, signals toggling per vector)
+SINGLE_TOGGLE = (0.100, 2)      # A[0] and the result bit it drives
+ALL_TOGGLE_CURRENT_A = 0.110
+
+STRESS_FREQUENCY_HZ = 1e6
+STRESS_ENERGY_J = 2.5e-6
+
+# Toggle word layout (same as tools/vector_coverage.py toggle_word)
+INPUT_BITS = 21                 # A[0-7], B[8-15], opcode select[16-20]
+TOGGLE_BITS = 33                # + result[21-28], C, Z, V, N
+INPUT_MASK = (1 << INPUT_BITS) - 1
+CHUNK = 65536
+
+
+def calibrate() -> Tuple[float, float]:
+    """(base energy per vector, energy per toggled bit) in J from PPA.md."""
+    single_current, single_bits = SINGLE_TOGGLE
+    per_bit = (ALL_TOGGLE_CURRENT_A - single_current) / (TOGGLE_BITS - single_bits)
+    base = single_current - IDLE_CURRENT_A - single_bits * per_bit
+    dynamic = STRESS_ENERGY_J - SUPPLY_V * NOMINAL_CURRENT_A / STRESS_FREQUENCY_HZ
+    base_energy = dynamic / (1 + TOGGLE_BITS * per_bit / base)
+    return base_energy, base_energy * per_bit / base
+
+
+BASE_ENERGY_J, TOGGLE_ENERGY_J = calibrate()
+
+# Golden-model operation name -> base energy per vector (J)
+OP_BASE_ENERGY_J: Dict[str, float] = {name: BASE_ENERGY_J for name, _, _ in OPERATIONS}
+
+OPCODE_NAMES: Dict[int, str] = {int(code, 2): name for name, code, _ in OPERATIONS}
+
+_WORDS: Dict[int, array] = {}
+
+
+def toggle_words(opcode: int) -> array:
+    """Packed toggle word for every (A << 8) | B input of an opcode."""
+    if opcode in _WORDS:
+        return _WORDS[opcode]
+    table = opcode_table(format(opcode, "05b"))
+    select = opcode << 16
+    words = array("Q", (index >> 8 | (index & 0xFF) << 8 | select | (packed & 0xFFF) << 21
+                        for index, packed in enumerate(table)))
+    _WORDS[opcode] = words
+    return words
+
+
+@dataclass
+class OpEnergy:
+    """Totals for the vectors of one opcode."""
+    count: int = 0
+    toggles: int = 0
+    energy_j: float = 0.0
+
+
+@dataclass
+class EnergyMeter:
+    """
+    Streaming energy accumulator. Feed (opcode, A, B) tuples in order with
+    `feed`; memory does not grow with the stream.
+    """
+    frequency_hz: float = STRESS_FREQUENCY_HZ
+    vectors: int = 0
+    toggles: int = 0
+    input_ones: int = 0
+    static_j: float = 0.0
+    base_j: float = 0.0
+    toggle_j: float = 0.0
+    per_op: Dict[str, OpEnergy] = field(default_factory=dict)
+    previous: int = 0
+
+    @property
+    def energy_j(self) -> float:
+        return self.static_j + self.base_j + self.toggle_j
+
+    @property
+    def power_w(self) -> float:
+        """Average power with one vector per clock period."""
+        return self.energy_j * self.frequency_hz / self.vectors if self.vectors else 0.0
+
+    def feed(self, vectors: Iterable[Tuple[int, int, int]]) -> "EnergyMeter":
+        iterator = iter(vectors)
+        while True:
+            chunk = list(islice(iterator, CHUNK))
+            if not chunk:
+                return self
+            self._feed_chunk(chunk)
+
+    def _feed_chunk(self, chunk: List[Tuple[int, int, int]]) -> None:
+        opcodes = [opcode for opcode, _, _ in chunk]
+        words = [(_WORDS.get(opcode) or toggle_words(opcode))[a << 8 | b] for opcode, a, b in chunk]
+        flips = list(map(int.bit_count, map(xor, words, [self.previous] + words[:-1])))
+        ones = list(map(int.bit_count, map(and_, words, [INPUT_MASK] * len(words))))
+        self.previous = words[-1]
+
+        by_op: Dict[int, List[int]] = {}
+        for opcode, flipped, high in zip(opcodes, flips, ones):
+            totals = by_op.get(opcode)
+            if totals is None:
+                by_op[opcode] = [1, flipped, high]
+            else:
+                totals[0] += 1
+                totals[1] += flipped
+                totals[2] += high
+
+        period = 1.0 / self.frequency_hz
+        for opcode, (count, flipped, high) in by_op.items():
+            name = OPCODE_NAMES[opcode]
+            static_j = SUPPLY_V * period * (count * IDLE_CURRENT_A
+                                            + high * (HIGH_CURRENT_A - IDLE_CURRENT_A) / INPUT_BITS)
+            base_j = OP_BASE_ENERGY_J[name] * count
+            toggle_j = flipped * TOGGLE_ENERGY_J
+            totals = self.per_op.setdefault(name, OpEnergy())
+            totals.count += count
+            totals.toggles += flipped
+            totals.energy_j += static_j + base_j + toggle_j
+            self.vectors += count
+            self.toggles += flipped
+            self.input_ones += high
+            self.static_j += static_j
+            self.base_j += base_j
+            self.toggle_j += toggle_j
+
+
+def measure(vectors: Iterable[Tuple[int, int, int]],
+            frequency_hz: float = STRESS_FREQUENCY_HZ) -> EnergyMeter:
+    """Energy of a whole (opcode, A, B) stream."""
+    return EnergyMeter(frequency_hz).feed(vectors)
+
+
+def dict_vectors(vectors: Iterable[Dict]) -> Iterator[Tuple[int, int, int]]:
+    """(opcode, A, B) from repo-schema vector dicts."""
+    for vector in vectors:
+        yield int(str(vector["opcode"]).strip(), 2), int(vector.get("A", 0)), int(vector.get("B", 0))
@@ -15,67 +15,74 @@ Benefits:
 from typing import Iterator, Dict, Any, Tuple
 
 
-# Opcode definitions (matches hardware implementation)
+# Opcode definitions (matches hardware implementation).
+# Third field: operands the operation actually reads ("AB", "A" or "B").
+# Unary operations ignore the other operand entirely.
 OPERATIONS = [
-    ("ADD", "00000"),
-    ("SUB", "00001"),
-    ("INC_A", "00010"),
-    ("DEC_A", "00011"),
-    ("LSL", "00100"),
-    ("LSR", "00101"),
-    ("ASR", "00110"),
-    ("REV_A", "00111"),
-    ("NAND", "01000"),
-    ("NOR", "01001"),
-    ("XOR", "01010"),
-    ("PASS_A", "01011"),
-    ("PASS_B", "01100"),
-    ("AND", "01101"),
-    ("OR", "01110"),
-    ("XNOR", "01111"),
-    ("CMP", "10000"),
-    ("NOT_A", "10001"),
-    ("NOT_B", "10010"),
+    ("ADD", "00000", "AB"),
+    ("SUB", "00001", "AB"),
+    ("INC_A", "00010", "A"),
+    ("DEC_A", "00011", "A"),
+    ("LSL", "00100", "A"),
+    ("LSR", "00101", "A"),
+    ("ASR", "00110", "A"),
+    ("REV_A", "00111", "A"),
+    ("NAND", "01000", "AB"),
+    ("NOR", "01001", "AB"),
+    ("XOR", "01010", "AB"),
+    ("PASS_A", "01011", "A"),
+    ("PASS_B", "01100", "B"),
+    ("AND", "01101", "AB"),
+    ("OR", "01110", "AB"),
+    ("XNOR", "01111", "AB"),
+    ("CMP", "10000", "AB"),
+    ("NOT_A", "10001", "A"),
+    ("NOT_B", "10010", "B"),
 ]
 
 
-def compute_alu_operation(opcode: str, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
+def compute_alu_operation(opcode: str, a: int, b: int,
+                          width: int = 8) -> Tuple[int, Dict[str, bool]]:
     """
     Golden model: compute expected ALU output.
     
     This is the SINGLE SOURCE OF TRUTH for ALU behavior.
     All test vectors are derived from this function.
+    
+    `width` is the operand width in bits (8 for this ALU); the same
+    semantics scale to any width, matching the WIDTH parameter of ALU.sv.
     """
     op = int(opcode, 2)
-    mask = 0xFF
+    mask = (1 << width) - 1
+    sign = 1 << (width - 1)
     
     # Arithmetic operations
     if op == 0:  # ADD
         total = a + b
         result = total & mask
         carry = total > mask
-        overflow = ((a & 0x80) == (b & 0x80)) and ((a & 0x80) != (result & 0x80))
+        overflow = ((a & sign) == (b & sign)) and ((a & sign) != (result & sign))
     
     elif op == 1:  # SUB
         diff = a - b
         result = diff & mask
         carry = diff >= 0
-        overflow = ((a & 0x80) != (b & 0x80)) and ((a & 0x80) != (result & 0x80))
+        overflow = ((a & sign) != (b & sign)) and ((a & sign) != (result & sign))
     
     elif op == 2:  # INC_A
         total = a + 1
         result = total & mask
         carry = total > mask
-        overflow = (a == 0x7F)
+        overflow = (a == sign - 1)
     
     elif op == 3:  # DEC_A
         diff = a - 1
         result = diff & mask
         carry = diff >= 0
-        overflow = (a == 0x80)
+        overflow = (a == sign)
     
     elif op == 4:  # LSL
-        carry = bool(a & 0x80)
+        carry = bool(a & sign)
         result = (a << 1) & mask
         overflow = False
     
@@ -86,15 +93,15 @@ def compute_alu_operation(opcode: str, a: int, b: int) -> Tuple[int, Dict[str, b
     
     elif op == 6:  # ASR
         carry = bool(a & 0x01)
-        sign_bit = a & 0x80
+        sign_bit = a & sign
         result = ((a >> 1) | sign_bit) & mask
         overflow = False
     
     elif op == 7:  # REV_A
         result = 0
-        for i in range(8):
+        for i in range(width):
             if a & (1 << i):
-                result |= (1 << (7 - i))
+                result |= (1 << (width - 1 - i))
         carry = overflow = False
     
     # Logic operations (no carry/overflow)
@@ -134,11 +141,11 @@ def compute_alu_operation(opcode: str, a: int, b: int) -> Tuple[int, Dict[str, b
         diff = a - b
         result = 0  # CMP returns 0
         carry = diff >= 0
-        overflow = ((a & 0x80) != (b & 0x80)) and ((a & 0x80) != (diff & 0x80))
+        overflow = ((a & sign) != (b & sign)) and ((a & sign) != (diff & sign))
         # For CMP, flags are based on the comparison (diff), not the result (0)
         diff_masked = diff & mask
         zero = (diff_masked == 0)
-        negative = (diff_masked & 0x80) != 0
+        negative = (diff_masked & sign) != 0
         return result, {
             "carry": carry,
             "overflow": overflow,
@@ -159,7 +166,7 @@ def compute_alu_operation(opcode: str, a: int, b: int) -> Tuple[int, Dict[str, b
     
     # Common flags (not used for CMP which returns early)
     zero = (result == 0)
-    negative = (result & 0x80) != 0
+    negative = (result & sign) != 0
     
     return result, {
         "carry": carry,
@@ -169,33 +176,112 @@ def compute_alu_operation(opcode: str, a: int, b: int) -> Tuple[int, Dict[str, b
     }
 
 
-def generate_exhaustive_vectors() -> Iterator[Dict[str, Any]]:
+def ignored_operand_samples(width: int = 8) -> Tuple[int, ...]:
+    """
+    Values driven onto an ignored operand when proving it has no effect.
+    Covers all-ones, both checkerboards and the single-bit extremes.
+    """
+    mask = (1 << width) - 1
+    sign = 1 << (width - 1)
+    checker = int("01" * ((width + 1) // 2), 2) & mask
+    return (mask, checker, checker ^ mask, 0x01, sign, sign - 1, mask - 1)
+
+
+IGNORED_OPERAND_SAMPLES = ignored_operand_samples(8)
+
+
+def operand_dependence(opcode: str) -> str:
+    """Return the operands ("AB", "A" or "B") read by an opcode."""
+    for _, code, operands in OPERATIONS:
+        if code == opcode:
+            return operands
+    raise ValueError(f"Unsupported opcode: {opcode}")
+
+
+def operand_pairs(operands: str, reduce_operands: bool = False,
+                  witness_samples: int = 0, width: int = 8) -> Iterator[Tuple[int, int]]:
+    """
+    Yield the (A, B) pairs to test for an operation.
+    
+    Without reduction every 256×256 combination is produced. With reduction,
+    an ignored operand is held at 0 so only the 256 distinct cases remain;
+    `witness_samples` then adds that many full sweeps with the ignored
+    operand driven to IGNORED_OPERAND_SAMPLES values, proving independence.
+    At other widths 256 becomes 2**width.
+    """
+    values = 1 << width
+    if not reduce_operands or operands == "AB":
+        for a in range(values):
+            for b in range(values):
+                yield a, b
+        return
+    
+    samples = ignored_operand_samples(width)
+    if not 0 <= witness_samples <= len(samples):
+        raise ValueError(
+            f"witness_samples must be between 0 and {len(samples)}"
+        )
+    
+    for ignored in (0,) + samples[:witness_samples]:
+        for value in range(values):
+            if operands == "A":
+                yield value, ignored
+            else:
+                yield ignored, value
+
+
+def vector_name(op_name: str, a: int, b: int, width: int = 8) -> str:
+    """Test name used for generated vectors, e.g. ADD_7F_01."""
+    digits = (width + 3) // 4
+    return f"{op_name}_{a:0{digits}X}_{b:0{digits}X}"
+
+
+def generate_exhaustive_vectors(reduce_operands: bool = False,
+                                witness_samples: int = 0,
+                                width: int = 8) -> Iterator[Dict[str, Any]]:
     """
     Generate all exhaustive test vectors on-the-fly.
     
     Yields 19 operations × 256 A values × 256 B values = 1,245,184 vectors
     Memory efficient: yields one vector at a time (streaming).
+    
+    With `reduce_operands`, operations that ignore an operand only get their
+    distinct cases (see `operand_pairs`), giving 592,384 vectors.
+    
+    Only practical up to width 8 (12 bits with `reduce_operands`); wider
+    ALUs are swept with `sweep_strategies.sweep_vectors`.
     """
-    for op_name, opcode in OPERATIONS:
-        # Exhaustive: all 256×256 combinations of A and B
-        for a in range(256):
-            for b in range(256):
-                # Compute expected result and flags using golden model
-                result, flags = compute_alu_operation(opcode, a, b)
-                
-                yield {
-                    "test_name": f"{op_name}_{a:02X}_{b:02X}",
-                    "opcode": opcode,
-                    "A": a,
-                    "B": b,
-                    "expected_result": result,
-                    "expected_flags": flags
-                }
-
-
-def count_vectors() -> int:
+    for op_name, opcode, operands in OPERATIONS:
+        for a, b in operand_pairs(operands, reduce_operands, witness_samples, width):
+            # Compute expected result and flags using golden model
+            result, flags = compute_alu_operation(opcode, a, b, width)
+            
+            yield {
+                "test_name": vector_name(op_name, a, b, width),
+                "opcode": opcode,
+                "A": a,
+                "B": b,
+                "expected_result": result,
+                "expected_flags": flags
+            }
+
+
+def count_vectors(reduce_operands: bool = False, witness_samples: int = 0,
+                  width: int = 8) -> int:
     """Count total number of exhaustive vectors."""
-    return len(OPERATIONS) * 256 * 256
+    values = 1 << width
+    samples = ignored_operand_samples(width)
+    if reduce_operands and not 0 <= witness_samples <= len(samples):
+        raise ValueError(
+            f"witness_samples must be between 0 and {len(samples)}"
+        )
+    total = 0
+    for _, _, operands in OPERATIONS:
+        if not reduce_operands or operands == "AB":
+            total += values * values
+        else:
+            total += values * (1 + witness_samples)
+    return total
 
 
 if __name__ == "__main__":
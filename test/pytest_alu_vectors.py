@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+pytest plugin: run JSON vector files as batched tests.
+
+Instead of one pytest item per vector, each vector file is collected as one
+item per opcode it contains. An item evaluates its whole chunk in bulk against
+the model under test, and only a failing chunk is re-expanded into per-vector
+detail.
+
+The model under test (`--alu-model`) defaults to `test_alu.ALU8Bit`, the
+software ALU the vectors exist to check. `golden` checks the files against
+`compute_alu_operation` through `batch_model` instead; that only validates
+the expectations, since the golden model produced them.
+
+Collected files:
+- `*.json` / `*.json.gz` anywhere under a directory named `vectors`
+- any vector file named explicitly on the command line
+
+Collection never parses the JSON: the opcodes present in a file are found by a
+byte-level scan and cached in pytest's cache, keyed by file size and mtime, so
+re-collection of even the 1.2M-vector suite is instant. Items carry no shared
+state, so they distribute cleanly under pytest-xdist (`-n auto`); each worker
+loads a given file at most once.
+
+Enable with `pytest_plugins = ("pytest_alu_vectors",)` (see conftest.py) or
+`pytest -p pytest_alu_vectors`.
+"""
+
+import gzip
+import json
+import re
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import pytest
+
+from batch_model import (TABLE_THRESHOLD, expected_outcomes, find_mismatches, pack_outcome,
+                         unpack_outcome)
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+
+
+OPCODE_NAMES = {code: name for name, code, _ in OPERATIONS}
+OPCODE_PATTERN = re.compile(rb'"opcode"\s*:\s*"([01]+)"')
+CACHE_PREFIX = "alu_vectors/opcodes/"
+SCAN_BLOCK = 1 << 22
+MODELS = ("alu8bit", "golden")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("alu-vectors", "ALU vector files")
+    group.addoption(
+        "--alu-max-failures",
+        type=int,
+        default=20,
+        help="Per-vector failures to detail for each failing opcode chunk (default: 20).",
+    )
+    group.addoption(
+        "--alu-model",
+        choices=MODELS,
+        default="alu8bit",
+        help="Model checked against vector files: test_alu.ALU8Bit (alu8bit, default) "
+             "or compute_alu_operation (golden).",
+    )
+
+
+def _is_vector_file(path: Path) -> bool:
+    return path.name.endswith(".json") or path.name.endswith(".json.gz")
+
+
+def _open_bytes(path: Path):
+    return gzip.open(path, "rb") if path.suffix == ".gz" else path.open("rb")
+
+
+def _scan_opcodes(path: Path) -> List[str]:
+    """Find the opcodes used in a vector file without parsing it."""
+    found = set()
+    tail = b""
+    with _open_bytes(path) as handle:
+        while True:
+            block = handle.read(SCAN_BLOCK)
+            if not block:
+                break
+            data = tail + block
+            found.update(m.decode() for m in OPCODE_PATTERN.findall(data))
+            tail = data[-64:]
+    return sorted(found)
+
+
+def file_opcodes(path: Path, config) -> List[str]:
+    """Return the opcodes present in `path`, using pytest's cache when fresh."""
+    stat = path.stat()
+    stamp = [stat.st_size, stat.st_mtime_ns]
+    cache = getattr(config, "cache", None)
+    key = CACHE_PREFIX + str(path.resolve()).replace("/", "_").replace("\\", "_")
+
+    if cache is not None:
+        entry = cache.get(key, None)
+        if entry and entry.get("stamp") == stamp:
+            return entry["opcodes"]
+
+    opcodes = _scan_opcodes(path)
+    if cache is not None:
+        cache.set(key, {"stamp": stamp, "opcodes": opcodes})
+    return opcodes
+
+
+@lru_cache(maxsize=4)
+def load_chunks(path: str) -> Dict[str, List[Dict]]:
+    """Load a vector file once per process and group its vectors by opcode."""
+    with _open_bytes(Path(path)) as handle:
+        data = json.load(handle)
+
+    if isinstance(data, list):
+        entries = data
+    elif isinstance(data, dict):
+        entries = data.get("vectors") or data.get("tests") or [data]
+    else:
+        raise ValueError(f"{path} must contain a JSON array or object with 'vectors'/'tests' key")
+
+    chunks: Dict[str, List[Dict]] = {}
+    for entry in entries:
+        chunks.setdefault(str(entry.get("opcode", "")).strip(), []).append(entry)
+    return chunks
+
+
+def model_execute(model: str) -> Callable[[str, int, int], Tuple[int, Dict[str, bool]]]:
+    """`execute(opcode, a, b) -> (result, flags)` of a model under test."""
+    if model == "golden":
+        return compute_alu_operation
+    from test_alu import ALU8Bit
+    return ALU8Bit().execute
+
+
+@lru_cache(maxsize=None)
+def model_table(model: str, opcode: str) -> array:
+    """Packed outcomes of a model for every (A << 8) | B, like batch_model.opcode_table."""
+    execute = model_execute(model)
+    return array("H", (pack_outcome(*execute(opcode, a, b)) for a in range(256) for b in range(256)))
+
+
+def model_mismatches(model: str, opcode: str, vectors: List[Dict]) -> List[int]:
+    """Indexes of vectors whose expectations the model under test disagrees with."""
+    if model == "golden":
+        return find_mismatches(opcode, vectors)
+    operands = [(int(v.get("A", 0)) & 0xFF, int(v.get("B", 0)) & 0xFF) for v in vectors]
+    if len(vectors) < TABLE_THRESHOLD:
+        execute = model_execute(model)
+        actual = [pack_outcome(*execute(opcode, a, b)) for a, b in operands]
+    else:
+        table = model_table(model, opcode)
+        actual = [table[a << 8 | b] for a, b in operands]
+    expected = expected_outcomes(vectors)
+    return [i for i, (act, exp) in enumerate(zip(actual, expected)) if act != exp]
+
+
+def pytest_collect_file(file_path: Path, parent):
+    if not _is_vector_file(file_path):
+        return None
+    if "vectors" in file_path.parts[:-1] or parent.session.isinitpath(file_path):
+        return VectorFile.from_parent(parent, path=file_path)
+    return None
+
+
+class VectorFile(pytest.File):
+    """A JSON vector file, collected as one item per opcode."""
+
+    def collect(self):
+        for opcode in file_opcodes(self.path, self.config):
+            name = f"{opcode}-{OPCODE_NAMES.get(opcode, 'UNKNOWN')}"
+            yield VectorChunk.from_parent(self, name=name, opcode=opcode)
+
+
+class VectorChunkFailure(Exception):
+    """Raised by a chunk whose vectors disagree with the model under test."""
+
+    def __init__(self, total: int, details: List[str]):
+        super().__init__(f"{len(details)} of {total} vectors failed")
+        self.total = total
+        self.details = details
+
+
+class VectorChunk(pytest.Item):
+    """All vectors for one opcode in one file, evaluated as a single batch."""
+
+    def __init__(self, *, opcode: str, **kwargs):
+        super().__init__(**kwargs)
+        self.opcode = opcode
+
+    def runtest(self):
+        vectors = load_chunks(str(self.path)).get(self.opcode, [])
+        if self.opcode not in OPCODE_NAMES:
+            raise VectorChunkFailure(len(vectors), [
+                f"{v.get('test_name', 'unknown')}: unknown opcode {self.opcode}"
+                for v in vectors
+            ])
+
+        mismatches = model_mismatches(self.config.getoption("alu_model"), self.opcode, vectors)
+        if mismatches:
+            raise VectorChunkFailure(len(vectors), [
+                self._describe(vectors[i]) for i in mismatches
+            ])
+
+    def _describe(self, vector: Dict) -> str:
+        """Re-evaluate one failing vector through the scalar model under test for detail."""
+        a = int(vector.get("A", 0))
+        b = int(vector.get("B", 0))
+        exp_result, exp_flags = unpack_outcome(pack_outcome(
+            int(vector.get("expected_result", 0)), vector.get("expected_flags", {})
+        ))
+        execute = model_execute(self.config.getoption("alu_model"))
+        act_result, act_flags = execute(self.opcode, a & 0xFF, b & 0xFF)
+
+        problems = []
+        if exp_result != act_result:
+            problems.append(f"result expected 0x{exp_result:02X}, got 0x{act_result:02X}")
+        for flag, expected in exp_flags.items():
+            if expected != act_flags[flag]:
+                problems.append(f"{flag} expected {expected}, got {act_flags[flag]}")
+        return f"{vector.get('test_name', 'unknown')} (A=0x{a:02X}, B=0x{b:02X}): " + "; ".join(problems)
+
+    def repr_failure(self, excinfo):
+        if isinstance(excinfo.value, VectorChunkFailure):
+            failure = excinfo.value
+            limit = self.config.getoption("alu_max_failures")
+            lines = [f"{self.path.name} opcode {self.name}: {failure}"]
+            lines.extend(f"  {detail}" for detail in failure.details[:limit])
+            if len(failure.details) > limit:
+                lines.append(f"  ... {len(failure.details) - limit} more")
+            return "\n".join(lines)
+        return super().repr_failure(excinfo)
+
+    def reportinfo(self):
+        return self.path, None, f"{self.path.name}::{self.name}"
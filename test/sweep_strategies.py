@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Sweep strategies for ALU widths too wide to test exhaustively.
+
+An 8-bit ALU has 65,536 input pairs per opcode; a 16-bit one has 4.3 billion
+and a 32-bit one 1.8e19. Each opcode is swept exhaustively when its pairs
+fit in the per-opcode sample count, and otherwise by sampling:
+
+    stratified   corner cases, then samples spread evenly over strata
+                 formed by the top bits of each operand (signs and
+                 magnitudes all get hit, low bits are random)
+    random       corner cases, then uniform random samples
+
+Corner cases (all zeros/ones, sign boundaries, single bits, checkerboards)
+are always injected before sampling. `plan_sweeps` turns a time budget into
+a per-opcode sample count for each width.
+"""
+
+import random
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from exhaustive_vectors import (OPERATIONS, compute_alu_operation, operand_pairs,
+                                vector_name)
+
+
+SAMPLERS = ("stratified", "random")
+DEFAULT_WIDTHS = (4, 8, 16, 32)
+
+# Strata use at most this many top bits per operand
+MAX_STRATA_BITS = 4
+
+
+def corner_values(width: int) -> Tuple[int, ...]:
+    """Operand values most likely to expose carry, sign and bit-slice bugs."""
+    mask = (1 << width) - 1
+    sign = 1 << (width - 1)
+    checker = int("01" * ((width + 1) // 2), 2) & mask
+    low_half = (1 << (width // 2)) - 1
+    values = {0, 1, 2, mask, mask - 1, sign, sign - 1, sign + 1,
+              checker, checker ^ mask, low_half, low_half ^ mask}
+    for bit in range(width):
+        values.add(1 << bit)
+        values.add(mask ^ (1 << bit))
+    return tuple(sorted(v & mask for v in values))
+
+
+def corner_pairs(operands: str, width: int) -> List[Tuple[int, int]]:
+    """Every corner value on each operand the opcode reads (others held at 0)."""
+    corners = corner_values(width)
+    if operands == "AB":
+        return list(product(corners, corners))
+    if operands == "A":
+        return [(value, 0) for value in corners]
+    return [(0, value) for value in corners]
+
+
+def exhaustive_size(operands: str, width: int, reduce_operands: bool = False) -> int:
+    """Pairs in an exhaustive sweep of one opcode."""
+    if reduce_operands and operands != "AB":
+        return 1 << width
+    return 1 << (2 * width)
+
+
+def stratified_pairs(operands: str, width: int, count: int,
+                     rng: random.Random) -> Iterator[Tuple[int, int]]:
+    """
+    `count` pairs cycling through strata of the operands' top bits, with
+    uniformly random low bits. Uses as many strata bits as `count` can
+    visit at least once.
+    """
+    used = 2 if operands == "AB" else 1
+    bits = 0
+    while (bits < min(MAX_STRATA_BITS, width)
+           and (1 << (used * (bits + 1))) <= count):
+        bits += 1
+    low = width - bits
+    strata = list(product(range(1 << bits), repeat=used))
+    for index in range(count):
+        values = [top << low | rng.getrandbits(low) if low else top
+                  for top in strata[index % len(strata)]]
+        if operands == "AB":
+            yield values[0], values[1]
+        elif operands == "A":
+            yield values[0], 0
+        else:
+            yield 0, values[0]
+
+
+def random_pairs(operands: str, width: int, count: int,
+                 rng: random.Random) -> Iterator[Tuple[int, int]]:
+    """`count` uniformly random pairs; an unread operand is held at 0."""
+    for _ in range(count):
+        a = rng.getrandbits(width) if "A" in operands else 0
+        b = rng.getrandbits(width) if "B" in operands else 0
+        yield a, b
+
+
+def sweep_pairs(opcode: str, operands: str, width: int, samples: int,
+                sampler: str = "stratified", seed: int = 0,
+                reduce_operands: bool = False) -> Iterator[Tuple[int, int]]:
+    """
+    Pairs for one opcode: exhaustive when it fits in `samples`, otherwise the
+    corner cases followed by `samples` minus their number of sampled pairs.
+    Deterministic for a given seed.
+    """
+    if exhaustive_size(operands, width, reduce_operands) <= samples:
+        yield from operand_pairs(operands, reduce_operands, width=width)
+        return
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unknown sampler: {sampler} (choose from {', '.join(SAMPLERS)})")
+
+    corners = corner_pairs(operands, width)
+    yield from corners
+    rng = random.Random(f"{seed}:{opcode}:{width}")
+    remaining = max(0, samples - len(corners))
+    if sampler == "stratified":
+        yield from stratified_pairs(operands, width, remaining, rng)
+    else:
+        yield from random_pairs(operands, width, remaining, rng)
+
+
+def opcode_vector_count(operands: str, width: int, samples: int,
+                        reduce_operands: bool = False) -> int:
+    """Vectors `sweep_pairs` yields for one opcode."""
+    size = exhaustive_size(operands, width, reduce_operands)
+    if size <= samples:
+        return size
+    return max(samples, len(corner_pairs(operands, width)))
+
+
+def sweep_vectors(width: int, samples: int, sampler: str = "stratified", seed: int = 0,
+                  reduce_operands: bool = False,
+                  opcodes: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Vectors in the repo JSON schema for every (or each selected) opcode."""
+    for op_name, opcode, operands in OPERATIONS:
+        if opcodes is not None and opcode not in opcodes:
+            continue
+        for a, b in sweep_pairs(opcode, operands, width, samples, sampler, seed,
+                                reduce_operands):
+            result, flags = compute_alu_operation(opcode, a, b, width)
+            yield {
+                "test_name": vector_name(op_name, a, b, width),
+                "opcode": opcode,
+                "A": a,
+                "B": b,
+                "expected_result": result,
+                "expected_flags": flags,
+            }
+
+
+@dataclass
+class SweepPlan:
+    """How one width is swept: per-opcode sample count and resulting size."""
+    width: int
+    samples: int
+    vectors: int
+    exhaustive: bool
+
+
+def plan_width(width: int, samples: int, reduce_operands: bool = False) -> SweepPlan:
+    vectors = sum(opcode_vector_count(operands, width, samples, reduce_operands)
+                  for _, _, operands in OPERATIONS)
+    exhaustive = all(exhaustive_size(operands, width, reduce_operands) <= samples
+                     for _, _, operands in OPERATIONS)
+    return SweepPlan(width, samples, vectors, exhaustive)
+
+
+def plan_sweeps(widths: Sequence[int], budget_seconds: float, rate: float,
+                reduce_operands: bool = False) -> List[SweepPlan]:
+    """
+    Split a time budget across widths, narrowest first.
+
+    Each width gets an equal share of what is left (`rate` is vectors per
+    second); a width that fits its share exhaustively is swept exhaustively
+    and returns the rest of its share to the pool. Corner cases are always
+    kept, so a tiny budget can be overrun.
+    """
+    remaining = budget_seconds * rate
+    plans = []
+    ordered = sorted(set(widths))
+    for index, width in enumerate(ordered):
+        share = remaining / (len(ordered) - index)
+        full = max(exhaustive_size(operands, width, reduce_operands)
+                   for _, _, operands in OPERATIONS)
+        plan = plan_width(width, full, reduce_operands)
+        if plan.vectors > share:
+            plan = plan_width(width, int(share // len(OPERATIONS)), reduce_operands)
+        plans.append(plan)
+        remaining = max(0.0, remaining - plan.vectors)
+    return plans
@@ -32,11 +32,12 @@ except ImportError:
 
 
 class ALU8Bit:
-    """Software simulation of 8-bit ALU"""
+    """Software simulation of 8-bit ALU (other widths via `width`)"""
     
-    def __init__(self):
-        self.width = 8
+    def __init__(self, width: int = 8):
+        self.width = width
         self.mask = (1 << self.width) - 1
+        self.sign = 1 << (self.width - 1)
         
     def execute(self, opcode: str, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         """Execute ALU operation and return result with flags"""
@@ -72,45 +73,45 @@ class ALU8Bit:
     
     def _flags(self, result: int, carry: bool = False, overflow: bool = False) -> Dict[str, bool]:
         """Calculate standard flags"""
-        result_8bit = result & self.mask
+        result_masked = result & self.mask
         return {
             'carry': carry,
-            'zero': result_8bit == 0,
+            'zero': result_masked == 0,
             'overflow': overflow,
-            'negative': bool(result_8bit & 0x80)
+            'negative': bool(result_masked & self.sign)
         }
     
     def add(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         """ADD: A + B"""
         result = a + b
         carry = result > self.mask
-        overflow = ((a & 0x80) == (b & 0x80)) and ((a & 0x80) != (result & 0x80))
+        overflow = ((a & self.sign) == (b & self.sign)) and ((a & self.sign) != (result & self.sign))
         return result & self.mask, self._flags(result, carry, overflow)
     
     def sub(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         """SUB: A - B"""
         result = a - b
         carry = result >= 0
-        overflow = ((a & 0x80) != (b & 0x80)) and ((a & 0x80) != (result & 0x80))
+        overflow = ((a & self.sign) != (b & self.sign)) and ((a & self.sign) != (result & self.sign))
         return result & self.mask, self._flags(result, carry, overflow)
     
     def inc_a(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         """INC A: A + 1"""
         result = a + 1
         carry = result > self.mask
-        overflow = (a == 0x7F)
+        overflow = (a == self.sign - 1)
         return result & self.mask, self._flags(result, carry, overflow)
     
     def dec_a(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         """DEC A: A - 1"""
         result = a - 1
         carry = result >= 0
-        overflow = (a == 0x80)
+        overflow = (a == self.sign)
         return result & self.mask, self._flags(result, carry, overflow)
     
     def lsl(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         """LSL: Logical shift left"""
-        carry = bool(a & 0x80)
+        carry = bool(a & self.sign)
         result = (a << 1) & self.mask
         return result, self._flags(result, carry, False)
     
@@ -123,16 +124,16 @@ class ALU8Bit:
     def asr(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         """ASR: Arithmetic shift right"""
         carry = bool(a & 0x01)
-        sign_bit = a & 0x80
+        sign_bit = a & self.sign
         result = ((a >> 1) | sign_bit) & self.mask
         return result, self._flags(result, carry, False)
     
     def rev_a(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         """REV A: Reverse bits"""
         result = 0
-        for i in range(8):
+        for i in range(self.width):
             if a & (1 << i):
-                result |= (1 << (7 - i))
+                result |= (1 << (self.width - 1 - i))
         return result, self._flags(result, False, False)
     
     def nand(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
@@ -177,7 +178,7 @@ class ALU8Bit:
         """CMP: Compare (flags only)"""
         result = a - b
         carry = result >= 0
-        overflow = ((a & 0x80) != (b & 0x80)) and ((a & 0x80) != (result & 0x80))
+        overflow = ((a & self.sign) != (b & self.sign)) and ((a & self.sign) != (result & self.sign))
         return 0, self._flags(result, carry, overflow)
     
     def not_a(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
@@ -216,9 +217,11 @@ def test_load_vectors(test_vectors):
     assert len(test_vectors) == 1900, f"Expected 1900 tests, got {len(test_vectors)}"
 
 
-@pytest.mark.parametrize("test_data", load_test_vectors(), ids=lambda t: t.get('test_name', 'unknown'))
-def test_alu_operation(test_data):
-    """Test each ALU operation from test vectors"""
+# Under pytest, the vectors themselves are run through ALU8Bit by the
+# pytest_alu_vectors plugin (see conftest.py): one batched item per
+# (file, opcode) instead of one per vector.
+def check_alu_operation(test_data):
+    """Check one ALU operation from a test vector (standalone mode)"""
     test_name = test_data.get('test_name', 'unknown')
     opcode = test_data.get('opcode', '')
     a = int(test_data.get('A', 0))
@@ -426,7 +429,7 @@ def main():
         op_name = test_data.get('test_name', '').split('_')[0]
         
         try:
-            test_alu_operation(test_data)
+            check_alu_operation(test_data)
             op_stats[opcode]["passed"] += 1
             op_stats[opcode]["name"] = op_name
         except AssertionError:
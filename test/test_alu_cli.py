@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tests for batch mode of the ALU command line interface (alu_cli.py).
+Run with: pytest test_alu_cli.py -v
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+CLI = Path(__file__).resolve().parent.parent / "alu_cli.py"
+
+
+def run_batch(text, *options):
+    return subprocess.run([sys.executable, str(CLI), "--batch", "-", *options],
+                          input=text, capture_output=True, text=True, check=False)
+
+
+def test_batch_prints_one_line_per_operation():
+    run = run_batch("ADD 200 100\n# comment\n\nCMP 5 5\n")
+    assert run.returncode == 0, run.stderr
+    assert run.stdout.splitlines() == ["ADD   200 100 ->  44  --C-", "CMP     5   5 ->   0  -ZC-"]
+
+
+def test_batch_reports_malformed_lines_and_continues():
+    run = run_batch("ADD 1 2\nADD 1\nADD 300 1\nFROB 1 2\nADD x 1\nSUB 0x05 0x03\n", "--quiet")
+    assert run.returncode == 1
+    assert run.stdout.split() == ["3", "2"]
+    errors = run.stderr.splitlines()
+    assert errors[0] == "Error: line 2: expected: OP A B"
+    assert errors[1] == "Error: line 3: operands out of 8-bit range (0-255)"
+    assert errors[2] == "Error: line 4: Unknown operation: FROB"
+    assert errors[3].startswith("Error: line 5: invalid literal")
+    assert len(errors) == 4
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Tests for the adder/shifter architecture explorer (tools/arch_explore.py).
+Run with: pytest test_arch_explore.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from alu_netlist import build_alu_netlist
+from arch_explore import (ADDERS, SHIFTERS, adder_vectors, build_adder, check_adder, check_alu,
+                          sensitized_delay, static_delay)
+
+
+@pytest.mark.parametrize("width", [8, 13, 32])
+@pytest.mark.parametrize("adder", sorted(ADDERS))
+def test_adders_match_golden_model(adder, width):
+    # 8 bits is exhaustive; 13 leaves a partial block
+    assert check_adder(build_adder(ADDERS[adder], width), random.Random(1)) == []
+
+
+@pytest.mark.parametrize("shifter", sorted(SHIFTERS))
+@pytest.mark.parametrize("adder", sorted(ADDERS))
+def test_alu_variants_match_golden_model(adder, shifter):
+    netlist = build_alu_netlist(16, ADDERS[adder], SHIFTERS[shifter])
+    assert check_alu(netlist, random.Random(1)) == []
+
+
+def test_carry_skip_only_gains_with_sensitization():
+    vectors = adder_vectors(32, random.Random(1))
+    ripple = build_adder(ADDERS["ripple"], 32)
+    skip = build_adder(ADDERS["skip"], 32)
+    assert sensitized_delay(ripple, vectors) == static_delay(ripple)
+    assert static_delay(skip) > static_delay(ripple)
+    assert sensitized_delay(skip, vectors) < static_delay(ripple) / 2
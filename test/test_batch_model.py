@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the persisted, memory-mapped golden-model tables (batch_model.py).
+Run with: pytest test_batch_model.py -v
+"""
+
+from array import array
+
+import pytest
+
+import batch_model
+from batch_model import build_table, map_tables, pack_outcome, table_path
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    path = tmp_path_factory.mktemp("tables")
+    map_tables(path)
+    return path
+
+
+def test_mapped_tables_match_golden_model(cache_dir):
+    tables = map_tables(cache_dir)
+    assert table_path(cache_dir).exists()
+    assert list(tables) == [code for _, code, _ in OPERATIONS]
+    for code, table in tables.items():
+        assert len(table) == 65536
+        for a, b in ((0, 0), (0x7F, 0x01), (0x80, 0xFF), (0xFF, 0xFF)):
+            assert table[a << 8 | b] == pack_outcome(*compute_alu_operation(code, a, b))
+    assert tables["01010"] == build_table("01010")
+
+
+def test_tables_are_mapped_not_rebuilt(cache_dir, tmp_path, monkeypatch):
+    assert map_tables(tmp_path, build=False) is None
+
+    def fail(opcode):
+        raise AssertionError("table rebuilt")
+
+    monkeypatch.setattr(batch_model, "build_table", fail)
+    assert map_tables(cache_dir)["00000"][0xFF01] == 0x300  # 0xFF + 1: zero result, carry + zero
+
+
+def test_model_change_rebuilds_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_model, "build_table", lambda opcode: array("H", bytes(2 * 65536)))
+    old = table_path(tmp_path)
+    map_tables(tmp_path)
+    monkeypatch.setattr(batch_model, "TABLE_FORMAT", batch_model.TABLE_FORMAT + 1)
+    assert table_path(tmp_path) != old
+    map_tables(tmp_path)
+    assert table_path(tmp_path).exists() and not old.exists()
+
+
+def test_missing_tables_are_probed_once(monkeypatch):
+    probes = []
+
+    def probe(cache_dir=None, build=True):
+        probes.append(build)
+        return None
+
+    monkeypatch.setattr(batch_model, "_TABLES", {})
+    monkeypatch.setattr(batch_model, "_PROBED", False)
+    monkeypatch.setattr(batch_model, "map_tables", probe)
+    for _ in range(3):
+        assert batch_model.evaluate_batch("00000", [0xFF], [0x01]) == [0x300]
+    assert probes == [False]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the BDD package and BDD equivalence checking (tools/bdd.py, tools/bdd_equiv.py).
+Run with: pytest test_bdd_equiv.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from alu_netlist import Gate, build_alu_netlist
+from bdd import BDD, FALSE, TRUE, add, bus, interleaved
+from bdd_equiv import check_opcode, golden_spec
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+
+
+def test_bdd_is_canonical():
+    bdd = BDD(["x", "y", "z"])
+    x, y, z = (bdd.var(name) for name in "xyz")
+    assert bdd.or_(bdd.and_(x, y), bdd.and_(x, z)) == bdd.and_(x, bdd.or_(y, z))
+    assert bdd.xor(x, bdd.xor(x, y)) == y
+    assert bdd.and_(x, bdd.not_(x)) == FALSE and bdd.or_(x, bdd.not_(x)) == TRUE
+    assert bdd.count(bdd.or_(x, y)) == 6
+    witness = bdd.satisfy_one(bdd.and_(bdd.not_(x), z))
+    assert witness == {"x": 0, "z": 1}
+
+
+def test_interleaved_adder_is_linear():
+    sizes = []
+    for width in (8, 16, 32):
+        bdd = BDD(interleaved(("A", "B"), width))
+        total, carry = add(bdd, [bdd.var(bit) for bit in bus("A", width)],
+                           [bdd.var(bit) for bit in bus("B", width)])
+        sizes.append(bdd.size([carry]))
+    assert sizes == [3 * width - 1 for width in (8, 16, 32)]
+
+
+@pytest.mark.parametrize("name,opcode", [(name, code) for name, code, _ in OPERATIONS])
+def test_golden_spec_matches_golden_model(name, opcode):
+    width = 4
+    bdd = BDD(interleaved(("A", "B"), width))
+    spec = golden_spec(bdd, name, [bdd.var(bit) for bit in bus("A", width)],
+                       [bdd.var(bit) for bit in bus("B", width)])
+    for a in range(16):
+        for b in range(16):
+            point = {f"A[{i}]": a >> i & 1 for i in range(width)}
+            point.update({f"B[{i}]": b >> i & 1 for i in range(width)})
+            result, flags = compute_alu_operation(opcode, a, b, width)
+            assert sum(bdd.evaluate(bit, point) << i
+                       for i, bit in enumerate(spec["result"])) == result
+            for flag, value in flags.items():
+                assert bdd.evaluate(spec[flag], point) == int(value), (flag, a, b)
+
+
+def test_gate_netlist_equivalent_at_16_bits():
+    for name, opcode, _ in OPERATIONS:
+        result = check_opcode("gates", 16, name, opcode)
+        assert not result.mismatches and not result.error, name
+
+
+def test_counterexample_for_broken_netlist():
+    netlist = build_alu_netlist(16)
+    index = netlist.driver["s[9]"]
+    gate = netlist.gates[index]
+    netlist.gates[index] = Gate(gate.output, "XNOR", gate.inputs)
+
+    result = check_opcode("gates", 16, "ADD", "00000", gates=netlist)
+    assert result.failed
+    for mismatch in result.mismatches:
+        value, flags = compute_alu_operation("00000", mismatch.a, mismatch.b, 16)
+        assert mismatch.golden != mismatch.netlist
+        if mismatch.output == "OUT[9]":
+            assert mismatch.golden == value >> 9 & 1
+    assert "OUT[9]" in {m.output for m in result.mismatches}
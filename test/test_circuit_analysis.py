@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for hierarchical Logisim circuit analysis (tools/circuit_analysis.py).
+Run with: pytest test_circuit_analysis.py -v
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from circuit_analysis import CircuitCache, Design, gate_count, transistor_counts
+
+# top -> 2x half (same file) + 2x slice (file#slice.circ); half -> slice
+TOP = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<project source="3.8.0" version="1.0">
+  <lib desc="#Wiring" name="0"/>
+  <lib desc="#Gates" name="1"/>
+  <lib desc="file#slice.circ" name="2"/>
+  <main name="top"/>
+  <circuit name="top">
+    <comp lib="0" loc="(10,10)" name="Pin"/>
+    <comp loc="(50,10)" name="half"/>
+    <comp loc="(50,50)" name="half"/>
+    <comp lib="2" loc="(90,10)" name="slice"/>
+    <comp lib="2" loc="(90,50)" name="slice"/>
+  </circuit>
+  <circuit name="half">
+    <comp lib="1" loc="(30,30)" name="NOT Gate"/>
+    <comp lib="2" loc="(60,30)" name="slice"/>
+  </circuit>
+  <circuit name="loop">
+    <comp loc="(30,30)" name="loop_inner"/>
+  </circuit>
+  <circuit name="loop_inner">
+    <comp loc="(30,30)" name="loop"/>
+  </circuit>
+</project>
+"""
+
+SLICE = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<project source="3.8.0" version="1.0">
+  <lib desc="#Gates" name="1"/>
+  <main name="slice"/>
+  <circuit name="slice">
+    <comp lib="1" loc="(30,30)" name="AND Gate">
+      <a name="width" val="8"/>
+    </comp>
+    <comp lib="1" loc="(30,70)" name="XOR Gate"/>
+  </circuit>
+</project>
+"""
+
+
+@pytest.fixture
+def design_files(tmp_path):
+    (tmp_path / "slice.circ").write_text(SLICE)
+    top = tmp_path / "top.circ"
+    top.write_text(TOP)
+    return top
+
+
+def test_expands_same_file_and_library_subcircuits(design_files):
+    design = Design(design_files)
+    leaves = design.leaf_counts()
+
+    # 2 halves (NOT + slice each) + 2 direct slices = 2 NOT, 4 AND8, 4 XOR, 1 Pin
+    assert sum(leaves.values()) == 11
+    assert gate_count(leaves) == 2 + 4 * 8 + 4
+    discrete, ic, excluded = transistor_counts(leaves)
+    assert (discrete, ic, dict(excluded)) == (2 * 2 + 4 * 6 * 8, 4 * 14, {"Pin": 1})
+
+    rows = design.hierarchy()
+    assert [row[:3] for row in rows] == [
+        (0, "top", 1), (1, "slice", 2), (1, "half", 2), (2, "slice", 1)]
+    assert [row[3] for row in rows] == [11, 2, 3, 2]
+    # The library is parsed once and each subcircuit expanded once
+    assert design.cache.misses == 2
+    slice_file = design.cache.load(design_files.parent / "slice.circ")
+    assert design.leaf_counts("slice", slice_file) is design.leaf_counts("slice", slice_file)
+
+
+def test_recursive_instance_is_an_error(design_files):
+    with pytest.raises(ValueError, match="Recursive subcircuit"):
+        Design(design_files).leaf_counts("loop")
+
+
+def test_cache_hits_on_touched_but_unchanged_file(design_files, tmp_path):
+    cache_dir = tmp_path / "cache"
+    first = CircuitCache(cache_dir)
+    first.load(design_files)
+    assert (first.hits, first.misses) == (0, 1)
+
+    stat = design_files.stat()
+    os.utime(design_files, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    touched = CircuitCache(cache_dir)
+    parsed = touched.load(design_files)
+    assert (touched.hits, touched.misses) == (1, 0)
+    assert set(parsed.circuits) == {"top", "half", "loop", "loop_inner"}
+
+    design_files.write_text(TOP.replace('name="NOT Gate"', 'name="NAND Gate"'))
+    edited = CircuitCache(cache_dir)
+    edited.load(design_files)
+    assert (edited.hits, edited.misses) == (0, 1)
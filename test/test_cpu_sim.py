@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the register-machine simulator (tools/cpu_sim.py).
+Run with: pytest test_cpu_sim.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+TOOLS = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS))
+
+from cpu_sim import CONDITIONS, AssemblyError, Machine, assemble
+
+
+def run(source, max_steps=10_000, **registers):
+    machine = Machine(*assemble(source))
+    for name, value in registers.items():
+        machine.regs[int(name[1:])] = value
+    executed = machine.run(max_steps)
+    return machine, executed
+
+
+@pytest.mark.parametrize("source, message", [
+    ("FOO R1, R2", "line 1: unknown instruction 'FOO'"),
+    ("NOP\nB nowhere", "line 2: unknown label 'nowhere'"),
+    ("LDI R0, 256", "immediate 256 does not fit in 8 bits"),
+    ("LDI R0, -129", "immediate -129 does not fit in 8 bits"),
+    ("LDI R0, x", "bad immediate 'x'"),
+    ("LD R0, R1", "LD expects \\[Rn\\] as its address"),
+    ("ST R0, [R8]", "ST expects \\[Rn\\] as its address"),
+    ("ADD R0, R1", "ADD takes 3 operand"),
+    ("a: NOP\na: NOP", "line 2: duplicate label 'a'"),
+])
+def test_assembler_errors(source, message):
+    with pytest.raises(AssemblyError, match=message):
+        assemble(source)
+
+
+def signed(value):
+    return value - 256 if value & 0x80 else value
+
+
+# What each condition means after CMP a, b (C = no borrow)
+MEANINGS = {
+    "": lambda a, b: True,
+    "EQ": lambda a, b: a == b, "NE": lambda a, b: a != b,
+    "CS": lambda a, b: a >= b, "HS": lambda a, b: a >= b,
+    "CC": lambda a, b: a < b, "LO": lambda a, b: a < b,
+    "MI": lambda a, b: bool((a - b) & 0x80), "PL": lambda a, b: not (a - b) & 0x80,
+    "VS": lambda a, b: not -128 <= signed(a) - signed(b) <= 127,
+    "VC": lambda a, b: -128 <= signed(a) - signed(b) <= 127,
+    "HI": lambda a, b: a > b, "LS": lambda a, b: a <= b,
+    "GE": lambda a, b: signed(a) >= signed(b), "LT": lambda a, b: signed(a) < signed(b),
+    "GT": lambda a, b: signed(a) > signed(b), "LE": lambda a, b: signed(a) <= signed(b),
+}
+
+
+@pytest.mark.parametrize("cc", sorted(CONDITIONS))
+def test_branch_conditions(cc):
+    program = f"""
+        CMP  R0, R1
+        B{cc} taken
+        LDI  R2, 1
+        HALT
+taken:  LDI  R2, 2
+        HALT
+    """
+    values = (0x00, 0x01, 0x7F, 0x80, 0x81, 0xFF)
+    for a in values:
+        for b in values:
+            machine, _ = run(program, R0=a, R1=b)
+            assert machine.regs[2] == (2 if MEANINGS[cc](a, b) else 1), (cc, a, b)
+
+
+def test_load_and_store():
+    machine, executed = run("""
+        LDI R0, 0x10
+        LDI R1, 0xAB
+        ST  R1, [R0]
+        LD  R2, [R0]
+        HALT
+    """)
+    assert machine.memory[0x10] == 0xAB and machine.regs[2] == 0xAB
+    assert machine.halted and executed == 5
+
+
+def test_step_limit_and_falling_off_the_end():
+    machine, executed = run("loop: B loop", max_steps=1000)
+    assert executed == 1000 and not machine.halted
+    assert machine.board_time_ns() == (0.0, 0.0)
+    assert machine.board_time_ns(10.0) == (10_000.0, 10_000.0)
+
+    machine, executed = run("NOP\nNOP")
+    assert executed == 2 and machine.halted
+
+
+def test_multiply_program():
+    source = (TOOLS / "programs" / "multiply.asm").read_text()
+    for a, b in ((200, 123), (0, 77), (255, 255), (1, 1)):
+        machine, _ = run(source, R0=a, R1=b)
+        assert machine.halted
+        assert machine.regs[3] << 8 | machine.regs[2] == a * b
+    self_timed, clocked = machine.board_time_ns()
+    assert 0 < self_timed < clocked
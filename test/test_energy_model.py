@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the PPA.md-calibrated energy model.
+Run with: pytest test_energy_model.py -v
+"""
+
+import pytest
+
+import energy_model
+from energy_model import (BASE_ENERGY_J, NOMINAL_CURRENT_A, STRESS_ENERGY_J, SUPPLY_V,
+                          TOGGLE_BITS, TOGGLE_ENERGY_J, EnergyMeter, dict_vectors, measure,
+                          toggle_words)
+from exhaustive_vectors import compute_alu_operation
+
+
+def test_calibration_reproduces_full_stress():
+    """Base plus every signal toggling, plus nominal static, is the 2.5 uJ stress figure"""
+    static = SUPPLY_V * NOMINAL_CURRENT_A / 1e6
+    assert BASE_ENERGY_J + TOGGLE_BITS * TOGGLE_ENERGY_J + static == pytest.approx(STRESS_ENERGY_J)
+    assert 0 < TOGGLE_ENERGY_J < BASE_ENERGY_J
+
+
+@pytest.mark.parametrize("opcode,a,b", [(0b00000, 0xFF, 0x01), (0b00001, 0x00, 0x01),
+                                        (0b10000, 0x42, 0x42), (0b00111, 0x5A, 0x00)])
+def test_toggle_words_match_golden_model(opcode, a, b):
+    result, flags = compute_alu_operation(format(opcode, "05b"), a, b)
+    expected = (a | b << 8 | opcode << 16 | result << 21 | flags["carry"] << 29
+                | flags["zero"] << 30 | flags["overflow"] << 31 | flags["negative"] << 32)
+    assert toggle_words(opcode)[a << 8 | b] == expected
+
+
+def test_repeated_vector_only_toggles_once():
+    word = toggle_words(0b00000)[0x12 << 8 | 0x34]
+    meter = measure([(0b00000, 0x12, 0x34)] * 10)
+    assert meter.toggles == bin(word).count("1")
+    assert meter.per_op["ADD"].count == 10
+
+
+def test_chunking_does_not_change_the_result(monkeypatch):
+    vectors = [(opcode, (7 * i) & 0xFF, (13 * i) & 0xFF)
+               for i, opcode in enumerate([0b00000, 0b00001, 0b01010, 0b10000] * 50)]
+    whole = measure(vectors)
+    monkeypatch.setattr(energy_model, "CHUNK", 7)
+    chunked = EnergyMeter().feed(vectors[:100]).feed(vectors[100:])
+    assert chunked.toggles == whole.toggles
+    assert chunked.energy_j == pytest.approx(whole.energy_j)
+    assert sum(op.energy_j for op in whole.per_op.values()) == pytest.approx(whole.energy_j)
+
+
+def test_ordering_changes_toggle_energy_only():
+    """Reordering a set keeps static and base energy and moves the toggle share"""
+    gray = [(0b00000, a ^ (a >> 1), 0) for a in range(256)]
+    scattered = sorted(gray, key=lambda vector: (vector[1] * 37) & 0xFF)
+    low, high = measure(gray), measure(scattered)
+    assert low.static_j == pytest.approx(high.static_j)
+    assert low.base_j == pytest.approx(high.base_j)
+    assert low.toggles < high.toggles
+
+
+def test_static_energy_scales_with_period():
+    vectors = list(dict_vectors([{"opcode": "00000", "A": 0xFF, "B": 0xFF}]))
+    assert measure(vectors, 0.5e6).static_j == pytest.approx(2 * measure(vectors, 1e6).static_j)
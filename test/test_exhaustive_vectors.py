@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-demand exhaustive vector generator.
+Run with: pytest test_exhaustive_vectors.py -v
+"""
+
+from collections import Counter
+
+import pytest
+
+from exhaustive_vectors import (
+    IGNORED_OPERAND_SAMPLES,
+    OPERATIONS,
+    compute_alu_operation,
+    count_vectors,
+    generate_exhaustive_vectors,
+    ignored_operand_samples,
+    operand_dependence,
+    operand_pairs,
+)
+
+
+def test_full_sweep_count():
+    """Default generation still covers every operand pair"""
+    assert count_vectors() == 19 * 256 * 256
+
+
+def test_reduced_sweep_per_opcode():
+    """Unary opcodes get 256 distinct pairs, binary opcodes keep 65,536"""
+    for _, _, operands in OPERATIONS:
+        pairs = list(operand_pairs(operands, reduce_operands=True))
+        assert len(set(pairs)) == len(pairs)
+        assert len(pairs) == (256 * 256 if operands == "AB" else 256)
+
+
+def test_reduced_generator_matches_count():
+    """count_vectors agrees with what the reduced generator yields"""
+    unary = [op for op in OPERATIONS if op[2] != "AB"]
+    per_opcode = Counter(v["opcode"] for v in generate_exhaustive_vectors(True, 2)
+                         if v["opcode"] in {code for _, code, _ in unary})
+    assert all(count == 256 * 3 for count in per_opcode.values())
+    assert count_vectors(True, 2) == 9 * 256 * 256 + len(unary) * 256 * 3
+    with pytest.raises(ValueError):
+        count_vectors(True, -1)
+
+
+@pytest.mark.parametrize("name,opcode,operands",
+                         [op for op in OPERATIONS if op[2] != "AB"],
+                         ids=lambda value: str(value))
+def test_ignored_operand_has_no_effect(name, opcode, operands):
+    """The registry only marks operands as ignored when the model agrees"""
+    for value in range(256):
+        baseline = compute_alu_operation(opcode, value, 0) if operands == "A" \
+            else compute_alu_operation(opcode, 0, value)
+        for ignored in IGNORED_OPERAND_SAMPLES:
+            if operands == "A":
+                assert compute_alu_operation(opcode, value, ignored) == baseline
+            else:
+                assert compute_alu_operation(opcode, ignored, value) == baseline
+
+
+def test_operand_dependence_lookup():
+    """Registry lookups by opcode"""
+    assert operand_dependence("00000") == "AB"
+    assert operand_dependence("00010") == "A"
+    assert operand_dependence("10010") == "B"
+    with pytest.raises(ValueError):
+        operand_dependence("11111")
+
+
+def signed(value, width):
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+@pytest.mark.parametrize("width", [4, 5])
+def test_arithmetic_flags_scale_with_width(width):
+    """ADD/SUB/CMP flags match two's-complement arithmetic at other widths"""
+    limit = 1 << width
+    low, high = -(limit >> 1), (limit >> 1) - 1
+    for a in range(limit):
+        for b in range(limit):
+            result, flags = compute_alu_operation("00000", a, b, width)
+            assert result == (a + b) % limit
+            assert flags["carry"] == (a + b >= limit)
+            assert flags["overflow"] == (not low <= signed(a, width) + signed(b, width) <= high)
+            result, flags = compute_alu_operation("00001", a, b, width)
+            assert flags["carry"] == (a >= b)
+            assert flags["overflow"] == (not low <= signed(a, width) - signed(b, width) <= high)
+            assert flags["negative"] == bool(result >> (width - 1))
+            assert compute_alu_operation("10000", a, b, width) == (0, flags)
+
+
+def test_sixteen_bit_spot_checks():
+    assert compute_alu_operation("00010", 0x7FFF, 0, 16) == \
+        (0x8000, {"carry": False, "overflow": True, "zero": False, "negative": True})
+    assert compute_alu_operation("00111", 0x0001, 0, 16)[0] == 0x8000
+    assert compute_alu_operation("00110", 0x8002, 0, 16)[0] == 0xC001
+    assert compute_alu_operation("00100", 0x8000, 0, 16) == \
+        (0, {"carry": True, "overflow": False, "zero": True, "negative": False})
+
+
+def test_width_sweep_counts():
+    """Exhaustive generation at 4 bits yields 2**4 x 2**4 pairs per opcode"""
+    assert count_vectors(width=4) == 19 * 16 * 16
+    assert sum(1 for _ in generate_exhaustive_vectors(width=4)) == 19 * 16 * 16
+    assert count_vectors(True, 1, width=4) == 9 * 256 + 10 * 16 * 2
+    assert ignored_operand_samples(8) == IGNORED_OPERAND_SAMPLES
+    assert next(generate_exhaustive_vectors(width=16))["test_name"] == "ADD_0000_0000"
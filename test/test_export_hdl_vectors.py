@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the $readmemh vector exporter (tools/export_hdl_vectors.py).
+Run with: pytest test_export_hdl_vectors.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from batch_model import pack_outcome
+from export_hdl_vectors import (
+    CMP_OPCODE, FIELDS, HEX_DIGITS, WORD_BITS, export, exhaustive_words, pack_word,
+    resolve_opcodes,
+)
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+
+
+def unpack_word(word):
+    """Split a packed word into its struct fields, MSB first."""
+    fields = {}
+    shift = WORD_BITS
+    for name, bits in FIELDS:
+        shift -= bits
+        fields[name] = word >> shift & ((1 << bits) - 1)
+    return fields
+
+
+def test_pack_word_round_trips_golden_outcomes():
+    rng = random.Random(7)
+    for name, code, _ in OPERATIONS:
+        for _ in range(50):
+            a, b = rng.randrange(256), rng.randrange(256)
+            result, flags = compute_alu_operation(code, a, b)
+            _, cmp_flags = compute_alu_operation(CMP_OPCODE, a, b)
+            word = pack_word(int(code, 2), a, b, pack_outcome(result, flags),
+                             pack_outcome(0, cmp_flags))
+
+            assert word < 1 << WORD_BITS
+            assert unpack_word(word) == {
+                "less": int(a < b), "great": int(a > b), "equal": int(a == b),
+                "overflow": int(flags["overflow"]), "negative": int(flags["negative"]),
+                "zero": int(flags["zero"]), "carry": int(flags["carry"]), "opcode": int(code, 2),
+                "a": a, "b": b, "result": result & 0xFF,
+            }, (name, a, b)
+
+
+def test_exhaustive_words_filter_by_opcode():
+    opcodes = resolve_opcodes(["ADD", "10000"])
+    words = list(exhaustive_words(opcodes, reduce_operands=False))
+    assert len(words) == 2 * 256 * 256
+    assert {unpack_word(w)["opcode"] for w in words} == {int(code, 2) for code in opcodes}
+    with pytest.raises(ValueError, match="Unknown opcode"):
+        resolve_opcodes(["NOPE"])
+
+
+@pytest.mark.parametrize("count, chunk, sizes", [
+    (10, 4, [4, 4, 2]),
+    (8, 4, [4, 4]),
+    (3, 4, [3]),
+    (0, 4, []),
+])
+def test_export_chunk_boundaries_and_counts(tmp_path, count, chunk, sizes):
+    (tmp_path / "v_0009.hex").write_text("stale\n")
+    words = list(range(count))
+
+    assert export(iter(words), tmp_path, "v", chunk) == count
+
+    hex_files = sorted(tmp_path.glob("v_[0-9][0-9][0-9][0-9].hex"))
+    assert [p.name for p in hex_files] == [f"v_{i:04d}.hex" for i in range(len(sizes))]
+    lines = [p.read_text().splitlines() for p in hex_files]
+    assert [len(chunk_lines) for chunk_lines in lines] == sizes
+    assert [int(line, 16) for chunk_lines in lines for line in chunk_lines] == words
+    assert all(len(line) == HEX_DIGITS for chunk_lines in lines for line in chunk_lines)
+
+    # The testbench reads the count and chunk size from here at run time
+    assert (tmp_path / "v_count.hex").read_text().split() == [f"{count:08x}", f"{chunk:08x}"]
+    include = (tmp_path / "v.svh").read_text()
+    assert f"localparam VEC_CHUNK_SIZE = {chunk};" in include
+    assert f"localparam VEC_CHUNKS     = {len(sizes)};" in include
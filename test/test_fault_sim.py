@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel-pattern fault simulator (tools/fault_sim.py).
+Run with: pytest test_fault_sim.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from alu_netlist import build_alu_netlist, pack_vectors, unpack_bus
+from exhaustive_vectors import OPERATIONS
+from fault_sim import (Fault, FaultSimulator, adjacent_pairs, diagnose, enumerate_faults,
+                       file_batches, run_campaign)
+
+
+@pytest.fixture(scope="module")
+def netlist():
+    return build_alu_netlist()
+
+
+def random_vectors(count, seed):
+    rng = random.Random(seed)
+    return [(int(rng.choice(OPERATIONS)[1], 2), rng.randrange(256), rng.randrange(256))
+            for _ in range(count)]
+
+
+def test_fault_enumeration(netlist):
+    """One SA0 and one SA1 per net; bridges deduplicated, feedback pairs dropped"""
+    stuck = enumerate_faults(netlist, bridges=False)
+    assert len(stuck) == len(set(stuck)) == 2 * len(netlist.nets())
+
+    faults = enumerate_faults(netlist)
+    assert len(faults) == len(set(faults))
+    pairs = adjacent_pairs(netlist)
+    assert len(faults) == len(stuck) + 2 * len(pairs)
+    assert pairs == sorted(set(pairs)) and all(first < second for first, second in pairs)
+    assert ("A[0]", "A[1]") in pairs
+
+    readers = netlist.fanout()
+    for first, second in pairs:
+        for source, target in ((first, second), (second, first)):
+            driver = netlist.driver.get(target)
+            assert driver is None or driver not in netlist.cone([source], readers)
+
+
+def test_known_stuck_at_fault_is_detected(netlist):
+    simulator = FaultSimulator(netlist)
+    # ADD 0+0 leaves OUT[0] low, ADD 0+1 drives it high
+    vectors = [(0b00000, 0, 0), (0b00000, 0, 1)]
+    found = run_campaign(simulator, [Fault("SA0", ("OUT[0]",)), Fault("SA1", ("OUT[0]",))],
+                         file_batches(netlist, vectors))
+    assert found == {Fault("SA0", ("OUT[0]",)): 1, Fault("SA1", ("OUT[0]",)): 0}
+
+    rows = run_campaign(simulator, [Fault("SA0", ("OUT[0]",))], file_batches(netlist, vectors),
+                        drop=False)
+    assert rows == {Fault("SA0", ("OUT[0]",)): 0b10}
+
+
+def test_diagnose_ranks_injected_fault_first(netlist):
+    simulator = FaultSimulator(netlist)
+    injected = Fault("SA1", ("A[2]",))
+    vectors = random_vectors(200, seed=1)
+    words, mask = pack_vectors(netlist, vectors)
+    faulty = simulator.faulty_nets(injected, netlist.simulate(words, mask), mask)
+    results = unpack_bus(faulty, [f"OUT[{i}]" for i in range(8)], len(vectors))
+    observations = [{"opcode": format(opcode, "05b"), "A": a, "B": b, "actual_result": result}
+                    for (opcode, a, b), result in zip(vectors, results)]
+
+    ranking = diagnose(simulator, enumerate_faults(netlist), observations)
+    fault, explained, contradicted, unexplained = ranking[0]
+    assert fault == injected
+    assert explained > 0 and (contradicted, unexplained) == (0, 0)
+    assert ranking[1][1:] != ranking[0][1:]
+
+
+def test_diagnose_requires_measured_outputs(netlist):
+    with pytest.raises(ValueError, match="vector 2: missing 'actual_result'"):
+        diagnose(FaultSimulator(netlist), [],
+                 [{"opcode": "00000", "A": 1, "B": 2, "actual_result": 3},
+                  {"opcode": "00000", "A": 1, "B": 2}])
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the hierarchical KiCad BOM (tools/kicad_bom.py).
+Run with: pytest test_kicad_bom.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import kicad_index
+from kicad_bom import HierarchicalBom, part_category
+from kicad_index import KicadIndex
+
+
+def lib_symbol(lib_id, units):
+    name = lib_id.partition(":")[2]
+    parts = "".join(f'(symbol "{name}_{unit}_1" (pin input line (at 0 0 0) (name "P") (number "{unit}")))'
+                    for unit in units)
+    return f'(symbol "{lib_id}" {parts})'
+
+
+def symbol(lib_id, reference, value, unit=1):
+    return (f'(symbol (lib_id "{lib_id}") (at 0 0 0) (unit {unit}) (in_bom yes) '
+            f'(uuid "{reference}-{unit}") (property "Reference" "{reference}") '
+            f'(property "Value" "{value}") (property "Footprint" "FP"))')
+
+
+def sheet(name, target):
+    return (f'(sheet (at 0 0) (size 10 10) (uuid "{name}") (property "Sheetname" "{name}") '
+            f'(property "Sheetfile" "{target}"))')
+
+
+# One 74HC86 (gate units 1 and 2 plus power unit 5), one single-unit 74HC157,
+# a resistor and an NMOS
+MODULE = f"""(kicad_sch (uuid "module")
+  (lib_symbols {lib_symbol("74xx:74HC86", [1, 2, 3, 4, 5])} {lib_symbol("74xx:74HC157", [1])}
+               {lib_symbol("Device:R", [1])} {lib_symbol("Device:Q_NMOS_GSD", [1])})
+  {symbol("74xx:74HC86", "U1", "74HC86", 1)}
+  {symbol("74xx:74HC86", "U1", "74HC86", 2)}
+  {symbol("74xx:74HC86", "U1", "74HC86", 5)}
+  {symbol("74xx:74HC157", "U2", "74HC157")}
+  {symbol("Device:R", "R1", "10k")}
+  {symbol("Device:Q_NMOS_GSD", "Q1", "2N7002")}
+)
+"""
+
+BOARD = f"""(kicad_sch (uuid "board")
+  (lib_symbols {lib_symbol("Connector:Conn_01x02", [1])})
+  {symbol("Connector:Conn_01x02", "J1", "Conn")}
+  {sheet("xor_a", "../../modules/gate_xor_2in/gate_xor_2in.kicad_sch")}
+  {sheet("xor_b", "../../modules/gate_xor_2in/gate_xor_2in.kicad_sch")}
+)
+"""
+
+
+@pytest.fixture
+def bom(tmp_path, monkeypatch):
+    monkeypatch.setattr(kicad_index, "ROOT", tmp_path)
+    kicad = tmp_path / "schematics" / "kicad"
+    for relative, text in (("boards/demo/demo.kicad_sch", BOARD),
+                           ("modules/gate_xor_2in/gate_xor_2in.kicad_sch", MODULE)):
+        path = kicad / relative
+        path.parent.mkdir(parents=True)
+        path.write_text(text)
+    return HierarchicalBom(KicadIndex(kicad, None).update(jobs=1))
+
+
+def test_module_counts_units_once_per_package(bom):
+    totals = bom.totals("schematics/kicad/modules/gate_xor_2in/gate_xor_2in.kicad_sch")
+    # 2 XOR units (power unit 5 adds none) + all 4 channels of the single-unit 74HC157
+    assert (totals["XOR"], totals["MUX2"]) == (2, 4)
+    assert totals["ic_transistors"] == 2 * 14 + 4 * 16
+    assert (totals["ic_packages"], totals["resistors"], totals["discrete"]) == (2, 1, 1)
+
+
+def test_board_multiplies_sub_sheet_instances(bom):
+    assert bom.boards() == ["schematics/kicad/boards/demo/demo.kicad_sch"]
+    board = bom.boards()[0]
+    totals = bom.totals(board)
+    assert {column: totals[column] for column in
+            ("discrete", "ic_transistors", "ic_packages", "resistors", "connectors")} == {
+        "discrete": 2, "ic_transistors": 2 * 92, "ic_packages": 4, "resistors": 2, "connectors": 1}
+    assert bom.parts(board)[("74HC86", "74xx:74HC86", "FP")] == 2
+    assert bom.parts(board)[("Conn", "Connector:Conn_01x02", "FP")] == 1
+    # The module counts as one gate of its kind per instance
+    assert bom.gates(board) == {"XOR 2-in": 2}
+
+
+@pytest.mark.parametrize("lib_id, category", [
+    ("Connector:Conn_01x02", "connectors"),
+    ("Device:Q_NMOS_GSD", "discrete"),
+    ("Custom:PMOS", "discrete"),
+    ("Device:R", "resistors"),
+    ("Device:R_Small", "resistors"),
+    ("Device:LED", "leds"),
+    ("Device:C_Small", "capacitors"),
+    ("74xx:74HC86", "ic_packages"),
+    ("Device:Crystal", "other"),
+])
+def test_part_category(lib_id, category):
+    assert part_category(lib_id) == category
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the KiCad S-expression reader and cached index
+(tools/kicad_sexpr.py, tools/kicad_index.py).
+Run with: pytest test_kicad_index.py -v
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import kicad_index
+from kicad_index import KicadIndex
+from kicad_sexpr import parse, position, properties, value
+
+SCHEMATIC = """(kicad_sch (version 20231120) (uuid "root-uuid")
+  (lib_symbols)
+  (symbol (lib_id "Device:R") (at 10 20 90) (unit 1)
+    (property "Reference" "R1") (property "Value" "10k"))
+  (label "MID" (at 5 5 0))
+)
+"""
+
+
+def test_parse_nested_atoms_and_helpers():
+    tree = parse('(root (at 1.5 -2) (name "a b") (flag))')
+    assert tree == ["root", ["at", "1.5", "-2"], ["name", "a b"], ["flag"]]
+    assert value(tree, "name") == "a b"
+    assert value(tree, "flag", "none") == "none"
+    assert position(tree) == (1.5, -2.0, 0.0)
+
+
+def test_quoted_string_escapes():
+    tree = parse(r'(property "Notes" "line 1\nline 2\ttab \"quoted\" back\\slash \q")')
+    assert properties([tree]) == {"Notes": 'line 1\nline 2\ttab "quoted" back\\slash q'}
+
+
+@pytest.mark.parametrize("text, message", [
+    ("(a (b)", "Unbalanced or empty"),
+    ("(a))", r"Unbalanced '\)' at offset 3"),
+    ("", "Unbalanced or empty"),
+    ("atom", "Unbalanced or empty"),
+])
+def test_unbalanced_parentheses_are_errors(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse(text)
+
+
+@pytest.fixture
+def kicad_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(kicad_index, "ROOT", tmp_path)
+    directory = tmp_path / "kicad"
+    directory.mkdir()
+    (directory / "board.kicad_sch").write_text(SCHEMATIC)
+    return directory
+
+
+def test_index_reuses_touched_but_unchanged_file(kicad_dir, tmp_path, monkeypatch):
+    index_path = tmp_path / "index.json"
+    first = KicadIndex(kicad_dir, index_path).update(jobs=1)
+    assert (first.parsed, first.reused) == (1, 0)
+    entry = first.files[os.path.join("kicad", "board.kicad_sch")]
+    assert [s["reference"] for s in entry["symbols"]] == ["R1"]
+    assert entry["nets"] == ["MID"]
+
+    schematic = kicad_dir / "board.kicad_sch"
+    stat = schematic.stat()
+    os.utime(schematic, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    index_job = kicad_index._index_job
+
+    def fail(path):
+        raise AssertionError(f"{path} re-parsed")
+
+    monkeypatch.setattr(kicad_index, "_index_job", fail)
+    touched = KicadIndex(kicad_dir, index_path).update(jobs=1)
+    assert (touched.parsed, touched.reused) == (0, 1)
+    reused = touched.files[os.path.join("kicad", "board.kicad_sch")]
+    assert reused["symbols"] == entry["symbols"] and reused["sha256"] == entry["sha256"]
+    assert reused["mtime_ns"] == stat.st_mtime_ns + 10**9
+
+    monkeypatch.setattr(kicad_index, "_index_job", index_job)
+    schematic.write_text(SCHEMATIC.replace('"R1"', '"R2"'))
+    edited = KicadIndex(kicad_dir, index_path).update(jobs=1)
+    assert (edited.parsed, edited.reused) == (1, 0)
+
+
+def test_malformed_file_error_names_the_file(kicad_dir):
+    (kicad_dir / "broken.kicad_pcb").write_text("(kicad_pcb (net 0 \"\")")
+    with pytest.raises(ValueError, match=r"broken\.kicad_pcb: Unbalanced"):
+        KicadIndex(kicad_dir, None).update(jobs=1)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the KiCad connectivity graph (tools/kicad_nets.py).
+Run with: pytest test_kicad_nets.py -v
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from kicad_index import KicadIndex
+from kicad_nets import NetGraph, build_graph, grid, pin_position, sheet_nets
+
+INVERTER = {"pins": [[0, 1, "1", "A", "input", -2.54, 0.0, 0.0],
+                     [0, 1, "2", "Y", "output", 2.54, 0.0, 180.0]],
+            "power": False}
+
+
+def symbol(reference, x, y, angle=0, mirror=None, lib_id="Sim:INV"):
+    return {"lib_id": lib_id, "reference": reference, "value": "INV", "footprint": "",
+            "unit": 1, "at": [x, y, angle], "mirror": mirror, "in_bom": True,
+            "uuid": reference, "instances": []}
+
+
+# IN -> U1 -> (T-junction) -> U2 (rotated 90) -> U3 (mirrored in y) -> OUT
+#
+#   U1.A (7.46, 10)    U1.Y (12.54, 10)
+#   U2.A (30, 12.54)   U2.Y (30, 7.46)
+#   U3.A (52.54, 10)   U3.Y (47.46, 10)
+SAMPLE = {
+    "kind": "sch", "uuid": "root", "sha256": "0",
+    "lib_symbols": {"Sim:INV": INVERTER},
+    "symbols": [symbol("U1", 10, 10), symbol("U2", 30, 10, angle=90),
+                symbol("U3", 50, 10, mirror="y")],
+    "labels": [{"kind": "global", "name": "IN", "at": [5, 10, 0], "shape": None},
+               {"kind": "local", "name": "MID", "at": [25, 10, 0], "shape": None},
+               {"kind": "global", "name": "OUT", "at": [45, 10, 0], "shape": None}],
+    "sheets": [],
+    "wires": [
+        [5, 10, 7.46, 10],
+        [12.54, 10, 25, 10],
+        [20, 10, 20, 20, 30, 20, 30, 12.54],   # starts on the span of the wire above
+        [30, 7.46, 52.54, 7.46, 52.54, 10],
+        [45, 10, 47.46, 10],
+    ],
+}
+BOARD = "schematics/kicad/boards/sample.kicad_sch"
+
+
+def sample_graph(entry=SAMPLE):
+    index = KicadIndex(index_path=None)
+    index.files = {BOARD: entry}
+    return NetGraph(build_graph(index))
+
+
+def test_pin_position_rotates_and_mirrors():
+    plain, rotated, mirrored = SAMPLE["symbols"]
+    assert pin_position(plain, -2.54, 0) == grid(7.46, 10)
+    assert pin_position(rotated, -2.54, 0) == grid(30, 12.54)
+    assert pin_position(rotated, 2.54, 0) == grid(30, 7.46)
+    assert pin_position(mirrored, -2.54, 0) == grid(52.54, 10)
+    # Library y points up, sheet y points down
+    assert pin_position(plain, 0, 2.54) == grid(10, 7.46)
+    assert pin_position(dict(plain, mirror="x"), 0, 2.54) == grid(10, 12.54)
+
+
+def test_sheet_nets_join_wires_at_t_junctions():
+    nets = sheet_nets(SAMPLE)
+    by_label = {name: net for net in nets for _, name in net["labels"]}
+    assert sorted(map(tuple, by_label["IN"]["pins"])) == [(0, "1")]
+    assert sorted(map(tuple, by_label["MID"]["pins"])) == [(0, "2"), (1, "1")]
+    assert sorted(map(tuple, by_label["OUT"]["pins"])) == [(2, "2")]
+    assert len(nets) == 4
+
+
+def test_path_follows_input_to_output_stages():
+    graph = sample_graph()
+    assert [graph.nets[net]["name"] for net in graph.find("mid")] == ["MID"]
+    (source,), (target,) = graph.find("IN"), graph.find("OUT")
+    hops = graph.path([source], [target])
+    assert [graph.components[graph.pins[load][1]][0] for _, load, _ in hops] == ["U1", "U2", "U3"]
+    assert hops[0][0] == source and graph.pins[hops[-1][2]][0] == target
+    assert [graph.describe_pin(pin) for pin in graph.drivers(target)] == ["sample:U3.2 (Y, INV)"]
+    assert graph.path([target], [source]) is None
+
+
+def test_missing_library_symbol_is_skipped():
+    entry = copy.deepcopy(SAMPLE)
+    entry["symbols"].append(symbol("U4", 7.46, 30, lib_id="Sim:GONE"))
+    graph = sample_graph(entry)
+    assert len(graph.components) == 3
+    assert all(pin[4] in ("input", "output") for pin in graph.pins)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the netlist-to-Python compiler (tools/netlist_compile.py).
+Run with: pytest test_netlist_compile.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from alu_netlist import build_alu_netlist, pack_vectors
+from exhaustive_vectors import OPERATIONS
+from netlist_compile import (
+    Builder,
+    compile_gates,
+    compile_yosys,
+    generate,
+    netlist_key,
+    opcode_constants,
+)
+import yosys_sim
+from yosys_sim import DEFAULT_DESIGN
+
+
+def random_vectors(count, seed):
+    rng = random.Random(seed)
+    return [(int(rng.choice(OPERATIONS)[1], 2), rng.randrange(256), rng.randrange(256))
+            for _ in range(count)]
+
+
+def test_builder_folds_and_shares():
+    builder = Builder()
+    a, b = builder.input("a"), builder.input("b")
+    not_a = builder.not_(a)
+    assert builder.and_(a, 0) == 0 and builder.and_(a, 1) == a
+    assert builder.or_(a, not_a) == 1 and builder.xor(a, a) == 0
+    assert builder.xor(a, 1) == not_a and builder.not_(not_a) == a
+    assert builder.and_(a, b) == builder.and_(b, a)
+
+    dead = builder.or_(a, b)
+    source = generate(builder, {"y": builder.xor(builder.and_(a, b), 1), "z": 0}, "test", "key")
+    assert f"n{dead} =" not in source
+    namespace = {}
+    exec(source, namespace)
+    assert namespace["evaluate"]({"a": 0b1100, "b": 0b1010}, 0b1111) == {"y": 0b0111, "z": 0}
+
+
+def test_compiled_gates_match_interpreter(tmp_path):
+    netlist = build_alu_netlist()
+    compiled = compile_gates(netlist, cache_dir=tmp_path)
+    assert not compiled.cached and compile_gates(netlist, cache_dir=tmp_path).cached
+
+    words, mask = pack_vectors(netlist, random_vectors(2000, seed=3))
+    reference = netlist.simulate(words, mask)
+    result = compiled.evaluate(words, mask)
+    assert result == {name: reference[name] for name in netlist.outputs}
+
+
+def test_cache_key_covers_cell_lowering(tmp_path, monkeypatch):
+    key = netlist_key("yosys", b"netlist")
+    edited = tmp_path / "yosys_sim.py"
+    edited.write_bytes(Path(yosys_sim.__file__).read_bytes() + b"\n# changed lowering\n")
+    monkeypatch.setattr(yosys_sim, "__file__", str(edited))
+    assert netlist_key("yosys", b"netlist") != key
+
+
+def test_specialized_opcode_folds_decoder():
+    netlist = build_alu_netlist()
+    general = compile_gates(netlist, cache_dir=None)
+    words, mask = pack_vectors(netlist, [(0b00001, a, b) for a in range(0, 256, 7)
+                                         for b in range(0, 256, 5)])
+    sub = compile_gates(netlist, opcode_constants("OP", "00001"), cache_dir=None)
+    assert sub.nets < general.nets // 2
+    assert not any(name.startswith("OP") for name in sub.inputs)
+    assert sub.evaluate(words, mask) == general.evaluate(words, mask)
+
+
+def test_compiled_yosys_netlist_adds():
+    compiled = compile_yosys(DEFAULT_DESIGN, constants=opcode_constants("Opcode", "00000"),
+                             cache_dir=None)
+    vectors = random_vectors(500, seed=5)
+    words = {f"{bus}[{k}]": sum((v[column] >> k & 1) << lane for lane, v in enumerate(vectors))
+             for bus, column in (("A", 1), ("B", 2)) for k in range(8)}
+    result = compiled.evaluate(words, (1 << len(vectors)) - 1)
+    for lane, (_, a, b) in enumerate(vectors):
+        total = sum((result[f"Result[{k}]"] >> lane & 1) << k for k in range(8))
+        total |= (result["CarryOut"] >> lane & 1) << 8
+        assert total == a + b
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tests for toggle-minimising vector ordering (tools/order_vectors.py).
+Run with: pytest test_order_vectors.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+from order_vectors import gray_order, gray_rank, greedy_order, sequence_cost
+from vector_io import encode_flags
+
+
+def records(count, seed):
+    rng = random.Random(seed)
+    vectors = []
+    for _ in range(count):
+        _, code, _ = rng.choice(OPERATIONS)
+        a, b = rng.randrange(256), rng.randrange(256)
+        result, flags = compute_alu_operation(code, a, b)
+        vectors.append((int(code, 2), a, b, result, encode_flags(flags)))
+    # Duplicates share an input word and must each appear once
+    return vectors + vectors[:5]
+
+
+def test_gray_rank_steps_one_bit():
+    values = sorted(range(256), key=gray_rank)
+    assert all((x ^ y).bit_count() == 1 for x, y in zip(values, values[1:]))
+
+
+def test_orders_are_permutations():
+    vectors = records(300, seed=1)
+    for order in (gray_order(vectors), greedy_order(vectors), greedy_order(vectors, ripple_weight=2)):
+        assert sorted(order) == list(range(len(vectors)))
+    assert greedy_order([]) == [] and gray_order([]) == []
+
+
+def test_greedy_never_toggles_more_than_file_order():
+    for seed in range(3):
+        vectors = records(500, seed)
+        ordered = [vectors[i] for i in greedy_order(vectors)]
+        assert sequence_cost(ordered)["toggles"] <= sequence_cost(vectors)["toggles"]
+
+
+def test_ripple_weight_trades_toggles_for_ripple():
+    vectors = records(500, seed=4)
+    plain = sequence_cost([vectors[i] for i in greedy_order(vectors)])
+    weighted = sequence_cost([vectors[i] for i in greedy_order(vectors, ripple_weight=2)])
+    assert weighted["ripple"] < plain["ripple"]
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for PCB net length and wire delay extraction (tools/pcb_nets.py).
+Run with: pytest test_pcb_nets.py -v
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from pcb_nets import analyze_board, arc_length, manhattan_mst, pad_positions
+
+
+def arc_through(radius, start_deg, end_deg):
+    """(x1, y1, xm, ym, x2, y2) of an arc around the origin, mid point halfway."""
+    points = []
+    for degrees in (start_deg, (start_deg + end_deg) / 2, end_deg):
+        angle = math.radians(degrees)
+        points += [radius * math.cos(angle), radius * math.sin(angle)]
+    return points
+
+
+@pytest.mark.parametrize("sweep", [90, 180, 270])
+def test_arc_length(sweep):
+    assert arc_length(*arc_through(2.0, 30, 30 + sweep)) == pytest.approx(2.0 * math.radians(sweep))
+    # Same arc traversed the other way round
+    assert arc_length(*arc_through(2.0, 30 + sweep, 30)) == pytest.approx(2.0 * math.radians(sweep))
+
+
+def test_straight_arc_is_its_chord():
+    assert arc_length(0, 0, 1, 1, 3, 3) == pytest.approx(3 * math.sqrt(2))
+
+
+def test_manhattan_mst():
+    assert manhattan_mst([]) == 0.0 and manhattan_mst([(1, 1, 0)]) == 0.0
+    # A chain (0,0) - (3,0) - (3,4): 3 + 4, never the 7-long diagonal pair
+    assert manhattan_mst([(0, 0, 0), (3, 0, 1), (3, 4, 2)]) == pytest.approx(7)
+    # Points already in one island join for free
+    assert manhattan_mst([(0, 0, 0), (10, 0, 0), (10, 5, 1)]) == pytest.approx(5)
+
+
+def test_pad_positions_rotate_with_footprint():
+    footprint = {"at": [10.0, 20.0, 90.0],
+                 "pads": [["1", "N", "", 1.0, 0.0, 0.0, 1.0, 1.0],
+                          ["2", "N", "", 0.0, 2.0, 0.0, 1.0, 1.0]]}
+    positions = [(x, y) for _, x, y in pad_positions(footprint)]
+    assert positions[0] == pytest.approx((10.0, 19.0))
+    assert positions[1] == pytest.approx((12.0, 20.0))
+    footprint["at"][2] = 0.0
+    assert [(x, y) for _, x, y in pad_positions(footprint)] == [(11.0, 20.0), (10.0, 22.0)]
+
+
+def board(segments):
+    pad = ["1", "SIG", "", 0.0, 0.0, 0.0, 1.0, 1.0]
+    return {
+        "footprints": [{"at": [0.0, 0.0, 0.0], "pads": [pad]},
+                       {"at": [10.0, 0.0, 0.0], "pads": [pad]},
+                       {"at": [10.0, 4.0, 0.0], "pads": [["1", "SIG", "G", 0.0, 0.0, 0.0, 1.0, 1.0]]}],
+        "segments": [[x1, y1, x2, y2, 0.25, "F.Cu", "SIG"] for x1, y1, x2, y2 in segments],
+        "arcs": [],
+        "vias": [],
+    }
+
+
+def test_analyze_board_joins_islands():
+    (row,) = analyze_board("test", board([]), 10.0, 40.0)
+    assert (row["pads"], row["islands"], row["segments"], row["gate_pins"]) == (3, 3, 0, 1)
+    assert row["routed_mm"] == 0 and row["estimated_mm"] == pytest.approx(14)
+
+    # A trace from the first pad to halfway merges nothing yet
+    (row,) = analyze_board("test", board([(0, 0, 5, 0)]), 10.0, 40.0)
+    assert row["islands"] == 3 and row["estimated_mm"] == pytest.approx(5 + 14)
+
+    # Two segments meeting mid-way join the first two pads into one island
+    (row,) = analyze_board("test", board([(0, 0, 5, 0), (5, 0, 10, 0)]), 10.0, 40.0)
+    assert (row["islands"], row["segments"]) == (2, 2)
+    assert row["routed_mm"] == pytest.approx(10) and row["estimated_mm"] == pytest.approx(14)
+    assert row["load_pf"] == 40.0 and row["wire_delay_ns"] > row["flight_ns"] > 0
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched vector-file pytest plugin.
+Run with: pytest test_pytest_alu_vectors.py -v
+"""
+
+import json
+
+from exhaustive_vectors import compute_alu_operation
+from test_alu import ALU8Bit
+
+
+def make_vector(name, opcode, a, b):
+    result, flags = compute_alu_operation(opcode, a, b)
+    return {"test_name": name, "opcode": opcode, "A": a, "B": b,
+            "expected_result": result, "expected_flags": flags}
+
+
+def write_vectors(pytester, vectors):
+    path = pytester.mkdir("vectors") / "suite.json"
+    path.write_text(json.dumps({"tests": vectors}))
+    return path
+
+
+def test_one_item_per_opcode(pytester):
+    """Collection yields one item per opcode present, not per vector"""
+    write_vectors(pytester, [make_vector(f"ADD_{a}", "00000", a, 3) for a in range(50)]
+                  + [make_vector(f"XOR_{a}", "01010", a, 7) for a in range(50)])
+    result = pytester.runpytest("-p", "pytest_alu_vectors", "--collect-only", "-q")
+    result.stdout.fnmatch_lines(["vectors/suite.json::00000-ADD",
+                                 "vectors/suite.json::01010-XOR",
+                                 "2 tests collected*"])
+
+
+def test_failing_chunk_reports_each_vector(pytester):
+    """Only the failing chunk fails, and it names the offending vectors"""
+    vectors = [make_vector(f"ADD_{a}", "00000", a, 3) for a in range(50)]
+    vectors += [make_vector("SUB_OK", "00001", 9, 4)]
+    vectors[7]["expected_result"] ^= 0x01
+    vectors[9]["expected_flags"]["zero"] = True
+    write_vectors(pytester, vectors)
+
+    result = pytester.runpytest("-p", "pytest_alu_vectors")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines([
+        "*opcode 00000-ADD: 2 of 50 vectors failed",
+        "  ADD_7 (A=0x07, B=0x03): result expected 0x0B, got 0x0A",
+        "  ADD_9 (A=0x09, B=0x03): zero expected True, got False",
+    ])
+
+
+def test_alu8bit_is_the_default_model(pytester, monkeypatch):
+    """Vectors are checked against ALU8Bit unless --alu-model golden is given"""
+    write_vectors(pytester, [make_vector(f"ADD_{a}", "00000", a, 3) for a in range(10)])
+
+    def broken_add(self, a, b):
+        result = (a + b + 1) & self.mask
+        return result, self._flags(result, False, False)
+
+    monkeypatch.setattr(ALU8Bit, "add", broken_add)
+    result = pytester.runpytest("-p", "pytest_alu_vectors")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*opcode 00000-ADD: 10 of 10 vectors failed"])
+    result = pytester.runpytest("-p", "pytest_alu_vectors", "--alu-model", "golden")
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for sweep strategies at widths too wide to test exhaustively.
+Run with: pytest test_sweep_strategies.py -v
+"""
+
+from collections import Counter
+
+import pytest
+
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+from sweep_strategies import (corner_pairs, corner_values, opcode_vector_count,
+                              plan_sweeps, plan_width, sweep_pairs, sweep_vectors)
+from test_alu import ALU8Bit
+
+
+def test_corner_values():
+    corners = corner_values(16)
+    for value in (0, 1, 0xFFFF, 0xFFFE, 0x8000, 0x7FFF, 0x8001, 0x5555, 0xAAAA,
+                  0x00FF, 0xFF00, 0x0400, 0xFBFF):
+        assert value in corners
+    assert all(0 <= value <= 0xFFFF for value in corners)
+    assert len(set(corners)) == len(corners)
+
+
+@pytest.mark.parametrize("sampler", ["stratified", "random"])
+def test_sampled_sweep_injects_corners(sampler):
+    pairs = list(sweep_pairs("00000", "AB", 32, 10000, sampler, seed=1))
+    corners = corner_pairs("AB", 32)
+    assert len(pairs) == 10000 == opcode_vector_count("AB", 32, 10000)
+    assert pairs[:len(corners)] == corners
+    assert pairs == list(sweep_pairs("00000", "AB", 32, 10000, sampler, seed=1))
+    assert pairs != list(sweep_pairs("00000", "AB", 32, 10000, sampler, seed=2))
+
+
+def test_stratified_sweep_hits_every_stratum():
+    """Top-bit strata of both operands are visited evenly"""
+    corners = len(corner_pairs("AB", 16))
+    pairs = list(sweep_pairs("00000", "AB", 16, corners + 256 * 4))[corners:]
+    strata = Counter((a >> 12, b >> 12) for a, b in pairs)
+    assert len(strata) == 256 and set(strata.values()) == {4}
+
+
+def test_unary_sweep_is_exhaustive_when_it_fits():
+    pairs = list(sweep_pairs("00010", "A", 16, 1 << 16, reduce_operands=True))
+    assert sorted(a for a, _ in pairs) == list(range(1 << 16))
+    assert {b for _, b in pairs} == {0}
+
+
+def test_sampled_vectors_match_models():
+    """Sampled 16-bit vectors carry golden expectations that ALU8Bit(16) agrees with"""
+    alu = ALU8Bit(16)
+    vectors = list(sweep_vectors(16, 2000, seed=3))
+    assert Counter(v["opcode"] for v in vectors) == {code: 2000 for _, code, _ in OPERATIONS}
+    for vector in vectors[::7]:
+        expected = compute_alu_operation(vector["opcode"], vector["A"], vector["B"], 16)
+        assert (vector["expected_result"], vector["expected_flags"]) == expected
+        assert alu.execute(vector["opcode"], vector["A"], vector["B"]) == expected
+
+
+def test_budget_plan():
+    """Narrow widths go exhaustive; wide widths share what is left"""
+    plans = plan_sweeps([32, 4, 16], budget_seconds=10, rate=100000)
+    assert [plan.width for plan in plans] == [4, 16, 32]
+    assert plans[0].exhaustive and plans[0].vectors == 19 * 256
+    assert not plans[1].exhaustive and not plans[2].exhaustive
+    assert sum(plan.vectors for plan in plans) <= 10 * 100000
+    assert plans[1].vectors == plan_width(16, plans[1].samples).vectors
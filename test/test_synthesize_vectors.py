@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for minimal vector set synthesis (tools/synthesize_vectors.py).
+Run with: pytest test_synthesize_vectors.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import synthesize_vectors
+from batch_model import opcode_table, unpack_outcome
+from exhaustive_vectors import OPERATIONS
+from synthesize_vectors import (
+    candidates, fault_masks, opcode_fault_masks, synthesize, write_bin_vectors,
+)
+from vector_coverage import INPUT_TOGGLE_BITS, ToggleTracker, goal_masks, toggle_word
+from vector_io import read_vectors
+
+# Reduced problem: three opcodes; ADD and INC differ only in select bit 1
+REDUCED = [op for op in OPERATIONS if op[0] in ("ADD", "INC", "XOR")]
+
+
+@pytest.fixture(scope="module")
+def reduced_problem():
+    patch = pytest.MonkeyPatch()
+    patch.setattr(synthesize_vectors, "OPERATIONS", REDUCED)
+    opcode_fault_masks.cache_clear()  # which faulty opcodes are valid depends on OPERATIONS
+    yield
+    patch.undo()
+    opcode_fault_masks.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def synthesized(reduced_problem):
+    return synthesize(100.0)
+
+
+def test_full_target_reaches_every_reachable_goal(synthesized):
+    vectors, stats = synthesized
+    assert stats["covered"] == stats["total"] > 0
+    assert all(hit == reach for _, hit, reach in stats["categories"])
+
+    # Recompute from the goal masks: every reachable goal is hit
+    missing_global = 0
+    for _, opcode, _ in REDUCED:
+        reachable = 0
+        for local, global_ in candidates(opcode):
+            reachable |= local
+            missing_global |= global_
+        goals, faults, opcode_faults = goal_masks(opcode), fault_masks(opcode), opcode_fault_masks(opcode)
+        for op, a, b in vectors:
+            if op == opcode:
+                reachable &= ~(goals[a << 8 | b] | faults[a << 8 | b])
+                missing_global &= ~opcode_faults[a << 8 | b]
+        assert reachable == 0, opcode
+    assert missing_global == 0
+
+    toggles = ToggleTracker()
+    for vector in vectors:
+        toggles.push(toggle_word(*vector))
+    assert all(bit >= INPUT_TOGGLE_BITS for bit, _ in toggles.missing())
+
+
+def test_partial_target_stops_early(synthesized):
+    vectors, stats = synthesized
+    partial, partial_stats = synthesize(50.0)
+    assert partial_stats["total"] == stats["total"]
+    assert stats["total"] / 2 <= partial_stats["covered"] < stats["total"]
+    assert len(partial) < len(vectors)
+
+
+def test_bin_output_round_trips_through_vector_io(synthesized, tmp_path, monkeypatch):
+    vectors, _ = synthesized
+    # Toggle-closing vectors may use any opcode, not just the reduced ones
+    monkeypatch.setattr(synthesize_vectors, "OPERATIONS", OPERATIONS)
+    path = tmp_path / "hw.bin"
+    write_bin_vectors(path, vectors)
+
+    records = list(read_vectors(path))
+    assert [(r["opcode"], r["A"], r["B"]) for r in records] == vectors
+    for record in records:
+        result, flags = unpack_outcome(opcode_table(record["opcode"])[record["A"] << 8 | record["B"]])
+        assert (record["expected_result"], record["expected_flags"]) == (result, flags)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the operation-stream throughput estimator (tools/throughput_estimate.py).
+Run with: pytest test_throughput_estimate.py -v
+"""
+
+import io
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from op_timing import OP_LATENCY_NS, WORST_LATENCY_NS
+from throughput_estimate import estimate, histogram, trace_operations
+
+
+def test_delays_used_below_are_the_ppa_values():
+    assert (OP_LATENCY_NS["ADD"], OP_LATENCY_NS["XOR"], OP_LATENCY_NS["SUB"]) == (85.0, 100.0, 475.0)
+    assert WORST_LATENCY_NS == 475.0
+
+
+def test_estimate_totals_for_a_tiny_stream():
+    # 2 ADD + 1 XOR + 1 non-ALU instruction, 10 ns overhead on all 4
+    assert estimate(Counter({"ADD": 2, "XOR": 1}), other=1, overhead_ns=10.0) == {
+        "executed": 4,
+        "self_timed": 2 * 85 + 100 + 4 * 10,    # 310
+        "clocked_isa": 3 * 475 + 4 * 10,        # 1465
+        "clocked_used": 3 * 100 + 4 * 10,       # 340: XOR is the slowest op used
+        "period_isa": 485.0,
+        "period_used": 110.0,
+    }
+
+
+def test_estimate_of_empty_stream_is_zero():
+    result = estimate(Counter())
+    assert (result["executed"], result["self_timed"], result["clocked_isa"],
+            result["clocked_used"]) == (0, 0, 0, 0)
+
+
+def test_trace_lines_accept_cli_golden_and_opcode_names():
+    trace = io.StringIO("ADD 1 2\n\n# comment\ninc_a 3 0\n01010 1 1  # XOR\nPASSB 0 9\n")
+    assert histogram(trace_operations(trace, "ops.txt")) == Counter(
+        {"ADD": 1, "INC_A": 1, "XOR": 1, "PASS_B": 1})
+
+
+def test_malformed_trace_line_names_the_line():
+    trace = io.StringIO("ADD 1 2\nFROB 1 2\n")
+    with pytest.raises(ValueError, match=r"ops\.txt:2: Unknown operation: FROB"):
+        list(trace_operations(trace, "ops.txt"))
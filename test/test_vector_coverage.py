@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the vector coverage analyzer (tools/vector_coverage.py).
+Run with: pytest test_vector_coverage.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import vector_coverage
+from exhaustive_vectors import OPERATIONS
+from vector_coverage import (
+    A_BIT_BASE, B_BIT_BASE, CHAIN_BASE, INPUT_TOGGLE_BITS, analyze, carry_chain_length,
+    goal_masks, propose_vectors, reachable_goals, vector_goals,
+)
+
+ADD, SUB, INC, DEC, XOR, CMP = "00000", "00001", "00010", "00011", "01010", "10000"
+
+SUITE = [
+    {"opcode": ADD, "A": 0x00, "B": 0x00},
+    {"opcode": ADD, "A": 0xFF, "B": 0x01},
+    {"opcode": ADD, "A": 0x7F, "B": 0x01},
+    {"opcode": XOR, "A": 0xAA, "B": 0x55},
+    {"opcode": INC, "A": 0x0F, "B": 0x00},
+]
+
+
+@pytest.mark.parametrize("opcode, a, b, length", [
+    (ADD, 0xFF, 0x01, 8),
+    (ADD, 0x00, 0x00, 0),
+    (ADD, 0x01, 0x01, 1),
+    (ADD, 0x0F, 0x01, 4),
+    (ADD, 0x81, 0x81, 1),   # two separate 1-bit runs
+    (SUB, 0x00, 0x00, 8),   # A + ~B + 1 carries through every bit
+    (SUB, 0x05, 0x03, 6),   # 0x05 + 0xFC + 1: carries out of bits 2-7
+    (INC, 0x7F, 0x00, 7),
+    (DEC, 0x00, 0x00, 0),
+    (CMP, 0x10, 0x10, 8),
+])
+def test_carry_chain_length(opcode, a, b, length):
+    assert carry_chain_length(opcode, a, b) == length
+
+
+def test_goal_masks_match_single_vector_goals():
+    for opcode in (ADD, XOR, INC):
+        masks = goal_masks(opcode)
+        for a, b in ((0, 0), (0xFF, 0x01), (0x80, 0x7F), (0x5A, 0xC3)):
+            assert masks[a << 8 | b] == vector_goals(opcode, a, b)
+
+    # INC ignores B, XOR has no carry chain; ADD reaches every chain length
+    assert reachable_goals(INC) >> B_BIT_BASE & 0xFFFF == 0
+    assert reachable_goals(INC) >> A_BIT_BASE & 0xFFFF == 0xFFFF
+    assert reachable_goals(XOR) >> CHAIN_BASE & 0x1FF == 0
+    assert reachable_goals(ADD) >> CHAIN_BASE & 0x1FF == 0x1FF
+
+
+def test_report_counts_chains_and_gaps():
+    report = analyze(SUITE)
+    assert report.vectors == {ADD: 3, XOR: 1, INC: 1}
+    assert report.chains[ADD] == [1, 0, 0, 0, 0, 0, 0, 1, 1]
+    chain_gaps = report.gaps(ADD) >> CHAIN_BASE & 0x1FF
+    assert [length for length in range(9) if chain_gaps >> length & 1] == [1, 2, 3, 4, 5, 6]
+
+
+def test_proposals_close_exactly_the_reported_gaps(monkeypatch):
+    report = analyze(SUITE)
+    gaps = {opcode: report.gaps(opcode) for _, opcode, _ in OPERATIONS}
+
+    # Static goals alone: every vector closes at least one goal still open
+    with monkeypatch.context() as patch:
+        patch.setattr(vector_coverage, "close_input_toggles", lambda toggles, last: [])
+        static = propose_vectors(report)
+    remaining = dict(gaps)
+    for opcode, a, b in static:
+        closed = goal_masks(opcode)[a << 8 | b] & remaining[opcode]
+        assert closed, f"redundant proposal {opcode} {a:02X} {b:02X}"
+        remaining[opcode] &= ~closed
+    assert not any(remaining.values())
+    assert {opcode for opcode, _, _ in static} == {opcode for opcode, gap in gaps.items() if gap}
+
+    proposals = propose_vectors(report)
+    assert proposals[:len(static)] == static
+    extended = analyze(SUITE + [{"opcode": op, "A": a, "B": b} for op, a, b in proposals])
+    assert not any(extended.gaps(opcode) for opcode in gaps)
+    assert all(bit >= INPUT_TOGGLE_BITS for bit, _ in extended.toggles.missing())
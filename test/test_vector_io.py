@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact binary vector format.
+Run with: pytest test_vector_io.py -v
+"""
+
+import pytest
+
+from exhaustive_vectors import compute_alu_operation
+from batch_model import opcode_table
+from vector_io import (HEADER_SIZE, read_header, read_records, read_vectors, record_size,
+                       write_records, write_vectors)
+
+
+def make_vector(opcode, a, b):
+    result, flags = compute_alu_operation(opcode, a, b)
+    return {"opcode": opcode, "A": a, "B": b,
+            "expected_result": result, "expected_flags": flags}
+
+
+def test_round_trip(tmp_path):
+    """Every field survives a write/read cycle"""
+    vectors = [make_vector(op, a, b) for op in ("00000", "00001", "10000", "10010")
+               for a, b in ((0, 0), (0x7F, 0x01), (0x80, 0xFF), (0xFF, 0xFF))]
+    path = tmp_path / "vectors.bin"
+    assert write_vectors(path, vectors) == len(vectors)
+
+    assert read_header(path) == (8, 5, len(vectors))
+    assert path.stat().st_size == HEADER_SIZE + 5 * len(vectors)
+    for original, loaded in zip(vectors, read_vectors(path)):
+        for key in ("opcode", "A", "B", "expected_result", "expected_flags"):
+            assert loaded[key] == original[key]
+
+
+def test_read_range(tmp_path):
+    """Records can be read from an offset without touching earlier ones"""
+    vectors = [make_vector("00000", a, 1) for a in range(10)]
+    path = tmp_path / "vectors.bin"
+    write_vectors(path, vectors)
+    assert [v["A"] for v in read_vectors(path, 4, 7)] == [4, 5, 6]
+
+
+def test_wide_records(tmp_path):
+    """Record size scales with operand width"""
+    assert record_size(8) == 5
+    assert record_size(16) == 8
+    path = tmp_path / "wide.bin"
+    write_vectors(path, [{"opcode": "00000", "A": 0x1234, "B": 0xFFFF,
+                          "expected_result": 0x1233, "expected_flags": {"carry": True}}], width=16)
+    loaded = next(read_vectors(path))
+    assert (loaded["A"], loaded["B"], loaded["expected_result"]) == (0x1234, 0xFFFF, 0x1233)
+    assert loaded["expected_flags"]["carry"]
+
+
+def test_records_from_outcome_tables(tmp_path):
+    """Packed batch_model flag bits are the record flag bits"""
+    table = opcode_table("00001")
+    pairs = ((0, 1), (0x80, 0x01), (0x10, 0x10), (0xFF, 0x00))
+    path = tmp_path / "sub.bin"
+    write_records(path, ((1, a, b, table[a << 8 | b] & 0xFF, table[a << 8 | b] >> 8 & 0xF)
+                         for a, b in pairs))
+    for (a, b), loaded in zip(pairs, read_vectors(path)):
+        assert loaded == {**make_vector("00001", a, b), "test_name": loaded["test_name"]}
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "vectors.json"
+    path.write_bytes(b'{"tests": []}' + bytes(16))
+    with pytest.raises(ValueError):
+        read_header(path)
+
+
+def test_read_records_across_chunks(tmp_path):
+    records = [(i % 19, i & 0xFF, (i * 7) & 0xFF, (i * 3) & 0xFF, i & 0xF) for i in range(1000)]
+    path = tmp_path / "records.bin"
+    write_records(path, records)
+    assert list(read_records(path, chunk=64)) == records
+    assert list(read_records(path, 100, 300, chunk=64)) == records[100:300]
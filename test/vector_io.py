@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Compact fixed-width binary vector format.
+
+JSON costs ~150 bytes and a parse per vector; this format stores each vector
+as a fixed-size record so files can be streamed, mmapped and split by offset.
+
+Layout (little-endian):
+
+    header (16 bytes)
+        magic        4s   b"ALUV"
+        version      u8   1
+        width        u8   operand width in bits (8 for this ALU)
+        record_size  u16  bytes per record
+        count        u64  number of records
+
+    record (2 + 3 * ceil(width / 8) bytes; 5 bytes at width 8)
+        opcode       u8   opcode value (0-31)
+        flags        u8   bit0 carry, bit1 zero, bit2 overflow, bit3 negative
+        A, B, result      ceil(width / 8) bytes each
+
+Record `i` starts at byte `HEADER_SIZE + i * record_size`.
+"""
+
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+MAGIC = b"ALUV"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHQ")
+HEADER_SIZE = HEADER.size
+BYTE_RECORD = struct.Struct("<5B")  # record layout for widths up to 8
+FLAG_BITS = ("carry", "zero", "overflow", "negative")
+
+
+def record_size(width: int) -> int:
+    return 2 + 3 * ((width + 7) // 8)
+
+
+def encode_flags(flags: Dict[str, bool]) -> int:
+    return sum(1 << bit for bit, flag in enumerate(FLAG_BITS) if flags.get(flag, False))
+
+
+def decode_flags(value: int) -> Dict[str, bool]:
+    return {flag: bool(value >> bit & 1) for bit, flag in enumerate(FLAG_BITS)}
+
+
+def encode_record(opcode: int, a: int, b: int, result: int, flags: int,
+                  width: int = 8) -> bytes:
+    size = (width + 7) // 8
+    return (bytes((opcode, flags)) + a.to_bytes(size, "little")
+            + b.to_bytes(size, "little") + result.to_bytes(size, "little"))
+
+
+def decode_record(data: bytes, width: int = 8) -> Tuple[int, int, int, int, int]:
+    """Return (opcode, A, B, result, flags) from one record."""
+    size = (width + 7) // 8
+    return (data[0],
+            int.from_bytes(data[2:2 + size], "little"),
+            int.from_bytes(data[2 + size:2 + 2 * size], "little"),
+            int.from_bytes(data[2 + 2 * size:2 + 3 * size], "little"),
+            data[1])
+
+
+def read_header(path: Union[str, Path]) -> Tuple[int, int, int]:
+    """Return (width, record_size, count), validating the header."""
+    with open(path, "rb") as handle:
+        magic, version, width, size, count = HEADER.unpack(handle.read(HEADER_SIZE))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not an ALU binary vector file (v{VERSION})")
+    if size != record_size(width):
+        raise ValueError(f"{path}: record size {size} does not match width {width}")
+    return width, size, count
+
+
+def write_records(path: Union[str, Path],
+                  records: Iterable[Tuple[int, int, int, int, int]], width: int = 8) -> int:
+    """
+    Stream (opcode, A, B, result, flags) tuples, flags already encoded, into
+    a binary file. Returns the number written.
+    """
+    size = record_size(width)
+    count = 0
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, VERSION, width, size, 0))
+        if width <= 8:
+            pack = BYTE_RECORD.pack
+            chunk = []
+            for opcode, a, b, result, flags in records:
+                chunk.append(pack(opcode, flags, a, b, result))
+                if len(chunk) == 65536:
+                    handle.write(b"".join(chunk))
+                    count += len(chunk)
+                    chunk = []
+            handle.write(b"".join(chunk))
+            count += len(chunk)
+        else:
+            for opcode, a, b, result, flags in records:
+                handle.write(encode_record(opcode, a, b, result, flags, width))
+                count += 1
+        handle.seek(0)
+        handle.write(HEADER.pack(MAGIC, VERSION, width, size, count))
+    return count
+
+
+def write_vectors(path: Union[str, Path], vectors: Iterable[Dict], width: int = 8) -> int:
+    """
+    Stream repo-schema vector dicts (opcode, A, B, expected_result,
+    expected_flags) into a binary file. Returns the number written.
+    """
+    mask = (1 << width) - 1
+    return write_records(path, (
+        (int(str(vector["opcode"]).strip(), 2),
+         int(vector.get("A", 0)) & mask,
+         int(vector.get("B", 0)) & mask,
+         int(vector.get("expected_result", 0)) & mask,
+         encode_flags(vector.get("expected_flags", {})))
+        for vector in vectors
+    ), width)
+
+
+def read_records(path: Union[str, Path], start: int = 0, stop: Union[int, None] = None,
+                 chunk: int = 65536) -> Iterator[Tuple[int, int, int, int, int]]:
+    """Yield (opcode, A, B, result, flags) tuples for records [start, stop)."""
+    width, size, count = read_header(path)
+    stop = count if stop is None else min(stop, count)
+    with open(path, "rb") as handle:
+        handle.seek(HEADER_SIZE + start * size)
+        for first in range(start, stop, chunk):
+            data = handle.read(min(chunk, stop - first) * size)
+            if width <= 8:
+                for opcode, flags, a, b, result in BYTE_RECORD.iter_unpack(data):
+                    yield opcode, a, b, result, flags
+            else:
+                for offset in range(0, len(data), size):
+                    yield decode_record(data[offset:offset + size], width)
+
+
+def read_vectors(path: Union[str, Path], start: int = 0,
+                 stop: Union[int, None] = None) -> Iterator[Dict]:
+    """Yield records [start, stop) as repo-schema vector dicts."""
+    for index, (opcode, a, b, result, flags) in enumerate(read_records(path, start, stop), start):
+        yield {
+            "test_name": f"BIN_{index}",
+            "opcode": format(opcode, "05b"),
+            "A": a,
+            "B": b,
+            "expected_result": result,
+            "expected_flags": decode_flags(flags),
+        }
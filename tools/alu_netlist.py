@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Gate-level netlist of the discrete ALU, with a bit-parallel simulator.
+
+`sim/top/alu_top.circ` is a word-level Logisim model (library Adder,
+Multiplexers, tunnels) whose wiring exists only as drawing coordinates, so it
+cannot serve as a gate netlist of the board. This module builds one
+structurally from docs/ARCHITECTURE.md instead:
+
+    FUNC[4:0] -> minterm opcode decoder -> control lines
+    B -> AND gate (B enable) -> XOR array (M) -> ripple-carry adder (Cin)
+    A, B -> NAND / NOR / XOR / PASS A / PASS B -> AND-OR 5:1 logic mux
+    A -> shifter (LSL, LSR/ASR, REV) as AND-OR selection
+    adder / shifter / logic -> output OR -> global inverter (XOR) -> OUT
+    flags: C from adder carry-out or shifted-out bit, V from the adder sign
+           bits, Z/N from OUT (from the adder sum for CMP, whose OUT is 0)
+
+The 8-bit netlist is verified against the golden model on all 1,245,184
+vectors; other widths on corner cases plus random samples per opcode, since
+the precomputed golden tables are 8-bit only.
+
+Simulation is bit-parallel: every net holds a Python int whose bit j is the
+net's value under pattern j, so one pass over the gates evaluates any number
+of vectors at once.
+
+Usage:
+    python3 tools/alu_netlist.py            # stats + exhaustive verification
+    python3 tools/alu_netlist.py --width 16 # stats + sampled verification
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+
+from batch_model import opcode_table
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+
+OPCODE_BITS = 5
+FLAG_OUTPUTS = ("CARRY", "ZERO", "OVERFLOW", "NEGATIVE")
+SAMPLES = 4096  # random vectors per opcode when verification cannot be exhaustive
+
+# CMOS transistor cost per gate; n is the number of inputs.
+TRANSISTORS = {
+    "NOT": lambda n: 2,
+    "BUF": lambda n: 4,
+    "NAND": lambda n: 2 * n,
+    "NOR": lambda n: 2 * n,
+    "AND": lambda n: 2 * n + 2,
+    "OR": lambda n: 2 * n + 2,
+    "XOR": lambda n: 12 * (n - 1),
+    "XNOR": lambda n: 12 * (n - 1),
+    "CONST0": lambda n: 0,
+    "CONST1": lambda n: 0,
+}
+
+@dataclass(frozen=True)
+class Gate:
+    output: str
+    kind: str
+    inputs: Tuple[str, ...]
+
+
+def evaluate_gate(kind: str, values: Sequence[int], mask: int) -> int:
+    """Evaluate one gate over lane words."""
+    if kind in ("AND", "NAND"):
+        result = mask
+        for value in values:
+            result &= value
+    elif kind in ("OR", "NOR"):
+        result = 0
+        for value in values:
+            result |= value
+    elif kind in ("XOR", "XNOR"):
+        result = 0
+        for value in values:
+            result ^= value
+    elif kind in ("BUF", "NOT"):
+        result = values[0]
+    elif kind == "CONST0":
+        return 0
+    elif kind == "CONST1":
+        return mask
+    else:
+        raise ValueError(f"Unknown gate kind: {kind}")
+    if kind in ("NAND", "NOR", "XNOR", "NOT"):
+        result ^= mask
+    return result
+
+
+class Netlist:
+    """Combinational gate netlist; gates are kept in topological order."""
+
+    def __init__(self, width: int = 8):
+        self.width = width
+        self.inputs: List[str] = []
+        self.outputs: List[str] = []
+        self.gates: List[Gate] = []
+        self.driver: Dict[str, int] = {}
+        self._anonymous = 0
+
+    def add_input(self, name: str) -> str:
+        self.inputs.append(name)
+        return name
+
+    def add(self, kind: str, inputs: Sequence[str], name: Optional[str] = None) -> str:
+        """Add a gate driving `name` (auto-named if omitted); returns the net."""
+        if name is None:
+            name = f"n{self._anonymous}"
+            self._anonymous += 1
+        if name in self.driver or name in self.inputs:
+            raise ValueError(f"Net {name} already driven")
+        for net in inputs:
+            if net not in self.driver and net not in self.inputs:
+                raise ValueError(f"Net {net} used before it is driven")
+        self.driver[name] = len(self.gates)
+        self.gates.append(Gate(name, kind, tuple(inputs)))
+        return name
+
+    def nets(self) -> List[str]:
+        return self.inputs + [gate.output for gate in self.gates]
+
+    def simulate(self, values: Dict[str, int], mask: int) -> Dict[str, int]:
+        """Evaluate every gate; `values` holds a lane word per primary input."""
+        nets = dict(values)
+        for gate in self.gates:
+            nets[gate.output] = evaluate_gate(gate.kind, [nets[i] for i in gate.inputs], mask)
+        return nets
+
+    def fanout(self) -> Dict[str, List[int]]:
+        """Net -> indexes of the gates it feeds."""
+        readers: Dict[str, List[int]] = {net: [] for net in self.nets()}
+        for index, gate in enumerate(self.gates):
+            for net in gate.inputs:
+                readers[net].append(index)
+        return readers
+
+    def cone(self, nets: Sequence[str], readers: Optional[Dict[str, List[int]]] = None) -> List[int]:
+        """Indexes, in topological order, of every gate downstream of `nets`."""
+        readers = readers if readers is not None else self.fanout()
+        seen = set()
+        stack = list(nets)
+        while stack:
+            for index in readers[stack.pop()]:
+                if index not in seen:
+                    seen.add(index)
+                    stack.append(self.gates[index].output)
+        return sorted(seen)
+
+    def depth(self) -> Dict[str, int]:
+        """Logic depth (gate levels from the primary inputs) of every net."""
+        levels = {net: 0 for net in self.inputs}
+        for gate in self.gates:
+            levels[gate.output] = 1 + max((levels[i] for i in gate.inputs), default=0)
+        return levels
+
+    def transistor_count(self) -> int:
+        return sum(TRANSISTORS[gate.kind](len(gate.inputs)) for gate in self.gates)
+
+
+def _bus(name: str, width: int) -> List[str]:
+    return [f"{name}[{i}]" for i in range(width)]
+
+
+def ripple_carry_adder(netlist: Netlist, a: Sequence[str], b: Sequence[str],
+                       carry_in: str, prefix: str = "") -> Tuple[List[str], List[str]]:
+    """Full-adder chain; returns (sum nets, carry nets c[0]=Cin .. c[width])."""
+    carries = [carry_in]
+    sums = []
+    for i, (a_bit, b_bit) in enumerate(zip(a, b)):
+        p = netlist.add("XOR", (a_bit, b_bit), f"{prefix}p[{i}]")
+        g = netlist.add("AND", (a_bit, b_bit), f"{prefix}g[{i}]")
+        sums.append(netlist.add("XOR", (p, carries[-1]), f"{prefix}s[{i}]"))
+        t = netlist.add("AND", (p, carries[-1]), f"{prefix}t[{i}]")
+        carries.append(netlist.add("OR", (g, t), f"{prefix}c[{i + 1}]"))
+    return sums, carries
+
+
+def and_or_shift_bit(netlist: Netlist, i: int, a: Sequence[str], decoded: Dict[str, str],
+                     shift_right: str) -> str:
+    """Shifter output bit i: LSL / LSR-ASR / REV_A terms into one OR."""
+    width = len(a)
+    terms = []
+    if i > 0:
+        terms.append(netlist.add("AND", (decoded["LSL"], a[i - 1]), f"shl[{i}]"))
+    if i < width - 1:
+        terms.append(netlist.add("AND", (shift_right, a[i + 1]), f"shr[{i}]"))
+    else:
+        terms.append(netlist.add("AND", (decoded["ASR"], a[i]), "asr_msb"))
+    terms.append(netlist.add("AND", (decoded["REV_A"], a[width - 1 - i]), f"rev[{i}]"))
+    return netlist.add("OR", terms, f"sh[{i}]")
+
+
+def build_alu_netlist(width: int = 8, adder: Callable[..., Tuple[List[str], List[str]]] = ripple_carry_adder,
+                      shifter: Callable[..., str] = and_or_shift_bit) -> Netlist:
+    """
+    Build the ALU at `width` bits with primary inputs A, B, OP.
+
+    `adder(netlist, a, b, carry_in)` returns (sum nets, carry nets ending in
+    the carry out) and `shifter(netlist, i, a, decoded, shift_right)` returns
+    shifter output bit i; tools/arch_explore.py swaps in alternatives.
+    """
+    netlist = Netlist(width)
+    a = [netlist.add_input(net) for net in _bus("A", width)]
+    b = [netlist.add_input(net) for net in _bus("B", width)]
+    op = [netlist.add_input(net) for net in _bus("OP", OPCODE_BITS)]
+
+    # Opcode decoder: one 5-input AND (minterm) per operation
+    op_n = [netlist.add("NOT", (bit,), f"OP_N[{k}]") for k, bit in enumerate(op)]
+    decoded = {}
+    for name, code, _ in OPERATIONS:
+        value = int(code, 2)
+        literals = [op[k] if value >> k & 1 else op_n[k] for k in range(OPCODE_BITS)]
+        decoded[name] = netlist.add("AND", literals, f"dec_{name}")
+
+    def control(name: str, operations: Sequence[str]) -> str:
+        return netlist.add("OR", [decoded[o] for o in operations], name)
+
+    b_enable = control("ctl_BEN", ("ADD", "SUB", "CMP"))
+    m = control("ctl_M", ("SUB", "DEC_A", "CMP"))
+    carry_in = control("ctl_CIN", ("SUB", "INC_A", "CMP"))
+    adder_flags = control("ctl_ADDER", ("ADD", "SUB", "INC_A", "DEC_A", "CMP"))
+    arith_out = control("ctl_ARITH", ("ADD", "SUB", "INC_A", "DEC_A"))
+    shift_right = control("ctl_SHR", ("LSR", "ASR"))
+    select = {
+        "NAND": control("ctl_L_NAND", ("NAND", "AND")),
+        "NOR": control("ctl_L_NOR", ("NOR", "OR")),
+        "XOR": control("ctl_L_XOR", ("XOR", "XNOR")),
+        "PASS_A": control("ctl_L_PA", ("PASS_A", "NOT_A")),
+        "PASS_B": control("ctl_L_PB", ("PASS_B", "NOT_B")),
+    }
+    invert = control("ctl_INV", ("AND", "OR", "XNOR", "NOT_A", "NOT_B"))
+
+    # Arithmetic unit: B enable + XOR array feeding the ripple-carry adder
+    b_gated = [netlist.add("AND", (bit, b_enable), f"bg[{i}]") for i, bit in enumerate(b)]
+    b_prime = [netlist.add("XOR", (bit, m), f"bx[{i}]") for i, bit in enumerate(b_gated)]
+    sums, carries = adder(netlist, a, b_prime, carry_in)
+
+    pre = []
+    for i in range(width):
+        shifted = shifter(netlist, i, a, decoded, shift_right)
+
+        # Logic unit and its 5:1 AND-OR mux
+        sources = {
+            "NAND": netlist.add("NAND", (a[i], b[i]), f"nand[{i}]"),
+            "NOR": netlist.add("NOR", (a[i], b[i]), f"nor[{i}]"),
+            "XOR": netlist.add("XOR", (a[i], b[i]), f"xor[{i}]"),
+            "PASS_A": a[i],
+            "PASS_B": b[i],
+        }
+        logic = netlist.add("OR", [netlist.add("AND", (select[k], net), f"lm_{k.lower()}[{i}]")
+                                   for k, net in sources.items()], f"lu[{i}]")
+
+        arith = netlist.add("AND", (arith_out, sums[i]), f"au[{i}]")
+        pre.append(netlist.add("OR", (arith, shifted, logic), f"pre[{i}]"))
+
+    # Global inverter
+    out = [netlist.add("XOR", (bit, invert), f"OUT[{i}]") for i, bit in enumerate(pre)]
+
+    # Flags
+    msb = width - 1
+    netlist.add("OR", (
+        netlist.add("AND", (adder_flags, carries[-1]), "cf_add"),
+        netlist.add("AND", (decoded["LSL"], a[msb]), "cf_lsl"),
+        netlist.add("AND", (shift_right, a[0]), "cf_shr"),
+    ), "CARRY")
+    netlist.add("AND", (
+        adder_flags,
+        netlist.add("XNOR", (a[msb], b_prime[msb]), "vf_same"),
+        netlist.add("XOR", (a[msb], sums[msb]), "vf_flip"),
+    ), "OVERFLOW")
+    flag_source = [
+        netlist.add("OR", (out[i], netlist.add("AND", (decoded["CMP"], sums[i]), f"zc[{i}]")), f"zf[{i}]")
+        for i in range(width)
+    ]
+    netlist.add("NOR", flag_source, "ZERO")
+    netlist.add("BUF", (flag_source[msb],), "NEGATIVE")
+
+    netlist.outputs = out + list(FLAG_OUTPUTS)
+    return netlist
+
+
+def pack_bits(values: Sequence[int], bit: int) -> int:
+    """Lane word whose bit j is bit `bit` of values[j]."""
+    byte, shift = divmod(bit, 8)
+    data = bytes(v >> (8 * byte) & 0xFF for v in values)
+    table = bytes(48 + (v >> shift & 1) for v in range(256))  # b"0" / b"1"
+    return int(data.translate(table)[::-1] or b"0", 2)
+
+
+def pack_vectors(netlist: Netlist, vectors: Sequence[Tuple[int, int, int]]) -> Tuple[Dict[str, int], int]:
+    """Input lane words for (opcode, A, B) vectors; returns (words, mask)."""
+    words = {}
+    for bus, column, width in (("A", 1, netlist.width), ("B", 2, netlist.width),
+                               ("OP", 0, OPCODE_BITS)):
+        values = [vector[column] for vector in vectors]
+        for i in range(width):
+            words[f"{bus}[{i}]"] = pack_bits(values, i)
+    return words, (1 << len(vectors)) - 1
+
+
+def unpack_bus(nets: Dict[str, int], names: Sequence[str], count: int) -> List[int]:
+    """Per-vector integer values of a bus (names LSB first)."""
+    values = [0] * count
+    for bit, name in enumerate(names):
+        word = nets[name]
+        for j in range(count):
+            if word >> j & 1:
+                values[j] |= 1 << bit
+    return values
+
+
+@lru_cache(maxsize=1)
+def _operand_words() -> Tuple[Tuple[str, int], ...]:
+    a_values = [index >> 8 for index in range(65536)]
+    b_values = [index & 0xFF for index in range(65536)]
+    return tuple([(f"A[{i}]", pack_bits(a_values, i)) for i in range(8)]
+                 + [(f"B[{i}]", pack_bits(b_values, i)) for i in range(8)])
+
+
+def opcode_patterns(netlist: Netlist, opcode: str) -> Tuple[Dict[str, int], int]:
+    """Lane words for all 65,536 (A, B) inputs of one opcode, index (A << 8) | B."""
+    words = dict(_operand_words())
+    mask = (1 << 65536) - 1
+    value = int(opcode, 2)
+    for k in range(OPCODE_BITS):
+        words[f"OP[{k}]"] = mask if value >> k & 1 else 0
+    return words, mask
+
+
+def expected_words(opcode: str) -> Dict[str, int]:
+    """Golden-model output lane words for `opcode_patterns`."""
+    table = opcode_table(opcode)
+    words = {f"OUT[{i}]": pack_bits(table, i) for i in range(8)}
+    for bit, name in enumerate(FLAG_OUTPUTS):  # batch_model.FLAG_ORDER
+        words[name] = pack_bits(table, 8 + bit)
+    return words
+
+
+def verify(netlist: Netlist) -> List[str]:
+    """Compare the 8-bit netlist with the golden model on every vector."""
+    problems = []
+    for name, opcode, _ in OPERATIONS:
+        inputs, mask = opcode_patterns(netlist, opcode)
+        nets = netlist.simulate(inputs, mask)
+        for output, expected in expected_words(opcode).items():
+            diff = nets[output] ^ expected
+            if diff:
+                index = (diff & -diff).bit_length() - 1
+                problems.append(f"{name} {output}: {diff.bit_count()} mismatches, "
+                                f"first A=0x{index >> 8:02X} B=0x{index & 0xFF:02X}")
+    return problems
+
+
+def verify_sampled(netlist: Netlist, rng: random.Random, samples: int = SAMPLES) -> List[str]:
+    """Compare a netlist of any width with the golden model on corner and random vectors."""
+    width = netlist.width
+    mask = (1 << width) - 1
+    corners = [0, 1, mask, mask >> 1, 1 << (width - 1)]
+    problems = []
+    for name, code, _ in OPERATIONS:
+        pairs = [(a, b) for a in corners for b in corners]
+        pairs += [(rng.getrandbits(width), rng.getrandbits(width)) for _ in range(samples)]
+        vectors = [(int(code, 2), a, b) for a, b in pairs]
+        words, lane_mask = pack_vectors(netlist, vectors)
+        nets = netlist.simulate(words, lane_mask)
+        results = unpack_bus(nets, [f"OUT[{i}]" for i in range(width)], len(vectors))
+        flags = {f: unpack_bus(nets, [f], len(vectors)) for f in FLAG_OUTPUTS}
+        for j, (a, b) in enumerate(pairs):
+            result, expected = compute_alu_operation(code, a, b, width)
+            got = {f.lower(): bool(flags[f][j]) for f in FLAG_OUTPUTS}
+            if results[j] != result or got != expected:
+                problems.append(f"{name} A=0x{a:X} B=0x{b:X}")
+                break
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Gate-level ALU netlist statistics and verification.")
+    parser.add_argument("--width", type=int, default=8, help="Datapath width (default: 8).")
+    parser.add_argument("--samples", type=int, default=SAMPLES,
+                        help=f"Random vectors per opcode for widths other than 8 (default: {SAMPLES}).")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed for sampled verification.")
+    args = parser.parse_args()
+    if args.samples < 0:
+        parser.error("--samples must not be negative")
+
+    netlist = build_alu_netlist(args.width)
+    kinds: Dict[str, int] = {}
+    for gate in netlist.gates:
+        kinds[gate.kind] = kinds.get(gate.kind, 0) + 1
+    depth = netlist.depth()
+
+    print(f"{args.width}-bit ALU netlist: {len(netlist.gates)} gates, "
+          f"{len(netlist.nets())} nets, ~{netlist.transistor_count():,} transistors")
+    print("  " + ", ".join(f"{kind} {count}" for kind, count in sorted(kinds.items())))
+    print(f"  Logic depth: {max(depth[o] for o in netlist.outputs)} levels")
+
+    if args.width != 8:
+        start = time.time()
+        problems = verify_sampled(netlist, random.Random(args.seed), args.samples)
+        elapsed = time.time() - start
+        if problems:
+            print(f"FAIL: netlist disagrees with the golden model ({elapsed:.1f}s)")
+            for problem in problems:
+                print(f"  {problem}")
+            return 1
+        print(f"PASS: matches the golden model on corner cases and {args.samples:,} random "
+              f"vectors per opcode ({elapsed:.1f}s; exhaustive tables are 8-bit only)")
+        return 0
+
+    start = time.time()
+    problems = verify(netlist)
+    elapsed = time.time() - start
+    if problems:
+        print(f"FAIL: netlist disagrees with the golden model ({elapsed:.1f}s)")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    print(f"PASS: matches the golden model on all 1,245,184 vectors ({elapsed:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
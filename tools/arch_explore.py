@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+What-if explorer for adder and shifter architectures of the discrete ALU.
+
+PPA.md guesses that carry-lookahead "could reduce T_pd by ~40% at the cost
+of ~800 additional transistors". This tool builds the alternatives as gate
+netlists (tools/alu_netlist.py) and measures them:
+
+    adders    ripple   full-adder chain (the board; alu_netlist.ripple_carry_adder)
+              cla      4-bit lookahead blocks, block carries by a second
+                       lookahead level over groups of 4 blocks
+              select   4-bit carry-select: each block precomputed for carry 0
+                       and 1, the block carry-in picks one
+              skip     4-bit carry-skip: a block whose bits all propagate
+                       passes its carry-in straight to its carry-out
+    shifters  andor    AND-OR term selection (the board)
+              nand     the same terms in NAND-NAND form
+              mux      2:1 NAND muxes: direction, then REV_A, then enable
+
+Each adder is measured on its own (A, B, CIN -> S, COUT), then as part of
+the full ALU with every shifter. Metrics per netlist:
+
+- transistors, using the CMOS costs in alu_netlist.TRANSISTORS
+- logic depth in gate levels
+- static delay: longest topological path with discrete-gate delays
+- sensitized delay: worst floating-mode settle time over carry-chain and
+  random vectors. A gate with a controlling input value settles when its
+  earliest controlling input does, so the false paths a static analysis
+  charges carry-skip for are not counted. Being sampled, it is a lower
+  bound where static delay is an upper one.
+
+Gate delays come from the critical-path figures in docs/ARCHITECTURE.md
+(XOR 15 ns, full-adder carry 50 ns = AND + OR, NAND 20 ns, inverter 10 ns),
+plus 5 ns per input beyond two.
+
+Every netlist is checked against the golden model with bit-parallel
+simulation. At 8 bits the adders get all 131,072 inputs (ADD, and SUB
+through a + ~b + 1). The ALUs get corner and random vectors for every
+opcode, or all 1,245,184 vectors with --exhaustive. The Pareto-optimal
+designs (no other design both faster and smaller) are starred.
+
+Usage:
+    python3 tools/arch_explore.py                    # 8, 16 and 32 bits
+    python3 tools/arch_explore.py --widths 8 --exhaustive
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from alu_netlist import (Netlist, and_or_shift_bit, build_alu_netlist, pack_bits,
+                         ripple_carry_adder, verify, verify_sampled)
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+
+BLOCK = 4
+
+# Gate delays in ns for two inputs (docs/ARCHITECTURE.md critical paths)
+GATE_DELAY_NS = {
+    "NOT": 10, "BUF": 10,
+    "NAND": 20, "NOR": 20,
+    "AND": 25, "OR": 25,
+    "XOR": 15, "XNOR": 15,
+    "CONST0": 0, "CONST1": 0,
+}
+FANIN_DELAY_NS = 5
+CONTROLLING = {"AND": 0, "NAND": 0, "OR": 1, "NOR": 1}
+
+SAMPLES = 256   # random vectors per check (per opcode for ALUs)
+
+
+def gate_delay(kind: str, inputs: int) -> float:
+    return GATE_DELAY_NS[kind] + FANIN_DELAY_NS * max(inputs - 2, 0)
+
+
+# ---------------------------------------------------------------------------
+# Adders: adder(netlist, a, b, carry_in) -> (sums, carries ending in carry out)
+# ---------------------------------------------------------------------------
+
+def _propagate_generate(netlist: Netlist, a: Sequence[str], b: Sequence[str]) -> Tuple[List[str], List[str]]:
+    p = [netlist.add("XOR", (x, y), f"p[{i}]") for i, (x, y) in enumerate(zip(a, b))]
+    g = [netlist.add("AND", (x, y), f"g[{i}]") for i, (x, y) in enumerate(zip(a, b))]
+    return p, g
+
+
+def _lookahead(netlist: Netlist, g: Sequence[str], p: Sequence[str], carry_in: str) -> List[str]:
+    """Carries c[1..n] of a group straight from its carry-in, in two gate levels."""
+    carries = []
+    for k in range(1, len(g) + 1):
+        terms = [g[k - 1]]
+        for j in range(k - 2, -1, -1):   # g[j] propagated through p[j+1..k-1]
+            terms.append(netlist.add("AND", [g[j], *p[j + 1:k]]))
+        terms.append(netlist.add("AND", [carry_in, *p[:k]]))
+        carries.append(netlist.add("OR", terms))
+    return carries
+
+
+def _group(netlist: Netlist, g: Sequence[str], p: Sequence[str]) -> Tuple[str, str]:
+    """Group generate and propagate."""
+    if len(g) == 1:
+        return g[0], p[0]
+    terms = [g[-1]] + [netlist.add("AND", [g[j], *p[j + 1:]]) for j in range(len(g) - 2, -1, -1)]
+    return netlist.add("OR", terms), netlist.add("AND", list(p))
+
+
+def _blocks(width: int) -> List[range]:
+    return [range(start, min(start + BLOCK, width)) for start in range(0, width, BLOCK)]
+
+
+def _chain(netlist: Netlist, p: Sequence[str], g: Sequence[str], carry, sums: List[str],
+           first: Optional[int] = None) -> str:
+    """
+    Ripple through precomputed p/g, appending to `sums` (named s[first..] if
+    `first` is given); `carry` may be a net or the constant 0/1.
+    """
+    for i, (p_bit, g_bit) in enumerate(zip(p, g), first or 0):
+        name = f"s[{i}]" if first is not None else None
+        if carry == 0:
+            sums.append(p_bit)
+            carry = g_bit
+        elif carry == 1:
+            sums.append(netlist.add("NOT", (p_bit,)))
+            carry = netlist.add("OR", (g_bit, p_bit))
+        else:
+            sums.append(netlist.add("XOR", (p_bit, carry), name))
+            carry = netlist.add("OR", (g_bit, netlist.add("AND", (p_bit, carry))))
+    return carry
+
+
+def cla_adder(netlist: Netlist, a: Sequence[str], b: Sequence[str],
+              carry_in: str) -> Tuple[List[str], List[str]]:
+    p, g = _propagate_generate(netlist, a, b)
+    blocks = _blocks(len(a))
+    groups = [_group(netlist, [g[i] for i in block], [p[i] for i in block]) for block in blocks]
+    block_carries = [carry_in]
+    for start in range(0, len(blocks), BLOCK):   # lookahead within 4 blocks, ripple beyond
+        chunk = groups[start:start + BLOCK]
+        block_carries += _lookahead(netlist, [gg for gg, _ in chunk], [pp for _, pp in chunk],
+                                    block_carries[-1])
+    carries = []
+    for block, block_in in zip(blocks, block_carries):
+        inner = _lookahead(netlist, [g[i] for i in block[:-1]], [p[i] for i in block[:-1]], block_in)
+        carries += [block_in, *inner]
+    carries.append(block_carries[-1])
+    sums = [netlist.add("XOR", (p[i], carries[i]), f"s[{i}]") for i in range(len(a))]
+    return sums, carries
+
+
+def _mux(netlist: Netlist, low: str, high: str, select: str, select_n: str,
+         name: Optional[str] = None) -> str:
+    return netlist.add("OR", (netlist.add("AND", (high, select)), netlist.add("AND", (low, select_n))),
+                       name)
+
+
+def carry_select_adder(netlist: Netlist, a: Sequence[str], b: Sequence[str],
+                       carry_in: str) -> Tuple[List[str], List[str]]:
+    p, g = _propagate_generate(netlist, a, b)
+    sums: List[str] = []
+    carries = [carry_in]
+    for block in _blocks(len(a)):
+        bp, bg = [p[i] for i in block], [g[i] for i in block]
+        if not sums:
+            carries.append(_chain(netlist, bp, bg, carry_in, sums, block[0]))
+            continue
+        low: List[str] = []
+        high: List[str] = []
+        carry_low = _chain(netlist, bp, bg, 0, low)
+        carry_high = _chain(netlist, bp, bg, 1, high)
+        select = carries[-1]
+        select_n = netlist.add("NOT", (select,))
+        for i, s0, s1 in zip(block, low, high):
+            sums.append(_mux(netlist, s0, s1, select, select_n, f"s[{i}]"))
+        # carry_low implies carry_high, so the carry mux reduces to AND-OR
+        carries.append(netlist.add("OR", (carry_low, netlist.add("AND", (carry_high, select)))))
+    return sums, carries
+
+
+def carry_skip_adder(netlist: Netlist, a: Sequence[str], b: Sequence[str],
+                     carry_in: str) -> Tuple[List[str], List[str]]:
+    p, g = _propagate_generate(netlist, a, b)
+    sums: List[str] = []
+    carries = [carry_in]
+    for block in _blocks(len(a)):
+        bp, bg = [p[i] for i in block], [g[i] for i in block]
+        ripple = _chain(netlist, bp, bg, carries[-1], sums, block[0])
+        if len(bp) == 1:
+            carries.append(ripple)
+            continue
+        # Block propagate selects the carry-in over the ripple: a mux, not an OR,
+        # so a 0 carry does not have to ripple through the block either
+        propagate = netlist.add("AND", bp)
+        carries.append(_mux(netlist, ripple, carries[-1], propagate, netlist.add("NOT", (propagate,))))
+    return sums, carries
+
+
+ADDERS: Dict[str, Callable[..., Tuple[List[str], List[str]]]] = {
+    "ripple": ripple_carry_adder,
+    "cla": cla_adder,
+    "select": carry_select_adder,
+    "skip": carry_skip_adder,
+}
+
+
+# ---------------------------------------------------------------------------
+# Shifters: shifter(netlist, i, a, decoded, shift_right) -> output bit i
+# ---------------------------------------------------------------------------
+
+def _shared(netlist: Netlist, kind: str, inputs: Sequence[str], name: str) -> str:
+    """A control net built once and reused by every bit slice."""
+    return name if name in netlist.driver else netlist.add(kind, inputs, name)
+
+
+def nand_shift_bit(netlist: Netlist, i: int, a: Sequence[str], decoded: Dict[str, str],
+                   shift_right: str) -> str:
+    width = len(a)
+    terms = []
+    if i > 0:
+        terms.append(netlist.add("NAND", (decoded["LSL"], a[i - 1]), f"shl[{i}]"))
+    if i < width - 1:
+        terms.append(netlist.add("NAND", (shift_right, a[i + 1]), f"shr[{i}]"))
+    else:
+        terms.append(netlist.add("NAND", (decoded["ASR"], a[i]), "asr_msb"))
+    terms.append(netlist.add("NAND", (decoded["REV_A"], a[width - 1 - i]), f"rev[{i}]"))
+    return netlist.add("NAND", terms, f"sh[{i}]")
+
+
+def mux_shift_bit(netlist: Netlist, i: int, a: Sequence[str], decoded: Dict[str, str],
+                  shift_right: str) -> str:
+    width = len(a)
+    lsl_n = _shared(netlist, "NOT", (decoded["LSL"],), "shm_lsl_n")
+    rev_n = _shared(netlist, "NOT", (decoded["REV_A"],), "shm_rev_n")
+    enable = _shared(netlist, "OR", (decoded["LSL"], shift_right, decoded["REV_A"]), "shm_en")
+
+    def mux(low: str, high: str, select: str, select_n: str, name: str) -> str:
+        return netlist.add("NAND", (netlist.add("NAND", (high, select)),
+                                    netlist.add("NAND", (low, select_n))), name)
+
+    right = a[i + 1] if i < width - 1 else netlist.add("AND", (decoded["ASR"], a[i]), "asr_msb")
+    if i > 0:
+        shifted = mux(right, a[i - 1], decoded["LSL"], lsl_n, f"shm_dir[{i}]")
+    else:
+        shifted = netlist.add("AND", (right, lsl_n), f"shm_dir[{i}]")
+    selected = mux(shifted, a[width - 1 - i], decoded["REV_A"], rev_n, f"shm_rev[{i}]")
+    return netlist.add("AND", (selected, enable), f"sh[{i}]")
+
+
+SHIFTERS: Dict[str, Callable[..., str]] = {
+    "andor": and_or_shift_bit,
+    "nand": nand_shift_bit,
+    "mux": mux_shift_bit,
+}
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def build_adder(adder: Callable[..., Tuple[List[str], List[str]]], width: int) -> Netlist:
+    """Stand-alone adder: inputs A, B, CIN; outputs the sum bits then COUT."""
+    netlist = Netlist(width)
+    a = [netlist.add_input(f"A[{i}]") for i in range(width)]
+    b = [netlist.add_input(f"B[{i}]") for i in range(width)]
+    sums, carries = adder(netlist, a, b, netlist.add_input("CIN"))
+    netlist.outputs = list(sums) + [carries[-1]]
+    return netlist
+
+
+def static_delay(netlist: Netlist) -> float:
+    """Longest topological input-to-output path in ns."""
+    times = {net: 0.0 for net in netlist.inputs}
+    for gate in netlist.gates:
+        times[gate.output] = gate_delay(gate.kind, len(gate.inputs)) + max(
+            (times[i] for i in gate.inputs), default=0.0)
+    return max(times[o] for o in netlist.outputs)
+
+
+def sensitized_delay(netlist: Netlist, vectors: Sequence[Dict[str, int]]) -> float:
+    """Worst floating-mode settle time (ns) of the outputs over input assignments."""
+    index = {net: k for k, net in enumerate(netlist.nets())}
+    gates = [(index[g.output], g.kind, CONTROLLING.get(g.kind), [index[i] for i in g.inputs],
+              gate_delay(g.kind, len(g.inputs))) for g in netlist.gates]
+    outputs = [index[o] for o in netlist.outputs]
+    worst = 0.0
+    for vector in vectors:
+        values = [0] * len(index)
+        times = [0.0] * len(index)
+        for net in netlist.inputs:
+            values[index[net]] = vector[net]
+        for out, kind, controlling, ins, delay in gates:
+            pins = [values[i] for i in ins]
+            if kind in ("AND", "NAND"):
+                value = int(all(pins))
+            elif kind in ("OR", "NOR"):
+                value = int(any(pins))
+            elif kind in ("XOR", "XNOR"):
+                value = sum(pins) & 1
+            elif kind in ("BUF", "NOT"):
+                value = pins[0]
+            else:
+                value = int(kind == "CONST1")
+            if kind in ("NAND", "NOR", "XNOR", "NOT"):
+                value ^= 1
+            if controlling is not None and controlling in pins:
+                arrival = min(times[i] for i, v in zip(ins, pins) if v == controlling)
+            else:
+                arrival = max((times[i] for i in ins), default=0.0)
+            values[out] = value
+            times[out] = arrival + delay
+        worst = max(worst, max(times[o] for o in outputs))
+    return worst
+
+
+def _bits(name: str, value: int, width: int) -> Dict[str, int]:
+    return {f"{name}[{i}]": value >> i & 1 for i in range(width)}
+
+
+def carry_chain_operands(width: int, rng: random.Random) -> List[Tuple[int, int, int]]:
+    """(a, b, carry_in) whose carries ripple from every bit position, plus random ones."""
+    mask = (1 << width) - 1
+    operands = [(mask, 1 << k, 0) for k in range(width)]
+    operands += [(mask ^ ((1 << k) - 1), 0, 1) for k in range(width)]
+    operands += [(rng.getrandbits(width), rng.getrandbits(width), rng.getrandbits(1))
+                 for _ in range(SAMPLES // 4)]
+    return operands
+
+
+def adder_vectors(width: int, rng: random.Random) -> List[Dict[str, int]]:
+    return [{**_bits("A", a, width), **_bits("B", b, width), "CIN": cin}
+            for a, b, cin in carry_chain_operands(width, rng)]
+
+
+def alu_vectors(width: int, rng: random.Random) -> List[Dict[str, int]]:
+    """Timing vectors: carry chains through ADD/SUB, a few random ones per opcode."""
+    codes = {name: int(code, 2) for name, code, _ in OPERATIONS}
+    mask = (1 << width) - 1
+    vectors = []
+    for a, b, cin in carry_chain_operands(width, rng):
+        code, b = (codes["SUB"], ~b & mask) if cin else (codes["ADD"], b)
+        vectors.append((code, a, b))
+    for code in codes.values():
+        vectors += [(code, rng.getrandbits(width), rng.getrandbits(width)) for _ in range(4)]
+    return [{**_bits("A", a, width), **_bits("B", b, width), **_bits("OP", code, 5)}
+            for code, a, b in vectors]
+
+
+def check_adder(netlist: Netlist, rng: random.Random) -> List[str]:
+    """Bit-parallel check against the golden ADD (carry in 0) and SUB (a + ~b + 1)."""
+    width = netlist.width
+    mask = (1 << width) - 1
+    if width == 8:
+        pairs = [(a, b) for a in range(256) for b in range(256)]
+    else:
+        pairs = [(rng.getrandbits(width), rng.getrandbits(width)) for _ in range(4 * SAMPLES)]
+        pairs += [(mask, 1), (mask, mask), (0, 0), (1 << (width - 1), 1 << (width - 1))]
+    problems = []
+    for name, code, carry_in in (("ADD", "00000", 0), ("SUB", "00001", 1)):
+        a_values = [a for a, _ in pairs]
+        b_values = [b if not carry_in else ~b & mask for _, b in pairs]
+        words = {f"A[{i}]": pack_bits(a_values, i) for i in range(width)}
+        words.update({f"B[{i}]": pack_bits(b_values, i) for i in range(width)})
+        lane_mask = (1 << len(pairs)) - 1
+        words["CIN"] = lane_mask if carry_in else 0
+        nets = netlist.simulate(words, lane_mask)
+        expected = []
+        for a, b in pairs:
+            result, flags = compute_alu_operation(code, a, b, width)
+            expected.append(result | flags["carry"] << width)
+        diff = 0
+        for bit, output in enumerate(netlist.outputs):
+            diff |= nets[output] ^ pack_bits(expected, bit)
+        if diff:
+            a, b = pairs[(diff & -diff).bit_length() - 1]
+            problems.append(f"{name} A=0x{a:X} B=0x{b:X}")
+    return problems
+
+
+def check_alu(netlist: Netlist, rng: random.Random, exhaustive: bool = False) -> List[str]:
+    """Bit-parallel check of every opcode against the golden model."""
+    if exhaustive and netlist.width == 8:
+        return verify(netlist)
+    return verify_sampled(netlist, rng, SAMPLES)
+
+
+@dataclass
+class Design:
+    label: str
+    netlist: Netlist
+    transistors: int
+    depth: int
+    static_ns: float
+    sensitized_ns: float
+    problems: List[str]
+    pareto: bool = False
+
+
+def measure(label: str, netlist: Netlist, vectors: Sequence[Dict[str, int]],
+            problems: List[str]) -> Design:
+    depth = netlist.depth()
+    return Design(label, netlist, netlist.transistor_count(), max(depth[o] for o in netlist.outputs),
+                  static_delay(netlist), sensitized_delay(netlist, vectors), problems)
+
+
+def mark_pareto(designs: Sequence[Design]) -> None:
+    """Star designs that no other design beats on both delay and transistors."""
+    for design in designs:
+        design.pareto = not any(
+            other.sensitized_ns <= design.sensitized_ns and other.transistors <= design.transistors
+            and (other.sensitized_ns, other.transistors) != (design.sensitized_ns, design.transistors)
+            for other in designs)
+
+
+def explore(width: int, seed: int = 1, exhaustive: bool = False,
+            adders: Optional[Sequence[str]] = None,
+            shifters: Optional[Sequence[str]] = None) -> Tuple[List[Design], List[Design]]:
+    """Measure and verify the stand-alone adders and the ALU combinations at one width."""
+    rng = random.Random(seed)
+    adders = list(adders or ADDERS)
+    shifters = list(shifters or SHIFTERS)
+    vectors = adder_vectors(width, rng)
+    adder_designs = []
+    for name in adders:
+        netlist = build_adder(ADDERS[name], width)
+        adder_designs.append(measure(name, netlist, vectors, check_adder(netlist, rng)))
+    vectors = alu_vectors(width, rng)
+    alu_designs = []
+    for adder in adders:
+        for shifter in shifters:
+            netlist = build_alu_netlist(width, ADDERS[adder], SHIFTERS[shifter])
+            alu_designs.append(measure(f"{adder} / {shifter}", netlist, vectors,
+                                       check_alu(netlist, rng, exhaustive)))
+    mark_pareto(adder_designs)
+    mark_pareto(alu_designs)
+    return adder_designs, alu_designs
+
+
+def print_designs(title: str, designs: Sequence[Design], baseline: Design) -> None:
+    print(f"\n{title:<18} {'gates':>6} {'transistors':>11} {'depth':>6} {'static':>8} "
+          f"{'sensitized':>10} {'vs baseline':>17}  verified")
+    for d in designs:
+        delta = (f"{d.transistors - baseline.transistors:+5}T "
+                 f"{100 * (d.sensitized_ns / baseline.sensitized_ns - 1):+4.0f}%")
+        status = "PASS" if not d.problems else f"FAIL ({d.problems[0]})"
+        print(f"{'*' if d.pareto else ' '} {d.label:<16} {len(d.netlist.gates):>6} {d.transistors:>11,} "
+              f"{d.depth:>6} {d.static_ns:>6.0f}ns {d.sensitized_ns:>8.0f}ns {delta:>17}  {status}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare adder and shifter architectures for the ALU.")
+    parser.add_argument("--widths", type=int, nargs="+", default=[8, 16, 32],
+                        help="Datapath widths (default: 8 16 32).")
+    parser.add_argument("--adders", nargs="+", choices=sorted(ADDERS), default=None,
+                        help="Adder architectures (default: all).")
+    parser.add_argument("--shifters", nargs="+", choices=sorted(SHIFTERS), default=None,
+                        help="Shifter architectures (default: all).")
+    parser.add_argument("--exhaustive", action="store_true",
+                        help="Verify 8-bit ALUs on all 1,245,184 vectors (~3 s each).")
+    parser.add_argument("--seed", type=int, default=1, help="Random vector seed (default: 1).")
+    args = parser.parse_args()
+    if any(width < 2 for width in args.widths):
+        print("Error: widths must be at least 2", file=sys.stderr)
+        return 2
+
+    failed = False
+    for width in args.widths:
+        start = time.time()
+        adders, alus = explore(width, args.seed, args.exhaustive, args.adders, args.shifters)
+        print(f"\n=== {width}-bit ({time.time() - start:.1f}s) ===")
+        print_designs("Adder", adders, adders[0])
+        print_designs("ALU adder/shifter", alus, alus[0])
+        failed |= any(d.problems for d in adders + alus)
+    print("\n* Pareto-optimal (sensitized delay vs transistors); "
+          f"gate delays {GATE_DELAY_NS['XOR']} ns XOR .. {GATE_DELAY_NS['AND']} ns AND/OR, "
+          f"+{FANIN_DELAY_NS} ns per extra input")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+PODEM test pattern generation for stuck-at faults in the ALU netlist.
+
+Works on the gate-level netlist from tools/alu_netlist.py, the same one
+tools/fault_sim.py grades; the Logisim and KiCad sources have no gate-level
+wiring to run on. For every stuck-at fault on every net, PODEM searches the
+primary inputs:
+
+- implication: three-valued simulation of the good and the faulty machine
+  (the faulty one only inside the fault's fanout cone)
+- objective: activate the fault, then drive a D-frontier gate's side input
+  to its non-controlling value (frontier gate nearest an output first)
+- backtrace: walk the objective back to a primary input through X nets,
+  choosing the easiest input (SCOAP controllability) when one input
+  decides the gate and the hardest when all must be set
+- backtracking over the decision stack until a test is found, the space
+  is exhausted (the fault is redundant: no input detects it) or the
+  backtrack limit is hit (aborted)
+
+The opcode bits are constrained to the 19 defined operations, so every
+pattern has a golden-model expectation and "redundant" means undetectable
+in normal operation.
+
+Each new test cube is extended to more faults (dynamic compaction), filled
+with seeded random bits, then fault-simulated to drop every other fault it
+detects. A greedy set cover over the final detection matrix removes
+patterns that became unnecessary (static compaction).
+
+Usage:
+    python3 tools/atpg.py                           # stats
+    python3 tools/atpg.py --json atpg.json          # write the pattern set
+    python3 tools/atpg.py --verify                  # confirm redundancies exhaustively
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from alu_netlist import OPCODE_BITS, Netlist, build_alu_netlist
+from exhaustive_vectors import OPERATIONS
+from fault_sim import (Fault, FaultSimulator, enumerate_faults, exhaustive_batches,
+                       file_batches, run_campaign)
+from vector_coverage import write_json_vectors
+
+X = 2  # unknown, in three-valued simulation
+BASE = {"AND": "AND", "NAND": "AND", "OR": "OR", "NOR": "OR", "XOR": "XOR", "XNOR": "XOR",
+        "BUF": "BUF", "NOT": "BUF", "CONST0": "CONST0", "CONST1": "CONST1"}
+INVERTING = {"NAND", "NOR", "XNOR", "NOT"}
+NON_CONTROLLING = {"AND": 1, "OR": 0, "XOR": 0, "BUF": 0}
+
+DETECTED, REDUNDANT, ABORTED = "detected", "redundant", "aborted"
+
+
+def evaluate3(base: str, values: Sequence[int]) -> int:
+    if base == "AND":
+        return 0 if 0 in values else X if X in values else 1
+    if base == "OR":
+        return 1 if 1 in values else X if X in values else 0
+    if base == "XOR":
+        return X if X in values else sum(values) & 1
+    if base == "BUF":
+        return values[0]
+    return 1 if base == "CONST1" else 0
+
+
+class Podem:
+    """PODEM over a gate netlist whose OP inputs must form a defined opcode."""
+
+    def __init__(self, netlist: Netlist, backtrack_limit: int = 1000):
+        self.netlist = netlist
+        self.backtrack_limit = backtrack_limit
+        nets = netlist.nets()
+        self.index = {net: i for i, net in enumerate(nets)}
+        self.names = nets
+        self.inputs = [self.index[net] for net in netlist.inputs]
+        self.outputs = [self.index[net] for net in netlist.outputs]
+        self.gates = [(self.index[g.output], BASE[g.kind], g.kind in INVERTING,
+                       tuple(self.index[i] for i in g.inputs)) for g in netlist.gates]
+        self.driver = {gate[0]: gate for gate in self.gates}
+        self.readers = netlist.fanout()
+        self.opcode_bits = [self.index[f"OP[{k}]"] for k in range(OPCODE_BITS)]
+        self.opcodes = [int(code, 2) for _, code, _ in OPERATIONS]
+        self._controllability()
+        self._distance()
+
+    def _controllability(self) -> None:
+        """SCOAP-style CC0/CC1: cost to set each net to 0/1."""
+        self.cc = {net: (1, 1) for net in self.inputs}
+        for out, base, invert, ins in self.gates:
+            zero = [self.cc[i][0] for i in ins]
+            one = [self.cc[i][1] for i in ins]
+            if base == "AND":
+                cc = (min(zero) + 1, sum(one) + 1)
+            elif base == "OR":
+                cc = (sum(zero) + 1, min(one) + 1)
+            elif base == "XOR":
+                cost = min(sum(min(pair) for pair in zip(zero, one)), 1 << 30) + 1
+                cc = (cost, cost)
+            elif base == "BUF":
+                cc = (zero[0] + 1, one[0] + 1)
+            else:
+                cc = (0, 1 << 30) if base == "CONST0" else (1 << 30, 0)
+            self.cc[out] = cc[::-1] if invert else cc
+
+    def _distance(self) -> None:
+        """Gate levels from each net to the nearest primary output."""
+        far = len(self.gates) + 1
+        self.distance = [far] * len(self.names)
+        for net in self.outputs:
+            self.distance[net] = 0
+        for out, _, _, ins in reversed(self.gates):
+            for net in ins:
+                self.distance[net] = min(self.distance[net], self.distance[out] + 1)
+
+    # -- implication -------------------------------------------------------
+
+    def _imply(self, assign: Dict[int, int], site: int, stuck: int, cone: set) -> None:
+        good = self.good = [X] * len(self.names)
+        bad = self.bad = [X] * len(self.names)
+        # same[n]: the good and faulty machines provably agree on n
+        same = self.same = [True] * len(self.names)
+        for net in self.inputs:
+            good[net] = bad[net] = assign.get(net, X)
+        if site in self.inputs:
+            bad[site] = stuck
+            same[site] = good[site] == stuck
+        for out, base, invert, ins in self.gates:
+            value = evaluate3(base, [good[i] for i in ins])
+            good[out] = value ^ 1 if invert and value != X else value
+            if out == site:
+                bad[out] = stuck
+                same[out] = good[out] == stuck
+            elif out in cone:
+                value = evaluate3(base, [bad[i] for i in ins])
+                bad[out] = value ^ 1 if invert and value != X else value
+                same[out] = (good[out] == bad[out] != X) or all(same[i] for i in ins)
+            else:
+                bad[out] = good[out]
+
+    def _opcode_possible(self, assign: Dict[int, int]) -> bool:
+        fixed = [(k, assign[net]) for k, net in enumerate(self.opcode_bits) if net in assign]
+        return any(all(opcode >> k & 1 == value for k, value in fixed) for opcode in self.opcodes)
+
+    def _detected(self) -> bool:
+        return any(self.good[o] != X and self.bad[o] != X and self.good[o] != self.bad[o]
+                   for o in self.outputs)
+
+    # -- objective and backtrace ---------------------------------------------
+
+    def _objective(self, site: int, stuck: int, cone: set) -> Optional[Tuple[int, int]]:
+        """(net, value) to aim for next, or None when the fault cannot be detected."""
+        good, same = self.good, self.same
+        if good[site] == X:
+            return site, 1 - stuck
+        if good[site] == stuck or not any(not same[o] for o in self.outputs):
+            return None
+        frontier = []
+        for out, base, _, ins in self.gates:
+            if out in cone and not same[out] and not (good[out] != X and self.bad[out] != X):
+                if any(not same[i] for i in ins):
+                    frontier.append((self.distance[out], out, base, ins))
+        for _, _, base, ins in sorted(frontier):
+            for net in ins:
+                if same[net] and good[net] == X:
+                    return net, NON_CONTROLLING.get(base, 0)
+        for _, _, base, ins in sorted(frontier):
+            for net in ins:
+                if good[net] == X:
+                    return net, NON_CONTROLLING.get(base, 0)
+        return None if not frontier else (-1, 0)
+
+    def _backtrace(self, net: int, value: int) -> Optional[Tuple[int, int]]:
+        good, cc = self.good, self.cc
+        while net in self.driver:
+            _, base, invert, ins = self.driver[net]
+            if invert:
+                value ^= 1
+            unknown = [i for i in ins if good[i] == X]
+            if not unknown or base in ("CONST0", "CONST1"):
+                return None
+            if base == "XOR":
+                net = min(unknown, key=lambda i: min(cc[i]))
+                # Parity of the known inputs; other X inputs are left at 0 for now
+                value ^= sum(good[i] for i in ins if good[i] != X) & 1
+            elif base == "BUF":
+                net = unknown[0]
+            else:
+                controlling = 0 if base == "AND" else 1
+                if value == controlling:   # one input decides: the easiest
+                    net = min(unknown, key=lambda i: cc[i][value])
+                else:                      # all inputs needed: the hardest first
+                    net = max(unknown, key=lambda i: cc[i][value])
+        return net, value
+
+    # -- search ------------------------------------------------------------
+
+    def generate(self, fault: Fault, fixed: Optional[Dict[str, int]] = None,
+                 limit: Optional[int] = None) -> Tuple[str, Dict[str, int], int]:
+        """
+        Search for a test of a stuck-at fault; returns (status, cube, backtracks).
+        `fixed` pre-assigns inputs that the search may not change.
+        """
+        site = self.index[fault.nets[0]]
+        stuck = 1 if fault.kind == "SA1" else 0
+        cone = {self.gates[i][0] for i in self.netlist.cone([fault.nets[0]], self.readers)}
+        cone.add(site)
+        assign = {self.index[name]: value for name, value in (fixed or {}).items()}
+        limit = self.backtrack_limit if limit is None else limit
+        stack: List[List[int]] = []   # [input, value, both values tried]
+        backtracks = 0
+        while True:
+            ok = self._opcode_possible(assign)
+            if ok:
+                self._imply(assign, site, stuck, cone)
+                if self._detected():
+                    return DETECTED, {self.names[n]: v for n, v in assign.items()}, backtracks
+                objective = self._objective(site, stuck, cone)
+                ok = objective is not None
+            if ok:
+                decision = self._backtrace(*objective) if objective[0] >= 0 else None
+                if decision is None or decision[0] in assign:
+                    free = [n for n in self.inputs if n not in assign]
+                    decision = (free[0], 0) if free else None
+                if decision is not None:
+                    assign[decision[0]] = decision[1]
+                    stack.append([decision[0], decision[1], 0])
+                    continue
+            # Backtrack: flip the newest decision not yet tried both ways
+            while stack and stack[-1][2]:
+                del assign[stack.pop()[0]]
+            if not stack:
+                return REDUNDANT, {}, backtracks
+            backtracks += 1
+            if backtracks > limit:
+                return ABORTED, {}, backtracks
+            stack[-1][1] ^= 1
+            stack[-1][2] = 1
+            assign[stack[-1][0]] = stack[-1][1]
+
+
+# ---------------------------------------------------------------------------
+# Pattern set generation
+# ---------------------------------------------------------------------------
+
+@dataclass
+class AtpgResult:
+    vectors: List[Tuple[str, int, int]] = field(default_factory=list)
+    detected: Dict[Fault, int] = field(default_factory=dict)   # fault -> vector index
+    redundant: List[Fault] = field(default_factory=list)
+    aborted: List[Fault] = field(default_factory=list)
+    generated: int = 0          # cubes PODEM produced before static compaction
+    backtracks: int = 0
+
+
+def fill_cube(netlist: Netlist, cube: Dict[str, int], rng: random.Random) -> Tuple[str, int, int]:
+    """Random-fill a test cube's unassigned bits into an (opcode, A, B) vector."""
+    codes = [int(code, 2) for _, code, _ in OPERATIONS]
+    fixed = {k: cube[f"OP[{k}]"] for k in range(OPCODE_BITS) if f"OP[{k}]" in cube}
+    choices = [c for c in codes if all(c >> k & 1 == v for k, v in fixed.items())]
+    opcode = rng.choice(choices)
+    a = b = 0
+    for i in range(netlist.width):
+        a |= cube.get(f"A[{i}]", rng.getrandbits(1)) << i
+        b |= cube.get(f"B[{i}]", rng.getrandbits(1)) << i
+    return format(opcode, f"0{OPCODE_BITS}b"), a, b
+
+
+def to_tuple(vector: Tuple[str, int, int]) -> Tuple[int, int, int]:
+    return int(vector[0], 2), vector[1], vector[2]
+
+
+def generate_patterns(netlist: Netlist, faults: Sequence[Fault], backtrack_limit: int = 1000,
+                      merge: int = 8, seed: int = 1) -> AtpgResult:
+    """PODEM per undetected fault with dynamic compaction and fault dropping."""
+    podem = Podem(netlist, backtrack_limit)
+    simulator = FaultSimulator(netlist)
+    rng = random.Random(seed)
+    result = AtpgResult()
+    # Hardest faults first: their cubes fix the most bits and catch easy faults for free
+    order = sorted(faults, key=lambda f: -max(podem.cc[podem.index[f.nets[0]]]))
+    remaining = set(faults)
+    vectors = []
+    for fault in order:
+        if fault not in remaining:
+            continue
+        status, cube, backtracks = podem.generate(fault)
+        result.backtracks += backtracks
+        if status != DETECTED:
+            (result.redundant if status == REDUNDANT else result.aborted).append(fault)
+            remaining.discard(fault)
+            continue
+        tried = 0
+        for other in order:
+            if tried == merge:
+                break
+            if other in remaining and other != fault:
+                tried += 1
+                status, extended, backtracks = podem.generate(other, cube, limit=16)
+                if status == DETECTED:
+                    cube = extended
+        vectors.append(fill_cube(netlist, cube, rng))
+        words, mask = next(file_batches(netlist, [to_tuple(vectors[-1])]))[:2]
+        good = netlist.simulate(words, mask)
+        remaining -= {f for f in remaining if simulator.detect(f, good, mask)}
+        if fault in remaining:
+            raise AssertionError(f"PODEM cube does not detect {fault}")
+    result.generated = len(vectors)
+
+    # Static compaction: greedy set cover over the detection matrix
+    rows = run_campaign(simulator, [f for f in faults if f not in result.redundant
+                                    and f not in result.aborted],
+                        file_batches(netlist, [to_tuple(v) for v in vectors]), drop=False)
+    uncovered = {f: row for f, row in rows.items() if row}
+    chosen = []
+    while uncovered:
+        counts = [0] * len(vectors)
+        for row in uncovered.values():
+            while row:
+                low = row & -row
+                counts[low.bit_length() - 1] += 1
+                row ^= low
+        best = max(range(len(vectors)), key=counts.__getitem__)
+        chosen.append(best)
+        uncovered = {f: row for f, row in uncovered.items() if not row >> best & 1}
+    chosen.sort()
+    result.vectors = [vectors[j] for j in chosen]
+    for fault, row in rows.items():
+        hits = [k for k, j in enumerate(chosen) if row >> j & 1]
+        if hits:
+            result.detected[fault] = hits[0]
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PODEM ATPG for stuck-at faults in the ALU netlist.")
+    parser.add_argument("--json", type=Path, default=None,
+                        help="Write the compacted pattern set (repo JSON vector schema).")
+    parser.add_argument("--backtracks", type=int, default=1000,
+                        help="Backtrack limit per fault before aborting (default: 1000).")
+    parser.add_argument("--merge", type=int, default=8,
+                        help="Extra faults tried per test cube (dynamic compaction, default: 8).")
+    parser.add_argument("--seed", type=int, default=1, help="Random-fill seed (default: 1).")
+    parser.add_argument("--verify", action="store_true",
+                        help="Confirm redundant faults with the exhaustive fault simulator.")
+    args = parser.parse_args()
+
+    netlist = build_alu_netlist()
+    faults = enumerate_faults(netlist, bridges=False)
+    print(f"Netlist: {len(netlist.gates)} gates, {len(netlist.nets())} nets; "
+          f"{len(faults)} stuck-at faults")
+
+    start = time.time()
+    result = generate_patterns(netlist, faults, args.backtracks, args.merge, args.seed)
+    elapsed = time.time() - start
+    detected = len(result.detected)
+    testable = len(faults) - len(result.redundant)
+    print(f"Generated in {elapsed:.1f}s ({result.backtracks:,} backtracks)\n")
+    print(f"  Detected   {detected:>5}/{len(faults):<5} ({100 * detected / len(faults):.1f}%)")
+    print(f"  Redundant  {len(result.redundant):>5}  (proved: no valid input detects them)")
+    print(f"  Aborted    {len(result.aborted):>5}")
+    print(f"  Coverage of testable faults: {100 * detected / testable:.1f}%")
+    print(f"  Patterns   {len(result.vectors):>5}  ({result.generated} before static compaction; "
+          f"exhaustive is 1,245,184)")
+    for fault in result.redundant + result.aborted:
+        print(f"  {'redundant' if fault in result.redundant else 'aborted'}: {fault}")
+
+    if args.verify and result.redundant:
+        simulator = FaultSimulator(netlist)
+        found = run_campaign(simulator, result.redundant, exhaustive_batches(netlist))
+        status = "confirmed" if not found else f"CONTRADICTED for {len(found)}"
+        print(f"\nExhaustive check of {len(result.redundant)} redundant fault(s): {status}")
+        if found:
+            return 1
+
+    if args.json is not None:
+        write_json_vectors(args.json, result.vectors, tag="ATPG")
+        print(f"\nWrote {args.json}")
+    return 0 if not result.aborted else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
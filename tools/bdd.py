@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Reduced ordered binary decision diagrams.
+
+A small BDD package for equivalence checking (tools/bdd_equiv.py). Nodes
+are ints: 0 and 1 are the terminals, every other node is a (level, low,
+high) triple kept unique by a hash table, so two functions are equal exactly
+when their nodes are equal. All operations go through `ite` (if-then-else)
+with a computed table, and the variable order is fixed when the manager is
+created: the order heuristics below pick it from a netlist or a bus layout.
+
+Bit vectors are lists of nodes, LSB first; `add`, `equal` and `constant`
+cover what the golden-model specifications need.
+"""
+
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+FALSE, TRUE = 0, 1
+
+
+class NodeLimitError(RuntimeError):
+    """Raised when a manager grows past its node limit (usually a bad variable order)."""
+
+
+class BDD:
+    """A BDD manager over a fixed variable order."""
+
+    def __init__(self, variables: Sequence[str], max_nodes: int = 2_000_000):
+        self.variables = list(variables)
+        self.level_of = {name: level for level, name in enumerate(self.variables)}
+        if len(self.level_of) != len(self.variables):
+            raise ValueError("Duplicate variable names")
+        terminal = len(self.variables)
+        self._level: List[int] = [terminal, terminal]
+        self._low: List[int] = [FALSE, TRUE]
+        self._high: List[int] = [FALSE, TRUE]
+        self._unique: Dict[Tuple[int, int, int], int] = {}
+        self._computed: Dict[Tuple[int, int, int], int] = {}
+        self.max_nodes = max_nodes
+        # ite recursion is as deep as the variable count, plus headroom
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * terminal + 1000))
+
+    def __len__(self) -> int:
+        return len(self._level)
+
+    def _make(self, level: int, low: int, high: int) -> int:
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = len(self._level)
+            if node >= self.max_nodes:
+                raise NodeLimitError(f"BDD node limit ({self.max_nodes:,}) exceeded")
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+            self._unique[key] = node
+        return node
+
+    def var(self, name: str) -> int:
+        return self._make(self.level_of[name], FALSE, TRUE)
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        """if f then g else h"""
+        if f == TRUE:
+            return g
+        if f == FALSE:
+            return h
+        if g == h:
+            return g
+        if g == TRUE and h == FALSE:
+            return f
+        key = (f, g, h)
+        result = self._computed.get(key)
+        if result is not None:
+            return result
+        level_, low_, high_ = self._level, self._low, self._high
+        top = min(level_[f], level_[g], level_[h])
+        cofactors = []
+        for branch in (low_, high_):
+            cofactors.append(self.ite(
+                branch[f] if level_[f] == top else f,
+                branch[g] if level_[g] == top else g,
+                branch[h] if level_[h] == top else h))
+        result = self._make(top, cofactors[0], cofactors[1])
+        self._computed[key] = result
+        return result
+
+    def not_(self, f: int) -> int:
+        return self.ite(f, FALSE, TRUE)
+
+    def and_(self, f: int, g: int) -> int:
+        return self.ite(f, g, FALSE)
+
+    def or_(self, f: int, g: int) -> int:
+        return self.ite(f, TRUE, g)
+
+    def xor(self, f: int, g: int) -> int:
+        return self.ite(f, self.not_(g), g)
+
+    def xnor(self, f: int, g: int) -> int:
+        return self.ite(f, g, self.not_(g))
+
+    def all_of(self, nodes: Iterable[int]) -> int:
+        result = TRUE
+        for node in nodes:
+            result = self.and_(result, node)
+        return result
+
+    def any_of(self, nodes: Iterable[int]) -> int:
+        result = FALSE
+        for node in nodes:
+            result = self.or_(result, node)
+        return result
+
+    # -- inspection ----------------------------------------------------------
+
+    def size(self, roots: Iterable[int]) -> int:
+        """Distinct non-terminal nodes reachable from `roots`."""
+        seen = set()
+        stack = [root for root in roots if root > TRUE]
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                stack.extend(child for child in (self._low[node], self._high[node]) if child > TRUE)
+        return len(seen)
+
+    def evaluate(self, f: int, assignment: Dict[str, int]) -> int:
+        while f > TRUE:
+            name = self.variables[self._level[f]]
+            f = self._high[f] if assignment.get(name, 0) else self._low[f]
+        return f
+
+    def satisfy_one(self, f: int) -> Optional[Dict[str, int]]:
+        """One assignment making `f` true (variables off the path are left out), or None."""
+        if f == FALSE:
+            return None
+        assignment = {}
+        while f > TRUE:
+            name = self.variables[self._level[f]]
+            if self._low[f] != FALSE:
+                assignment[name], f = 0, self._low[f]
+            else:
+                assignment[name], f = 1, self._high[f]
+        return assignment
+
+    def count(self, f: int) -> int:
+        """Number of satisfying assignments over all variables."""
+        levels = len(self.variables)
+        memo: Dict[int, int] = {FALSE: 0, TRUE: 1}
+
+        def walk(node: int) -> int:
+            # Solutions counted from this node's level down
+            if node not in memo:
+                level = self._level[node]
+                memo[node] = sum(walk(child) << (self._level[child] - level - 1)
+                                 for child in (self._low[node], self._high[node]))
+            return memo[node]
+
+        return walk(f) << min(self._level[f], levels)
+
+
+# ---------------------------------------------------------------------------
+# Bit vectors (lists of nodes, LSB first)
+# ---------------------------------------------------------------------------
+
+def constant(value: int, width: int) -> List[int]:
+    return [TRUE if value >> i & 1 else FALSE for i in range(width)]
+
+
+def add(bdd: BDD, a: Sequence[int], b: Sequence[int], carry: int = FALSE) -> Tuple[List[int], int]:
+    """Ripple addition; returns (sum bits, carry out)."""
+    total = []
+    for x, y in zip(a, b):
+        half = bdd.xor(x, y)
+        total.append(bdd.xor(half, carry))
+        carry = bdd.or_(bdd.and_(x, y), bdd.and_(carry, half))
+    return total, carry
+
+
+def subtract(bdd: BDD, a: Sequence[int], b: Sequence[int]) -> Tuple[List[int], int]:
+    """a - b as a + ~b + 1; returns (difference bits, no-borrow i.e. a >= b unsigned)."""
+    return add(bdd, a, [bdd.not_(bit) for bit in b], TRUE)
+
+
+def equal(bdd: BDD, a: Sequence[int], b: Sequence[int]) -> int:
+    return bdd.all_of(bdd.xnor(x, y) for x, y in zip(a, b))
+
+
+def is_zero(bdd: BDD, bits: Sequence[int]) -> int:
+    return bdd.not_(bdd.any_of(bits))
+
+
+# ---------------------------------------------------------------------------
+# Variable order heuristics
+# ---------------------------------------------------------------------------
+
+def bus(name: str, width: int) -> List[str]:
+    return [f"{name}[{i}]" for i in range(width)]
+
+
+def interleaved(buses: Sequence[str], width: int, msb_first: bool = False) -> List[str]:
+    """a[0] b[0] a[1] b[1] ... (the linear-size order for adders and comparators)."""
+    bits = range(width - 1, -1, -1) if msb_first else range(width)
+    return [f"{name}[{i}]" for i in bits for name in buses]
+
+
+def concatenated(buses: Sequence[str], width: int) -> List[str]:
+    """a[0..n-1] then b[0..n-1] (exponential for adders; kept for comparison)."""
+    return [bit for name in buses for bit in bus(name, width)]
+
+
+def fanin_order(nodes: Sequence[Tuple], outputs: Iterable[int]) -> List[str]:
+    """
+    Inputs in the order a depth-first walk from the outputs reaches them
+    (the classic netlist heuristic). `nodes` are netlist_compile.Builder
+    nodes: ("input", name) or (op, operand ids...).
+    """
+    order: List[str] = []
+    seen = set()
+    for root in outputs:
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node in seen or node <= TRUE:
+                continue
+            seen.add(node)
+            op, *args = nodes[node]
+            if op == "input":
+                order.append(args[0])
+            else:
+                stack.extend(reversed(args))
+    return order
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Prove ALU netlists equivalent to the golden model with BDDs.
+
+Exhaustive vectors stop at 8 bits (2^16 operand pairs per opcode; 32 bits
+would be 2^64). Here every output bit becomes a BDD instead, once from the
+golden model's semantics and once from a netlist, and the two are compared
+per opcode. BDDs are canonical for a fixed variable order, so equal nodes
+mean equal functions over every operand value. A mismatch yields a
+counterexample (A, B), which is replayed through
+`exhaustive_vectors.compute_alu_operation`.
+
+The golden side is `golden_spec`: compute_alu_operation written over bit
+vectors of BDDs. The test suite checks it against compute_alu_operation by
+enumeration at small widths. Netlists are lowered with tools/netlist_compile.py
+with the opcode bound to a constant, so only that opcode's logic is built:
+
+    gates  tools/alu_netlist.py at any --width (the board architecture)
+    yosys  the Yosys netlist of ALU.sv read by tools/yosys_sim.py (8-bit)
+
+Variable orders: interleaved (a0 b0 a1 b1 ..., default), msb (interleaved
+from the MSB), fanin (depth-first from the netlist outputs) and concat
+(all of A then all of B, which is exponential for adders and shows why
+the order matters; --max-nodes stops it).
+
+Usage:
+    python3 tools/bdd_equiv.py                          # gate netlist, 8/16/32 bits
+    python3 tools/bdd_equiv.py --width 64 --order fanin
+    python3 tools/bdd_equiv.py --source yosys
+    python3 tools/bdd_equiv.py --width 16 --order concat --opcodes ADD
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from alu_netlist import build_alu_netlist
+from bdd import (BDD, FALSE, NodeLimitError, add, bus, concatenated, constant, equal,
+                 fanin_order, interleaved, is_zero, subtract)
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+from export_hdl_vectors import resolve_opcodes
+from netlist_compile import Builder, lower_gates, lower_yosys, opcode_constants
+from rtl_cosim import is_known_difference
+import yosys_sim
+
+ORDERS = ("interleaved", "msb", "fanin", "concat")
+
+# Source -> (opcode bus, result bus, flag output -> golden field)
+SOURCE_OUTPUTS = {
+    "gates": ("OP", "OUT", {"CARRY": "carry", "ZERO": "zero",
+                            "OVERFLOW": "overflow", "NEGATIVE": "negative"}),
+    "yosys": ("Opcode", "Result", {"CarryOut": "carry", "Zero": "zero",
+                                   "Overflow": "overflow", "Negative": "negative"}),
+}
+
+
+# ---------------------------------------------------------------------------
+# Golden model over BDD bit vectors
+# ---------------------------------------------------------------------------
+
+def golden_spec(bdd: BDD, name: str, a: List[int], b: List[int]) -> Dict[str, object]:
+    """compute_alu_operation for opcode `name` over BDD bit vectors (LSB first)."""
+    width = len(a)
+    carry = overflow = FALSE
+    if name == "ADD":
+        result, carry = add(bdd, a, b)
+        overflow = bdd.and_(bdd.xnor(a[-1], b[-1]), bdd.xor(a[-1], result[-1]))
+    elif name in ("SUB", "CMP"):
+        result, carry = subtract(bdd, a, b)           # carry = (a - b >= 0)
+        overflow = bdd.and_(bdd.xor(a[-1], b[-1]), bdd.xor(a[-1], result[-1]))
+    elif name == "INC_A":
+        result, carry = add(bdd, a, constant(1, width))
+        overflow = equal(bdd, a, constant((1 << (width - 1)) - 1, width))
+    elif name == "DEC_A":
+        result, carry = subtract(bdd, a, constant(1, width))
+        overflow = equal(bdd, a, constant(1 << (width - 1), width))
+    elif name == "LSL":
+        result, carry = [FALSE] + a[:-1], a[-1]
+    elif name == "LSR":
+        result, carry = a[1:] + [FALSE], a[0]
+    elif name == "ASR":
+        result, carry = a[1:] + [a[-1]], a[0]
+    elif name == "REV_A":
+        result = a[::-1]
+    elif name in BITWISE:
+        result = [BITWISE[name](bdd, x, y) for x, y in zip(a, b)]
+    else:
+        raise ValueError(f"Unsupported operation: {name}")
+
+    spec = {"result": result, "carry": carry, "overflow": overflow,
+            "zero": is_zero(bdd, result), "negative": result[-1]}
+    if name == "CMP":  # flags come from the difference, Result is 0
+        spec["result"] = constant(0, width)
+    return spec
+
+
+BITWISE = {
+    "NAND": lambda bdd, x, y: bdd.not_(bdd.and_(x, y)),
+    "NOR": lambda bdd, x, y: bdd.not_(bdd.or_(x, y)),
+    "XOR": lambda bdd, x, y: bdd.xor(x, y),
+    "XNOR": lambda bdd, x, y: bdd.xnor(x, y),
+    "AND": lambda bdd, x, y: bdd.and_(x, y),
+    "OR": lambda bdd, x, y: bdd.or_(x, y),
+    "PASS_A": lambda bdd, x, y: x,
+    "PASS_B": lambda bdd, x, y: y,
+    "NOT_A": lambda bdd, x, y: bdd.not_(x),
+    "NOT_B": lambda bdd, x, y: bdd.not_(y),
+}
+
+
+# ---------------------------------------------------------------------------
+# Netlist side
+# ---------------------------------------------------------------------------
+
+def builder_bdds(bdd: BDD, builder: Builder, outputs: Dict[str, int]) -> Dict[str, int]:
+    """BDDs of the builder's output nodes (only their fan-in cone is built)."""
+    live = set(outputs.values())
+    for node in range(len(builder.nodes) - 1, 1, -1):
+        if node in live:
+            live.update(arg for arg in builder.nodes[node][1:] if isinstance(arg, int))
+    values = {0: FALSE, 1: bdd.not_(FALSE)}
+    for node in sorted(live):
+        if node <= 1:
+            continue
+        op, *args = builder.nodes[node]
+        if op == "input":
+            values[node] = bdd.var(args[0])
+        elif op == "not":
+            values[node] = bdd.not_(values[args[0]])
+        else:
+            values[node] = getattr(bdd, OPS[op])(values[args[0]], values[args[1]])
+    return {name: values[node] for name, node in outputs.items()}
+
+
+OPS = {"and": "and_", "or": "or_", "xor": "xor"}
+
+
+def lower(source: str, width: int, opcode: str, design: Path,
+          gates=None) -> Tuple[Builder, Dict[str, int]]:
+    bus_name = SOURCE_OUTPUTS[source][0]
+    constants = opcode_constants(bus_name, opcode)
+    if source == "gates":
+        return lower_gates(gates or build_alu_netlist(width), constants)
+    netlist = yosys_sim.load_netlist(design)
+    return lower_yosys(netlist, yosys_sim.FIELD_SIGNALS.values(), constants)
+
+
+def variable_order(order: str, width: int, builder: Builder, outputs: Dict[str, int]) -> List[str]:
+    if order == "interleaved":
+        return interleaved(("A", "B"), width)
+    if order == "msb":
+        return interleaved(("A", "B"), width, msb_first=True)
+    if order == "concat":
+        return concatenated(("A", "B"), width)
+    reached = fanin_order(builder.nodes, outputs.values())
+    return reached + [bit for bit in interleaved(("A", "B"), width) if bit not in reached]
+
+
+# ---------------------------------------------------------------------------
+# Equivalence check
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Mismatch:
+    output: str
+    field: str
+    a: int
+    b: int
+    golden: int
+    netlist: int
+    known: bool
+
+
+@dataclass
+class OpcodeResult:
+    name: str
+    opcode: str
+    nodes: int = 0
+    largest: int = 0
+    seconds: float = 0.0
+    mismatches: List[Mismatch] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or any(not m.known for m in self.mismatches)
+
+
+def check_opcode(source: str, width: int, name: str, opcode: str, order: str = "interleaved",
+                 max_nodes: int = 2_000_000, design: Path = yosys_sim.DEFAULT_DESIGN,
+                 gates=None) -> OpcodeResult:
+    """
+    Build golden and netlist BDDs for one opcode and compare every output bit.
+    `gates` overrides the alu_netlist Netlist built for the gates source.
+    """
+    result = OpcodeResult(name, opcode)
+    start = time.perf_counter()
+    builder, outputs = lower(source, width, opcode, design, gates)
+    _, result_bus, flags = SOURCE_OUTPUTS[source]
+    bdd = BDD(variable_order(order, width, builder, outputs), max_nodes)
+    try:
+        a = [bdd.var(bit) for bit in bus("A", width)]
+        b = [bdd.var(bit) for bit in bus("B", width)]
+        spec = golden_spec(bdd, name, a, b)
+        impl = builder_bdds(bdd, builder, outputs)
+    except NodeLimitError as e:
+        result.error = str(e)
+        result.nodes = len(bdd)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    pairs = [(f"{result_bus}[{i}]", "result", spec["result"][i]) for i in range(width)]
+    pairs += [(output, flag, spec[flag]) for output, flag in flags.items()]
+    for output, flag, golden in pairs:
+        if impl[output] == golden:
+            continue
+        witness = bdd.satisfy_one(bdd.xor(impl[output], golden))
+        a_value = sum(witness.get(f"A[{i}]", 0) << i for i in range(width))
+        b_value = sum(witness.get(f"B[{i}]", 0) << i for i in range(width))
+        bit = int(output[output.index("[") + 1:-1]) if flag == "result" else None
+        value, flag_values = compute_alu_operation(opcode, a_value, b_value, width)
+        expected = value >> bit & 1 if bit is not None else int(flag_values[flag])
+        if bdd.evaluate(golden, witness) != expected:
+            raise AssertionError(f"golden_spec disagrees with the golden model: {name} {output}")
+        result.mismatches.append(Mismatch(
+            output, flag, a_value, b_value, expected, bdd.evaluate(impl[output], witness),
+            source == "yosys" and is_known_difference(int(opcode, 2), flag)))
+    result.nodes = len(bdd)
+    result.largest = max(bdd.size([node]) for node in impl.values())
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def print_results(width: int, results: List[OpcodeResult], max_examples: int) -> None:
+    print(f"\nWidth {width}:")
+    print(f"  {'Opcode':<8} {'BDD nodes':>10} {'Largest':>8} {'Time':>8}  Status")
+    for r in results:
+        if r.error:
+            status = r.error
+        elif not r.mismatches:
+            status = "equivalent"
+        else:
+            known = sum(m.known for m in r.mismatches)
+            status = f"{len(r.mismatches)} output(s) differ" + (f" ({known} known)" if known else "")
+        print(f"  {r.name:<8} {r.nodes:>10,} {r.largest:>8,} {r.seconds:>7.2f}s  {status}")
+    digits = (width + 3) // 4
+    shown = 0
+    for r in results:
+        for m in r.mismatches:
+            if shown == max_examples:
+                return
+            shown += 1
+            note = " (known ALU.sv difference)" if m.known else ""
+            print(f"  [CEX] {r.name} {m.output}: A=0x{m.a:0{digits}X} B=0x{m.b:0{digits}X} "
+                  f"golden {m.golden}, netlist {m.netlist}{note}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="BDD equivalence of the golden model and ALU netlists.")
+    parser.add_argument("--source", choices=tuple(SOURCE_OUTPUTS), default="gates",
+                        help="Gate netlist (default) or the Yosys netlist of ALU.sv.")
+    parser.add_argument("--width", type=int, nargs="+", default=None,
+                        help="Datapath widths (default: 8 16 32; the Yosys netlist is 8-bit).")
+    parser.add_argument("--order", choices=ORDERS, default="interleaved",
+                        help="Variable order heuristic (default: interleaved).")
+    parser.add_argument("--opcodes", nargs="+", default=None,
+                        help="Only these opcodes (names like ADD or codes like 00000).")
+    parser.add_argument("--design", type=Path, default=yosys_sim.DEFAULT_DESIGN,
+                        help="RTLIL netlist for --source yosys.")
+    parser.add_argument("--max-nodes", type=int, default=2_000_000,
+                        help="Give up on an opcode past this many BDD nodes.")
+    parser.add_argument("--max-failures", type=int, default=20,
+                        help="Counterexamples to print per width (default: 20).")
+    args = parser.parse_args()
+
+    widths = args.width or ([8] if args.source == "yosys" else [8, 16, 32])
+    if args.source == "yosys" and widths != [8]:
+        parser.error("the Yosys netlist is 8-bit; --width does not apply")
+    if any(width < 2 for width in widths):
+        parser.error("--width must be at least 2")
+    try:
+        opcodes = resolve_opcodes(args.opcodes)
+    except ValueError as e:
+        parser.error(str(e))
+
+    failed = False
+    for width in widths:
+        results = []
+        try:
+            for name, opcode, _ in OPERATIONS:
+                if opcodes is None or opcode in opcodes:
+                    results.append(check_opcode(args.source, width, name, opcode, args.order,
+                                                args.max_nodes, args.design))
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        print_results(width, results, args.max_failures)
+        total = sum(r.seconds for r in results)
+        proved = sum(not r.mismatches and not r.error for r in results)
+        print(f"  {proved}/{len(results)} opcodes equivalent over all 2^{2 * width} "
+              f"operand pairs in {total:.2f}s")
+        failed = failed or any(r.failed for r in results)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Hierarchical, cached analysis of Logisim circuit files.
+
+Parses every circuit in a .circ file, resolves subcircuit instances (same
+file, or another .circ loaded as a library) and expands them recursively
+into leaf components, memoizing each subcircuit's counts so a circuit
+instantiated a hundred times is counted once.
+
+Parsed files are cached as JSON under .cache/circuit_analysis/, keyed by
+path and validated by mtime and size, falling back to a SHA-256 of the
+contents (a touched but unchanged file is still a hit). Re-runs skip XML
+parsing entirely.
+
+Transistor counts follow meta/TRANSISTOR_COUNT_REPORT.md:
+
+    NOT 2T, NAND/NOR 2nT, AND/OR 2n+2T (discrete, n inputs, per bit)
+    XOR 14T (74HC86), 2:1 mux channel 16T (74HC157, a 2^s:1 mux is 2^s - 1)
+    Adder: 18T discrete carry logic + 2 XORs per bit
+    Wiring, I/O and simulation stimulus are excluded.
+
+Usage:
+    python3 tools/circuit_analysis.py                         # sim/top/alu_top.circ
+    python3 tools/circuit_analysis.py design.circ --circuit alu_slice
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CIRCUIT_FILE = ROOT / "sim" / "top" / "alu_top.circ"
+DEFAULT_CACHE_DIR = ROOT / ".cache" / "circuit_analysis"
+CACHE_VERSION = 1
+
+# Attributes that change what a component is (not where or how it is drawn)
+COUNTED_ATTRS = ("width", "inputs", "select", "fanout", "incoming")
+
+# Logisim factory defaults; saved components only list attributes that differ
+DEFAULTS: Dict[str, Dict[str, str]] = {
+    "#Gates": {"width": "1", "inputs": "2"},
+    "#Plexers": {"width": "1", "select": "1"},
+    "#Arithmetic": {"width": "8"},
+}
+
+DISCRETE_GATES = {"NOT Gate", "NAND Gate", "NOR Gate", "AND Gate", "OR Gate"}
+XOR_TRANSISTORS = 14
+MUX_CHANNEL_TRANSISTORS = 16
+ADDER_CARRY_TRANSISTORS = 18  # 2 AND + 1 OR per bit
+
+@dataclass
+class Component:
+    library: Optional[str]  # library desc ("#Gates", "file#sub.circ"); None = this file
+    name: str
+    attrs: Dict[str, str]
+
+
+@dataclass
+class CircuitFile:
+    path: Path
+    main: Optional[str]
+    circuits: Dict[str, List[Component]]
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def parse_circuit_file(path: Path) -> CircuitFile:
+    """Parse every circuit of a .circ file into component lists."""
+    root = ET.parse(path).getroot()
+    libraries = {lib.get("name"): lib.get("desc") for lib in root.findall("lib")}
+    main = root.find("main")
+    circuits = {}
+    for circuit in root.findall("circuit"):
+        components = []
+        for comp in circuit.findall("comp"):
+            lib = comp.get("lib")
+            attrs = {a.get("name"): a.get("val") for a in comp.findall("a")
+                     if a.get("name") in COUNTED_ATTRS}
+            components.append(Component(libraries.get(lib, f"#{lib}") if lib is not None else None,
+                                        comp.get("name"), attrs))
+        circuits[circuit.get("name")] = components
+    return CircuitFile(path, main.get("name") if main is not None else None, circuits)
+
+
+class CircuitCache:
+    """Parsed .circ files on disk, keyed by path, validated by mtime/size then hash."""
+
+    def __init__(self, directory: Optional[Path] = DEFAULT_CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._loaded: Dict[Path, CircuitFile] = {}
+
+    def _entry_path(self, path: Path) -> Path:
+        return self.directory / (hashlib.sha256(str(path).encode()).hexdigest()[:24] + ".json")
+
+    def load(self, path: Path) -> CircuitFile:
+        path = path.resolve()
+        if path in self._loaded:
+            return self._loaded[path]
+        stat = path.stat()
+        entry = None
+        if self.directory is not None:
+            try:
+                entry = json.loads(self._entry_path(path).read_text())
+            except (OSError, ValueError):
+                entry = None
+        digest = None
+        if entry and entry.get("version") == CACHE_VERSION:
+            if (entry["mtime_ns"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+                digest = file_digest(path)
+                if digest != entry["sha256"]:
+                    entry = None
+        else:
+            entry = None
+
+        if entry is not None:
+            self.hits += 1
+            parsed = CircuitFile(path, entry["main"], {
+                name: [Component(library, comp_name, attrs) for library, comp_name, attrs in comps]
+                for name, comps in entry["circuits"].items()
+            })
+        else:
+            self.misses += 1
+            parsed = parse_circuit_file(path)
+        if self.directory is not None and (entry is None or digest is not None):
+            self._store(path, stat, digest or file_digest(path), parsed)
+        self._loaded[path] = parsed
+        return parsed
+
+    def _store(self, path: Path, stat: os.stat_result, digest: str, parsed: CircuitFile) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "version": CACHE_VERSION, "path": str(path), "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size, "sha256": digest, "main": parsed.main,
+            "circuits": {name: [[c.library, c.name, c.attrs] for c in comps]
+                         for name, comps in parsed.circuits.items()},
+        }
+        target = self._entry_path(path)
+        temporary = target.with_suffix(".tmp")
+        temporary.write_text(json.dumps(entry))
+        temporary.replace(target)
+
+
+class Design:
+    """A top-level file plus the subcircuit libraries it pulls in."""
+
+    def __init__(self, path: Path, cache: Optional[CircuitCache] = None):
+        self.cache = cache or CircuitCache(None)
+        self.top = self.cache.load(path)
+        self._counts: Dict[Tuple[Path, str], Counter] = {}
+        self._instances: Dict[Tuple[Path, str], Counter] = {}
+
+    def _resolve(self, source: CircuitFile, component: Component) -> Optional[Tuple[CircuitFile, str]]:
+        """The (file, circuit) a component instantiates, or None for a leaf."""
+        if component.library is None:
+            if component.name not in source.circuits:
+                raise ValueError(f"{source.path}: unknown subcircuit '{component.name}'")
+            return source, component.name
+        if component.library.startswith("file#"):
+            library = self.cache.load(source.path.parent / component.library[len("file#"):])
+            return library, component.name
+        return None
+
+    def leaf_counts(self, circuit: Optional[str] = None, source: Optional[CircuitFile] = None,
+                    active: Optional[Set[Tuple[Path, str]]] = None) -> Counter:
+        """Leaf components of a circuit with every subcircuit expanded (memoized)."""
+        source = source or self.top
+        circuit = circuit or source.main or next(iter(source.circuits))
+        key = (source.path, circuit)
+        if key in self._counts:
+            return self._counts[key]
+        if circuit not in source.circuits:
+            raise ValueError(f"{source.path}: no circuit named '{circuit}'")
+        active = active or set()
+        if key in active:
+            raise ValueError(f"Recursive subcircuit: {circuit}")
+        active.add(key)
+
+        counts: Counter = Counter()
+        instances: Counter = Counter()
+        for component in source.circuits[circuit]:
+            target = self._resolve(source, component)
+            if target is None:
+                defaults = DEFAULTS.get(component.library, {})
+                attrs = {**defaults, **component.attrs}
+                counts[(component.library, component.name, tuple(sorted(attrs.items())))] += 1
+            else:
+                child_source, child = target
+                instances[(child_source.path, child)] += 1
+                counts.update(self.leaf_counts(child, child_source, active))
+        active.discard(key)
+        self._counts[key] = counts
+        self._instances[key] = instances
+        return counts
+
+    def hierarchy(self, circuit: Optional[str] = None, source: Optional[CircuitFile] = None,
+                  depth: int = 0, instances: int = 1) -> List[Tuple[int, str, int, int]]:
+        """(depth, circuit, instances in parent, leaf count) rows of the instance tree."""
+        source = source or self.top
+        circuit = circuit or source.main or next(iter(source.circuits))
+        rows = [(depth, circuit, instances, sum(self.leaf_counts(circuit, source).values()))]
+        for (path, child), count in sorted(self._instances[(source.path, circuit)].items()):
+            rows.extend(self.hierarchy(child, self.cache.load(path), depth + 1, count))
+        return rows
+
+
+def gate_count(leaves: Counter) -> int:
+    """Single-bit logic gates (an n-bit gate component is n gates)."""
+    return sum(int(dict(attrs).get("width", "1")) * count
+               for (library, _, attrs), count in leaves.items() if library == "#Gates")
+
+
+def transistor_counts(leaves: Counter) -> Tuple[int, int, Counter]:
+    """(discrete, IC, excluded components) using the transistor-count report's rules."""
+    discrete = ic = 0
+    excluded: Counter = Counter()
+    for (library, name, attrs), count in leaves.items():
+        attrs = dict(attrs)
+        width = int(attrs.get("width", "1"))
+        if library == "#Gates" and name in DISCRETE_GATES:
+            inputs = 1 if name == "NOT Gate" else int(attrs.get("inputs", "2"))
+            per_gate = 2 * inputs + (2 if name in ("AND Gate", "OR Gate") else 0)
+            discrete += per_gate * width * count
+        elif library == "#Gates" and name == "XOR Gate":
+            ic += XOR_TRANSISTORS * width * count
+        elif library == "#Plexers" and name == "Multiplexer":
+            channels = (2 ** int(attrs.get("select", "1")) - 1) * width
+            ic += MUX_CHANNEL_TRANSISTORS * channels * count
+        elif library == "#Arithmetic" and name == "Adder":
+            discrete += ADDER_CARRY_TRANSISTORS * width * count
+            ic += 2 * XOR_TRANSISTORS * width * count
+        else:
+            excluded[name] += count
+    return discrete, ic, excluded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Hierarchical Logisim gate and transistor counts.")
+    parser.add_argument("path", nargs="?", type=Path, default=DEFAULT_CIRCUIT_FILE,
+                        help=f"Logisim .circ file (default: {DEFAULT_CIRCUIT_FILE.relative_to(ROOT)}).")
+    parser.add_argument("--circuit", default=None, help="Circuit to analyze (default: the file's main).")
+    parser.add_argument("--no-cache", action="store_true", help="Always parse the XML.")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR,
+                        help="Parsed-file cache directory.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cache = CircuitCache(None if args.no_cache else args.cache_dir)
+    try:
+        design = Design(args.path, cache)
+        leaves = design.leaf_counts(args.circuit)
+        rows = design.hierarchy(args.circuit)
+    except (OSError, ET.ParseError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.path}: {len(design.top.circuits)} circuit(s), "
+          f"{cache.hits} cached / {cache.misses} parsed file(s), {elapsed * 1e3:.1f} ms\n")
+    print("Hierarchy (leaf components, subcircuits expanded):")
+    for depth, circuit, instances, count in rows:
+        label = f"{circuit} x{instances}" if depth else circuit
+        print(f"  {'  ' * depth}{label:<{32 - 2 * depth}} {count:>7,}")
+
+    discrete, ic, excluded = transistor_counts(leaves)
+    print(f"\nGates (1-bit):          {gate_count(leaves):>7,}")
+    print(f"Discrete transistors:   {discrete:>7,}")
+    print(f"IC transistors (74xx):  {ic:>7,}")
+    print(f"Total transistors:      {discrete + ic:>7,}")
+    if excluded:
+        print("\nExcluded (wiring, I/O, stimulus): "
+              + ", ".join(f"{name} x{count}" for name, count in sorted(excluded.items())))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
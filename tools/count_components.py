@@ -1,88 +1,65 @@
 #!/usr/bin/env python3
 """
 Analyze Logisim circuit file and extract all components with their sizes.
+
+Subcircuits are expanded through tools/circuit_analysis.py, which also
+caches the parsed file.
 """
 
-import xml.etree.ElementTree as ET
+import argparse
 from collections import defaultdict
-import sys
+from pathlib import Path
 
-def get_attr(comp, name, default=None):
-    """Get attribute value from component."""
-    for attr in comp.findall('a'):
-        if attr.get('name') == name:
-            return attr.get('val')
-    return default
+from circuit_analysis import DEFAULT_CACHE_DIR, DEFAULT_CIRCUIT_FILE, CircuitCache, Design
 
-def analyze_logisim_circuit(filename):
+def analyze_logisim_circuit(filename, circuit=None, cache=None):
     """Analyze a Logisim circuit file and return component statistics."""
     
-    tree = ET.parse(filename)
-    root = tree.getroot()
+    leaves = Design(Path(filename), cache).leaf_counts(circuit)
     
     # Component categories
     gates = defaultdict(lambda: defaultdict(int))
     muxes = defaultdict(lambda: defaultdict(int))
     other = defaultdict(int)
     
-    # Find all components in the main circuit
-    circuit = root.find(".//circuit[@name='main']")
-    if circuit is None:
-        print("Warning: Could not find main circuit")
-        return
-    
-    for comp in circuit.findall('comp'):
-        lib = comp.get('lib')
-        name = comp.get('name')
+    for (library, name, attrs), count in leaves.items():
+        attrs = dict(attrs)
         
-        if lib == '1':  # Gates library
+        if library == '#Gates':
+            width = attrs.get('width', '1')
             # NOT gates don't have inputs attribute
             if 'NOT' in name or name == 'NOT Gate':
-                width = get_attr(comp, 'width', '1')
-                key = f"{name}"
-                gates[key][f"width={width}"] += 1
+                gates[name][f"width={width}"] += count
             else:
-                inputs = get_attr(comp, 'inputs', '2')  # Default is 2 for gates
-                width = get_attr(comp, 'width', '1')  # Default is 1 bit
+                inputs = attrs.get('inputs', '2')
                 
                 # Create key: "GateType (inputs=X, width=Y)"
-                key = f"{name}"
                 if inputs != '2' or width != '1':
                     if width != '1':
-                        gates[key][f"width={width}"] += 1
+                        gates[name][f"width={width}"] += count
                     if inputs != '2':
-                        gates[key][f"inputs={inputs}"] += 1
+                        gates[name][f"inputs={inputs}"] += count
                 else:
-                    gates[key]["inputs=2, width=1"] += 1
+                    gates[name]["inputs=2, width=1"] += count
                 
-        elif lib == '2':  # Multiplexers library
-            select = get_attr(comp, 'select', '1')  # Default select bits
-            width = get_attr(comp, 'width', '1')
+        elif library == '#Plexers':
+            select = attrs.get('select', '1')  # Default select bits
+            width = attrs.get('width', '1')
             num_inputs = 2 ** int(select) if select else 2
             
-            key = f"{name}"
-            muxes[key][f"{num_inputs}:1 MUX, select={select}, width={width}"] += 1
+            muxes[name][f"{num_inputs}:1 MUX, select={select}, width={width}"] += count
             
-        elif lib == '3':  # Arithmetic library
-            width = get_attr(comp, 'width', '1')
-            key = f"{name} (width={width})"
-            other[key] += 1
+        elif library == '#Arithmetic':
+            other[f"{name} (width={attrs.get('width', '8')})"] += count
             
         else:
             # Other components
-            width = get_attr(comp, 'width', None)
-            fanout = get_attr(comp, 'fanout', None)
-            incoming = get_attr(comp, 'incoming', None)
-            
             key = name
-            if width:
-                key += f" (width={width})"
-            if fanout:
-                key += f" (fanout={fanout})"
-            if incoming:
-                key += f" (incoming={incoming})"
+            for attr in ('width', 'fanout', 'incoming'):
+                if attr in attrs:
+                    key += f" ({attr}={attrs[attr]})"
                 
-            other[key] += 1
+            other[key] += count
     
     return gates, muxes, other
 
@@ -169,11 +146,13 @@ def print_results(gates, muxes, other):
     print(f"Grand Total: {total_gates + total_muxes + total_other}")
 
 if __name__ == '__main__':
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
-    else:
-        filename = '/Users/tmarhguy/Documents/cpu/logisim/top/alu_top.circ'
-    
-    gates, muxes, other = analyze_logisim_circuit(filename)
+    parser = argparse.ArgumentParser(description="Count components in a Logisim circuit.")
+    parser.add_argument('filename', nargs='?', default=str(DEFAULT_CIRCUIT_FILE),
+                        help="Logisim .circ file (default: sim/top/alu_top.circ)")
+    parser.add_argument('--circuit', default=None, help="Circuit to analyze (default: the file's main)")
+    parser.add_argument('--no-cache', action='store_true', help="Always parse the XML")
+    args = parser.parse_args()
+    
+    cache = CircuitCache(None if args.no_cache else DEFAULT_CACHE_DIR)
+    gates, muxes, other = analyze_logisim_circuit(args.filename, args.circuit, cache)
     print_results(gates, muxes, other)
-
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+Register-machine simulator built around the ALU golden model.
+
+A small CPU of the kind the ALU is meant to sit in: eight 8-bit registers
+(R0-R7), an NZCV flag register, 256 bytes of data memory and a tiny
+instruction set. Every ALU instruction is evaluated through the golden-model
+outcome tables (test/batch_model.py), so results and flags are exactly what
+the test suite expects from the hardware.
+
+Instruction set (one per line, `;` or `#` starts a comment, `label:` prefix):
+
+    ADD SUB AND OR XOR NAND NOR XNOR   rd, ra, rb
+    INC DEC LSL LSR ASR REV NOTA MOV   rd, ra        (MOV = PASSA, NOT = NOTA)
+    PASSB NOTB                         rd, rb
+    CMP                                ra, rb        (flags only)
+    LDI rd, imm     LD rd, [ra]     ST rs, [ra]      (flags unchanged)
+    B label         B<cc> label     NOP     HALT
+
+    cc: EQ NE CS/HS CC/LO MI PL VS VC HI LS GE LT GT LE  (ARM meanings;
+        C after SUB/CMP means "no borrow")
+
+The program is predecoded into one closure per instruction that does its
+work and returns the next PC, so the interpreter loop is just
+`pc = code[pc]()` (threaded dispatch) and runs a few million instructions per
+second. Execution counts per instruction give a profile, and per-opcode
+delays from PPA.md (tools/op_timing.py) give the runtime on the discrete
+board, self-timed or clocked by the slowest operation.
+
+Usage:
+    python3 tools/cpu_sim.py tools/programs/multiply.asm --reg R0=200 R1=123
+    python3 tools/cpu_sim.py tools/programs/bubble_sort.asm --profile 10
+    python3 tools/cpu_sim.py prog.asm --trace ops.txt --overhead-ns 50
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from batch_model import opcode_table
+from exhaustive_vectors import OPERATIONS
+from op_timing import OP_LATENCY_NS, WORST_LATENCY_NS
+
+REGISTERS = 8
+MEMORY_SIZE = 256
+DEFAULT_MAX_STEPS = 100_000_000
+
+# Packed flag bits (batch_model layout shifted down by 8)
+CARRY, ZERO, OVERFLOW, NEGATIVE = 1, 2, 4, 8
+
+# Assembly mnemonic -> golden-model operation name (mnemonics follow alu_cli.py)
+MNEMONICS: Dict[str, str] = {
+    "ADD": "ADD", "SUB": "SUB", "INC": "INC_A", "DEC": "DEC_A",
+    "LSL": "LSL", "LSR": "LSR", "ASR": "ASR", "REV": "REV_A",
+    "NAND": "NAND", "NOR": "NOR", "XOR": "XOR", "PASSA": "PASS_A", "MOV": "PASS_A",
+    "PASSB": "PASS_B", "AND": "AND", "OR": "OR", "XNOR": "XNOR", "CMP": "CMP",
+    "NOTA": "NOT_A", "NOT": "NOT_A", "NOTB": "NOT_B",
+}
+OPERANDS = {name: operands for name, _, operands in OPERATIONS}
+OPCODES = {name: code for name, code, _ in OPERATIONS}
+# Canonical mnemonic per operation, for traces and reports
+CANONICAL = {"INC_A": "INC", "DEC_A": "DEC", "REV_A": "REV", "PASS_A": "PASSA",
+             "PASS_B": "PASSB", "NOT_A": "NOTA", "NOT_B": "NOTB"}
+
+CONDITIONS: Dict[str, Callable[[int], bool]] = {
+    "": lambda f: True,
+    "EQ": lambda f: bool(f & ZERO),
+    "NE": lambda f: not f & ZERO,
+    "CS": lambda f: bool(f & CARRY),
+    "CC": lambda f: not f & CARRY,
+    "MI": lambda f: bool(f & NEGATIVE),
+    "PL": lambda f: not f & NEGATIVE,
+    "VS": lambda f: bool(f & OVERFLOW),
+    "VC": lambda f: not f & OVERFLOW,
+    "HI": lambda f: bool(f & CARRY) and not f & ZERO,
+    "LS": lambda f: not f & CARRY or bool(f & ZERO),
+    "GE": lambda f: bool(f & NEGATIVE) == bool(f & OVERFLOW),
+    "LT": lambda f: bool(f & NEGATIVE) != bool(f & OVERFLOW),
+    "GT": lambda f: not f & ZERO and bool(f & NEGATIVE) == bool(f & OVERFLOW),
+    "LE": lambda f: bool(f & ZERO) or bool(f & NEGATIVE) != bool(f & OVERFLOW),
+}
+CONDITIONS["HS"] = CONDITIONS["CS"]
+CONDITIONS["LO"] = CONDITIONS["CC"]
+# Precomputed truth table per condition, indexed by the 4-bit flag register
+CONDITION_TABLES = {cc: tuple(test(flags) for flags in range(16)) for cc, test in CONDITIONS.items()}
+
+REGISTER = re.compile(r"^R([0-7])$", re.IGNORECASE)
+INDIRECT = re.compile(r"^\[\s*(R[0-7])\s*\]$", re.IGNORECASE)
+LABEL = re.compile(r"^([A-Za-z_.][\w.]*)\s*:\s*(.*)$")
+
+
+class AssemblyError(ValueError):
+    """Raised for malformed source, with the offending line number."""
+
+
+@dataclass
+class Instruction:
+    mnemonic: str           # ADD, LDI, BNE, HALT ...
+    args: Tuple             # register numbers, immediates or label names
+    line: int               # 1-based source line
+    text: str               # source text, for profiles
+
+    @property
+    def operation(self) -> Optional[str]:
+        """Golden-model operation name for ALU instructions, else None."""
+        return MNEMONICS.get(self.mnemonic)
+
+
+def _register(token: str, line: int) -> int:
+    match = REGISTER.match(token)
+    if not match:
+        raise AssemblyError(f"line {line}: expected a register R0-R7, got '{token}'")
+    return int(match.group(1))
+
+
+def _immediate(token: str, line: int) -> int:
+    try:
+        value = int(token, 0)
+    except ValueError:
+        raise AssemblyError(f"line {line}: bad immediate '{token}'") from None
+    if not -128 <= value <= 255:
+        raise AssemblyError(f"line {line}: immediate {value} does not fit in 8 bits")
+    return value & 0xFF
+
+
+def assemble(source: str) -> Tuple[List[Instruction], Dict[str, int]]:
+    """Parse assembly text into instructions and a label -> index map."""
+    instructions: List[Instruction] = []
+    labels: Dict[str, int] = {}
+    for number, raw in enumerate(source.splitlines(), 1):
+        text = re.split(r"[;#]", raw, maxsplit=1)[0].strip()
+        while True:
+            match = LABEL.match(text)
+            if not match:
+                break
+            name, text = match.group(1), match.group(2).strip()
+            if name in labels:
+                raise AssemblyError(f"line {number}: duplicate label '{name}'")
+            labels[name] = len(instructions)
+        if not text:
+            continue
+
+        mnemonic, _, rest = text.partition(" ")
+        mnemonic = mnemonic.upper()
+        tokens = [token.strip() for token in rest.split(",")] if rest.strip() else []
+        instructions.append(Instruction(mnemonic, _parse_args(mnemonic, tokens, number),
+                                        number, raw.strip()))
+
+    for instruction in instructions:
+        if instruction.mnemonic.startswith("B") and instruction.mnemonic[1:] in CONDITIONS:
+            if instruction.args[0] not in labels:
+                raise AssemblyError(f"line {instruction.line}: unknown label '{instruction.args[0]}'")
+    return instructions, labels
+
+
+def _parse_args(mnemonic: str, tokens: List[str], line: int) -> Tuple:
+    def expect(count: int) -> None:
+        if len(tokens) != count:
+            raise AssemblyError(f"line {line}: {mnemonic} takes {count} operand(s)")
+
+    if mnemonic in MNEMONICS:
+        operation = MNEMONICS[mnemonic]
+        if operation == "CMP":
+            expect(2)
+            return _register(tokens[0], line), _register(tokens[1], line)
+        expect(3 if OPERANDS[operation] == "AB" else 2)
+        return tuple(_register(token, line) for token in tokens)
+    if mnemonic == "LDI":
+        expect(2)
+        return _register(tokens[0], line), _immediate(tokens[1], line)
+    if mnemonic in ("LD", "ST"):
+        expect(2)
+        match = INDIRECT.match(tokens[1])
+        if not match:
+            raise AssemblyError(f"line {line}: {mnemonic} expects [Rn] as its address")
+        return _register(tokens[0], line), _register(match.group(1), line)
+    if mnemonic.startswith("B") and mnemonic[1:] in CONDITIONS:
+        expect(1)
+        return (tokens[0],)
+    if mnemonic in ("NOP", "HALT"):
+        expect(0)
+        return ()
+    raise AssemblyError(f"line {line}: unknown instruction '{mnemonic}'")
+
+
+class Machine:
+    """CPU state plus the predecoded program."""
+
+    def __init__(self, instructions: List[Instruction], labels: Dict[str, int],
+                 trace: Optional[TextIO] = None):
+        self.instructions = instructions
+        self.labels = labels
+        self.regs = [0] * REGISTERS
+        self.memory = bytearray(MEMORY_SIZE)
+        self.flags = 0
+        self.pc = 0 if instructions else -1
+        self.code = [self._compile(index, instruction, trace)
+                     for index, instruction in enumerate(instructions)]
+        self.counts = [0] * len(self.code)
+
+    # -- predecoding --------------------------------------------------------
+
+    def _compile(self, index: int, instruction: Instruction,
+                 trace: Optional[TextIO]) -> Callable[[], int]:
+        end = len(self.instructions)
+        nxt = index + 1 if index + 1 < end else -1   # falling off the end halts
+        regs = self.regs
+        memory = self.memory
+        mnemonic, args = instruction.mnemonic, instruction.args
+        operation = instruction.operation
+
+        if operation is not None:
+            step = self._compile_alu(operation, args, nxt)
+            if trace is None:
+                return step
+            name = CANONICAL.get(operation, operation)
+            write = trace.write
+            form = OPERANDS[operation]
+            if operation == "CMP":
+                ra, rb = args
+            elif form == "AB":
+                _, ra, rb = args
+            elif form == "A":
+                ra, rb = args[1], None
+            else:
+                ra, rb = None, args[1]
+
+            def traced() -> int:
+                a = regs[ra] if ra is not None else 0
+                b = regs[rb] if rb is not None else 0
+                write(f"{name} 0x{a:02X} 0x{b:02X}\n")
+                return step()
+            return traced
+
+        if mnemonic == "LDI":
+            rd, value = args
+
+            def ldi() -> int:
+                regs[rd] = value
+                return nxt
+            return ldi
+        if mnemonic == "LD":
+            rd, ra = args
+
+            def load() -> int:
+                regs[rd] = memory[regs[ra]]
+                return nxt
+            return load
+        if mnemonic == "ST":
+            rs, ra = args
+
+            def store() -> int:
+                memory[regs[ra]] = regs[rs]
+                return nxt
+            return store
+        if mnemonic == "NOP":
+            return lambda: nxt
+        if mnemonic == "HALT":
+            return lambda: -1
+
+        # Branches
+        target = self.labels[args[0]]
+        if target >= end:
+            target = -1
+        condition = CONDITION_TABLES[mnemonic[1:]]
+        if mnemonic == "B":
+            return lambda: target
+
+        def branch() -> int:
+            return target if condition[self.flags] else nxt
+        return branch
+
+    def _compile_alu(self, operation: str, args: Tuple, nxt: int) -> Callable[[], int]:
+        table = opcode_table(OPCODES[operation])
+        regs = self.regs
+        machine = self
+        form = OPERANDS[operation]
+
+        if operation == "CMP":
+            ra, rb = args
+
+            def compare() -> int:
+                machine.flags = table[regs[ra] << 8 | regs[rb]] >> 8
+                return nxt
+            return compare
+        if form == "AB":
+            rd, ra, rb = args
+
+            def binary() -> int:
+                out = table[regs[ra] << 8 | regs[rb]]
+                regs[rd] = out & 0xFF
+                machine.flags = out >> 8
+                return nxt
+            return binary
+        rd, rs = args
+        shift = 8 if form == "A" else 0
+
+        def unary() -> int:
+            out = table[regs[rs] << shift]
+            regs[rd] = out & 0xFF
+            machine.flags = out >> 8
+            return nxt
+        return unary
+
+    # -- execution ----------------------------------------------------------
+
+    def run(self, max_steps: int = DEFAULT_MAX_STEPS) -> int:
+        """Run until HALT or `max_steps`; returns instructions executed."""
+        code = self.code
+        counts = self.counts
+        pc = self.pc
+        executed = 0
+        while pc >= 0 and executed < max_steps:
+            counts[pc] += 1
+            pc = code[pc]()
+            executed += 1
+        self.pc = pc
+        return executed
+
+    @property
+    def halted(self) -> bool:
+        return self.pc < 0
+
+    def op_counts(self) -> Counter:
+        """Executions per mnemonic (ALU ops by canonical mnemonic)."""
+        totals: Counter = Counter()
+        for instruction, count in zip(self.instructions, self.counts):
+            if count:
+                operation = instruction.operation
+                totals[CANONICAL.get(operation, operation) if operation else instruction.mnemonic] += count
+        return totals
+
+    def board_time_ns(self, overhead_ns: float = 0.0) -> Tuple[float, float]:
+        """
+        Estimated board runtime as (self-timed, clocked) in ns. An ALU
+        instruction takes its own delay self-timed, or the slowest ALU delay
+        clocked. Every instruction, ALU or not, adds `overhead_ns` to both,
+        so non-ALU instructions (branches, loads, LDI) cost the same in both
+        columns and the ratio reflects only the data-dependent ALU timing.
+        """
+        executed = sum(self.counts)
+        alu_time = worst_time = 0.0
+        for instruction, count in zip(self.instructions, self.counts):
+            if instruction.operation is not None and count:
+                alu_time += OP_LATENCY_NS[instruction.operation] * count
+                worst_time += WORST_LATENCY_NS * count
+        return alu_time + overhead_ns * executed, worst_time + overhead_ns * executed
+
+
+def flag_string(flags: int) -> str:
+    return "".join(name if flags & bit else "-" for name, bit in
+                   (("N", NEGATIVE), ("Z", ZERO), ("C", CARRY), ("V", OVERFLOW)))
+
+
+def format_time(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.3f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def print_report(machine: Machine, executed: int, elapsed: float, profile: int,
+                 overhead_ns: float) -> None:
+    state = "halted" if machine.halted else f"stopped at step limit (pc={machine.pc})"
+    rate = executed / elapsed if elapsed else 0.0
+    print(f"Executed {executed:,} instructions in {elapsed:.3f}s "
+          f"({rate / 1e6:.2f} M instr/s host), {state}")
+    print("Registers: " + "  ".join(f"R{i}={value:02X}" for i, value in enumerate(machine.regs))
+          + f"  flags={flag_string(machine.flags)}")
+    used = [i for i, value in enumerate(machine.memory) if value]
+    if used:
+        last = used[-1] + 1
+        print(f"Memory [00..{last - 1:02X}]:")
+        for start in range(0, last, 16):
+            row = machine.memory[start:min(start + 16, last)]
+            print(f"  {start:02X}: " + " ".join(f"{value:02X}" for value in row))
+
+    self_timed, clocked = machine.board_time_ns(overhead_ns)
+    other = executed - sum(count for instruction, count in zip(machine.instructions, machine.counts)
+                           if instruction.operation is not None)
+    print(f"\nBoard estimate (PPA.md delays, +{overhead_ns:g} ns/instr overhead):")
+    if other:
+        print(f"  {other:,} non-ALU instruction(s) (branch, LDI, LD/ST, NOP, HALT) have no "
+              f"PPA.md delay and cost only the overhead")
+    period = f"clocked at worst op ({WORST_LATENCY_NS + overhead_ns:.0f} ns)"
+    print(f"  {'self-timed (per-op delay)':<32} {format_time(self_timed)}")
+    print(f"  {period:<32} {format_time(clocked)}")
+    if self_timed:
+        print(f"  {'data-dependent timing speedup':<32} {clocked / self_timed:.2f}x")
+
+    if profile:
+        print(f"\n{'Op':<6} {'Count':>12} {'Share':>7}")
+        for mnemonic, count in machine.op_counts().most_common():
+            print(f"{mnemonic:<6} {count:>12,} {100.0 * count / executed:>6.1f}%")
+        print("\nHottest instructions:")
+        hot = sorted(range(len(machine.instructions)), key=lambda i: -machine.counts[i])[:profile]
+        for index in hot:
+            if machine.counts[index]:
+                instruction = machine.instructions[index]
+                print(f"  {machine.counts[index]:>12,}  line {instruction.line:>4}: {instruction.text}")
+
+
+def parse_register_assignments(items: List[str]) -> Dict[int, int]:
+    values = {}
+    for item in items:
+        name, _, value = item.partition("=")
+        match = REGISTER.match(name.strip())
+        if not match or not value:
+            raise ValueError(f"Expected Rn=value, got '{item}'")
+        values[int(match.group(1))] = int(value, 0) & 0xFF
+    return values
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run an assembly program on the ALU CPU model.")
+    parser.add_argument("program", type=Path, help="Assembly source file.")
+    parser.add_argument("--reg", nargs="+", default=[], metavar="Rn=VALUE",
+                        help="Initial register values, e.g. R0=200 R1=0x7B.")
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS,
+                        help=f"Stop after this many instructions (default: {DEFAULT_MAX_STEPS:,}).")
+    parser.add_argument("--profile", type=int, nargs="?", const=10, default=0, metavar="N",
+                        help="Print the op histogram and the N hottest instructions (default N: 10).")
+    parser.add_argument("--overhead-ns", type=float, default=0.0,
+                        help="Fetch/decode/writeback time added to every instruction, and the "
+                             "only cost of non-ALU instructions (default: 0).")
+    parser.add_argument("--trace", type=Path, default=None,
+                        help="Write every executed ALU op as 'OP 0xAA 0xBB' lines.")
+    args = parser.parse_args()
+
+    try:
+        instructions, labels = assemble(args.program.read_text())
+        registers = parse_register_assignments(args.reg)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    trace = args.trace.open("w") if args.trace else None
+    try:
+        machine = Machine(instructions, labels, trace)
+        for index, value in registers.items():
+            machine.regs[index] = value
+        start = time.perf_counter()
+        executed = machine.run(args.max_steps)
+        elapsed = time.perf_counter() - start
+    finally:
+        if trace:
+            trace.close()
+
+    print_report(machine, executed, elapsed, args.profile, args.overhead_ns)
+    return 0 if machine.halted else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Estimate the bench-supply energy of vector files and operation traces.
+
+Uses the PPA.md-calibrated model in test/energy_model.py: static current
+from the input levels, a base energy per operation and a per-bit cost for
+every input and output toggle between consecutive vectors. With several
+inputs it prints a comparison, so orderings and workloads can be ranked
+before they go on the bench.
+
+Inputs (each measured separately, in file order):
+    *.bin            binary vectors (test/vector_io.py)
+    *.json/.json.gz  repo-schema vector files
+    *.txt / -        "OP A B" lines: cpu_sim.py --trace output or an
+                     alu_cli.py --batch file
+    --program FILE   an assembly program run on tools/cpu_sim.py
+
+Usage:
+    python3 tools/energy_estimate.py test/vectors/demo.json
+    python3 tools/energy_estimate.py ordered.bin shuffled.bin --per-op
+    python3 tools/energy_estimate.py --program tools/programs/bubble_sort.asm
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from cpu_sim import DEFAULT_MAX_STEPS, Machine, assemble, parse_register_assignments
+from energy_model import (BASE_ENERGY_J, STRESS_FREQUENCY_HZ, TOGGLE_ENERGY_J, EnergyMeter,
+                          dict_vectors)
+from exhaustive_vectors import OPERATIONS
+from run_vectors import load_vectors
+from throughput_estimate import operation_name
+from vector_io import read_records
+
+OPCODE_VALUES = {name: int(code, 2) for name, code, _ in OPERATIONS}
+
+
+def parse_trace_line(line: str, source: str, number: int) -> Tuple[int, int, int]:
+    fields = line.split()
+    try:
+        if len(fields) != 3:
+            raise ValueError("expected: OP A B")
+        a, b = int(fields[1], 0), int(fields[2], 0)
+        if not (0 <= a <= 255 and 0 <= b <= 255):
+            raise ValueError("operands out of 8-bit range")
+        return OPCODE_VALUES[operation_name(fields[0])], a, b
+    except ValueError as e:
+        raise ValueError(f"{source}:{number}: {e}") from None
+
+
+def trace_vectors(handle, source: str) -> Iterator[Tuple[int, int, int]]:
+    """(opcode, A, B) from "OP A B" lines (blank lines and # comments skipped)."""
+    for number, line in enumerate(handle, 1):
+        line = line.split("#", 1)[0]
+        if line.strip():
+            yield parse_trace_line(line, source, number)
+
+
+class TraceMeter:
+    """File-like trace sink for cpu_sim.Machine that meters each line."""
+
+    def __init__(self, meter: EnergyMeter):
+        self.meter = meter
+        self.pending: List[Tuple[int, int, int]] = []
+        self.lines = 0
+
+    def write(self, text: str) -> None:
+        self.lines += 1
+        self.pending.append(parse_trace_line(text, "trace", self.lines))
+        if len(self.pending) >= 65536:
+            self.flush()
+
+    def flush(self) -> None:
+        self.meter.feed(self.pending)
+        self.pending = []
+
+
+def measure_path(path: str, frequency_hz: float) -> EnergyMeter:
+    meter = EnergyMeter(frequency_hz)
+    if path == "-":
+        return meter.feed(trace_vectors(sys.stdin, "<stdin>"))
+    if path.endswith(".bin"):
+        return meter.feed((opcode, a, b) for opcode, a, b, _, _ in read_records(path))
+    if path.endswith((".json", ".json.gz")):
+        return meter.feed(dict_vectors(load_vectors([Path(path)])))
+    with open(path) as handle:
+        return meter.feed(trace_vectors(handle, path))
+
+
+def measure_program(path: Path, registers: List[str], max_steps: int,
+                    frequency_hz: float) -> EnergyMeter:
+    instructions, labels = assemble(path.read_text())
+    sink = TraceMeter(EnergyMeter(frequency_hz))
+    machine = Machine(instructions, labels, sink)
+    for index, value in parse_register_assignments(registers).items():
+        machine.regs[index] = value
+    machine.run(max_steps)
+    sink.flush()
+    return sink.meter
+
+
+def format_energy(joules: float) -> str:
+    for unit, scale in (("J", 1.0), ("mJ", 1e-3), ("uJ", 1e-6)):
+        if joules >= scale:
+            return f"{joules / scale:.3f} {unit}"
+    return f"{joules / 1e-9:.1f} nJ"
+
+
+def print_report(name: str, meter: EnergyMeter, per_op: bool) -> None:
+    print(f"{name}: {meter.vectors:,} vectors, {meter.toggles:,} toggles "
+          f"({meter.toggles / meter.vectors:.2f}/vector)")
+    print(f"  {'energy':<10} {format_energy(meter.energy_j):>12}  "
+          f"({format_energy(meter.energy_j / meter.vectors)}/vector, "
+          f"{meter.power_w:.2f} W at {meter.frequency_hz / 1e6:g} MHz)")
+    for label, joules in (("static", meter.static_j), ("base", meter.base_j),
+                          ("toggles", meter.toggle_j)):
+        print(f"  {label:<10} {format_energy(joules):>12}  {100.0 * joules / meter.energy_j:>5.1f}%")
+    if per_op:
+        print(f"  {'Op':<8} {'Count':>10} {'Toggles/vec':>11} {'Energy':>12} {'Share':>6}")
+        for op, totals in sorted(meter.per_op.items(), key=lambda item: -item[1].energy_j):
+            print(f"  {op:<8} {totals.count:>10,} {totals.toggles / totals.count:>11.2f} "
+                  f"{format_energy(totals.energy_j):>12} {100.0 * totals.energy_j / meter.energy_j:>5.1f}%")
+    print()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Estimate energy of vector files and op traces.")
+    parser.add_argument("paths", nargs="*",
+                        help="Vector files (.bin, JSON) or traces (OP A B lines, - for stdin).")
+    parser.add_argument("--program", type=Path, default=None,
+                        help="Assembly program to run on tools/cpu_sim.py.")
+    parser.add_argument("--reg", nargs="+", default=[], metavar="Rn=VALUE",
+                        help="Initial register values for --program.")
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS,
+                        help=f"Instruction limit for --program (default: {DEFAULT_MAX_STEPS:,}).")
+    parser.add_argument("--frequency", type=float, default=STRESS_FREQUENCY_HZ / 1e6,
+                        help="Vector rate in MHz for static energy and power (default: 1).")
+    parser.add_argument("--per-op", action="store_true", help="Break energy down by opcode.")
+    args = parser.parse_args()
+
+    if not args.paths and not args.program:
+        parser.error("give vector/trace files or --program")
+    if args.frequency <= 0:
+        parser.error("--frequency must be positive")
+    frequency_hz = args.frequency * 1e6
+
+    print(f"Model: {format_energy(BASE_ENERGY_J)}/vector base + "
+          f"{format_energy(TOGGLE_ENERGY_J)}/toggle + static (PPA.md)\n")
+    results = []
+    try:
+        for path in args.paths:
+            results.append((path, measure_path(path, frequency_hz)))
+        if args.program:
+            results.append((str(args.program), measure_program(args.program, args.reg,
+                                                               args.max_steps, frequency_hz)))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    for name, meter in results:
+        if meter.vectors:
+            print_report(name, meter, args.per_op)
+        else:
+            print(f"{name}: no vectors\n")
+
+    measured = [(name, meter) for name, meter in results if meter.vectors]
+    if len(measured) > 1:
+        best = min(meter.energy_j / meter.vectors for _, meter in measured)
+        print(f"{'Input':<40} {'Vectors':>10} {'Toggles/vec':>11} {'Energy/vec':>11} {'vs best':>8}")
+        for name, meter in sorted(measured, key=lambda item: item[1].energy_j / item[1].vectors):
+            per_vector = meter.energy_j / meter.vectors
+            print(f"{name:<40} {meter.vectors:>10,} {meter.toggles / meter.vectors:>11.2f} "
+                  f"{format_energy(per_vector):>11} {per_vector / best:>7.3f}x")
+    return 0 if measured else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
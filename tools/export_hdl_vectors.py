@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Export ALU vectors as $readmemh memories for the FPGA testbench.
+
+Streams any vector source (the exhaustive golden-model sweep, JSON/JSON.gz
+files or binary files from test/vector_io.py, optionally filtered by opcode)
+into chunked hex files plus a SystemVerilog include describing them:
+
+    <prefix>_0000.hex, <prefix>_0001.hex, ...   one packed vector per line
+    <prefix>_count.hex                          vector count and chunk size,
+                                                read by the testbench at run
+                                                time (so +vectors=<prefix>
+                                                needs no recompile)
+    <prefix>.svh                                memory size, default file
+                                                prefix and the packed struct
+
+Each line is one `alu_vector_t` (MSB first):
+
+    less, great, equal, overflow, negative, zero, carry, opcode[4:0],
+    a[7:0], b[7:0], result[7:0]                              (36 bits)
+
+Equal/Great/Less follow ALU.sv, which drives them from an unsigned A/B
+compare for every opcode; they are derived from the golden model's CMP
+flags (equal = Z, great = C & !Z, less = !C).
+
+Chunks keep each $readmemh memory at --chunk entries, so the 1.2M sweep never
+needs more than one chunk resident in the simulator. Run the sweep with
+sim/FPGA/testbench/alu_vector_tb.sv.
+
+Usage:
+    python3 tools/export_hdl_vectors.py                          # exhaustive
+    python3 tools/export_hdl_vectors.py --opcodes ADD SUB CMP
+    python3 tools/export_hdl_vectors.py test/vectors/demo.json --prefix demo
+    python3 tools/export_hdl_vectors.py hw.bin --chunk 4096
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+
+from batch_model import opcode_table, pack_outcome
+from exhaustive_vectors import OPERATIONS, operand_pairs
+from run_vectors import load_vectors
+from vector_io import read_vectors
+
+WIDTH = 8
+CMP_OPCODE = "10000"
+DEFAULT_OUT_DIR = ROOT / "sim" / "FPGA" / "testbench" / "vectors"
+
+# (name, bits), MSB first, matching the packed struct in the include
+FIELDS = (
+    ("less", 1), ("great", 1), ("equal", 1), ("overflow", 1),
+    ("negative", 1), ("zero", 1), ("carry", 1), ("opcode", 5),
+    ("a", WIDTH), ("b", WIDTH), ("result", WIDTH),
+)
+WORD_BITS = sum(bits for _, bits in FIELDS)
+HEX_DIGITS = (WORD_BITS + 3) // 4
+
+
+def resolve_opcodes(selection: Optional[List[str]]) -> Optional[Set[str]]:
+    """Opcode filter from names (ADD) or binary codes (00000)."""
+    if not selection:
+        return None
+    by_name = {name: code for name, code, _ in OPERATIONS}
+    codes = {code for _, code, _ in OPERATIONS}
+    resolved = set()
+    for item in selection:
+        if item.upper() in by_name:
+            resolved.add(by_name[item.upper()])
+        elif item in codes:
+            resolved.add(item)
+        else:
+            raise ValueError(f"Unknown opcode: {item}")
+    return resolved
+
+
+def pack_word(opcode: int, a: int, b: int, outcome: int, compare: int) -> int:
+    """
+    Pack one vector from packed `batch_model` outcomes: `outcome` for the
+    vector itself, `compare` for CMP on the same A/B.
+    """
+    cmp_carry = compare >> 8 & 1
+    cmp_zero = compare >> 9 & 1
+    flags = (
+        (1 - cmp_carry) << 6                    # less
+        | (cmp_carry & (1 - cmp_zero)) << 5     # great
+        | cmp_zero << 4                         # equal
+        | (outcome >> 10 & 1) << 3              # overflow
+        | (outcome >> 11 & 1) << 2              # negative
+        | (outcome >> 9 & 1) << 1               # zero
+        | (outcome >> 8 & 1)                    # carry
+    )
+    return (flags << 5 | opcode) << 3 * WIDTH | a << 2 * WIDTH | b << WIDTH | outcome & 0xFF
+
+
+def exhaustive_words(opcodes: Optional[Set[str]], reduce_operands: bool) -> Iterator[int]:
+    """Packed words of the exhaustive sweep, straight from the outcome tables."""
+    compare = opcode_table(CMP_OPCODE)
+    for _, opcode, operands in OPERATIONS:
+        if opcodes is not None and opcode not in opcodes:
+            continue
+        table = opcode_table(opcode)
+        value = int(opcode, 2)
+        for a, b in operand_pairs(operands, reduce_operands):
+            index = a << 8 | b
+            yield pack_word(value, a, b, table[index], compare[index])
+
+
+def file_words(paths: List[Path], opcodes: Optional[Set[str]]) -> Iterator[int]:
+    """Packed words of JSON/JSON.gz/.bin files, using their recorded expectations."""
+    compare = opcode_table(CMP_OPCODE)
+    for path in paths:
+        vectors = read_vectors(path) if path.suffix == ".bin" else load_vectors([path])
+        for vector in vectors:
+            opcode = str(vector["opcode"]).strip()
+            if opcodes is not None and opcode not in opcodes:
+                continue
+            a = int(vector.get("A", 0)) & 0xFF
+            b = int(vector.get("B", 0)) & 0xFF
+            outcome = pack_outcome(int(vector.get("expected_result", 0)),
+                                   vector.get("expected_flags", {}))
+            yield pack_word(int(opcode, 2), a, b, outcome, compare[a << 8 | b])
+
+
+def export(words: Iterable[int], out_dir: Path, prefix: str, chunk: int) -> int:
+    """Write chunked hex files and the include; returns the vector count."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob(f"{prefix}_[0-9][0-9][0-9][0-9].hex"):
+        stale.unlink()
+
+    count = 0
+    lines: List[str] = []
+    for word in words:
+        lines.append(f"{word:0{HEX_DIGITS}x}\n")
+        count += 1
+        if len(lines) == chunk:
+            _write_chunk(out_dir, prefix, (count - 1) // chunk, lines)
+            lines = []
+    if lines:
+        _write_chunk(out_dir, prefix, count // chunk, lines)
+
+    (out_dir / f"{prefix}_count.hex").write_text(f"{count:08x}\n{chunk:08x}\n")
+    write_include(out_dir / f"{prefix}.svh", out_dir / prefix, count, chunk)
+    return count
+
+
+def _write_chunk(out_dir: Path, prefix: str, index: int, lines: List[str]) -> None:
+    with (out_dir / f"{prefix}_{index:04d}.hex").open("w") as handle:
+        handle.writelines(lines)
+
+
+def write_include(path: Path, prefix: Path, count: int, chunk: int) -> None:
+    guard = f"{path.stem.upper()}_SVH"
+    members = "\n".join(
+        f"    logic {'' if bits == 1 else f'[{bits - 1}:0] '}{name};" for name, bits in FIELDS
+    )
+    path.write_text(
+        f"// Generated by tools/export_hdl_vectors.py - do not edit.\n"
+        f"`ifndef {guard}\n"
+        f"`define {guard}\n\n"
+        f"localparam VEC_WIDTH      = {WIDTH};\n"
+        f"localparam VEC_COUNT      = {count};\n"
+        f"localparam VEC_CHUNK_SIZE = {chunk};\n"
+        f"localparam VEC_CHUNKS     = {(count + chunk - 1) // chunk};\n"
+        f"localparam VEC_PREFIX     = \"{prefix.resolve().as_posix()}\";\n\n"
+        f"typedef struct packed {{\n{members}\n}} alu_vector_t;  // {WORD_BITS} bits\n\n"
+        f"`endif\n"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export ALU vectors as $readmemh memories.")
+    parser.add_argument("paths", nargs="*", type=Path,
+                        help="JSON/JSON.gz/.bin vector files (default: exhaustive sweep).")
+    parser.add_argument("--opcodes", nargs="+", default=None,
+                        help="Only export these opcodes (names like ADD or codes like 00000).")
+    parser.add_argument("--reduce-operands", action="store_true",
+                        help="Exhaustive source: sweep only the operands each opcode uses.")
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR,
+                        help="Output directory (default: sim/FPGA/testbench/vectors).")
+    parser.add_argument("--prefix", default="alu_vectors", help="Output file prefix.")
+    parser.add_argument("--chunk", type=int, default=65536,
+                        help="Vectors per hex file / simulator memory (default: 65536).")
+    args = parser.parse_args()
+
+    if args.chunk <= 0:
+        parser.error("--chunk must be positive")
+    try:
+        opcodes = resolve_opcodes(args.opcodes)
+    except ValueError as e:
+        parser.error(str(e))
+
+    words = file_words(args.paths, opcodes) if args.paths \
+        else exhaustive_words(opcodes, args.reduce_operands)
+    count = export(words, args.out_dir, args.prefix, args.chunk)
+    chunks = (count + args.chunk - 1) // args.chunk
+    print(f"Exported {count:,} vectors in {chunks} chunk(s) to {args.out_dir}")
+    print(f"Include: {args.out_dir / (args.prefix + '.svh')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
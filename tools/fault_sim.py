@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Parallel-pattern stuck-at and bridging fault simulator for the ALU netlist.
+
+Faults are injected into the gate-level netlist from tools/alu_netlist.py:
+
+- Stuck-at-0 / stuck-at-1 on every net (primary inputs and gate outputs)
+- Bridging (wired-AND and wired-OR) between adjacent nets: neighbouring bits
+  of the same bus (parallel traces) and nets on neighbouring input pins of the
+  same gate. Pairs where one net feeds the other are skipped, as a short there
+  would form a feedback loop rather than a combinational fault.
+
+Vectors are simulated word-parallel (one Python int per net, one bit per
+vector), and only the fanout cone of a fault is re-evaluated. In campaign
+mode detected faults are dropped after each word, so the full exhaustive
+campaign runs in seconds; faults still undetected after all 1,245,184 vectors
+are provably redundant.
+
+--matrix disables dropping and writes the fault-detection matrix (one row per
+fault, one 0/1 column per vector). --diagnose takes observed board results and
+ranks the faults that best explain them. Observations use the repo vector
+schema plus the measured outputs:
+
+    {"tests": [{"opcode": "00000", "A": 3, "B": 5, "actual_result": 12,
+                "actual_flags": {...}}, ...]}
+
+`actual_flags` is optional (the Pico harness reads OUT only); vectors whose
+actual outputs match the golden model count as passing observations.
+
+Usage:
+    python3 tools/fault_sim.py                          # exhaustive campaign
+    python3 tools/fault_sim.py --vectors hw.json        # coverage of a vector set
+    python3 tools/fault_sim.py --vectors hw.bin --matrix matrix.csv
+    python3 tools/fault_sim.py --diagnose observed.json
+"""
+
+import argparse
+import csv
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from alu_netlist import (
+    FLAG_OUTPUTS,
+    Netlist,
+    build_alu_netlist,
+    evaluate_gate,
+    opcode_patterns,
+    pack_vectors,
+    unpack_bus,
+)
+from exhaustive_vectors import OPERATIONS
+from run_vectors import load_vectors
+from vector_io import read_vectors
+
+BUS_NET = re.compile(r"^(.*)\[(\d+)\]$")
+WORD_SIZE = 65536
+
+
+@dataclass(frozen=True)
+class Fault:
+    kind: str                   # "SA0", "SA1", "AND" (wired-AND), "OR" (wired-OR)
+    nets: Tuple[str, ...]
+
+    def __str__(self) -> str:
+        if self.kind in ("SA0", "SA1"):
+            return f"{self.nets[0]} stuck-at-{self.kind[-1]}"
+        return f"{self.nets[0]} <-> {self.nets[1]} wired-{self.kind}"
+
+
+def adjacent_pairs(netlist: Netlist) -> List[Tuple[str, str]]:
+    """Net pairs likely to short: bus neighbours and neighbouring gate pins."""
+    readers = netlist.fanout()
+    pairs = set()
+
+    buses: Dict[str, Dict[int, str]] = {}
+    for net in netlist.nets():
+        match = BUS_NET.match(net)
+        if match:
+            buses.setdefault(match.group(1), {})[int(match.group(2))] = net
+    for bits in buses.values():
+        for i in bits:
+            if i + 1 in bits:
+                pairs.add((bits[i], bits[i + 1]))
+
+    for gate in netlist.gates:
+        for first, second in zip(gate.inputs, gate.inputs[1:]):
+            if first != second:
+                pairs.add(tuple(sorted((first, second))))
+
+    def feeds(source: str, target: str) -> bool:
+        index = netlist.driver.get(target)
+        return index is not None and index in netlist.cone([source], readers)
+
+    return sorted(pair for pair in pairs
+                  if not feeds(pair[0], pair[1]) and not feeds(pair[1], pair[0]))
+
+
+def enumerate_faults(netlist: Netlist, bridges: bool = True) -> List[Fault]:
+    faults = [Fault(kind, (net,)) for net in netlist.nets() for kind in ("SA0", "SA1")]
+    if bridges:
+        faults += [Fault(kind, pair) for pair in adjacent_pairs(netlist) for kind in ("AND", "OR")]
+    return faults
+
+
+class FaultSimulator:
+    """Evaluates faulty copies of a netlist against a good-machine simulation."""
+
+    def __init__(self, netlist: Netlist):
+        self.netlist = netlist
+        self.readers = netlist.fanout()
+        self._cones: Dict[Tuple[str, ...], List[int]] = {}
+
+    def cone(self, fault: Fault) -> List[int]:
+        if fault.nets not in self._cones:
+            self._cones[fault.nets] = self.netlist.cone(fault.nets, self.readers)
+        return self._cones[fault.nets]
+
+    def faulty_nets(self, fault: Fault, good: Dict[str, int], mask: int) -> Dict[str, int]:
+        """Net values with `fault` injected, re-evaluating only its fanout cone."""
+        nets = dict(good)
+        if fault.kind == "SA0":
+            nets[fault.nets[0]] = 0
+        elif fault.kind == "SA1":
+            nets[fault.nets[0]] = mask
+        else:
+            first, second = (good[net] for net in fault.nets)
+            shorted = first & second if fault.kind == "AND" else first | second
+            for net in fault.nets:
+                nets[net] = shorted
+
+        gates = self.netlist.gates
+        for index in self.cone(fault):
+            gate = gates[index]
+            if gate.output in fault.nets:
+                continue  # the fault dominates the net's driver
+            nets[gate.output] = evaluate_gate(gate.kind, [nets[i] for i in gate.inputs], mask)
+        return nets
+
+    def detect(self, fault: Fault, good: Dict[str, int], mask: int) -> int:
+        """Lane word of the vectors on which `fault` changes any output."""
+        nets = self.faulty_nets(fault, good, mask)
+        diff = 0
+        for output in self.netlist.outputs:
+            diff |= nets[output] ^ good[output]
+        return diff
+
+
+def exhaustive_batches(netlist: Netlist) -> Iterator[Tuple[Dict[str, int], int, int]]:
+    """(input words, mask, lane count) per opcode over every (A, B)."""
+    for _, opcode, _ in OPERATIONS:
+        words, mask = opcode_patterns(netlist, opcode)
+        yield words, mask, 65536
+
+
+def load_vector_tuples(paths: Sequence[Path]) -> List[Tuple[int, int, int]]:
+    """(opcode, A, B) from JSON/JSON.gz or binary (vector_io) vector files."""
+    vectors = []
+    for path in paths:
+        entries = read_vectors(path) if path.suffix == ".bin" else load_vectors([path])
+        for entry in entries:
+            vectors.append((int(str(entry["opcode"]).strip(), 2),
+                            int(entry.get("A", 0)) & 0xFF, int(entry.get("B", 0)) & 0xFF))
+    return vectors
+
+
+def file_batches(netlist: Netlist, vectors: Sequence[Tuple[int, int, int]],
+                 word_size: int = WORD_SIZE) -> Iterator[Tuple[Dict[str, int], int, int]]:
+    for start in range(0, len(vectors), word_size):
+        chunk = vectors[start:start + word_size]
+        words, mask = pack_vectors(netlist, chunk)
+        yield words, mask, len(chunk)
+
+
+def run_campaign(simulator: FaultSimulator, faults: Sequence[Fault],
+                 batches, drop: bool = True) -> Dict[Fault, int]:
+    """
+    Simulate `faults` over vector batches.
+
+    With `drop`, returns fault -> index of its first detecting vector (faults
+    left out were never detected). Without, returns fault -> detection row
+    (bit j set when vector j detects the fault).
+    """
+    results: Dict[Fault, int] = {}
+    remaining = list(faults)
+    offset = 0
+    for words, mask, count in batches:
+        good = simulator.netlist.simulate(words, mask)
+        undetected = []
+        for fault in remaining:
+            diff = simulator.detect(fault, good, mask)
+            if drop:
+                if diff:
+                    results[fault] = offset + (diff & -diff).bit_length() - 1
+                else:
+                    undetected.append(fault)
+            else:
+                results[fault] = results.get(fault, 0) | diff << offset
+        if drop:
+            remaining = undetected
+            if not remaining:
+                break
+        offset += count
+    return results
+
+
+def write_matrix(path: Path, faults: Sequence[Fault], rows: Dict[Fault, int], count: int) -> None:
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["fault"] + [f"v{j}" for j in range(count)])
+        for fault in faults:
+            row = rows.get(fault, 0)
+            writer.writerow([str(fault)] + [row >> j & 1 for j in range(count)])
+
+
+def check_observations(observations: Sequence[Dict]) -> None:
+    """Raise ValueError naming the first observation `diagnose` cannot use."""
+    for number, entry in enumerate(observations, 1):
+        where = f"{entry.get('_source', 'observations')}: vector {number}"
+        if "actual_result" not in entry:
+            raise ValueError(f"{where}: missing 'actual_result' (the measured board output)")
+        try:
+            int(str(entry["opcode"]).strip(), 2)
+            int(entry.get("A", 0)), int(entry.get("B", 0)), int(entry["actual_result"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"{where}: opcode, A, B and actual_result must be integers") from None
+        if not isinstance(entry.get("actual_flags", {}), dict):
+            raise ValueError(f"{where}: 'actual_flags' must be an object")
+
+
+def diagnose(simulator: FaultSimulator, faults: Sequence[Fault],
+             observations: Sequence[Dict]) -> List[Tuple[Fault, int, int, int]]:
+    """
+    Rank faults against observed board results.
+
+    Returns (fault, explained, contradicted, unexplained) sorted best first:
+    explained = failing vectors whose observed outputs the fault reproduces
+    exactly; contradicted = vectors the fault predicts differently from what
+    was observed (including predicted failures on passing vectors);
+    unexplained = observed failures the fault does not affect at all.
+    Raises ValueError if an observation lacks its measured outputs.
+    """
+    check_observations(observations)
+    netlist = simulator.netlist
+    operand_mask = (1 << netlist.width) - 1
+    vectors = [(int(str(o["opcode"]).strip(), 2), int(o.get("A", 0)) & operand_mask,
+                int(o.get("B", 0)) & operand_mask) for o in observations]
+    words, mask = pack_vectors(netlist, vectors)
+    good = netlist.simulate(words, mask)
+    count = len(vectors)
+    out_bus = [f"OUT[{i}]" for i in range(netlist.width)]
+
+    def outputs(nets: Dict[str, int]) -> List[Tuple[int, Tuple[bool, ...]]]:
+        results = unpack_bus(nets, out_bus, count)
+        flags = unpack_bus(nets, FLAG_OUTPUTS, count)
+        return [(results[j], tuple(bool(flags[j] >> k & 1) for k in range(len(FLAG_OUTPUTS))))
+                for j in range(count)]
+
+    def observed(j: int, predicted: Tuple[int, Tuple[bool, ...]]) -> Tuple:
+        """The observed outputs of vector j, and the same fields of `predicted`."""
+        entry = observations[j]
+        actual = (int(entry["actual_result"]),)
+        model = (predicted[0],)
+        if "actual_flags" in entry:
+            actual += tuple(bool(entry["actual_flags"].get(flag.lower(), False))
+                            for flag in FLAG_OUTPUTS)
+            model += predicted[1]
+        return actual, model
+
+    expected = outputs(good)
+    failing = {j for j in range(count) if observed(j, expected[j])[0] != observed(j, expected[j])[1]}
+    ranking = []
+    for fault in faults:
+        diff = simulator.detect(fault, good, mask)
+        if not diff:
+            ranking.append((fault, 0, 0, len(failing)))
+            continue
+        predicted = outputs(simulator.faulty_nets(fault, good, mask))
+        explained = contradicted = unexplained = 0
+        for j in range(count):
+            actual, model = observed(j, predicted[j])
+            _, good_model = observed(j, expected[j])
+            if actual == model:
+                explained += j in failing
+            elif j in failing and model == good_model:
+                unexplained += 1
+            else:
+                contradicted += 1
+        ranking.append((fault, explained, contradicted, unexplained))
+    ranking.sort(key=lambda r: (-r[1], r[2], r[3], str(r[0])))
+    return ranking
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stuck-at and bridging fault simulation of the ALU netlist.")
+    parser.add_argument("--vectors", nargs="*", type=Path, default=None,
+                        help="JSON/JSON.gz/.bin vector files (default: exhaustive, all 1,245,184).")
+    parser.add_argument("--no-bridges", action="store_true", help="Stuck-at faults only.")
+    parser.add_argument("--matrix", type=Path, default=None,
+                        help="Write the fault-detection matrix (CSV); disables fault dropping.")
+    parser.add_argument("--diagnose", type=Path, default=None,
+                        help="Rank candidate faults against observed results (JSON).")
+    parser.add_argument("--top", type=int, default=10, help="Candidates to list when diagnosing.")
+    args = parser.parse_args()
+
+    netlist = build_alu_netlist()
+    simulator = FaultSimulator(netlist)
+    faults = enumerate_faults(netlist, bridges=not args.no_bridges)
+    stuck = sum(1 for f in faults if f.kind in ("SA0", "SA1"))
+    print(f"Netlist: {len(netlist.gates)} gates, {len(netlist.nets())} nets; "
+          f"{len(faults)} faults ({stuck} stuck-at, {len(faults) - stuck} bridging)")
+
+    start = time.time()
+    if args.diagnose is not None:
+        try:
+            observations = load_vectors([args.diagnose])
+            ranking = diagnose(simulator, faults, observations)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        print(f"Diagnosed {len(observations)} observations in {time.time() - start:.1f}s\n")
+        print(f"{'Rank':>4} | {'Explained':>9} | {'Contradicted':>12} | {'Unexplained':>11} | Fault")
+        print(f"{'-'*5}+{'-'*11}+{'-'*14}+{'-'*13}+{'-'*30}")
+        for rank, (fault, explained, contradicted, unexplained) in enumerate(ranking[:args.top], 1):
+            print(f"{rank:>4} | {explained:>9} | {contradicted:>12} | {unexplained:>11} | {fault}")
+        return 0
+
+    if args.vectors:
+        vectors = load_vector_tuples(args.vectors)
+        batches = file_batches(netlist, vectors)
+        total = len(vectors)
+        source = f"{total:,} vectors from {len(args.vectors)} file(s)"
+    else:
+        batches = exhaustive_batches(netlist)
+        total = 65536 * len(OPERATIONS)
+        source = f"all {total:,} vectors"
+
+    drop = args.matrix is None
+    results = run_campaign(simulator, faults, batches, drop=drop)
+    elapsed = time.time() - start
+    # Dropping records first-detection indexes (0 is valid); the matrix records rows
+    detected = [f for f in faults if (f in results if drop else results.get(f))]
+    undetected = [f for f in faults if (f not in results if drop else not results.get(f))]
+
+    print(f"Simulated {source} in {elapsed:.1f}s"
+          f"{' with fault dropping' if drop else ''}\n")
+    for label, kinds in (("Stuck-at", ("SA0", "SA1")), ("Bridging", ("AND", "OR"))):
+        group = [f for f in faults if f.kind in kinds]
+        if group:
+            hit = sum(1 for f in detected if f.kind in kinds)
+            print(f"  {label:<9} {hit:>5}/{len(group):<5} detected ({100 * hit / len(group):.1f}%)")
+    print(f"  {'Total':<9} {len(detected):>5}/{len(faults):<5} detected "
+          f"({100 * len(detected) / len(faults):.1f}%)")
+
+    if undetected:
+        note = "redundant (no input detects them)" if not args.vectors else "undetected"
+        print(f"\n{len(undetected)} {note}:")
+        for fault in undetected[:20]:
+            print(f"  {fault}")
+        if len(undetected) > 20:
+            print(f"  ... {len(undetected) - 20} more")
+
+    if args.matrix is not None:
+        write_matrix(args.matrix, faults, results, total)
+        print(f"\nWrote {args.matrix}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Differential fuzzer across every ALU model in the repository.
+
+The same random, edge-biased (opcode, A, B) batches are fed to each
+independent implementation and the outputs (result + C/Z/V/N) are compared
+against the golden model in `test/exhaustive_vectors.py`:
+
+    golden               test/exhaustive_vectors.py   compute_alu_operation
+    test_alu             test/test_alu.py             ALU8Bit.execute
+    run_json_tests       test/scripts/run_json_tests.py  ALU8Bit.execute
+    generate_exhaustive  test/scripts/generate_exhaustive_tests.py  ALU8Bit
+    run_tests            tools/run_tests.py           SimulatedALUHardware
+    streaming            test/generate_vectors_streaming.py  compute_alu_operation
+    run_vectors          test/run_vectors.py          compute_expected
+    cpp                  test/cpp/alu_tb.cpp          ALU_Model (with --cpp)
+
+Models that do not implement an opcode are skipped for that opcode only.
+The run is bounded by --seconds and split across --jobs worker processes;
+the first divergence stops every worker and is reported with a minimized
+repro (fewest set bits in A and B that still diverge). A worker that
+crashes, dies without reporting, or overruns the deadline is reported as a
+failure rather than waited on.
+
+Every model is called once per vector, so throughput is bound by Python
+call overhead: about 0.3-0.5M comparisons/s (one model checked against the
+golden model on one vector) per worker process, scaling with --jobs.
+
+Usage:
+    python3 tools/fuzz_models.py --seconds 60
+    python3 tools/fuzz_models.py --seconds 10 --jobs 4 --seed 1234
+    python3 tools/fuzz_models.py --cpp test/cpp/alu_tb
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import queue
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "test" / "scripts"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from exhaustive_vectors import OPERATIONS, compute_alu_operation
+
+Outcome = Tuple[int, bool, bool, bool, bool]
+Model = Callable[[str, int, int], Outcome]
+
+# Operand values that sit on carry, sign and overflow boundaries.
+EDGE_VALUES = (0x00, 0x01, 0x02, 0x7E, 0x7F, 0x80, 0x81, 0xFE, 0xFF,
+               0x55, 0xAA, 0x0F, 0xF0, 0x10, 0x08, 0x40)
+EDGE_PROBABILITY = 0.3
+UNSUPPORTED = (ValueError, KeyError, NotImplementedError)
+CPP_FAILURE = re.compile(r"\[(?:FAIL|ERROR)\] FUZZ_(\d+)")
+# How long past the deadline a live worker may take to report before it is killed.
+WORKER_GRACE_S = 10.0
+
+# Method names shared by the ALU8Bit copies that have no execute() dispatcher.
+OPCODE_METHODS = {
+    "00000": "add", "00001": "sub", "00010": "inc_a", "00011": "dec_a",
+    "00100": "lsl", "00101": "lsr", "00110": "asr", "00111": "rev_a",
+    "01000": "nand", "01001": "nor", "01010": "xor", "01011": "pass_a",
+    "01100": "pass_b", "01101": "and_op", "01110": "or_op", "01111": "xnor",
+    "10000": "cmp", "10001": "not_a", "10010": "not_b",
+}
+
+
+def normalize(result: int, flags: Dict[str, bool]) -> Outcome:
+    return (result & 0xFF, bool(flags["carry"]), bool(flags["zero"]),
+            bool(flags["overflow"]), bool(flags["negative"]))
+
+
+def load_models() -> Dict[str, Model]:
+    """Import every Python model and wrap it as model(opcode, a, b) -> Outcome."""
+    import generate_exhaustive_tests
+    import generate_vectors_streaming
+    import run_json_tests
+    import run_tests
+    import run_vectors
+    import test_alu
+
+    def method_model(alu) -> Model:
+        return lambda op, a, b: normalize(*getattr(alu, OPCODE_METHODS[op])(a, b))
+
+    def run_vectors_model(op: str, a: int, b: int) -> Outcome:
+        expected = run_vectors.compute_expected({"opcode": op, "A": a, "B": b})
+        return normalize(expected["expected_result"], expected["expected_flags"])
+
+    hardware = run_tests.SimulatedALUHardware()
+    test_alu_model = test_alu.ALU8Bit()
+    json_model = run_json_tests.ALU8Bit()
+
+    return {
+        "golden": lambda op, a, b: normalize(*compute_alu_operation(op, a, b)),
+        "test_alu": lambda op, a, b: normalize(*test_alu_model.execute(op, a, b)),
+        "run_json_tests": lambda op, a, b: normalize(*json_model.execute(op, a, b)),
+        "generate_exhaustive": method_model(generate_exhaustive_tests.ALU8Bit()),
+        "run_tests": lambda op, a, b: normalize(*hardware.ops[op][1](a, b)),
+        "streaming": lambda op, a, b: normalize(
+            *generate_vectors_streaming.compute_alu_operation(op, a, b)),
+        "run_vectors": run_vectors_model,
+    }
+
+
+def supported_models(models: Dict[str, Model]) -> Dict[str, List[Tuple[str, Model]]]:
+    """Map each opcode to the (name, model) pairs that implement it."""
+    support = {}
+    for _, opcode, _ in OPERATIONS:
+        support[opcode] = []
+        for name, model in models.items():
+            try:
+                model(opcode, 0, 0)
+            except UNSUPPORTED:
+                continue
+            support[opcode].append((name, model))
+    return support
+
+
+def random_operand(rng: random.Random) -> int:
+    if rng.random() < EDGE_PROBABILITY:
+        return rng.choice(EDGE_VALUES)
+    return rng.getrandbits(8)
+
+
+def make_batch(rng: random.Random, size: int) -> List[Tuple[str, int, int]]:
+    opcodes = [code for _, code, _ in OPERATIONS]
+    return [(rng.choice(opcodes), random_operand(rng), random_operand(rng))
+            for _ in range(size)]
+
+
+def disagreeing(models: List[Tuple[str, Model]], opcode: str, a: int, b: int) -> Dict[str, Outcome]:
+    """Return every model's outcome if any two disagree, else an empty dict."""
+    outcomes = {name: model(opcode, a, b) for name, model in models}
+    if len(set(outcomes.values())) > 1:
+        return outcomes
+    return {}
+
+
+def minimize(diverges: Callable[[int, int], bool], a: int, b: int) -> Tuple[int, int]:
+    """Clear bits of A and B greedily while `diverges(a, b)` still holds."""
+    changed = True
+    while changed:
+        changed = False
+        for bit in range(15, -1, -1):
+            if bit >= 8 and not a >> (bit - 8) & 1 or bit < 8 and not b >> bit & 1:
+                continue
+            trial_a = a & ~(1 << (bit - 8)) if bit >= 8 else a
+            trial_b = b & ~(1 << bit) if bit < 8 else b
+            if diverges(trial_a, trial_b):
+                a, b = trial_a, trial_b
+                changed = True
+    return a, b
+
+
+def _worker(worker_id: int, seed: int, deadline: float, batch_size: int,
+            stop, results) -> None:
+    checked = 0
+    comparisons = 0
+    divergence = None
+    try:
+        checked, comparisons, divergence = _fuzz_loop(worker_id, seed, deadline, batch_size, stop)
+    except Exception as e:   # a model crashing on an input is a finding, not a hang
+        stop.set()
+        results.put((worker_id, checked, comparisons, None, f"{type(e).__name__}: {e}"))
+        return
+    results.put((worker_id, checked, comparisons, divergence, None))
+
+
+def _fuzz_loop(worker_id: int, seed: int, deadline: float, batch_size: int,
+               stop) -> Tuple[int, int, Optional[Tuple[str, int, int]]]:
+    rng = random.Random(seed + worker_id)
+    support = supported_models(load_models())
+    checked = 0
+    comparisons = 0
+    divergence = None
+
+    while time.time() < deadline and not stop.is_set():
+        batch = make_batch(rng, batch_size)
+        by_opcode: Dict[str, List[Tuple[int, int]]] = {}
+        for opcode, a, b in batch:
+            by_opcode.setdefault(opcode, []).append((a, b))
+
+        for opcode, pairs in by_opcode.items():
+            models = support[opcode]
+            _, reference = models[0]
+            expected = [reference(opcode, a, b) for a, b in pairs]
+            for name, model in models[1:]:
+                actual = [model(opcode, a, b) for a, b in pairs]
+                comparisons += len(pairs)
+                if actual != expected:
+                    index = next(i for i, (x, y) in enumerate(zip(actual, expected)) if x != y)
+                    divergence = (opcode, pairs[index][0], pairs[index][1])
+                    break
+            if divergence:
+                break
+        checked += len(batch)
+        if divergence:
+            stop.set()
+            break
+    return checked, comparisons, divergence
+
+
+def run_cpp_model(binary: Path, vectors: List[Tuple[str, int, int]]) -> List[Tuple[str, int, int]]:
+    """Run the C++ testbench on golden-model expectations; return diverging vectors."""
+    tests = []
+    for index, (opcode, a, b) in enumerate(vectors):
+        result, flags = compute_alu_operation(opcode, a, b)
+        tests.append({"test_name": f"FUZZ_{index}", "opcode": opcode, "A": a, "B": b,
+                      "expected_result": result, "expected_flags": flags})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "fuzz.json"
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump({"tests": tests}, handle, indent=2)
+        output = subprocess.run([str(binary), str(path)], capture_output=True,
+                                text=True, check=False).stdout
+
+    failing = []
+    for line in output.splitlines():
+        match = CPP_FAILURE.search(line)
+        if match:
+            failing.append(vectors[int(match.group(1))])
+    return failing
+
+
+@dataclass
+class FuzzReport:
+    vectors: int = 0
+    comparisons: int = 0
+    elapsed: float = 0.0
+    divergences: List[Tuple[str, int, int]] = field(default_factory=list)
+    failures: List[str] = field(default_factory=list)   # workers that crashed or died
+
+
+def fuzz(seconds: float, jobs: int, seed: int, batch_size: int) -> FuzzReport:
+    """Run the Python models against each other across `jobs` processes."""
+    ctx = mp.get_context()
+    stop = ctx.Event()
+    results = ctx.Queue()
+    start = time.time()
+    deadline = start + seconds
+
+    workers = [ctx.Process(target=_worker, args=(i, seed, deadline, batch_size, stop, results))
+               for i in range(jobs)]
+    for worker in workers:
+        worker.start()
+
+    report = FuzzReport()
+    pending = set(range(jobs))
+    silent_exits = set()   # dead workers given one more poll for a result already in flight
+    while pending:
+        try:
+            worker_id, checked, comparisons, divergence, error = results.get(timeout=0.5)
+        except queue.Empty:
+            for worker_id in sorted(pending):
+                worker = workers[worker_id]
+                if worker.is_alive():
+                    if time.time() < deadline + WORKER_GRACE_S:
+                        continue
+                    worker.terminate()
+                    worker.join()
+                    problem = f"did not report within {WORKER_GRACE_S:.0f}s of the deadline"
+                elif worker_id not in silent_exits:
+                    silent_exits.add(worker_id)
+                    continue
+                else:
+                    problem = f"exited with code {worker.exitcode} without reporting"
+                report.failures.append(f"worker {worker_id} {problem}")
+                stop.set()
+                pending.discard(worker_id)
+            continue
+        pending.discard(worker_id)
+        report.vectors += checked
+        report.comparisons += comparisons
+        if divergence:
+            report.divergences.append(divergence)
+        if error:
+            report.failures.append(f"worker {worker_id} raised {error}")
+    for worker in workers:
+        worker.join()
+
+    report.elapsed = time.time() - start
+    return report
+
+
+def describe_divergence(opcode: str, a: int, b: int) -> str:
+    models = supported_models(load_models())[opcode]
+    small_a, small_b = minimize(lambda x, y: bool(disagreeing(models, opcode, x, y)), a, b)
+    name = next(n for n, code, _ in OPERATIONS if code == opcode)
+    lines = [f"DIVERGENCE: {name} ({opcode}) A=0x{a:02X} B=0x{b:02X}",
+             f"Minimized repro: {name} A=0x{small_a:02X} B=0x{small_b:02X}"]
+    for model_name, outcome in disagreeing(models, opcode, small_a, small_b).items():
+        result, carry, zero, overflow, negative = outcome
+        lines.append(f"  {model_name:<20} result=0x{result:02X} "
+                     f"C={carry:d} Z={zero:d} V={overflow:d} N={negative:d}")
+    return "\n".join(lines)
+
+
+def describe_cpp_divergence(binary: Path, opcode: str, a: int, b: int) -> str:
+    small_a, small_b = minimize(
+        lambda x, y: bool(run_cpp_model(binary, [(opcode, x, y)])), a, b)
+    name = next(n for n, code, _ in OPERATIONS if code == opcode)
+    return (f"DIVERGENCE: cpp vs golden at {name} ({opcode}) A=0x{a:02X} B=0x{b:02X}\n"
+            f"Minimized repro: {name} A=0x{small_a:02X} B=0x{small_b:02X} "
+            f"(rerun: {binary} on a vector file containing it)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Differential fuzzing of all in-repo ALU models.")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Time budget (default: 60).")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count).")
+    parser.add_argument("--seed", type=int, default=None, help="Base RNG seed (default: random).")
+    parser.add_argument("--batch", type=int, default=4096, help="Vectors per batch (default: 4096).")
+    parser.add_argument("--cpp", type=Path, default=None,
+                        help="Also compare the C++ testbench model (path to built alu_tb).")
+    parser.add_argument("--cpp-vectors", type=int, default=50000,
+                        help="Vectors fed to the C++ model (default: 50,000).")
+    args = parser.parse_args()
+
+    seed = args.seed if args.seed is not None else random.randrange(1 << 32)
+    print(f"Fuzzing {len(load_models())} Python models for {args.seconds:.0f}s "
+          f"on {args.jobs} process(es), seed {seed}")
+
+    report = fuzz(args.seconds, args.jobs, seed, args.batch)
+    rate = report.comparisons / report.elapsed if report.elapsed else 0
+    print(f"Vectors:      {report.vectors:,}")
+    print(f"Comparisons:  {report.comparisons:,} ({rate:,.0f}/s)")
+
+    for failure in report.failures:
+        print(f"Worker failed: {failure}")
+    if report.failures:
+        return 1
+
+    divergences = list(report.divergences)
+    if args.cpp is not None:
+        if not args.cpp.exists():
+            print(f"C++ testbench not found: {args.cpp} (build with: make -C test/cpp)")
+            return 1
+        cpp_vectors = make_batch(random.Random(seed), args.cpp_vectors)
+        cpp_failures = run_cpp_model(args.cpp, cpp_vectors)
+        print(f"C++ model:    {len(cpp_vectors):,} vectors, {len(cpp_failures)} divergence(s)")
+        if cpp_failures:
+            print(describe_cpp_divergence(args.cpp, *cpp_failures[0]))
+            return 1
+
+    if divergences:
+        print(describe_divergence(*divergences[0]))
+        return 1
+
+    print("No divergence found.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -98,6 +98,39 @@ def run_smoke_test():
             
     print(f"Smoke Test: {passed}/{len(tests)} Passed\n")
 
+def run_vector_file(path, max_failures=20):
+    """
+    Run an ALUV binary vector file (see test/vector_io.py) copied to the
+    Pico's flash, e.g. one produced by tools/synthesize_vectors.py --bin.
+    Only the result byte is checked; flags are not wired to the Pico.
+    """
+    print(f"=== Running {path} ===")
+    with open(path, "rb") as f:
+        header = f.read(16)
+        if header[0:4] != b"ALUV" or header[5] != 8:
+            print("Not an 8-bit ALUV vector file")
+            return
+        size = header[6] | (header[7] << 8)
+        count = int.from_bytes(header[8:16], "little")
+
+        passed = 0
+        failed = 0
+        for i in range(count):
+            rec = f.read(size)
+            op, a, b, exp = rec[0], rec[2], rec[3], rec[4]
+            success, act = run_test("VEC", op, a, b, exp)
+            if success:
+                passed += 1
+            else:
+                failed += 1
+                if failed <= max_failures:
+                    print(f"FAIL #{i}: op={op:05b} A=0x{a:02X} B=0x{b:02X} "
+                          f"got 0x{act:02X}, exp 0x{exp:02X}")
+            if (i + 1) % 500 == 0:
+                print(f"{i + 1}/{count} vectors, {failed} failures")
+
+    print(f"Vector File: {passed}/{count} Passed\n")
+
 # ------------------------------------------
 # Main Loop
 # ------------------------------------------
@@ -111,6 +144,7 @@ if __name__ == "__main__":
         print("1. Run Smoke Test")
         print("2. Manual Input")
         print("3. Loop Random Inputs (Stress Test)")
+        print("4. Run Vector File")
         
         choice = input("Select option: ")
         
@@ -148,3 +182,10 @@ if __name__ == "__main__":
                         print(f"{count} tests, {errors} errors")
             except KeyboardInterrupt:
                 print("Stopped.")
+
+        elif choice == "4":
+            path = input("Vector file [vectors.bin]: ") or "vectors.bin"
+            try:
+                run_vector_file(path)
+            except OSError:
+                print(f"Cannot open {path}")
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Hierarchical BOM and transistor counts from the KiCad schematics.
+
+Walks each board in schematics/kicad/boards down through its sheets into
+the reusable modules (gates, mux, adder). Every sheet's totals are
+computed once and multiplied by the number of times it is instantiated,
+so a gate sheet used forty times is still only summed once. Schematics
+come from the cached index in tools/kicad_index.py.
+
+Counting rules follow meta/TRANSISTOR_COUNT_REPORT.md:
+
+    discrete    every NMOS/PMOS symbol
+    IC          14T per XOR gate (74HC86, 74AHC1G86), 16T per 2:1 mux
+                channel (74HC157); a multi-unit package counts the gate
+                units placed, a single-unit package all of its gates
+    also listed resistors, LEDs, capacitors, connectors
+
+The gate-level modules each board instantiates are compared with the
+Logisim gate counts of sim/top/alu_top.circ (tools/circuit_analysis.py),
+as 1-bit gates, 2:1 mux channels and adder bits.
+
+Usage:
+    python3 tools/kicad_bom.py                 # per-board and per-module totals + diff
+    python3 tools/kicad_bom.py --bom add_sub   # expanded BOM for one board
+    python3 tools/kicad_bom.py --json totals.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from circuit_analysis import DEFAULT_CIRCUIT_FILE, CircuitCache, Design, transistor_counts
+from kicad_index import KicadIndex
+
+BOARDS_DIR = Path("schematics") / "kicad" / "boards"
+MODULES_DIR = Path("schematics") / "kicad" / "modules"
+
+# IC value -> (function, gates per package, transistors per gate)
+IC_FUNCTIONS: Dict[str, Tuple[str, int, int]] = {
+    "74HC86": ("XOR", 4, 14),
+    "74LS86": ("XOR", 4, 14),
+    "74AHC1G86": ("XOR", 1, 14),
+    "74HC157": ("MUX2", 4, 16),
+    "74LS157": ("MUX2", 4, 16),
+}
+
+# Module sheet -> (Logisim-equivalent gate, count) in 1-bit gates, 2:1 mux channels or adder bits
+GATE_MODULES: Dict[str, Tuple[str, int]] = {
+    "gate_inv_1bit": ("NOT", 1),
+    "gate_inv_8bit": ("NOT", 8),
+    "gate_nand_2in": ("NAND 2-in", 1),
+    "gate_nand_2in_8bit": ("NAND 2-in", 8),
+    "gate_nor_2in": ("NOR 2-in", 1),
+    "gate_nor_2in_8bit": ("NOR 2-in", 8),
+    "gate_nor_8in_1bit": ("NOR 8-in", 1),
+    "gate_and_2in": ("AND 2-in", 1),
+    "gate_and_2in_8bit": ("AND 2-in", 8),
+    "gate_and_3in": ("AND 3-in", 1),
+    "gate_and_4in": ("AND 4-in", 1),
+    "gate_or_2in": ("OR 2-in", 1),
+    "gate_or_2in_8bit": ("OR 2-in", 8),
+    "gate_or_3in": ("OR 3-in", 1),
+    "gate_xor_2in": ("XOR 2-in", 1),
+    "gate_xor_2in_1bit_ic_2": ("XOR 2-in", 1),
+    "gate_xor_8bit": ("XOR 2-in", 8),
+    "gate_xnor_2in": ("XNOR 2-in", 1),
+    "mux_2to1_8bit": ("MUX 2:1 channel", 8),
+    "mux_4to1_8bit": ("MUX 2:1 channel", 24),
+    "mux_8to1_8bit": ("MUX 2:1 channel", 56),
+    "adder2": ("Adder bit", 2),
+    "adder8": ("Adder bit", 8),
+}
+
+COLUMNS = ("discrete", "ic_transistors", "ic_packages", "resistors", "leds", "capacitors", "connectors")
+
+
+def part_category(lib_id: str) -> str:
+    library, _, name = lib_id.partition(":")
+    if library == "Connector":
+        return "connectors"
+    if name in ("NMOS", "PMOS") or name.startswith(("Q_NMOS", "Q_PMOS")):
+        return "discrete"
+    if name == "R" or name.startswith("R_"):
+        return "resistors"
+    if name.startswith("LED"):
+        return "leds"
+    if name == "C" or name.startswith("C_"):
+        return "capacitors"
+    if library.startswith("74"):
+        return "ic_packages"
+    return "other"
+
+
+class HierarchicalBom:
+    """Per-sheet parts and gate-module counts, expanded through the sheet tree."""
+
+    def __init__(self, index: KicadIndex):
+        self.index = index
+        self._totals: Dict[str, Counter] = {}
+        self._parts: Dict[str, Counter] = {}
+        self._gates: Dict[str, Counter] = {}
+
+    def _own(self, key: str) -> Tuple[Counter, Counter]:
+        """(totals, BOM lines) of the symbols placed directly on one sheet."""
+        entry = self.index.files[key]
+        totals: Counter = Counter()
+        parts: Counter = Counter()
+        packages = set()
+        for symbol in entry["symbols"]:
+            if not symbol["in_bom"] or self.index.is_power(entry, symbol):
+                continue
+            reference = symbol["reference"]
+            category = part_category(symbol["lib_id"])
+            units = {pin[0] for pin in entry["lib_symbols"].get(symbol["lib_id"], {}).get("pins", [])}
+            function = IC_FUNCTIONS.get(symbol["value"]) or IC_FUNCTIONS.get(symbol["lib_id"].partition(":")[2])
+            if function is not None:
+                kind, gates, per_gate = function
+                if len(units) <= 1:
+                    used = gates  # single-unit symbol: the whole package
+                elif symbol["unit"] <= gates:
+                    used = 1  # one gate unit of a multi-unit package
+                else:
+                    used = 0  # the package's power unit (e.g. unit 5 of a 74HC86)
+                totals["ic_transistors"] += used * per_gate
+                totals[kind] += used
+            # a multi-unit package appears once per unit; unannotated parts are all distinct
+            package = (symbol["lib_id"], reference) if not reference.endswith("?") else symbol["uuid"]
+            if package in packages:
+                continue
+            packages.add(package)
+            totals[category] += 1
+            parts[(symbol["value"], symbol["lib_id"], symbol["footprint"])] += 1
+        return totals, parts
+
+    def totals(self, key: str, active: Tuple[str, ...] = ()) -> Counter:
+        """Category totals of a sheet with every sub-sheet expanded (memoized)."""
+        if key in self._totals:
+            return self._totals[key]
+        if key in active:
+            raise ValueError(f"Recursive sheet: {key}")
+        totals, parts = self._own(key)
+        gates: Counter = Counter()
+        for sheet in self.index.files[key]["sheets"]:
+            target = sheet["target"]
+            if target not in self.index.files:
+                raise ValueError(f"{key}: sheet '{sheet['name']}' refers to missing {sheet['file']}")
+            totals.update(self.totals(target, active + (key,)))
+            parts.update(self._parts[target])
+            gates.update(self._gates[target])
+        module = GATE_MODULES.get(Path(key).stem)
+        self._totals[key] = totals
+        self._parts[key] = parts
+        # a gate module counts as one gate of its kind, not as the gates it is built from
+        self._gates[key] = Counter({module[0]: module[1]}) if module else gates
+        return totals
+
+    def parts(self, key: str) -> Counter:
+        self.totals(key)
+        return self._parts[key]
+
+    def gates(self, key: str) -> Counter:
+        self.totals(key)
+        return self._gates[key]
+
+    def boards(self) -> List[str]:
+        """Board root schematics (board sheets not used as a sub-sheet)."""
+        referenced = {sheet["target"] for _, entry in self.index.schematics() for sheet in entry["sheets"]}
+        return [key for key, _ in self.index.schematics()
+                if Path(key).is_relative_to(BOARDS_DIR) and key not in referenced]
+
+    def modules(self) -> List[str]:
+        return [key for key, _ in self.index.schematics() if Path(key).is_relative_to(MODULES_DIR)]
+
+
+def logisim_gates(leaves: Counter) -> Counter:
+    """Logisim leaf components in the units of GATE_MODULES."""
+    gates: Counter = Counter()
+    for (library, name, attrs), count in leaves.items():
+        attrs = dict(attrs)
+        width = int(attrs.get("width", "1"))
+        if library == "#Gates" and name.endswith(" Gate"):
+            gate = name[:-len(" Gate")]
+            if gate == "Buffer":
+                continue
+            label = gate if gate == "NOT" else f"{gate} {attrs.get('inputs', '2')}-in"
+            gates[label] += width * count
+        elif library == "#Plexers" and name == "Multiplexer":
+            gates["MUX 2:1 channel"] += (2 ** int(attrs.get("select", "1")) - 1) * width * count
+        elif library == "#Arithmetic" and name == "Adder":
+            gates["Adder bit"] += width * count
+    return gates
+
+
+def print_totals(title: str, rows: List[Tuple[str, Counter]]) -> None:
+    print(f"{title:<28} {'Discrete':>9} {'IC eq.':>7} {'Total T':>8} {'ICs':>5} "
+          f"{'R':>5} {'LED':>5} {'C':>4} {'Conn':>5}")
+    for name, totals in rows:
+        print(f"{name:<28} {totals['discrete']:>9,} {totals['ic_transistors']:>7,} "
+              f"{totals['discrete'] + totals['ic_transistors']:>8,} {totals['ic_packages']:>5} "
+              f"{totals['resistors']:>5} {totals['leds']:>5} {totals['capacitors']:>4} "
+              f"{totals['connectors']:>5}")
+    print()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Hierarchical KiCad BOM and transistor counts.")
+    parser.add_argument("--bom", metavar="BOARD", default=None,
+                        help="Print the expanded BOM of one board (schematic stem).")
+    parser.add_argument("--circuit", type=Path, default=DEFAULT_CIRCUIT_FILE,
+                        help="Logisim design to compare against (default: sim/top/alu_top.circ).")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the totals as JSON.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        index = KicadIndex().update()
+        bom = HierarchicalBom(index)
+        boards = {Path(key).stem: key for key in bom.boards()}
+        board_totals = [(name, bom.totals(key)) for name, key in boards.items()]
+        module_totals = [(Path(key).stem, bom.totals(key)) for key in bom.modules()]
+        leaves = Design(args.circuit, CircuitCache()).leaf_counts()
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+
+    if args.bom is not None:
+        if args.bom not in boards:
+            print(f"Error: no board '{args.bom}' (have: {', '.join(boards)})", file=sys.stderr)
+            return 2
+        print(f"{'Qty':>5}  {'Value':<24} {'Symbol':<34} Footprint")
+        for (value, lib_id, footprint), quantity in sorted(bom.parts(boards[args.bom]).items()):
+            print(f"{quantity:>5}  {value:<24} {lib_id:<34} {footprint}")
+        return 0
+
+    print(f"{len(index.files)} KiCad files, {index.parsed} parsed, {elapsed * 1e3:.0f} ms\n")
+    print_totals("Board", board_totals)
+    print_totals("Module (one instance)", module_totals)
+
+    alu: Counter = Counter()
+    kicad_gates: Counter = Counter()
+    for key in boards.values():
+        alu.update(bom.totals(key))
+        kicad_gates.update(bom.gates(key))
+    discrete, ic, _ = transistor_counts(leaves)
+    reference = logisim_gates(leaves)
+
+    print(f"All boards vs {args.circuit.name}:")
+    print(f"  {'':<20} {'Logisim':>8} {'KiCad':>8} {'Diff':>8}")
+    for label, logisim, kicad in (("Discrete transistors", discrete, alu["discrete"]),
+                                  ("IC transistors", ic, alu["ic_transistors"]),
+                                  ("Total transistors", discrete + ic,
+                                   alu["discrete"] + alu["ic_transistors"])):
+        print(f"  {label:<20} {logisim:>8,} {kicad:>8,} {kicad - logisim:>+8,}")
+    print(f"\n  {'Gate (1-bit units)':<20} {'Logisim':>8} {'KiCad':>8} {'Diff':>8}")
+    for gate in sorted(set(reference) | set(kicad_gates)):
+        print(f"  {gate:<20} {reference[gate]:>8,} {kicad_gates[gate]:>8,} "
+              f"{kicad_gates[gate] - reference[gate]:>+8,}")
+
+    if args.json is not None:
+        report = {
+            "boards": {name: {column: totals[column] for column in COLUMNS} for name, totals in board_totals},
+            "modules": {name: {column: totals[column] for column in COLUMNS} for name, totals in module_totals},
+            "alu": {"kicad": {column: alu[column] for column in COLUMNS},
+                    "logisim": {"discrete": discrete, "ic_transistors": ic},
+                    "gates": {gate: {"logisim": reference[gate], "kicad": kicad_gates[gate]}
+                              for gate in sorted(set(reference) | set(kicad_gates))}},
+        }
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nWrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Cached index of the KiCad schematics and PCBs under schematics/kicad.
+
+Every .kicad_sch and .kicad_pcb file (autosaves excluded) is parsed once
+with tools/kicad_sexpr.py and reduced to the records queries need:
+
+    schematic   placed symbols (lib id, reference, value, footprint, unit,
+                position, per-project instance references), library pins,
+                local/global/hierarchical labels, sheets (name, target
+                file, pins), wires, buses, bus entries, junctions, and the
+                net names the sheet declares (labels and power symbols)
+    pcb         footprints with pad nets, the net table, track segments,
+                arcs and vias
+
+The index lives in .cache/kicad_index/index.json. Each entry remembers its
+file's mtime, size and SHA-256: unchanged files are reused (a touched file
+is re-hashed, not re-parsed) and changed ones are parsed in a process pool.
+
+Usage:
+    python3 tools/kicad_index.py                    # update, print a summary
+    python3 tools/kicad_index.py find 'Q7*'         # symbols by reference/value/lib id
+    python3 tools/kicad_index.py net C_OUT          # where a net name appears
+    python3 tools/kicad_index.py count --by value   # symbol counts
+    python3 tools/kicad_index.py sheets             # hierarchy from each root
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from kicad_sexpr import child, children, parse, position, properties, value
+
+KICAD_DIR = ROOT / "schematics" / "kicad"
+DEFAULT_INDEX = ROOT / ".cache" / "kicad_index" / "index.json"
+INDEX_VERSION = 3
+SUFFIXES = (".kicad_sch", ".kicad_pcb")
+LABEL_KINDS = {"label": "local", "global_label": "global", "hierarchical_label": "hierarchical"}
+UNIT_NAME = re.compile(r"_(\d+)_(\d+)$")
+
+
+def kicad_files(directory: Path) -> List[Path]:
+    """Schematic and PCB files, skipping autosaves and backups."""
+    return sorted(path for path in directory.rglob("*")
+                  if path.suffix in SUFFIXES and not path.name.startswith(("_autosave", "~"))
+                  and not any(part.startswith(("#", ".")) for part in path.parent.parts))
+
+
+def _xy(node) -> List[float]:
+    return [float(node[1]), float(node[2])]
+
+
+def _points(node) -> List[float]:
+    pts = child(node, "pts")
+    return [coordinate for xy in children(pts, "xy") for coordinate in _xy(xy)]
+
+
+def _lib_symbol(symbol) -> Dict:
+    """Pins of a library symbol as [unit, style, number, name, type, x, y, angle]."""
+    pins = []
+    for part in children(symbol, "symbol"):
+        match = UNIT_NAME.search(part[1])
+        unit, style = (int(match.group(1)), int(match.group(2))) if match else (0, 1)
+        for pin in children(part, "pin"):
+            x, y, angle = position(pin)
+            pins.append([unit, style, value(pin, "number", ""), value(pin, "name", ""),
+                         pin[1], x, y, angle])
+    props = properties(symbol)
+    return {"pins": pins, "power": child(symbol, "power") is not None,
+            "extends": value(symbol, "extends"), "description": props.get("Description", "")}
+
+
+def index_schematic(tree, path: Path) -> Dict:
+    lib_symbols = {symbol[1]: _lib_symbol(symbol)
+                   for symbol in children(child(tree, "lib_symbols") or [], "symbol")}
+    symbols = []
+    nets = set()
+    for symbol in children(tree, "symbol"):
+        props = properties(symbol)
+        lib_id = value(symbol, "lib_id")
+        instances = [[project[1], instance[1], value(instance, "reference"),
+                      int(value(instance, "unit", "1"))]
+                     for project in children(child(symbol, "instances") or [], "project")
+                     for instance in children(project, "path")]
+        mirror = value(symbol, "mirror")
+        symbols.append({
+            "lib_id": lib_id, "reference": props.get("Reference", ""),
+            "value": props.get("Value", ""), "footprint": props.get("Footprint", ""),
+            "unit": int(value(symbol, "unit", "1")), "at": list(position(symbol)),
+            "mirror": mirror, "in_bom": value(symbol, "in_bom", "yes") == "yes",
+            "uuid": value(symbol, "uuid"), "instances": instances,
+        })
+        if lib_symbols.get(lib_id, {}).get("power"):
+            nets.add(props.get("Value", ""))
+
+    labels = []
+    for kind, scope in LABEL_KINDS.items():
+        for label in children(tree, kind):
+            labels.append({"kind": scope, "name": label[1], "at": list(position(label)),
+                           "shape": value(label, "shape")})
+            nets.add(label[1])
+
+    sheets = []
+    for sheet in children(tree, "sheet"):
+        props = properties(sheet)
+        target = props.get("Sheetfile", "")
+        sheets.append({
+            "name": props.get("Sheetname", ""), "file": target,
+            "target": os.path.relpath(os.path.normpath(path.parent / target), ROOT) if target else "",
+            "uuid": value(sheet, "uuid"), "at": list(position(sheet)),
+            "size": _xy(child(sheet, "size")),
+            "pins": [[pin[1], pin[2]] + list(position(pin)) for pin in children(sheet, "pin")],
+        })
+
+    return {
+        "kind": "sch", "uuid": value(tree, "uuid"), "lib_symbols": lib_symbols,
+        "symbols": symbols, "labels": labels, "sheets": sheets,
+        "wires": [_points(wire) for wire in children(tree, "wire")],
+        "buses": [_points(bus) for bus in children(tree, "bus")],
+        "bus_entries": [list(position(entry)[:2]) + _xy(child(entry, "size"))
+                        for entry in children(tree, "bus_entry")],
+        "junctions": [list(position(junction)[:2]) for junction in children(tree, "junction")],
+        "nets": sorted(net for net in nets if net),
+    }
+
+
+def index_pcb(tree) -> Dict:
+    nets = {net[1]: net[2] for net in children(tree, "net") if len(net) > 2}
+    footprints = []
+    for footprint in children(tree, "footprint"):
+        props = properties(footprint)
+        # [number, net, pin function, x, y, angle, width, height], position footprint-relative
+        pads = []
+        for pad in children(footprint, "pad"):
+            net = child(pad, "net")
+            size = child(pad, "size")
+            pads.append([pad[1], net[2] if net is not None and len(net) > 2 else "",
+                         value(pad, "pinfunction", "")] + list(position(pad))
+                        + (_xy(size) if size is not None else [0.0, 0.0]))
+        footprints.append({
+            "lib_id": footprint[1], "reference": props.get("Reference", ""),
+            "value": props.get("Value", ""), "layer": value(footprint, "layer"),
+            "at": list(position(footprint)), "sheetfile": value(footprint, "sheetfile", ""),
+            "pads": pads,
+        })
+
+    def net_name(node) -> str:
+        number = value(node, "net", "0")
+        return nets.get(number, number)
+
+    return {
+        "kind": "pcb", "nets": sorted(name for name in nets.values() if name),
+        "footprints": footprints,
+        # [x1, y1, x2, y2, width, layer, net]
+        "segments": [_xy(child(seg, "start")) + _xy(child(seg, "end"))
+                     + [float(value(seg, "width", "0")), value(seg, "layer"), net_name(seg)]
+                     for seg in children(tree, "segment")],
+        # [x1, y1, xm, ym, x2, y2, width, layer, net]
+        "arcs": [_xy(child(arc, "start")) + _xy(child(arc, "mid")) + _xy(child(arc, "end"))
+                 + [float(value(arc, "width", "0")), value(arc, "layer"), net_name(arc)]
+                 for arc in children(tree, "arc")],
+        # [x, y, size, drill, net, layers...]
+        "vias": [_xy(child(via, "at")) + [float(value(via, "size", "0")),
+                                          float(value(via, "drill", "0")), net_name(via)]
+                 + (child(via, "layers") or ["layers"])[1:]
+                 for via in children(tree, "via")],
+        "zones": sorted({value(zone, "net_name", "") for zone in children(tree, "zone")} - {""}),
+    }
+
+
+def index_file(path: Path) -> Dict:
+    """Parse one KiCad file into its index record."""
+    data = path.read_bytes()
+    tree = parse(data.decode("utf-8"))
+    record = index_schematic(tree, path) if tree[0] == "kicad_sch" else index_pcb(tree)
+    record["sha256"] = hashlib.sha256(data).hexdigest()
+    return record
+
+
+def _index_job(path: str) -> Tuple[str, Dict]:
+    try:
+        return path, index_file(Path(path))
+    except ValueError as error:  # malformed S-expression or not UTF-8
+        raise ValueError(f"{os.path.relpath(path, ROOT)}: {error}") from None
+
+
+class KicadIndex:
+    """All indexed files, keyed by path relative to the repo root."""
+
+    def __init__(self, directory: Path = KICAD_DIR, index_path: Optional[Path] = DEFAULT_INDEX):
+        self.directory = directory
+        self.index_path = index_path
+        self.files: Dict[str, Dict] = {}
+        self.parsed = 0
+        self.reused = 0
+
+    def update(self, jobs: Optional[int] = None, rebuild: bool = False) -> "KicadIndex":
+        """
+        Bring the index up to date, reparsing only changed files (or all with
+        `rebuild`). Raises ValueError naming the first file that fails to parse.
+        """
+        cached: Dict[str, Dict] = {}
+        if not rebuild and self.index_path is not None and self.index_path.exists():
+            try:
+                stored = json.loads(self.index_path.read_text())
+                if stored.get("version") == INDEX_VERSION:
+                    cached = stored["files"]
+            except ValueError:
+                cached = {}
+
+        stale = []
+        changed = False
+        for path in kicad_files(self.directory):
+            key = os.path.relpath(path, ROOT)
+            stat = path.stat()
+            entry = cached.get(key)
+            if entry is not None and (entry["mtime_ns"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+                if hashlib.sha256(path.read_bytes()).hexdigest() == entry["sha256"]:
+                    entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                    changed = True
+                else:
+                    entry = None
+            if entry is None:
+                stale.append((key, path, stat))
+            else:
+                self.files[key] = entry
+
+        if stale:
+            changed = True
+            if len(stale) == 1 or jobs == 1:
+                results = [_index_job(str(path)) for _, path, _ in stale]
+            else:
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    results = list(pool.map(_index_job, [str(path) for _, path, _ in stale]))
+            for (key, _, stat), (_, record) in zip(stale, results):
+                record.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                self.files[key] = record
+        self.parsed, self.reused = len(stale), len(self.files) - len(stale)
+
+        if self.index_path is not None and (changed or len(cached) != len(self.files)):
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.index_path.with_suffix(".tmp")
+            temporary.write_text(json.dumps({"version": INDEX_VERSION, "files": self.files}))
+            temporary.replace(self.index_path)
+        return self
+
+    # -- queries -------------------------------------------------------------
+
+    def schematics(self) -> Iterator[Tuple[str, Dict]]:
+        return ((key, entry) for key, entry in sorted(self.files.items()) if entry["kind"] == "sch")
+
+    def pcbs(self) -> Iterator[Tuple[str, Dict]]:
+        return ((key, entry) for key, entry in sorted(self.files.items()) if entry["kind"] == "pcb")
+
+    def is_power(self, entry: Dict, symbol: Dict) -> bool:
+        return entry["lib_symbols"].get(symbol["lib_id"], {}).get("power", False)
+
+    def find_symbols(self, pattern: str) -> Iterator[Tuple[str, Dict, List[str]]]:
+        """(file, symbol, matching references) for symbols whose reference (any
+        instance), value or lib id matches the glob `pattern` (case-insensitive)."""
+        pattern = pattern.lower()
+        for key, entry in self.schematics():
+            for symbol in entry["symbols"]:
+                references = sorted({symbol["reference"]} | {ref for _, _, ref, _ in symbol["instances"]})
+                matched = [ref for ref in references if fnmatch.fnmatch(ref.lower(), pattern)]
+                if matched or any(fnmatch.fnmatch(symbol[field].lower(), pattern)
+                                  for field in ("value", "lib_id")):
+                    yield key, symbol, matched or references
+
+    def net_sites(self, name: str) -> Iterator[Tuple[str, str]]:
+        """(file, description) for every label, power symbol and PCB pad on net `name`."""
+        for key, entry in self.schematics():
+            for label in entry["labels"]:
+                if label["name"] == name:
+                    yield key, f"{label['kind']} label at ({label['at'][0]:g}, {label['at'][1]:g})"
+            for sheet in entry["sheets"]:
+                for pin in sheet["pins"]:
+                    if pin[0] == name:
+                        yield key, f"sheet pin of '{sheet['name']}' ({pin[1]})"
+            powered = sum(1 for symbol in entry["symbols"]
+                          if symbol["value"] == name and self.is_power(entry, symbol))
+            if powered:
+                yield key, f"{powered} power symbol(s)"
+        for key, entry in self.pcbs():
+            pads = [f"{footprint['reference']}.{pad[0]}" for footprint in entry["footprints"]
+                    for pad in footprint["pads"] if pad[1] == name]
+            if pads:
+                yield key, f"pads {', '.join(pads)}"
+
+    def symbol_counts(self, by: str = "lib_id", instances: bool = False) -> Counter:
+        """Non-power symbols per `by` field, per placement or per hierarchical instance."""
+        counts: Counter = Counter()
+        for _, entry in self.schematics():
+            for symbol in entry["symbols"]:
+                if not self.is_power(entry, symbol):
+                    counts[symbol[by]] += max(1, len(symbol["instances"])) if instances else 1
+        return counts
+
+    def sheet_tree(self) -> List[Tuple[int, str, str]]:
+        """(depth, sheet name, file) rows from every root schematic down."""
+        referenced = {sheet["target"] for _, entry in self.schematics() for sheet in entry["sheets"]}
+        rows: List[Tuple[int, str, str]] = []
+
+        def walk(key: str, name: str, depth: int, seen: Tuple[str, ...]) -> None:
+            rows.append((depth, name, key))
+            entry = self.files.get(key)
+            if entry is None or key in seen:
+                return
+            for sheet in entry["sheets"]:
+                walk(sheet["target"], sheet["name"], depth + 1, seen + (key,))
+
+        for key, _ in self.schematics():
+            if key not in referenced:
+                walk(key, Path(key).stem, 0, ())
+        return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Index and query the KiCad schematics and PCBs.")
+    parser.add_argument("--dir", type=Path, default=KICAD_DIR, help="KiCad directory to index.")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Parser processes (default: CPUs).")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the cached index.")
+    commands = parser.add_subparsers(dest="command")
+    find = commands.add_parser("find", help="Symbols by reference, value or lib id (glob).")
+    find.add_argument("pattern")
+    net = commands.add_parser("net", help="Labels, sheet pins, power symbols and pads on a net.")
+    net.add_argument("name")
+    count = commands.add_parser("count", help="Symbol counts.")
+    count.add_argument("--by", choices=("lib_id", "value", "footprint"), default="lib_id")
+    count.add_argument("--instances", action="store_true",
+                       help="Count every hierarchical instance, not each placement once.")
+    commands.add_parser("sheets", help="Sheet hierarchy from each root schematic.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        index = KicadIndex(args.dir).update(args.jobs, args.rebuild)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+
+    if args.command == "find":
+        for key, symbol, references in index.find_symbols(args.pattern):
+            print(f"{', '.join(references):<24} {symbol['unit']:>4}  {symbol['value']:<16} "
+                  f"{symbol['lib_id']:<32} {key}")
+    elif args.command == "net":
+        sites = list(index.net_sites(args.name))
+        for key, site in sites:
+            print(f"{key}: {site}")
+        if not sites:
+            print(f"No net named '{args.name}'")
+            return 1
+    elif args.command == "count":
+        counts = index.symbol_counts(args.by, args.instances)
+        for name, total in counts.most_common():
+            print(f"{total:>7,}  {name or '(none)'}")
+        print(f"{sum(counts.values()):>7,}  total")
+    elif args.command == "sheets":
+        for depth, name, key in index.sheet_tree():
+            print(f"{'  ' * depth}{name:<{36 - 2 * depth}} {key}")
+    else:
+        schematics = list(index.schematics())
+        pcbs = list(index.pcbs())
+        print(f"Indexed {len(index.files)} files ({index.parsed} parsed, {index.reused} reused) "
+              f"in {elapsed * 1e3:.0f} ms")
+        print(f"  schematics: {len(schematics)}, "
+              f"{sum(len(e['symbols']) for _, e in schematics):,} symbols, "
+              f"{sum(len(e['sheets']) for _, e in schematics):,} sheets, "
+              f"{len({n for _, e in schematics for n in e['nets']}):,} net names")
+        print(f"  pcbs:       {len(pcbs)}, "
+              f"{sum(len(e['footprints']) for _, e in pcbs):,} footprints, "
+              f"{sum(len(e['segments']) for _, e in pcbs):,} segments, "
+              f"{sum(len(e['vias']) for _, e in pcbs):,} vias")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Cross-board connectivity graph of the KiCad schematics, with net queries.
+
+Each schematic sheet is reduced once to its local nets: wires are joined
+at shared end points and where an end point lands on another wire, and
+symbol pins, labels and sheet pins attach where they touch. The board
+hierarchies are then flattened per sheet instance. Sheet pins join the
+child's hierarchical labels. Global labels, power symbols and labels on
+a board's root sheet join by name across every board: the connector pins
+are not wired in the schematics, so the name is what carries a signal from
+one board to the next.
+
+The flattened graph (nets, component instances, pins, adjacency lists and
+a name index) is cached in .cache/kicad_nets/graph.json. It is rebuilt
+only when a schematic changes, so bench queries are dictionary lookups
+and a short breadth-first search.
+
+    drivers NET      output pins (and MOSFET drains) on the net
+    fanout NET       input pins (and MOSFET gates) the net feeds
+    show NET         every pin, name and board on the net
+    path FROM TO     shortest signal path, input pin -> output pin hops
+    nets [GLOB]      list net names
+
+Net names match case-insensitively with or without the sheet path, and
+A[3] is read as A3.
+
+Usage:
+    python3 tools/kicad_nets.py drivers C_OUT
+    python3 tools/kicad_nets.py fanout A[3]
+    python3 tools/kicad_nets.py path A[3] LESS_FL
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import math
+import re
+import sys
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from kicad_bom import HierarchicalBom
+from kicad_index import KicadIndex
+
+DEFAULT_GRAPH = ROOT / ".cache" / "kicad_nets" / "graph.json"
+GRAPH_VERSION = 2
+
+DRIVER_TYPES = {"output", "tri_state", "bidirectional", "power_out", "open_collector", "open_emitter"}
+TRANSISTORS = {"Simulation_SPICE:NMOS", "Simulation_SPICE:PMOS"}
+
+# Preference when naming a net: lower is better
+NAME_RANK = {"global": 0, "power": 0, "board": 1, "hierarchical": 2, "local": 3}
+
+
+def grid(x: float, y: float) -> Tuple[int, int]:
+    """Schematic coordinates on a 0.01 mm grid, so equal points hash equal."""
+    return round(x * 100), round(y * 100)
+
+
+def pin_position(symbol: Dict, x: float, y: float) -> Tuple[int, int]:
+    """Library pin (y up) to sheet coordinates: mirror, then rotate, then place."""
+    y = -y
+    if symbol["mirror"] == "x":
+        y = -y
+    elif symbol["mirror"] == "y":
+        x = -x
+    angle = math.radians(symbol["at"][2])
+    cos_a, sin_a = round(math.cos(angle)), round(math.sin(angle))
+    return grid(symbol["at"][0] + x * cos_a + y * sin_a, symbol["at"][1] - x * sin_a + y * cos_a)
+
+
+def is_bus_name(name: str) -> bool:
+    return "[" in name and ".." in name
+
+
+class UnionFind:
+    def __init__(self, size: int = 0):
+        self.parent = list(range(size))
+
+    def add(self) -> int:
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def find(self, node: int) -> int:
+        while self.parent[node] != node:
+            self.parent[node] = self.parent[self.parent[node]]
+            node = self.parent[node]
+        return node
+
+    def union(self, a: int, b: int) -> None:
+        self.parent[self.find(a)] = self.find(b)
+
+
+def sheet_nets(entry: Dict) -> List[Dict]:
+    """
+    Local nets of one sheet: {"labels": [(kind, name)], "pins": [(symbol, number)],
+    "sheet_pins": [(sheet, name)]}, with nets sharing a local label merged.
+    """
+    joined = UnionFind()
+    at_point: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    horizontal: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+    vertical: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+    diagonal: List[Tuple[Tuple[int, int], Tuple[int, int], int]] = []
+
+    for points in entry["wires"]:
+        for i in range(0, len(points) - 2, 2):
+            start, end = grid(points[i], points[i + 1]), grid(points[i + 2], points[i + 3])
+            node = joined.add()
+            at_point[start].append(node)
+            at_point[end].append(node)
+            if start[1] == end[1]:
+                horizontal[start[1]].append((min(start[0], end[0]), max(start[0], end[0]), node))
+            elif start[0] == end[0]:
+                vertical[start[0]].append((min(start[1], end[1]), max(start[1], end[1]), node))
+            else:
+                diagonal.append((start, end, node))
+
+    items: List[Tuple[str, object]] = []
+
+    def attach(point: Tuple[int, int], item: Tuple[str, object]) -> None:
+        node = joined.add()
+        items.append(item)
+        at_point[point].append(node)
+
+    wires = len(joined.parent)
+    for index, symbol in enumerate(entry["symbols"]):
+        library = entry["lib_symbols"].get(symbol["lib_id"], {})
+        for unit, style, number, _, _, x, y, _ in library.get("pins", []):
+            if unit in (0, symbol["unit"]) and style in (0, 1):
+                if library.get("power"):
+                    attach(pin_position(symbol, x, y), ("label", ("power", symbol["value"])))
+                else:
+                    attach(pin_position(symbol, x, y), ("pin", (index, number)))
+    for label in entry["labels"]:
+        if not is_bus_name(label["name"]):
+            attach(grid(*label["at"][:2]), ("label", (label["kind"], label["name"])))
+    for index, sheet in enumerate(entry["sheets"]):
+        for name, _, x, y, _ in sheet["pins"]:
+            attach(grid(x, y), ("sheet_pin", (index, name)))
+
+    # Everything at one point is connected; an end point on a wire's span joins that wire
+    for (x, y), nodes in at_point.items():
+        for node in nodes[1:]:
+            joined.union(nodes[0], node)
+        touching = [wire for low, high, wire in horizontal.get(y, ()) if low < x < high]
+        touching += [wire for low, high, wire in vertical.get(x, ()) if low < y < high]
+        touching += [wire for (x1, y1), (x2, y2), wire in diagonal
+                     if (x2 - x1) * (y - y1) == (y2 - y1) * (x - x1)
+                     and min(x1, x2) < x < max(x1, x2)]
+        for wire in touching:
+            joined.union(nodes[0], wire)
+
+    by_local_name: Dict[str, int] = {}
+    for offset, (kind, value) in enumerate(items):
+        if kind == "label" and value[0] == "local":
+            node = wires + offset
+            if value[1] in by_local_name:
+                joined.union(node, by_local_name[value[1]])
+            else:
+                by_local_name[value[1]] = node
+
+    nets: Dict[int, Dict] = {}
+    for offset, (kind, value) in enumerate(items):
+        net = nets.setdefault(joined.find(wires + offset), {"labels": [], "pins": [], "sheet_pins": []})
+        net[{"label": "labels", "pin": "pins", "sheet_pin": "sheet_pins"}[kind]].append(list(value))
+    return list(nets.values())
+
+
+def graph_signature(index: KicadIndex) -> str:
+    digest = hashlib.sha256(str(GRAPH_VERSION).encode())
+    for key, entry in index.schematics():
+        digest.update(f"{key}:{entry['sha256']}\n".encode())
+    return digest.hexdigest()
+
+
+def build_graph(index: KicadIndex) -> Dict:
+    """Flatten every board hierarchy into one net/component/pin graph."""
+    local = {key: sheet_nets(entry) for key, entry in index.schematics()}
+    joined = UnionFind()
+    named: Dict[str, int] = {}
+    net_labels: List[Tuple[str, str, str, str]] = []  # (node, rank kind, name, board)
+    components: List[List] = []
+    pins: List[List] = []  # [node, component, number, pin name, type]
+
+    def instance(key: str, board: str, path: str, uuid_path: str) -> Dict[Tuple[str, ...], int]:
+        """Nodes for one sheet instance; returns hierarchical label -> node."""
+        entry = index.files[key]
+        hierarchical: Dict[str, int] = {}
+        sheet_pin_nodes: List[Tuple[int, str, int]] = []
+        for net in local[key]:
+            node = joined.add()
+            for kind, name in net["labels"]:
+                if kind in ("global", "power") or (kind == "local" and path == "/"):
+                    scope = f"name:{name}"
+                    if scope in named:
+                        joined.union(node, named[scope])
+                    else:
+                        named[scope] = node
+                    net_labels.append((node, "board" if kind == "local" else kind, name, board))
+                else:
+                    if kind == "hierarchical":
+                        hierarchical[name] = node
+                    net_labels.append((node, kind, path + name, board))
+            for symbol_index, number in net["pins"]:
+                pins.append([node, (key, symbol_index, uuid_path, path), number])
+            for sheet_index, name in net["sheet_pins"]:
+                sheet_pin_nodes.append((sheet_index, name, node))
+
+        children = {}
+        for sheet_index, sheet in enumerate(entry["sheets"]):
+            if sheet["target"] in index.files:
+                children[sheet_index] = instance(sheet["target"], board, f"{path}{sheet['name']}/",
+                                                 f"{uuid_path}/{sheet['uuid']}")
+        for sheet_index, name, node in sheet_pin_nodes:
+            if name in children.get(sheet_index, {}):
+                joined.union(node, children[sheet_index][name])
+        return hierarchical
+
+    component_ids: Dict[Tuple[str, int, str], int] = {}
+    for key in HierarchicalBom(index).boards():
+        board = Path(key).stem
+        start = len(pins)
+        instance(key, board, "/", "/" + index.files[key]["uuid"])
+        for pin in pins[start:]:
+            sheet_key, symbol_index, uuid_path, path = pin[1]
+            entry = index.files[sheet_key]
+            symbol = entry["symbols"][symbol_index]
+            if (sheet_key, symbol_index, uuid_path) not in component_ids:
+                # Annotated per instance where the board was annotated, else sheet path + reference
+                reference = next((ref for _, instance_path, ref, _ in symbol["instances"]
+                                  if instance_path == uuid_path), path.lstrip("/") + symbol["reference"])
+                component_ids[(sheet_key, symbol_index, uuid_path)] = len(components)
+                components.append([reference, symbol["value"], symbol["lib_id"], board])
+            library = entry["lib_symbols"].get(symbol["lib_id"], {})
+            name, etype = next(((p[3], p[4]) for p in library.get("pins", [])
+                                if p[2] == pin[2] and p[0] in (0, symbol["unit"])), ("", "passive"))
+            pin[1:] = [component_ids[(sheet_key, symbol_index, uuid_path)], pin[2], name, etype]
+
+    # Compact the union-find roots into net ids and pick each net's name
+    roots: Dict[int, int] = {}
+    for node in range(len(joined.parent)):
+        roots.setdefault(joined.find(node), len(roots))
+    names: List[List[str]] = [[] for _ in roots]
+    best: List[Tuple[int, int, str]] = [(9, 0, "")] * len(roots)
+    boards: List[Set[str]] = [set() for _ in roots]
+    power: Set[int] = set()
+    for node, kind, name, board in net_labels:
+        net = roots[joined.find(node)]
+        if name not in names[net]:
+            names[net].append(name)
+        boards[net].add(board)
+        if kind == "power":
+            power.add(net)
+        best[net] = min(best[net], (NAME_RANK[kind], name.count("/"), name))
+    pin_rows = []
+    for node, component, number, name, etype in pins:
+        net = roots[joined.find(node)]
+        boards[net].add(components[component][3])
+        pin_rows.append([net, component, number, name, etype])
+    nets = []
+    for net in range(len(roots)):
+        if best[net][2]:
+            label = best[net][2]
+        else:
+            first = next((row for row in pin_rows if row[0] == net), None)
+            label = f"Net-({components[first[1]][0]}-{first[3] or first[2]})" if first else f"Net-{net}"
+        nets.append({"name": label, "aliases": names[net], "boards": sorted(boards[net]),
+                     "power": net in power})
+    used = sorted({row[0] for row in pin_rows} | {net for net, n in enumerate(names) if n})
+    renumber = {net: new for new, net in enumerate(used)}
+    return {
+        "version": GRAPH_VERSION, "signature": graph_signature(index),
+        "nets": [nets[net] for net in used], "components": components,
+        "pins": [[renumber[row[0]]] + row[1:] for row in pin_rows],
+    }
+
+
+def normalize(name: str) -> str:
+    return re.sub(r"\[(\d+)\]$", r"\1", name.strip()).lower()
+
+
+class NetGraph:
+    """The flattened graph with adjacency lists and a name index."""
+
+    def __init__(self, data: Dict):
+        self.nets = data["nets"]
+        self.components = data["components"]
+        self.pins = data["pins"]
+        self.net_pins: List[List[int]] = [[] for _ in self.nets]
+        self.component_pins: List[List[int]] = [[] for _ in self.components]
+        for pin_id, (net, component, _, _, _) in enumerate(self.pins):
+            self.net_pins[net].append(pin_id)
+            self.component_pins[component].append(pin_id)
+        self.by_name: Dict[str, Set[int]] = defaultdict(set)
+        self.by_leaf: Dict[str, Set[int]] = defaultdict(set)
+        for net_id, net in enumerate(self.nets):
+            for name in [net["name"]] + net["aliases"]:
+                self.by_name[normalize(name)].add(net_id)
+                self.by_leaf[normalize(name.rsplit("/", 1)[-1])].add(net_id)
+
+    @classmethod
+    def load(cls, index: KicadIndex, path: Optional[Path] = DEFAULT_GRAPH) -> "NetGraph":
+        """The cached graph, rebuilt if any schematic changed."""
+        signature = graph_signature(index)
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text())
+                if data.get("signature") == signature:
+                    return cls(data)
+            except ValueError:
+                pass
+        data = build_graph(index)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix(".tmp")
+            temporary.write_text(json.dumps(data, separators=(",", ":")))
+            temporary.replace(path)
+        return cls(data)
+
+    def find(self, name: str) -> List[int]:
+        """Nets named `name`, else nets with a sheet-local label `name` (A[3] == A3)."""
+        key = normalize(name)
+        return sorted(self.by_name.get(key) or self.by_leaf.get(key, ()))
+
+    def is_driver(self, pin_id: int) -> bool:
+        _, component, _, name, etype = self.pins[pin_id]
+        return etype in DRIVER_TYPES or (self.components[component][2] in TRANSISTORS and name == "D")
+
+    def is_load(self, pin_id: int) -> bool:
+        _, component, _, name, etype = self.pins[pin_id]
+        return etype == "input" or (self.components[component][2] in TRANSISTORS and name == "G")
+
+    def drivers(self, net: int) -> List[int]:
+        return [pin for pin in self.net_pins[net] if self.is_driver(pin)]
+
+    def fanout(self, net: int) -> List[int]:
+        return [pin for pin in self.net_pins[net] if self.is_load(pin)]
+
+    def stages(self, net: int) -> Iterator[Tuple[int, int]]:
+        """(pin on `net`, pin on a following net): input to output through a
+        component, or across a transistor channel (source <-> drain) so series
+        stacks are followed; power nets are never crossed."""
+        if self.nets[net]["power"]:
+            return
+        for pin in self.net_pins[net]:
+            component = self.pins[pin][1]
+            channel = self.components[component][2] in TRANSISTORS and self.pins[pin][3] in ("S", "D")
+            if not (channel or self.is_load(pin)):
+                continue
+            for out in self.component_pins[component]:
+                if out == pin:
+                    continue
+                if channel and self.pins[out][3] in ("S", "D") or not channel and self.is_driver(out):
+                    yield pin, out
+
+    def path(self, sources: List[int], targets: List[int]) -> Optional[List[Tuple[int, int, int]]]:
+        """Shortest [(net, input pin, output pin)] hops from any source to any target net."""
+        goal = set(targets)
+        previous: Dict[int, Optional[Tuple[int, int, int]]] = {net: None for net in sources}
+        queue = deque(sources)
+        while queue:
+            net = queue.popleft()
+            if net in goal:
+                hops = []
+                while previous[net] is not None:
+                    hop = previous[net]
+                    hops.append(hop)
+                    net = hop[0]
+                return hops[::-1]
+            for load, out in self.stages(net):
+                following = self.pins[out][0]
+                if following not in previous:
+                    previous[following] = (net, load, out)
+                    queue.append(following)
+        return None
+
+    def describe_pin(self, pin_id: int) -> str:
+        _, component, number, name, etype = self.pins[pin_id]
+        reference, value, _, board = self.components[component]
+        return f"{board}:{reference}.{number}" + (f" ({name}, {value})" if name and name != "~" else f" ({value})")
+
+    def describe_net(self, net: int) -> str:
+        return f"{self.nets[net]['name']} [{', '.join(self.nets[net]['boards'])}]"
+
+
+def report_pins(graph: NetGraph, nets: List[int], select, title: str) -> Iterator[str]:
+    for net in nets:
+        selected = select(net)
+        yield f"{graph.describe_net(net)}: {len(selected)} {title}"
+        for pin in selected:
+            yield f"  {graph.describe_pin(pin)}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Query the cross-board KiCad connectivity graph.")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the graph even if cached.")
+    commands = parser.add_subparsers(dest="command")
+    for command, text in (("drivers", "Pins driving a net."), ("fanout", "Inputs a net feeds."),
+                          ("show", "Every pin on a net.")):
+        commands.add_parser(command, help=text).add_argument("net")
+    path = commands.add_parser("path", help="Shortest signal path between two nets.")
+    path.add_argument("source")
+    path.add_argument("target")
+    listing = commands.add_parser("nets", help="List net names.")
+    listing.add_argument("pattern", nargs="?", default="*")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = KicadIndex().update()
+    if args.rebuild and DEFAULT_GRAPH.exists():
+        DEFAULT_GRAPH.unlink()
+    graph = NetGraph.load(index)
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lines: List[str] = []
+    if args.command in ("drivers", "fanout", "show"):
+        nets = graph.find(args.net)
+        if not nets:
+            print(f"No net named '{args.net}'")
+            return 1
+        select = {"drivers": graph.drivers, "fanout": graph.fanout,
+                  "show": lambda net: graph.net_pins[net]}[args.command]
+        lines.extend(report_pins(graph, nets, select, "pins" if args.command == "show" else args.command))
+        if args.command == "show":
+            lines.extend(f"{graph.nets[net]['name']} aliases: {', '.join(graph.nets[net]['aliases'])}"
+                         for net in nets if graph.nets[net]["aliases"])
+    elif args.command == "path":
+        sources, targets = graph.find(args.source), graph.find(args.target)
+        for name, found in ((args.source, sources), (args.target, targets)):
+            if not found:
+                print(f"No net named '{name}'")
+                return 1
+        hops = graph.path(sources, targets)
+        if hops is None:
+            lines.append(f"No signal path from {args.source} to {args.target}")
+        else:
+            for net, load, out in hops:
+                lines.append(graph.describe_net(net))
+                lines.append(f"  -> {graph.describe_pin(load)} -> {graph.describe_pin(out)}")
+            last = graph.pins[hops[-1][2]][0] if hops else min(set(sources) & set(targets))
+            lines.append(graph.describe_net(last))
+            lines.append(f"{len(hops)} stage(s)")
+    elif args.command == "nets":
+        lines.extend(sorted(graph.describe_net(net) for net in range(len(graph.nets))
+                            if fnmatch.fnmatch(graph.nets[net]["name"].lower(), args.pattern.lower())))
+    queried = time.perf_counter() - start
+
+    print("\n".join(lines))
+    if lines:
+        print()
+    print(f"{len(graph.nets):,} nets, {len(graph.components):,} components, {len(graph.pins):,} pins "
+          f"(loaded in {loaded * 1e3:.0f} ms, query {queried * 1e6:.0f} us)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
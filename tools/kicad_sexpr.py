@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Minimal, fast S-expression reader for KiCad files (.kicad_sch, .kicad_pcb).
+
+One regular expression tokenizes the text and an explicit stack builds the
+tree, so there is no recursion limit on deeply nested files. Lists are
+Python lists; atoms stay strings. Quoted strings are unescaped as KiCad's
+lexer does: `\\n`, `\\r` and `\\t` are control characters, any other escaped
+character stands for itself. KiCad's `(name ...)` convention is served by
+the helpers below.
+"""
+
+import re
+from typing import Iterator, List, Optional, Union
+
+Node = Union[str, List["Node"]]
+
+TOKEN = re.compile(r'\(|\)|"((?:[^"\\]|\\.)*)"|[^\s()"]+')
+ESCAPE = re.compile(r"\\(.)")
+ESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+
+
+def _unescape(match: "re.Match[str]") -> str:
+    return ESCAPES.get(match.group(1), match.group(1))
+
+
+def parse(text: str) -> List[Node]:
+    """Parse one top-level S-expression."""
+    stack: List[List[Node]] = [[]]
+    for match in TOKEN.finditer(text):
+        token = match.group()
+        if token == "(":
+            node: List[Node] = []
+            stack[-1].append(node)
+            stack.append(node)
+        elif token == ")":
+            if len(stack) == 1:
+                raise ValueError(f"Unbalanced ')' at offset {match.start()}")
+            stack.pop()
+        elif match.group(1) is not None:
+            quoted = match.group(1)
+            stack[-1].append(ESCAPE.sub(_unescape, quoted) if "\\" in quoted else quoted)
+        else:
+            stack[-1].append(token)
+    if len(stack) != 1 or not stack[0] or not isinstance(stack[0][0], list):
+        raise ValueError("Unbalanced or empty S-expression")
+    return stack[0][0]
+
+
+def children(node: List[Node], name: Optional[str] = None) -> Iterator[List[Node]]:
+    """Child lists of `node`, optionally only those named `name`."""
+    for child in node:
+        if isinstance(child, list) and child and (name is None or child[0] == name):
+            yield child
+
+
+def child(node: List[Node], name: str) -> Optional[List[Node]]:
+    """First child list named `name`, or None."""
+    return next(children(node, name), None)
+
+
+def value(node: List[Node], name: str, default: Optional[str] = None) -> Optional[str]:
+    """First argument of the child named `name`: value(sym, "lib_id")."""
+    found = child(node, name)
+    return found[1] if found is not None and len(found) > 1 else default
+
+
+def properties(node: List[Node]) -> dict:
+    """`(property "Key" "Value" ...)` children as a dict."""
+    return {prop[1]: prop[2] for prop in children(node, "property") if len(prop) > 2}
+
+
+def position(node: List[Node]) -> Optional[tuple]:
+    """(x, y, angle) from the node's `(at x y [angle])`."""
+    at = child(node, "at")
+    if at is None:
+        return None
+    return (float(at[1]), float(at[2]), float(at[3]) if len(at) > 3 else 0.0)
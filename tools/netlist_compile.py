@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Compile a combinational netlist into a straight-line Python function.
+
+Interpreting a netlist gate by gate pays for dict lookups, argument lists and
+dispatch on every gate of every batch. This compiler lowers a netlist to
+single-bit AND/OR/XOR/NOT nodes, folds constants (x & 0, x ^ 1, x ^ x, ...),
+merges identical nodes, drops every net that does not reach an output, and
+emits one Python assignment per remaining net:
+
+    def evaluate(inputs, mask):
+        n2 = inputs["A[0]"]
+        ...
+        n41 = n2 & n17
+        n42 = n41 ^ mask
+        return {"OUT[0]": n42, ...}
+
+Nets are lane words as in tools/alu_netlist.py and tools/yosys_sim.py, so the
+generated function evaluates a whole batch per call. Inputs can be bound to
+constants (`--specialize` binds the opcode), which lets the decoder and every
+unselected datapath fold away.
+
+Two netlists are supported: the gate-level ALU of tools/alu_netlist.py (the
+Logisim alu_top.circ is word-level and has no usable wiring) and the Yosys
+netlist read by tools/yosys_sim.py, whose word-level cells are lowered by
+evaluating the simulator's own cell functions on symbolic nets.
+
+Generated modules are cached under .cache/netlist_compile/, keyed by a hash
+of the source netlist, the bound constants, and the source of this compiler
+and tools/yosys_sim.py (the folding rules and the cell lowering).
+
+Usage:
+    python3 tools/netlist_compile.py                     # gate netlist, exhaustive check
+    python3 tools/netlist_compile.py --source yosys
+    python3 tools/netlist_compile.py --specialize        # one folded function per opcode
+    python3 tools/netlist_compile.py --emit alu_compiled.py
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import sys
+import time
+from dataclasses import dataclass
+from functools import reduce
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from alu_netlist import OPCODE_BITS, build_alu_netlist, expected_words, opcode_patterns
+from exhaustive_vectors import OPERATIONS
+import yosys_sim
+
+COMPILER_VERSION = 1
+CACHE_DIR = ROOT / ".cache" / "netlist_compile"
+
+# RTL signals compiled for --source yosys
+YOSYS_OUTPUTS = ("Result", "CarryOut", "Zero", "Overflow", "Negative")
+
+Evaluate = Callable[[Dict[str, int], int], Dict[str, int]]
+
+
+# ---------------------------------------------------------------------------
+# Folding builder
+# ---------------------------------------------------------------------------
+
+class Builder:
+    """
+    Single-bit logic nodes with constant folding and structural hashing.
+    Node 0 is constant 0 and node 1 constant 1; nodes are created in
+    topological order.
+    """
+
+    def __init__(self):
+        self.nodes: List[Tuple] = [("const", 0), ("const", 1)]
+        self._table: Dict[Tuple, int] = {}
+
+    def _node(self, key: Tuple) -> int:
+        node = self._table.get(key)
+        if node is None:
+            node = self._table[key] = len(self.nodes)
+            self.nodes.append(key)
+        return node
+
+    def input(self, name: str) -> int:
+        return self._node(("input", name))
+
+    def not_(self, a: int) -> int:
+        if a <= 1:
+            return 1 - a
+        if self.nodes[a][0] == "not":
+            return self.nodes[a][1]
+        return self._node(("not", a))
+
+    def _complements(self, a: int, b: int) -> bool:
+        return self.nodes[a] == ("not", b) or self.nodes[b] == ("not", a)
+
+    def and_(self, a: int, b: int) -> int:
+        if a == 0 or b == 0 or self._complements(a, b):
+            return 0
+        if a == 1 or a == b:
+            return b
+        if b == 1:
+            return a
+        return self._node(("and", min(a, b), max(a, b)))
+
+    def or_(self, a: int, b: int) -> int:
+        if a == 1 or b == 1 or self._complements(a, b):
+            return 1
+        if a == 0 or a == b:
+            return b
+        if b == 0:
+            return a
+        return self._node(("or", min(a, b), max(a, b)))
+
+    def xor(self, a: int, b: int) -> int:
+        if a == b:
+            return 0
+        if self._complements(a, b):
+            return 1
+        if a <= 1:
+            return b if a == 0 else self.not_(b)
+        if b <= 1:
+            return a if b == 0 else self.not_(a)
+        return self._node(("xor", min(a, b), max(a, b)))
+
+
+class Sym:
+    """A builder node that behaves like a lane word under &, | and ^."""
+
+    __slots__ = ("builder", "node")
+
+    def __init__(self, builder: Builder, node: int):
+        self.builder = builder
+        self.node = node
+
+    def _other(self, other) -> int:
+        if isinstance(other, Sym):
+            return other.node
+        if other == 0:
+            return 0
+        raise TypeError("only constant 0 can be mixed with symbolic nets")
+
+    def __and__(self, other):
+        return Sym(self.builder, self.builder.and_(self.node, self._other(other)))
+
+    def __or__(self, other):
+        return Sym(self.builder, self.builder.or_(self.node, self._other(other)))
+
+    def __xor__(self, other):
+        return Sym(self.builder, self.builder.xor(self.node, self._other(other)))
+
+    __rand__, __ror__, __rxor__ = __and__, __or__, __xor__
+
+
+# ---------------------------------------------------------------------------
+# Front ends
+# ---------------------------------------------------------------------------
+
+def lower_gates(netlist, constants: Dict[str, int]) -> Tuple[Builder, Dict[str, int]]:
+    """tools/alu_netlist.py Netlist -> builder and output nodes."""
+    builder = Builder()
+    nodes = {name: constants[name] if name in constants else builder.input(name)
+             for name in netlist.inputs}
+    for gate in netlist.gates:
+        ins = [nodes[net] for net in gate.inputs]
+        kind = gate.kind
+        if kind in ("CONST0", "CONST1"):
+            node = int(kind == "CONST1")
+        elif kind in ("AND", "NAND"):
+            node = reduce(builder.and_, ins, 1)
+        elif kind in ("OR", "NOR"):
+            node = reduce(builder.or_, ins, 0)
+        elif kind in ("XOR", "XNOR"):
+            node = reduce(builder.xor, ins, 0)
+        elif kind in ("BUF", "NOT"):
+            node = ins[0]
+        else:
+            raise ValueError(f"Unknown gate kind: {kind}")
+        nodes[gate.output] = builder.not_(node) if kind in ("NAND", "NOR", "XNOR", "NOT") else node
+    return builder, {name: nodes[name] for name in netlist.outputs}
+
+
+def bus_names(name: str, width: int) -> List[str]:
+    return [f"{name}[{k}]" for k in range(width)] if width > 1 else [name]
+
+
+def lower_yosys(netlist: yosys_sim.Netlist, outputs: Sequence[str],
+                constants: Dict[str, int]) -> Tuple[Builder, Dict[str, int]]:
+    """yosys_sim Netlist -> builder, by running its cell functions on Sym nets."""
+    builder = Builder()
+    one = Sym(builder, 1)
+    values: List = [Sym(builder, 0)] * netlist.net_count
+    values[1] = one
+    for name, nets in netlist.inputs.items():
+        for bit, net in zip(bus_names(name, len(nets)), nets):
+            values[net] = Sym(builder, constants[bit] if bit in constants else builder.input(bit))
+    for _, cell, ports in netlist.cells:
+        ins = {port: [values[net] for net in nets]
+               for port, nets in ports.items() if port != "\\Y"}
+        words = yosys_sim.CELL_TYPES[cell.kind](cell.params, ins, one)
+        for net, word in zip(ports["\\Y"], words):
+            values[net] = word if isinstance(word, Sym) else Sym(builder, 0)
+    result = {}
+    for name in outputs:
+        nets = netlist.signals[name]
+        for bit, net in zip(bus_names(name, len(nets)), nets):
+            result[bit] = values[net].node
+    return builder, result
+
+
+# ---------------------------------------------------------------------------
+# Code generation and cache
+# ---------------------------------------------------------------------------
+
+OPERATORS = {"and": "&", "or": "|", "xor": "^"}
+
+
+def generate(builder: Builder, outputs: Dict[str, int], label: str, key: str) -> str:
+    """Python source for `evaluate(inputs, mask)` over the live nodes."""
+    live = set(outputs.values())
+    for node in range(len(builder.nodes) - 1, 1, -1):
+        if node in live:
+            live.update(arg for arg in builder.nodes[node][1:] if isinstance(arg, int))
+
+    inputs = [builder.nodes[node][1] for node in sorted(live)
+              if node > 1 and builder.nodes[node][0] == "input"]
+    body = []
+    for node in sorted(live):
+        if node <= 1:
+            continue
+        op, *args = builder.nodes[node]
+        if op == "input":
+            body.append(f"    n{node} = inputs[{args[0]!r}]")
+        elif op == "not":
+            body.append(f"    n{node} = n{args[0]} ^ mask")
+        else:
+            body.append(f"    n{node} = n{args[0]} {OPERATORS[op]} n{args[1]}")
+    constant = {0: "0", 1: "mask"}
+    returned = ", ".join(f"{name!r}: {constant.get(node, f'n{node}')}"
+                         for name, node in outputs.items())
+    return "\n".join([
+        f"# Generated by tools/netlist_compile.py from {label}; do not edit.",
+        f"# Key {key}",
+        "",
+        f"SOURCE_NODES = {len(builder.nodes) - 2}",
+        f"NETS = {len(body)}",
+        f"INPUTS = {tuple(inputs)!r}",
+        f"OUTPUTS = {tuple(outputs)!r}",
+        "",
+        "",
+        "def evaluate(inputs, mask):",
+        *body,
+        f"    return {{{returned}}}",
+        "",
+    ])
+
+
+@dataclass
+class CompiledNetlist:
+    key: str
+    path: Path
+    evaluate: Evaluate
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    source_nodes: int
+    nets: int
+    cached: bool
+
+
+def netlist_key(*parts: object) -> str:
+    """Hash of `parts` and of the code that turns a netlist into a generated module."""
+    digest = hashlib.sha256(f"netlist_compile v{COMPILER_VERSION}".encode())
+    digest.update(Path(__file__).read_bytes())
+    digest.update(Path(yosys_sim.__file__).read_bytes())
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else json.dumps(part).encode())
+    return digest.hexdigest()
+
+
+def compile_cached(key: str, label: str, lower: Callable[[], Tuple[Builder, Dict[str, int]]],
+                   cache_dir: Optional[Path] = CACHE_DIR, rebuild: bool = False) -> CompiledNetlist:
+    """Load the module generated for `key`, running `lower` and generating it on a miss."""
+    path = (cache_dir or CACHE_DIR) / f"{key[:32]}.py"
+    cached = cache_dir is not None and path.exists() and not rebuild
+    if cached:
+        source = path.read_text()
+    else:
+        builder, outputs = lower()
+        source = generate(builder, outputs, label, key)
+        if cache_dir is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix(".tmp")
+            temporary.write_text(source)
+            temporary.replace(path)
+
+    namespace: Dict[str, object] = {}
+    if cache_dir is not None:
+        spec = importlib.util.spec_from_file_location(f"netlist_{key[:16]}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        namespace = vars(module)
+    else:
+        exec(compile(source, f"<netlist {key[:16]}>", "exec"), namespace)
+    return CompiledNetlist(key, path, namespace["evaluate"], namespace["INPUTS"],
+                           namespace["OUTPUTS"], namespace["SOURCE_NODES"],
+                           namespace["NETS"], cached)
+
+
+def compile_gates(netlist, constants: Optional[Dict[str, int]] = None,
+                  cache_dir: Optional[Path] = CACHE_DIR, rebuild: bool = False) -> CompiledNetlist:
+    """Compile an alu_netlist Netlist; `constants` binds inputs to 0/1."""
+    constants = constants or {}
+    gates = [[gate.output, gate.kind, list(gate.inputs)] for gate in netlist.gates]
+    key = netlist_key("gates", netlist.inputs, netlist.outputs, gates, sorted(constants.items()))
+    return compile_cached(key, f"alu_netlist ({len(gates)} gates)",
+                          lambda: lower_gates(netlist, constants), cache_dir, rebuild)
+
+
+def compile_yosys(path: Path, top: Optional[str] = None, outputs: Sequence[str] = YOSYS_OUTPUTS,
+                  constants: Optional[Dict[str, int]] = None,
+                  cache_dir: Optional[Path] = CACHE_DIR, rebuild: bool = False) -> CompiledNetlist:
+    """Compile an RTLIL netlist; the design is only parsed on a cache miss."""
+    constants = constants or {}
+    key = netlist_key("yosys", path.read_bytes(), top, list(outputs), sorted(constants.items()))
+    return compile_cached(key, path.name,
+                          lambda: lower_yosys(yosys_sim.load_netlist(path, top), outputs, constants),
+                          cache_dir, rebuild)
+
+
+# ---------------------------------------------------------------------------
+# Exhaustive check
+# ---------------------------------------------------------------------------
+
+def opcode_constants(bus: str, opcode: str) -> Dict[str, int]:
+    value = int(opcode, 2)
+    return {f"{bus}[{k}]": value >> k & 1 for k in range(OPCODE_BITS)}
+
+
+def yosys_patterns(opcode: str) -> Tuple[Dict[str, int], int]:
+    a_lanes, b_lanes = yosys_sim.operand_lanes()
+    words = {f"A[{k}]": word for k, word in enumerate(a_lanes)}
+    words.update({f"B[{k}]": word for k, word in enumerate(b_lanes)})
+    value = int(opcode, 2)
+    words.update({f"Opcode[{k}]": yosys_sim.LANE_MASK if value >> k & 1 else 0
+                  for k in range(OPCODE_BITS)})
+    return words, yosys_sim.LANE_MASK
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compile a netlist to straight-line Python.")
+    parser.add_argument("--source", choices=("gates", "yosys"), default="gates",
+                        help="alu_netlist gate netlist (default) or the Yosys RTLIL netlist.")
+    parser.add_argument("--design", type=Path, default=yosys_sim.DEFAULT_DESIGN,
+                        help="RTLIL netlist for --source yosys.")
+    parser.add_argument("--specialize", action="store_true",
+                        help="Compile one function per opcode with the opcode folded in.")
+    parser.add_argument("--emit", type=Path, default=None,
+                        help="Also write the generated (unspecialized) source here.")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore cached modules.")
+    args = parser.parse_args()
+
+    try:
+        if args.source == "gates":
+            netlist = build_alu_netlist()
+            bus = "OP"
+            interpret = netlist.simulate
+            patterns = lambda opcode: opcode_patterns(netlist, opcode)
+            build = lambda constants: compile_gates(netlist, constants, rebuild=args.rebuild)
+        else:
+            interpreted = yosys_sim.load_netlist(args.design)
+            bus = "Opcode"
+            patterns = yosys_patterns
+
+            def interpret(words: Dict[str, int], mask: int) -> Dict[str, int]:
+                inputs = {name: [words[bit] for bit in bus_names(name, len(nets))]
+                          for name, nets in interpreted.inputs.items()}
+                values = interpreted.evaluate(inputs, mask)
+                return {bit: values[net] for name in YOSYS_OUTPUTS
+                        for bit, net in zip(bus_names(name, len(interpreted.signals[name])),
+                                            interpreted.signals[name])}
+
+            build = lambda constants: compile_yosys(args.design, constants=constants,
+                                                    rebuild=args.rebuild)
+
+        start = time.perf_counter()
+        compiled = {None: build(None)}
+        if args.specialize:
+            for _, opcode, _ in OPERATIONS:
+                compiled[opcode] = build(opcode_constants(bus, opcode))
+        elapsed = time.perf_counter() - start
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    general = compiled[None]
+    hits = sum(c.cached for c in compiled.values())
+    print(f"Compiled {args.source}: {general.source_nodes} folded nodes -> {general.nets} nets "
+          f"({len(compiled)} module(s), {hits} cached, {elapsed * 1000:.0f} ms)")
+    if args.specialize:
+        sizes = [compiled[opcode].nets for _, opcode, _ in OPERATIONS]
+        print(f"  Per-opcode functions: {min(sizes)}-{max(sizes)} nets")
+    print(f"  Module: {general.path.relative_to(ROOT)}")
+    if args.emit:
+        args.emit.write_text(general.path.read_text())
+        print(f"  Wrote {args.emit}")
+
+    interpreter_time = compiled_time = 0.0
+    problems = []
+    for name, opcode, _ in OPERATIONS:
+        words, mask = patterns(opcode)
+        start = time.perf_counter()
+        reference = interpret(words, mask)
+        interpreter_time += time.perf_counter() - start
+        function = compiled[opcode if args.specialize else None].evaluate
+        start = time.perf_counter()
+        result = function(words, mask)
+        compiled_time += time.perf_counter() - start
+        if args.source == "gates":
+            reference = expected_words(opcode)
+        for output, expected in reference.items():
+            if output in result and result[output] != expected:
+                problems.append(f"{name} {output}: "
+                                f"{(result[output] ^ expected).bit_count()} mismatches")
+
+    against = "golden model" if args.source == "gates" else "interpreter"
+    print(f"\nInterpreted: {interpreter_time:.3f}s   Compiled: {compiled_time:.3f}s   "
+          f"({interpreter_time / compiled_time:.1f}x) over 1,245,184 vectors")
+    if problems:
+        print(f"FAIL: compiled netlist disagrees with the {against}")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    print(f"PASS: compiled netlist matches the {against} on every vector")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
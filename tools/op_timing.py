@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Per-opcode propagation delays of the discrete ALU, taken from PPA.md.
+
+PPA.md section 1 gives ranges for ADD (~80-90 ns) and SUB (~450-500 ns) and
+typical delays per sub-circuit (logic ~100 ns, shifter ~150 ns). Each opcode
+is assigned the sub-circuit on its critical path; ranges use their midpoint.
+
+    adder        ADD, INC_A              ripple carry, B (or carry-in) direct
+    subtractor   SUB, DEC_A, CMP         ripple carry behind the B inverters
+    shifter      LSL, LSR, ASR, REV_A    shift/reverse selector
+    logic        gates, PASS, NOT        one gate level plus output mux
+
+Usage:
+    python3 tools/op_timing.py      # print the table
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+
+from exhaustive_vectors import OPERATIONS
+
+# Sub-circuit delays in ns (PPA.md 1.1 and 1.2)
+SUBCIRCUIT_DELAY_NS: Dict[str, float] = {
+    "adder": 85.0,
+    "subtractor": 475.0,
+    "shifter": 150.0,
+    "logic": 100.0,
+}
+
+OPCODE_SUBCIRCUIT: Dict[str, str] = {
+    "ADD": "adder", "INC_A": "adder",
+    "SUB": "subtractor", "DEC_A": "subtractor", "CMP": "subtractor",
+    "LSL": "shifter", "LSR": "shifter", "ASR": "shifter", "REV_A": "shifter",
+    "NAND": "logic", "NOR": "logic", "XOR": "logic", "AND": "logic", "OR": "logic",
+    "XNOR": "logic", "PASS_A": "logic", "PASS_B": "logic", "NOT_A": "logic", "NOT_B": "logic",
+}
+
+# Golden-model operation name -> propagation delay (ns)
+OP_LATENCY_NS: Dict[str, float] = {
+    name: SUBCIRCUIT_DELAY_NS[OPCODE_SUBCIRCUIT[name]] for name, _, _ in OPERATIONS
+}
+
+# Opcode bits ("00000") -> operation name
+OPCODE_NAMES: Dict[str, str] = {code: name for name, code, _ in OPERATIONS}
+
+WORST_LATENCY_NS = max(OP_LATENCY_NS.values())
+
+
+def latency_ns(operation: str) -> float:
+    """Delay for an operation name (ADD) or opcode bits (00000)."""
+    name = OPCODE_NAMES.get(operation, operation)
+    if name not in OP_LATENCY_NS:
+        raise ValueError(f"Unknown operation: {operation}")
+    return OP_LATENCY_NS[name]
+
+
+def main() -> int:
+    print(f"{'Operation':<8} {'Opcode':<6} {'Path':<11} {'t_pd (ns)':>9} {'f_max (MHz)':>11}")
+    for name, code, _ in OPERATIONS:
+        delay = OP_LATENCY_NS[name]
+        print(f"{name:<8} {code:<6} {OPCODE_SUBCIRCUIT[name]:<11} {delay:>9.0f} {1e3 / delay:>11.2f}")
+    print(f"\nWorst case: {WORST_LATENCY_NS:.0f} ns ({1e3 / WORST_LATENCY_NS:.2f} MHz)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Reorder a vector set so consecutive vectors differ in as few input bits as
+possible.
+
+`pico_alu_test.py` applies vectors in file order, and every A, B or opcode
+bit that changes between two vectors costs supply current and settle time.
+Exhaustive and generated files are opcode-major with B varying fastest, so
+a B wrap from 0xFF to 0x00 flips eight bits at once. Strategies:
+
+    gray     sort by the Gray-code rank of opcode, A and B: a complete
+             A x B square is walked with one input toggle per step
+    greedy   nearest neighbour on Hamming distance over (opcode, A, B),
+             searched by radius, ties broken by the shorter carry ripple
+    best     run both and keep the cheaper order (default)
+
+Cost per step is input toggles; carry ripple is the span of adder carry
+bits that change (the distance the ripple has to travel before the output
+settles), reported next to the energy estimate from test/energy_model.py.
+By default carry settling is only a tie-breaker between equally short
+steps, so it is not minimised. --weight-ripple W makes the greedy step
+cost toggles + W * ripple bits and picks the best order on that cost, so
+carry ripple is traded against toggles.
+
+Usage:
+    python3 tools/order_vectors.py test/vectors/demo.json --out demo_ordered.json
+    python3 tools/order_vectors.py hw.bin --out hw_ordered.bin --strategy greedy
+    python3 tools/order_vectors.py hw.bin --weight-ripple 1
+"""
+
+import argparse
+import json
+import sys
+import time
+from itertools import combinations
+from math import comb
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from energy_estimate import format_energy
+from energy_model import INPUT_BITS, measure
+from exhaustive_vectors import OPERATIONS
+from run_vectors import load_vectors
+from vector_coverage import ADDER_OPERANDS
+from vector_io import decode_flags, encode_flags, read_records, write_records
+
+STRATEGIES = ("gray", "greedy", "best")
+ADDER_OPCODES = {int(code, 2): operands for code, operands in ADDER_OPERANDS.items()}
+OPCODE_NAMES = {int(code, 2): name for name, code, _ in OPERATIONS}
+
+Record = Tuple[int, int, int, int, int]  # (opcode, A, B, result, flags)
+
+
+def input_word(opcode: int, a: int, b: int) -> int:
+    """The 21 bench-driven bits, packed as in energy_model toggle words."""
+    return a | b << 8 | opcode << 16
+
+
+def carry_bits(opcode: int, a: int, b: int) -> int:
+    """Carry out of each adder bit (bit 7 = carry-out) for adder opcodes, else 0."""
+    if opcode not in ADDER_OPCODES:
+        return 0
+    operand, carry_in = ADDER_OPCODES[opcode]
+    if operand == "B":
+        operand = b
+    elif operand == "~B":
+        operand = ~b & 0xFF
+    return ((a + operand + carry_in) ^ a ^ operand) >> 1 & 0xFF
+
+
+def ripple_span(changed: int) -> int:
+    """Bits between the lowest and highest changed carry, inclusive."""
+    return changed.bit_length() - (changed & -changed).bit_length() + 1 if changed else 0
+
+
+def step_ripple(opcode: int, carry: int, previous_carry: int) -> int:
+    """Carry ripple of applying a vector after one with `previous_carry`."""
+    return ripple_span(carry ^ previous_carry) if opcode in ADDER_OPCODES else 0
+
+
+def gray_rank(value: int) -> int:
+    """Position of `value` in the reflected Gray sequence."""
+    rank = value
+    shift = value >> 1
+    while shift:
+        rank ^= shift
+        shift >>= 1
+    return rank
+
+
+def gray_order(records: Sequence[Record]) -> List[int]:
+    return sorted(range(len(records)), key=lambda i: (gray_rank(records[i][0]),
+                                                      gray_rank(records[i][1]),
+                                                      gray_rank(records[i][2])))
+
+
+MASKS_BY_DISTANCE = [
+    [sum(1 << bit for bit in bits) for bits in combinations(range(INPUT_BITS), distance)]
+    for distance in range(4)
+]
+
+
+def greedy_order(records: Sequence[Record], start: int = 0,
+                 ripple_weight: float = 0.0) -> List[int]:
+    """
+    Nearest-neighbour tour from input word `start` (idle) on step cost
+    toggles + `ripple_weight` * ripple, ties broken by the shorter ripple.
+    Neighbours are looked up by flipping up to three bits; beyond that, or
+    once few vectors remain, the remaining distinct words are scanned.
+    """
+    words = [input_word(opcode, a, b) for opcode, a, b, _, _ in records]
+    carries = [carry_bits(opcode, a, b) for opcode, a, b, _, _ in records]
+    pending: Dict[int, List[int]] = {}
+    for index in reversed(range(len(records))):
+        pending.setdefault(words[index], []).append(index)
+
+    order: List[int] = []
+    current, carry = start, 0
+
+    def step_cost(word: int) -> Tuple[float, int]:
+        index = pending[word][-1]
+        span = step_ripple(records[index][0], carries[index], carry)
+        return (word ^ current).bit_count() + ripple_weight * span, span
+
+    while pending:
+        best: Optional[int] = None
+        for distance in range(INPUT_BITS + 1):
+            # No word this far away can beat a step already found
+            if best is not None and distance > step_cost(best)[0]:
+                break
+            if distance >= len(MASKS_BY_DISTANCE) or comb(INPUT_BITS, distance) > len(pending):
+                best = min(pending, key=step_cost)
+                break
+            found = [current ^ mask for mask in MASKS_BY_DISTANCE[distance] if current ^ mask in pending]
+            if best is not None:
+                found.append(best)
+            if found:
+                best = min(found, key=step_cost)
+        indices = pending[best]
+        index = indices.pop()
+        if not indices:
+            del pending[best]
+        order.append(index)
+        current, carry = best, carries[index]
+    return order
+
+
+def sequence_cost(records: Sequence[Record]) -> Dict[str, float]:
+    """Input toggles and carry ripple over a sequence, starting from idle."""
+    toggles = ripple = worst_toggles = worst_ripple = 0
+    previous_word = previous_carry = 0
+    for opcode, a, b, _, _ in records:
+        word = input_word(opcode, a, b)
+        carry = carry_bits(opcode, a, b)
+        flips = (word ^ previous_word).bit_count()
+        span = step_ripple(opcode, carry, previous_carry)
+        toggles += flips
+        ripple += span
+        worst_toggles = max(worst_toggles, flips)
+        worst_ripple = max(worst_ripple, span)
+        previous_word, previous_carry = word, carry
+    return {"toggles": toggles, "worst_toggles": worst_toggles,
+            "ripple": ripple, "worst_ripple": worst_ripple,
+            "energy_j": measure((opcode, a, b) for opcode, a, b, _, _ in records).energy_j}
+
+
+def load_records(paths: List[Path]) -> Tuple[List[Record], Optional[List[Dict]]]:
+    """Records from one .bin or any JSON files; JSON entries are kept for rewriting."""
+    if len(paths) == 1 and paths[0].suffix == ".bin":
+        return list(read_records(paths[0])), None
+    if any(path.suffix == ".bin" for path in paths):
+        raise ValueError("Binary files must be ordered on their own")
+    entries = load_vectors(paths)
+    records = [(int(str(entry["opcode"]).strip(), 2), int(entry.get("A", 0)), int(entry.get("B", 0)),
+                int(entry.get("expected_result", 0)), encode_flags(entry.get("expected_flags", {})))
+               for entry in entries]
+    return records, entries
+
+
+def write_ordered(path: Path, records: Sequence[Record], entries: Optional[Sequence[Dict]]) -> None:
+    if path.suffix == ".bin":
+        write_records(path, records)
+        return
+    if entries is None:
+        entries = [{"test_name": f"{OPCODE_NAMES.get(opcode, format(opcode, '05b'))}_ORD_{index}",
+                    "opcode": format(opcode, "05b"), "A": a, "B": b,
+                    "expected_result": result, "expected_flags": decode_flags(flags)}
+                   for index, (opcode, a, b, result, flags) in enumerate(records)]
+    tests = [{key: value for key, value in entry.items() if key != "_source"} for entry in entries]
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump({"tests": tests}, handle, indent=2)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reorder ALU vectors to minimise input toggles.")
+    parser.add_argument("paths", nargs="+", type=Path, help="One .bin, or JSON/JSON.gz vector files.")
+    parser.add_argument("--out", type=Path, default=None,
+                        help="Write the reordered vectors here (.bin or .json).")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="best",
+                        help="Ordering strategy (default: best).")
+    parser.add_argument("--weight-ripple", type=float, default=0.0, metavar="W",
+                        help="Cost of one carry-ripple bit in input toggles; 0 only breaks ties "
+                             "(default: 0).")
+    args = parser.parse_args()
+    if args.weight_ripple < 0:
+        parser.error("--weight-ripple must not be negative")
+
+    try:
+        records, entries = load_records(args.paths)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if not records:
+        print("No vectors to order")
+        return 1
+
+    orders = {}
+    for strategy in ("gray", "greedy"):
+        if args.strategy in (strategy, "best"):
+            start = time.perf_counter()
+            orders[strategy] = (gray_order(records) if strategy == "gray"
+                                else greedy_order(records, ripple_weight=args.weight_ripple))
+            print(f"{strategy} order computed in {time.perf_counter() - start:.2f}s")
+
+    print(f"\n{'Order':<10} {'Toggles':>12} {'Per vec':>8} {'Worst':>6} "
+          f"{'Ripple bits':>12} {'Worst':>6} {'Energy':>12}")
+    costs = {"file": sequence_cost(records)}
+    for strategy, order in orders.items():
+        costs[strategy] = sequence_cost([records[i] for i in order])
+    for name, cost in costs.items():
+        print(f"{name:<10} {cost['toggles']:>12,} {cost['toggles'] / len(records):>8.2f} "
+              f"{cost['worst_toggles']:>6} {cost['ripple']:>12,} {cost['worst_ripple']:>6} "
+              f"{format_energy(cost['energy_j']):>12}")
+
+    chosen = min(orders, key=lambda strategy: (costs[strategy]["toggles"]
+                                               + args.weight_ripple * costs[strategy]["ripple"],
+                                               costs[strategy]["ripple"]))
+    saved = costs["file"]["toggles"] - costs[chosen]["toggles"]
+    print(f"\nUsing {chosen}: {saved:,} fewer input toggles than file order "
+          f"({100.0 * saved / costs['file']['toggles'] if costs['file']['toggles'] else 0:.1f}%)")
+
+    if args.out is not None:
+        order = orders[chosen]
+        write_ordered(args.out, [records[i] for i in order],
+                      [entries[i] for i in order] if entries is not None else None)
+        print(f"Wrote {len(order):,} vectors to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Per-net trace length, vias, capacitance and wire delay from the KiCad PCBs.
+
+Reads board geometry from the cached index (tools/kicad_index.py). For each
+net:
+
+    routed      length of its track segments and arcs, and its vias
+    islands     pads left in separate copper islands; tracks, vias and
+                pads are joined through a grid spatial index of their end
+                points (pad and via shapes are treated as circles, layers
+                are not distinguished)
+    estimated   routed length plus a Manhattan minimum spanning tree over
+                the islands still unconnected (the ratsnest), so unrouted
+                boards such as add_sub still get a length
+    capacitance microstrip trace capacitance over the estimated length on
+                1.6 mm FR-4 (IPC-2141), plus vias and pads; gate load is
+                reported separately as MOSFET gate pins x --gate-pf
+    delay       flight time plus ln 2 x driver resistance x wire capacitance,
+                the part of a gate delay the routing adds
+
+--export writes the per-net rows as JSON or CSV for a gate-level timing
+model; the report ranks nets by wire delay so the carry nets that
+dominate, and the ones worth re-routing, stand out.
+
+Usage:
+    python3 tools/pcb_nets.py                              # every board
+    python3 tools/pcb_nets.py add_sub --match '*C_OUT*'    # carry nets
+    python3 tools/pcb_nets.py --export net_delays.json
+"""
+
+import argparse
+import csv
+import fnmatch
+import json
+import math
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from operator import sub
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from kicad_index import KicadIndex
+
+# Stack-up: 2-layer, 1.6 mm FR-4, 1 oz copper
+BOARD_THICKNESS_MM = 1.6
+COPPER_THICKNESS_MM = 0.035
+DIELECTRIC_CONSTANT = 4.5
+VIA_ANTIPAD_CLEARANCE_MM = 0.2
+EPSILON_0_PF_PER_MM = 8.854e-3
+FLIGHT_PS_PER_MM = 85.0 * math.sqrt(0.475 * DIELECTRIC_CONSTANT + 0.67) / 25.4
+ESTIMATE_TRACK_WIDTH_MM = 0.25  # assumed for the unrouted part of a net
+
+DRIVER_RESISTANCE_OHM = 10.0  # BSS84/BSS138 R_DS(on) at 5 V gate drive
+GATE_INPUT_PF = 40.0          # per MOSFET gate pin, order of the datasheet C_iss
+
+POWER_NETS = {"GND", "VCC", "+5V", "VDD", "VSS"}
+GRID_MM = 2.0
+
+NET_FIELDS = ("board", "net", "pads", "gate_pins", "segments", "vias", "islands",
+              "routed_mm", "estimated_mm", "wire_pf", "load_pf", "flight_ns", "wire_delay_ns")
+
+
+@lru_cache(maxsize=None)
+def trace_pf_per_mm(width: float) -> float:
+    """Microstrip capacitance per mm for a track of `width` mm (IPC-2141)."""
+    impedance = (87.0 / math.sqrt(DIELECTRIC_CONSTANT + 1.41)
+                 * math.log(5.98 * BOARD_THICKNESS_MM / (0.8 * width + COPPER_THICKNESS_MM)))
+    return FLIGHT_PS_PER_MM / impedance
+
+
+def via_pf(size: float) -> float:
+    """Via pad-to-plane capacitance (Johnson: 1.41 er T D1 / (D2 - D1), inches)."""
+    return (1.41 * DIELECTRIC_CONSTANT * BOARD_THICKNESS_MM / 25.4 * size
+            / (2 * VIA_ANTIPAD_CLEARANCE_MM))
+
+
+def pad_pf(width: float, height: float) -> float:
+    """Parallel-plate capacitance of a pad over the far layer."""
+    return EPSILON_0_PF_PER_MM * DIELECTRIC_CONSTANT * width * height / BOARD_THICKNESS_MM
+
+
+def arc_length(x1: float, y1: float, xm: float, ym: float, x2: float, y2: float) -> float:
+    """Length of the circular arc from (x1, y1) through (xm, ym) to (x2, y2)."""
+    chord = math.hypot(x2 - x1, y2 - y1)
+    a, b = math.hypot(xm - x1, ym - y1), math.hypot(x2 - xm, y2 - ym)
+    cross = (xm - x1) * (y2 - y1) - (ym - y1) * (x2 - x1)
+    if abs(cross) < 1e-9:
+        return a + b
+    radius = a * b * chord / (2 * abs(cross))
+    angle = 2 * math.asin(min(1.0, chord / (2 * radius)))
+    if a * a + b * b > chord * chord:  # acute angle at the mid point: more than half a circle
+        angle = 2 * math.pi - angle
+    return radius * angle
+
+
+def pad_positions(footprint: Dict) -> Iterator[Tuple[List, float, float]]:
+    """(pad, x, y) in board coordinates."""
+    fx, fy, angle = footprint["at"]
+    cos_a, sin_a = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    for pad in footprint["pads"]:
+        px, py = pad[3], pad[4]
+        yield pad, fx + px * cos_a + py * sin_a, fy - px * sin_a + py * cos_a
+
+
+class GridIndex:
+    """Points with a reach radius, bucketed on a square grid."""
+
+    def __init__(self, cell: float = GRID_MM):
+        self.cell = cell
+        self.buckets: Dict[Tuple[int, int], List[Tuple[float, float, float, int]]] = defaultdict(list)
+
+    def add(self, x: float, y: float, reach: float, node: int) -> None:
+        self.buckets[(int(x // self.cell), int(y // self.cell))].append((x, y, reach, node))
+
+    def near(self, x: float, y: float, reach: float) -> Iterator[int]:
+        """Nodes whose reach overlaps a point with reach `reach`."""
+        span = int(math.ceil(2 * reach / self.cell)) + 1
+        cx, cy = int(x // self.cell), int(y // self.cell)
+        for gx in range(cx - span, cx + span + 1):
+            for gy in range(cy - span, cy + span + 1):
+                for px, py, other, node in self.buckets.get((gx, gy), ()):
+                    if math.hypot(px - x, py - y) <= reach + other:
+                        yield node
+
+
+class UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, node: int) -> int:
+        while self.parent[node] != node:
+            self.parent[node] = self.parent[self.parent[node]]
+            node = self.parent[node]
+        return node
+
+    def union(self, a: int, b: int) -> None:
+        self.parent[self.find(a)] = self.find(b)
+
+
+def manhattan_mst(points: List[Tuple[float, float, int]]) -> float:
+    """Prim's MST over (x, y, island) points; points in one island join for free."""
+    if len(points) < 2:
+        return 0.0
+    inf = float("inf")
+    best = [inf] * len(points)
+    best[0] = 0.0
+    done = [False] * len(points)
+    total = 0.0
+    for _ in range(len(points)):
+        current = min((i for i in range(len(points)) if not done[i]), key=best.__getitem__)
+        done[current] = True
+        total += best[current]
+        x, y, island = points[current]
+        for i, (px, py, other) in enumerate(points):
+            if not done[i]:
+                cost = 0.0 if other == island else abs(px - x) + abs(py - y)
+                if cost < best[i]:
+                    best[i] = cost
+    return total
+
+
+def analyze_board(board: str, entry: Dict, driver_ohm: float, gate_pf: float) -> List[Dict]:
+    """Per-net rows (NET_FIELDS) for one PCB index entry."""
+    segments, arcs, vias = entry["segments"], entry["arcs"], entry["vias"]
+
+    # Column-wise length and capacitance aggregation
+    lengths = list(map(math.hypot, map(sub, [s[2] for s in segments], [s[0] for s in segments]),
+                       map(sub, [s[3] for s in segments], [s[1] for s in segments])))
+    lengths += [arc_length(*arc[:6]) for arc in arcs]
+    tracks = [(s[4], s[6]) for s in segments] + [(a[6], a[8]) for a in arcs]
+    routed: Dict[str, float] = defaultdict(float)
+    wire_pf: Dict[str, float] = defaultdict(float)
+    track_count: Dict[str, int] = defaultdict(int)
+    for length, (width, net) in zip(lengths, tracks):
+        routed[net] += length
+        wire_pf[net] += length * trace_pf_per_mm(width)
+        track_count[net] += 1
+    via_count: Dict[str, int] = defaultdict(int)
+    for via in vias:
+        via_count[via[4]] += 1
+        wire_pf[via[4]] += via_pf(via[2])
+
+    # Connectivity: node per pad, via and track end, joined through the grid
+    grid = GridIndex()
+    nodes: List[str] = []
+    pads: Dict[str, List[Tuple[float, float, int]]] = defaultdict(list)
+    gate_pins: Dict[str, int] = defaultdict(int)
+    for footprint in entry["footprints"]:
+        for pad, x, y in pad_positions(footprint):
+            if not pad[1]:
+                continue
+            node = len(nodes)
+            nodes.append(pad[1])
+            grid.add(x, y, max(pad[6], pad[7]) / 2, node)
+            pads[pad[1]].append((x, y, node))
+            wire_pf[pad[1]] += pad_pf(pad[6], pad[7])
+            if pad[2] == "G":
+                gate_pins[pad[1]] += 1
+    for via in vias:
+        grid.add(via[0], via[1], via[2] / 2, len(nodes))
+        nodes.append(via[4])
+    ends = [(s[0], s[1], s[2], s[3], s[4], s[6]) for s in segments]
+    ends += [(a[0], a[1], a[4], a[5], a[6], a[8]) for a in arcs]
+    for x1, y1, x2, y2, width, net in ends:
+        grid.add(x1, y1, width / 2, len(nodes))
+        grid.add(x2, y2, width / 2, len(nodes) + 1)
+        nodes.extend((net, net))
+
+    joined = UnionFind(len(nodes))
+    first_end = len(nodes) - 2 * len(ends)
+    for start in range(first_end, len(nodes), 2):
+        joined.union(start, start + 1)
+    for bucket in grid.buckets.values():
+        for x, y, reach, node in bucket:
+            for other in grid.near(x, y, reach):
+                if other != node and nodes[other] == nodes[node]:
+                    joined.union(node, other)
+
+    rows = []
+    for net in sorted(set(pads) | set(routed)):
+        if not net or net.startswith("unconnected-"):
+            continue
+        points = [(x, y, joined.find(node)) for x, y, node in pads.get(net, [])]
+        remaining = manhattan_mst(points)
+        estimated = routed[net] + remaining
+        wire = wire_pf[net] + remaining * trace_pf_per_mm(ESTIMATE_TRACK_WIDTH_MM)
+        flight = estimated * FLIGHT_PS_PER_MM / 1e3
+        rows.append({
+            "board": board, "net": net, "pads": len(points), "gate_pins": gate_pins[net],
+            "segments": track_count[net], "vias": via_count[net],
+            "islands": len({island for _, _, island in points}),
+            "routed_mm": round(routed[net], 3), "estimated_mm": round(estimated, 3),
+            "wire_pf": round(wire, 3), "load_pf": round(gate_pins[net] * gate_pf, 3),
+            "flight_ns": round(flight, 4),
+            "wire_delay_ns": round(flight + math.log(2) * driver_ohm * wire * 1e-3, 4),
+        })
+    return rows
+
+
+def select_boards(index: KicadIndex, names: List[str]) -> List[Tuple[str, Dict]]:
+    boards = [(Path(key).stem, entry) for key, entry in index.pcbs() if entry["footprints"]]
+    if not names:
+        return boards
+    chosen = [(stem, entry) for stem, entry in boards if stem in names]
+    missing = set(names) - {stem for stem, _ in chosen}
+    if missing:
+        raise ValueError(f"No PCB with footprints named {', '.join(sorted(missing))}")
+    return chosen
+
+
+def write_export(path: Path, rows: List[Dict], driver_ohm: float, gate_pf: float) -> None:
+    if path.suffix == ".csv":
+        with path.open("w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=NET_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        path.write_text(json.dumps({
+            "model": {"driver_ohm": driver_ohm, "gate_pf": gate_pf,
+                      "flight_ps_per_mm": round(FLIGHT_PS_PER_MM, 3),
+                      "dielectric_constant": DIELECTRIC_CONSTANT,
+                      "board_thickness_mm": BOARD_THICKNESS_MM},
+            "nets": rows}, indent=1) + "\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PCB trace length, capacitance and wire delay per net.")
+    parser.add_argument("boards", nargs="*", help="PCB names (file stems, default: all with footprints).")
+    parser.add_argument("--match", default="*", help="Only nets matching this glob.")
+    parser.add_argument("--all", action="store_true", help="Include power nets in the ranking.")
+    parser.add_argument("--top", type=int, default=15, help="Nets to list (default: 15).")
+    parser.add_argument("--driver-ohm", type=float, default=DRIVER_RESISTANCE_OHM,
+                        help=f"Driver output resistance (default: {DRIVER_RESISTANCE_OHM:g}).")
+    parser.add_argument("--gate-pf", type=float, default=GATE_INPUT_PF,
+                        help=f"Load per MOSFET gate pin (default: {GATE_INPUT_PF:g} pF).")
+    parser.add_argument("--export", type=Path, default=None, help="Write per-net rows (.json or .csv).")
+    args = parser.parse_args()
+
+    try:
+        boards = select_boards(KicadIndex().update(), args.boards)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    rows = []
+    print(f"{'Board':<24} {'Nets':>5} {'Routed mm':>10} {'Est. mm':>9} {'Vias':>5} {'Unrouted':>9}")
+    for board, entry in boards:
+        board_rows = [row for row in analyze_board(board, entry, args.driver_ohm, args.gate_pf)
+                      if fnmatch.fnmatchcase(row["net"], args.match)]
+        rows.extend(board_rows)
+        print(f"{board:<24} {len(board_rows):>5} {sum(r['routed_mm'] for r in board_rows):>10,.1f} "
+              f"{sum(r['estimated_mm'] for r in board_rows):>9,.1f} {sum(r['vias'] for r in board_rows):>5} "
+              f"{sum(max(0, r['islands'] - 1) for r in board_rows):>9}")
+
+    ranked = sorted((row for row in rows if args.all or row["net"] not in POWER_NETS),
+                    key=lambda row: -row["wire_delay_ns"])
+    if ranked and args.top:
+        print(f"\nSlowest nets (wire delay = flight + ln2 x {args.driver_ohm:g} ohm x C_wire):")
+        print(f"{'Board':<16} {'Net':<34} {'Pads':>4} {'Est. mm':>8} {'Vias':>4} "
+              f"{'C wire pF':>9} {'C gate pF':>9} {'Delay ns':>8}")
+        for row in ranked[:args.top]:
+            state = "" if row["islands"] <= 1 else f"  ({row['islands']} islands)"
+            print(f"{row['board']:<16} {row['net'][-34:]:<34} {row['pads']:>4} {row['estimated_mm']:>8.1f} "
+                  f"{row['vias']:>4} {row['wire_pf']:>9.2f} {row['load_pf']:>9.0f} "
+                  f"{row['wire_delay_ns']:>8.3f}{state}")
+
+    if args.export is not None:
+        write_export(args.export, rows, args.driver_ohm, args.gate_pf)
+        print(f"\nWrote {len(rows)} nets to {args.export}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
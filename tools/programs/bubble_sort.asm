@@ -0,0 +1,37 @@
+; Fill memory[0..N-1] from a linear congruential generator (x = 5x + 1),
+; then bubble sort it in ascending order. Long-running; a profiling workload.
+;
+;   python3 tools/cpu_sim.py tools/programs/bubble_sort.asm --profile
+
+        LDI  R0, 0          ; address
+        LDI  R1, 7          ; seed
+        LDI  R6, 128        ; N
+
+fill:   ST   R1, [R0]
+        LSL  R2, R1         ; 2x
+        LSL  R2, R2         ; 4x
+        ADD  R1, R1, R2     ; 5x
+        INC  R1, R1         ; 5x + 1
+        INC  R0, R0
+        CMP  R0, R6
+        BNE  fill
+
+        DEC  R7, R6         ; last index
+outer:  LDI  R5, 0          ; swapped
+        LDI  R0, 0          ; j
+
+inner:  LD   R2, [R0]
+        INC  R3, R0
+        LD   R4, [R3]
+        CMP  R4, R2         ; mem[j+1] - mem[j]
+        BCS  ordered        ; no borrow: already in order
+        ST   R4, [R0]
+        ST   R2, [R3]
+        LDI  R5, 1
+ordered: MOV R0, R3
+        CMP  R0, R7
+        BNE  inner
+
+        MOV  R5, R5         ; Z = nothing swapped
+        BNE  outer
+        HALT
@@ -0,0 +1,20 @@
+; Fibonacci numbers into memory until the next one overflows 8 bits
+;   out: memory[0..13] = 0, 1, 1, 2, ... 233;  R2 = count
+;
+;   python3 tools/cpu_sim.py tools/programs/fibonacci.asm
+
+        LDI  R0, 0          ; F(n)
+        LDI  R1, 1          ; F(n+1)
+        LDI  R2, 0          ; address
+
+loop:   ST   R0, [R2]
+        INC  R2, R2
+        ADD  R3, R0, R1
+        BCS  done           ; F(n+2) > 255
+        MOV  R0, R1
+        MOV  R1, R3
+        B    loop
+
+done:   ST   R1, [R2]
+        INC  R2, R2
+        HALT
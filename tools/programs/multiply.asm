@@ -0,0 +1,28 @@
+; 8 x 8 -> 16-bit shift-and-add multiply
+;   in:  R0 = multiplicand, R1 = multiplier
+;   out: R3:R2 = product (high:low)
+;
+;   python3 tools/cpu_sim.py tools/programs/multiply.asm --reg R0=200 R1=123
+
+        LDI  R2, 0          ; product low
+        LDI  R3, 0          ; product high
+        LDI  R4, 0          ; multiplicand high byte
+        LDI  R5, 8          ; bits left
+
+loop:   LSR  R1, R1         ; C = next multiplier bit
+        BCC  shift
+        ADD  R2, R2, R0     ; product += multiplicand (16-bit)
+        BCC  high
+        INC  R3, R3
+high:   ADD  R3, R3, R4
+
+shift:  LSL  R0, R0         ; multiplicand <<= 1, C = bit shifted out
+        BCC  nocarry
+        LSL  R4, R4
+        INC  R4, R4
+        B    next
+nocarry: LSL R4, R4
+
+next:   DEC  R5, R5
+        BNE  loop
+        HALT
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Co-simulate sim/FPGA/src/ALU.sv against the Python golden model.
+
+Compiles ALU.sv with sim/FPGA/testbench/alu_cosim_tb.sv under Icarus Verilog
+or Verilator, then streams vectors to the simulator over its stdin and reads
+{Overflow, Negative, Zero, CarryOut, Result} back from its stdout. Vectors go
+in batches, and up to --depth batches are kept in flight at once (a bounded
+ring between a writer thread and the reader), so the pipe round trip is paid
+per ring slot rather than per vector.
+
+Every response is compared with `batch_model` (the golden model), field by
+field. Known ALU.sv differences are reported but do not fail the run unless
+--strict is given:
+
+    - CMP: ALU.sv puts A - B on Result, the golden model returns 0
+    - Overflow: ALU.sv drives a constant 0 placeholder
+
+Vectors come from the exhaustive sweep (default) or JSON/JSON.gz/.bin files;
+files only supply opcode/A/B, the expectation is always the golden model.
+
+Usage:
+    python3 tools/rtl_cosim.py                                  # exhaustive, Icarus
+    python3 tools/rtl_cosim.py --simulator verilator
+    python3 tools/rtl_cosim.py --opcodes ADD SUB CMP --strict
+    python3 tools/rtl_cosim.py test/vectors/demo.json
+    python3 tools/rtl_cosim.py --command "./obj_dir/Valu_cosim_tb"  # prebuilt
+"""
+
+import argparse
+import queue
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from batch_model import FLAG_ORDER, opcode_table
+from exhaustive_vectors import OPERATIONS, operand_pairs
+from export_hdl_vectors import resolve_opcodes
+from fault_sim import load_vector_tuples
+
+RTL_SOURCE = ROOT / "sim" / "FPGA" / "src" / "ALU.sv"
+HARNESS = ROOT / "sim" / "FPGA" / "testbench" / "alu_cosim_tb.sv"
+TOP_MODULE = "alu_cosim_tb"
+EXIT_WAIT_S = 5.0  # grace for a harness that closed stdout to finish exiting
+
+CMP_OPCODE = int("10000", 2)
+NAMES = {int(code, 2): name for name, code, _ in OPERATIONS}
+
+# Field name -> mask in the packed batch_model outcome
+FIELD_MASKS = {"result": 0xFF}
+FIELD_MASKS.update({flag: 1 << (8 + i) for i, flag in enumerate(FLAG_ORDER)})
+
+Vector = Tuple[int, int, int]
+
+
+def is_known_difference(opcode: int, field: str) -> bool:
+    """Differences between ALU.sv and the golden model that are by design."""
+    return field == "overflow" or (field == "result" and opcode == CMP_OPCODE)
+
+
+def unpack_response(word: int) -> int:
+    """Harness word {V, N, Z, C, Result[7:0]} -> packed batch_model outcome."""
+    result = word & 0xFF
+    carry = word >> 8 & 1
+    zero = word >> 9 & 1
+    negative = word >> 10 & 1
+    overflow = word >> 11 & 1
+    return result | carry << 8 | zero << 9 | overflow << 10 | negative << 11
+
+
+# ---------------------------------------------------------------------------
+# Simulator build
+# ---------------------------------------------------------------------------
+
+def build_command(simulator: str, build_dir: Path) -> List[str]:
+    """Compile the harness and return the command that runs it."""
+    sources = [str(RTL_SOURCE), str(HARNESS)]
+    if simulator == "icarus":
+        for tool in ("iverilog", "vvp"):
+            if shutil.which(tool) is None:
+                raise RuntimeError(f"{tool} not found on PATH (install Icarus Verilog)")
+        image = build_dir / TOP_MODULE
+        subprocess.run(["iverilog", "-g2012", "-s", TOP_MODULE, "-o", str(image)] + sources,
+                       check=True)
+        return ["vvp", "-n", str(image)]
+
+    if shutil.which("verilator") is None:
+        raise RuntimeError("verilator not found on PATH")
+    subprocess.run(["verilator", "--binary", "-j", "0", "-Wno-fatal",
+                    "--top-module", TOP_MODULE, "--Mdir", str(build_dir)] + sources,
+                   check=True, stdout=subprocess.DEVNULL)
+    return [str(build_dir / f"V{TOP_MODULE}")]
+
+
+# ---------------------------------------------------------------------------
+# Batch exchange
+# ---------------------------------------------------------------------------
+
+class RTLSession:
+    """A running harness process exchanging vector batches over pipes."""
+
+    def __init__(self, command: List[str]):
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            text=True, bufsize=1 << 20,
+        )
+
+    def run(self, batches: Iterable[List[Vector]], depth: int = 4
+            ) -> Iterator[Tuple[List[Vector], List[int]]]:
+        """
+        Yield (batch, response words) in order. A writer thread stays up to
+        `depth` batches ahead of the reader.
+        """
+        in_flight: "queue.Queue[Optional[List[Vector]]]" = queue.Queue(maxsize=depth)
+        errors: List[BaseException] = []
+
+        def writer() -> None:
+            stdin = self.process.stdin
+            try:
+                for batch in batches:
+                    in_flight.put(batch)
+                    stdin.write(f"{len(batch)}\n")
+                    stdin.writelines(f"{op:x} {a:x} {b:x}\n" for op, a, b in batch)
+                    stdin.flush()
+                stdin.write("0\n")
+                stdin.flush()
+            except BaseException as e:  # surfaced by the reader
+                errors.append(e)
+            finally:
+                in_flight.put(None)
+
+        thread = threading.Thread(target=writer, daemon=True)
+        thread.start()
+        stdout = self.process.stdout
+        while True:
+            batch = in_flight.get()
+            if batch is None:
+                break
+            words = []
+            for _ in batch:
+                line = stdout.readline()
+                if not line:
+                    raise RuntimeError(f"simulator exited early (status {self._exit_status()})")
+                words.append(int(line, 16))
+            yield batch, words
+        thread.join()
+        if errors:
+            raise errors[0]
+
+    def _exit_status(self) -> Optional[int]:
+        """Exit status once stdout hit EOF; the process may still be tearing down."""
+        try:
+            return self.process.wait(timeout=EXIT_WAIT_S)
+        except subprocess.TimeoutExpired:
+            return None
+
+    def close(self) -> int:
+        if self.process.stdin and not self.process.stdin.closed:
+            try:
+                self.process.stdin.close()
+            except BrokenPipeError:
+                pass
+        return self.process.wait()
+
+
+# ---------------------------------------------------------------------------
+# Vector sources and comparison
+# ---------------------------------------------------------------------------
+
+def exhaustive_vectors(opcodes: Optional[Set[str]], reduce_operands: bool) -> Iterator[Vector]:
+    for _, opcode, operands in OPERATIONS:
+        if opcodes is None or opcode in opcodes:
+            value = int(opcode, 2)
+            for a, b in operand_pairs(operands, reduce_operands):
+                yield value, a, b
+
+
+def file_vectors(paths: List[Path], opcodes: Optional[Set[str]]) -> Iterator[Vector]:
+    allowed = None if opcodes is None else {int(code, 2) for code in opcodes}
+    for vector in load_vector_tuples(paths):
+        if allowed is None or vector[0] in allowed:
+            yield vector
+
+
+def batched(vectors: Iterable[Vector], size: int) -> Iterator[List[Vector]]:
+    batch: List[Vector] = []
+    for vector in vectors:
+        batch.append(vector)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class CosimReport:
+    """Per-opcode vector counts and mismatch counts per output field."""
+
+    def __init__(self, strict: bool = False, max_examples: int = 20):
+        self.strict = strict
+        self.max_examples = max_examples
+        self.vectors: Dict[int, int] = defaultdict(int)
+        self.mismatches: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.failures = 0
+        self.examples: List[Tuple[Vector, int, int, List[str]]] = []
+
+    def add(self, batch: List[Vector], words: List[int]) -> None:
+        for (opcode, a, b), word in zip(batch, words):
+            self.vectors[opcode] += 1
+            expected = opcode_table(format(opcode, "05b"))[a << 8 | b]
+            actual = unpack_response(word)
+            if actual == expected:
+                continue
+            diff = actual ^ expected
+            failing = []
+            for field, mask in FIELD_MASKS.items():
+                if diff & mask:
+                    self.mismatches[opcode][field] += 1
+                    if self.strict or not is_known_difference(opcode, field):
+                        failing.append(field)
+            if failing:
+                self.failures += 1
+                if len(self.examples) < self.max_examples:
+                    self.examples.append(((opcode, a, b), expected, actual, failing))
+
+    @property
+    def total(self) -> int:
+        return sum(self.vectors.values())
+
+
+def print_report(report: CosimReport, elapsed: float) -> None:
+    fields = list(FIELD_MASKS)
+    print(f"\n{'Opcode':<8} {'Vectors':>9}  " + "  ".join(f"{f:>9}" for f in fields))
+    for opcode in sorted(report.vectors):
+        counts = report.mismatches.get(opcode, {})
+        cells = []
+        for field in fields:
+            count = counts.get(field, 0)
+            mark = "*" if count and is_known_difference(opcode, field) else " "
+            cells.append(f"{count:>8}{mark}")
+        print(f"{NAMES.get(opcode, format(opcode, '05b')):<8} {report.vectors[opcode]:>9,}  "
+              + "  ".join(cells))
+    print("  * known ALU.sv difference" + (" (counted: --strict)" if report.strict else ""))
+
+    for (opcode, a, b), expected, actual, failing in report.examples:
+        print(f"[FAIL] {NAMES.get(opcode, opcode)} A=0x{a:02X} B=0x{b:02X}: "
+              f"{', '.join(failing)} (expected 0x{expected:03X}, RTL 0x{actual:03X})")
+
+    rate = report.total / elapsed if elapsed else 0.0
+    print(f"\nChecked: {report.total:,} in {elapsed:.2f}s ({rate:,.0f} vectors/s)")
+    print(f"Passed:  {report.total - report.failures:,}")
+    print(f"Failed:  {report.failures:,}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Co-simulate ALU.sv against the golden model.")
+    parser.add_argument("paths", nargs="*", type=Path,
+                        help="JSON/JSON.gz/.bin vector files (default: exhaustive sweep).")
+    parser.add_argument("--simulator", choices=("icarus", "verilator"), default="icarus")
+    parser.add_argument("--command", default=None,
+                        help="Run this prebuilt harness command instead of compiling.")
+    parser.add_argument("--opcodes", nargs="+", default=None,
+                        help="Only these opcodes (names like ADD or codes like 00000).")
+    parser.add_argument("--reduce-operands", action="store_true",
+                        help="Exhaustive source: sweep only the operands each opcode uses.")
+    parser.add_argument("--batch", type=int, default=4096, help="Vectors per batch (default: 4096).")
+    parser.add_argument("--depth", type=int, default=4,
+                        help="Batches in flight (default: 4).")
+    parser.add_argument("--strict", action="store_true",
+                        help="Count known ALU.sv differences as failures.")
+    parser.add_argument("--max-failures", type=int, default=20,
+                        help="Failing vectors to print (default: 20).")
+    args = parser.parse_args()
+
+    if args.batch <= 0 or args.depth <= 0:
+        parser.error("--batch and --depth must be positive")
+    try:
+        opcodes = resolve_opcodes(args.opcodes)
+    except ValueError as e:
+        parser.error(str(e))
+
+    vectors = file_vectors(args.paths, opcodes) if args.paths \
+        else exhaustive_vectors(opcodes, args.reduce_operands)
+    report = CosimReport(strict=args.strict, max_examples=args.max_failures)
+
+    with tempfile.TemporaryDirectory(prefix="alu_cosim_") as build_dir:
+        try:
+            command = shlex.split(args.command) if args.command \
+                else build_command(args.simulator, Path(build_dir))
+        except (RuntimeError, subprocess.CalledProcessError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+
+        print(f"Simulator: {' '.join(command)}")
+        session = RTLSession(command)
+        start = time.perf_counter()
+        try:
+            for batch, words in session.run(batched(vectors, args.batch), args.depth):
+                report.add(batch, words)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            session.close()
+            return 2
+        session.close()
+        elapsed = time.perf_counter() - start
+
+    print_report(report, elapsed)
+    return 0 if report.failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Run the C++ testbench (test/cpp/alu_tb.cpp) on binary vectors, in parallel.
+
+The testbench's JSON reader spends most of an exhaustive run parsing text.
+This driver converts the vectors once to the fixed-width binary format
+(test/vector_io.py), which alu_tb mmaps, then splits the records into
+contiguous ranges and runs one `alu_tb --quiet --range START:STOP` per
+range. Each shard reports a SUMMARY line; the driver merges them.
+
+Vector sources:
+    (none)              exhaustive sweep straight from the batch_model tables
+    *.bin               used in place, no conversion
+    *.json / *.json.gz  converted to a temporary .bin (or --save-bin)
+
+Usage:
+    python3 tools/run_cpp_testbench.py                          # exhaustive
+    python3 tools/run_cpp_testbench.py --jobs 4 --save-bin /tmp/exhaustive.bin
+    python3 tools/run_cpp_testbench.py /tmp/exhaustive.bin
+    python3 tools/run_cpp_testbench.py test/vectors/demo.json --tb test/cpp/alu_tb
+"""
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+
+from batch_model import opcode_table
+from exhaustive_vectors import OPERATIONS, operand_pairs
+from run_vectors import load_vectors
+from vector_io import read_header, write_records, write_vectors
+
+TB_SOURCE = ROOT / "test" / "cpp" / "alu_tb.cpp"
+CXXFLAGS = ["-std=c++17", "-O3", "-Wall", "-Wextra"]
+SUMMARY = re.compile(r"SUMMARY total=(\d+) passed=(\d+) failed=(\d+) ms=(\d+)")
+
+
+def build_testbench(out_dir: Path) -> Path:
+    """Compile alu_tb.cpp with $CXX (default g++), as the Makefile does."""
+    compiler = os.environ.get("CXX", "g++")
+    if shutil.which(compiler) is None:
+        raise RuntimeError(f"{compiler} not found on PATH (set CXX or pass --tb)")
+    binary = out_dir / "alu_tb"
+    subprocess.run([compiler] + CXXFLAGS + [str(TB_SOURCE), "-o", str(binary)], check=True)
+    return binary
+
+
+def exhaustive_records(reduce_operands: bool = False) -> Iterator[Tuple[int, int, int, int, int]]:
+    """(opcode, A, B, result, flags) for the exhaustive sweep."""
+    for _, opcode, operands in OPERATIONS:
+        table = opcode_table(opcode)
+        value = int(opcode, 2)
+        for a, b in operand_pairs(operands, reduce_operands):
+            outcome = table[a << 8 | b]
+            yield value, a, b, outcome & 0xFF, outcome >> 8 & 0xF
+
+
+def prepare_vectors(paths: List[Path], out: Path, reduce_operands: bool) -> Path:
+    """Return a binary vector file for `paths`, converting into `out` if needed."""
+    if len(paths) == 1 and paths[0].suffix == ".bin":
+        return paths[0]
+    if any(path.suffix == ".bin" for path in paths):
+        raise ValueError("Binary files must be run on their own")
+    if paths:
+        write_vectors(out, load_vectors(paths))
+    else:
+        write_records(out, exhaustive_records(reduce_operands))
+    return out
+
+
+def shard_ranges(count: int, jobs: int) -> List[Tuple[int, int]]:
+    """Split [0, count) into at most `jobs` contiguous, near-equal ranges."""
+    jobs = max(1, min(jobs, count))
+    step, extra = divmod(count, jobs)
+    ranges = []
+    start = 0
+    for shard in range(jobs):
+        stop = start + step + (1 if shard < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def run_shards(binary: Path, vectors: Path, ranges: List[Tuple[int, int]]
+               ) -> List[Tuple[Tuple[int, int], Optional[Dict[str, int]], List[str]]]:
+    """Run all shards concurrently; returns (range, summary, other output lines)."""
+    processes = [
+        (span, subprocess.Popen([str(binary), "--quiet", "--range", f"{span[0]}:{span[1]}",
+                                 str(vectors)], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True))
+        for span in ranges
+    ]
+    results = []
+    for span, process in processes:
+        output, _ = process.communicate()
+        summary = None
+        lines = []
+        for line in output.splitlines():
+            match = SUMMARY.search(line)
+            if match:
+                summary = dict(zip(("total", "passed", "failed", "ms"), map(int, match.groups())))
+            elif line.strip():
+                lines.append(line)
+        results.append((span, summary, lines))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the C++ testbench on binary vectors in parallel.")
+    parser.add_argument("paths", nargs="*", type=Path,
+                        help="Vector files: one .bin, or JSON/JSON.gz (default: exhaustive sweep).")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Testbench processes (default: CPU count).")
+    parser.add_argument("--tb", type=Path, default=None,
+                        help="Prebuilt alu_tb binary (default: compile test/cpp/alu_tb.cpp).")
+    parser.add_argument("--save-bin", type=Path, default=None,
+                        help="Keep the converted binary vector file here.")
+    parser.add_argument("--reduce-operands", action="store_true",
+                        help="Exhaustive source: sweep only the operands each opcode uses.")
+    parser.add_argument("--max-failures", type=int, default=20,
+                        help="Failure report lines to print (default: 20).")
+    args = parser.parse_args()
+
+    if args.jobs <= 0:
+        parser.error("--jobs must be positive")
+
+    with tempfile.TemporaryDirectory(prefix="alu_tb_") as work:
+        work_dir = Path(work)
+        try:
+            binary = args.tb or build_testbench(work_dir)
+            start = time.perf_counter()
+            vectors = prepare_vectors(args.paths, args.save_bin or work_dir / "vectors.bin",
+                                      args.reduce_operands)
+            prepare_time = time.perf_counter() - start
+            _, _, count = read_header(vectors)
+        except (RuntimeError, ValueError, subprocess.CalledProcessError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+
+        ranges = shard_ranges(count, args.jobs)
+        print(f"Vectors: {count:,} from {vectors} (prepared in {prepare_time:.2f}s)")
+        print(f"Shards:  {len(ranges)} x {binary}")
+
+        start = time.perf_counter()
+        results = run_shards(binary, vectors, ranges) if count else []
+        wall = time.perf_counter() - start
+
+    totals = {"total": 0, "passed": 0, "failed": 0}
+    printed = 0
+    broken = 0
+    print()
+    for (first, last), summary, lines in results:
+        if summary is None:
+            broken += 1
+            print(f"  [{first:>9,}, {last:>9,})  no summary (testbench crashed?)")
+            lines = lines[-5:]
+        else:
+            for key in totals:
+                totals[key] += summary[key]
+            print(f"  [{first:>9,}, {last:>9,})  {summary['passed']:>9,} passed  "
+                  f"{summary['failed']:>7,} failed  {summary['ms']:>6} ms")
+        for line in lines:
+            if printed < args.max_failures:
+                print(f"    {line}")
+                printed += 1
+
+    rate = totals["total"] / wall if wall else 0.0
+    print(f"\nChecked: {totals['total']:,} in {wall:.2f}s wall ({rate:,.0f} vectors/s)")
+    print(f"Passed:  {totals['passed']:,}")
+    print(f"Failed:  {totals['failed']:,}")
+    if broken or totals["total"] != count:
+        print(f"Error: {broken} shard(s) did not report; {count - totals['total']:,} vectors unchecked")
+        return 2
+    return 0 if totals["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
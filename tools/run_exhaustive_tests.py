@@ -2,33 +2,53 @@
 """
 Exhaustive ALU Test Runner - On-Demand Generation
 Runs 1.2M+ test vectors without loading any files.
+
+Other operand widths (--width 4 16 32) use the same golden model. Widths too
+wide to sweep exhaustively are sampled (corner cases plus stratified or
+random pairs, see test/sweep_strategies.py): either a fixed --samples count
+per opcode, or a --budget in seconds split across the widths.
 """
 
+import argparse
+import itertools
 import sys
+import time
 from pathlib import Path
 
 # Add test directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "test"))
 
-from exhaustive_vectors import generate_exhaustive_vectors, count_vectors
+from exhaustive_vectors import generate_exhaustive_vectors, count_vectors, ignored_operand_samples
+from sweep_strategies import SAMPLERS, plan_sweeps, plan_width, sweep_vectors
 sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
 from run_tests import SimulatedALUHardware, OpcodeStats, print_header, print_table_header, print_row
 
-def main():
-    print_header()
-    print("Running EXHAUSTIVE tests (1,245,184 vectors generated on-demand)")
-    
-    hw = SimulatedALUHardware()
-    total_vectors = count_vectors()
-    op_stats = {}
-    
+# Refuse exhaustive sweeps larger than this without --samples/--budget
+MAX_EXHAUSTIVE_VECTORS = 20_000_000
+
+
+def measure_rate(hw, width, seconds=0.25):
+    """Vectors per second this runner generates and checks at `width`."""
+    vectors = sweep_vectors(width, 1 << 20, seed=-1)
+    count = 0
+    start = time.perf_counter()
+    for test in itertools.islice(vectors, 200000):
+        hw.evaluate(test)
+        count += 1
+        if count % 500 == 0 and time.perf_counter() - start >= seconds:
+            break
+    return count / (time.perf_counter() - start)
+
+
+def run_sweep(hw, vectors, total_vectors, op_stats):
+    """Check a vector stream, updating op_stats; returns (passed, failed)."""
     total_passed = 0
     total_failed = 0
     update_interval = max(1, total_vectors // 1000)
     
     sys.stdout.write(f"Executing {total_vectors:,} tests...\n")
     
-    for i, test in enumerate(generate_exhaustive_vectors()):
+    for i, test in enumerate(vectors):
         code = str(test.get("opcode", "UNKNOWN")).strip()
         name = hw.get_op_name(code)
         
@@ -49,14 +69,86 @@ def main():
             sys.stdout.flush()
     
     sys.stdout.write("\n\n")
+    return total_passed, total_failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run exhaustive ALU test vectors.")
+    parser.add_argument("--reduce-operands", action="store_true",
+                        help="Skip sweeping operands the opcode ignores (INC, shifts, PASS, NOT).")
+    parser.add_argument("--witness-samples", type=int, default=0,
+                        help="With --reduce-operands, extra sweeps proving the ignored operand has no effect.")
+    parser.add_argument("--width", type=int, nargs="+", default=[8],
+                        help="Operand width(s) in bits (default: 8).")
+    parser.add_argument("--samples", type=int, default=None,
+                        help="Vectors per opcode; opcodes that fit are still swept exhaustively.")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Time budget in seconds; picks exhaustive or sampled sweeps per width.")
+    parser.add_argument("--sampler", choices=SAMPLERS, default="stratified",
+                        help="Sampling strategy above the exhaustive limit (default: stratified).")
+    parser.add_argument("--seed", type=int, default=0, help="Sampling seed (default: 0).")
+    args = parser.parse_args()
+    
+    widths = sorted(set(args.width))
+    if widths[0] < 2 or widths[-1] > 64:
+        parser.error("--width must be between 2 and 64")
+    if args.witness_samples and not args.reduce_operands:
+        parser.error("--witness-samples requires --reduce-operands")
+    witness_limit = min(len(ignored_operand_samples(width)) for width in widths)
+    if not 0 <= args.witness_samples <= witness_limit:
+        parser.error(f"--witness-samples must be between 0 and {witness_limit}")
+    
+    if args.budget is not None:
+        rate = measure_rate(SimulatedALUHardware(widths[-1]), widths[-1])
+        plans = plan_sweeps(widths, args.budget, rate, args.reduce_operands)
+    elif args.samples is not None:
+        plans = [plan_width(width, args.samples, args.reduce_operands) for width in widths]
+    else:
+        plans = [plan_width(width, 1 << (2 * width), args.reduce_operands) for width in widths]
+        too_wide = [plan.width for plan in plans if plan.vectors > MAX_EXHAUSTIVE_VECTORS]
+        if too_wide:
+            parser.error(f"width {too_wide[0]} is too wide to sweep exhaustively; "
+                         "pass --samples or --budget")
+    
+    print_header()
+    if args.budget is not None:
+        print(f"Budget: {args.budget:g}s at ~{rate:,.0f} vectors/s")
+    
+    op_stats = {}
+    total_passed = 0
+    total_failed = 0
+    start = time.perf_counter()
+    for plan in plans:
+        hw = SimulatedALUHardware(plan.width)
+        if plan.exhaustive:
+            total_vectors = count_vectors(args.reduce_operands, args.witness_samples, plan.width)
+            mode = "operand-reduced" if args.reduce_operands else "EXHAUSTIVE"
+            vectors = generate_exhaustive_vectors(args.reduce_operands, args.witness_samples,
+                                                  plan.width)
+        else:
+            total_vectors = plan.vectors
+            mode = f"SAMPLED ({args.sampler}, {plan.samples:,}/opcode + corners)"
+            vectors = sweep_vectors(plan.width, plan.samples, args.sampler, args.seed,
+                                    args.reduce_operands)
+        width_label = "" if len(plans) == 1 and plan.width == 8 else f"{plan.width}-bit "
+        print(f"Running {width_label}{mode} tests ({total_vectors:,} vectors generated on-demand)")
+        
+        width_stats = {}
+        passed, failed = run_sweep(hw, vectors, total_vectors, width_stats)
+        total_passed += passed
+        total_failed += failed
+        for code, stats in width_stats.items():
+            op_stats[(plan.width, code)] = stats
     
     # Print Report Table
-    print_table_header()
-    sorted_codes = sorted(op_stats.keys())
-    for code in sorted_codes:
-        stats = op_stats[code]
-        print_row(code, stats.name, stats.passed + stats.failed, stats.passed, stats.failed)
-    print("\n")
+    for plan in plans:
+        if len(plans) > 1 or plan.width != 8:
+            print(f"{plan.width}-bit:")
+        print_table_header()
+        for (width, code), stats in sorted(op_stats.items()):
+            if width == plan.width:
+                print_row(code, stats.name, stats.passed + stats.failed, stats.passed, stats.failed)
+        print("\n")
     
     # Final Summary
     print(f"{'='*80}")
@@ -65,6 +157,8 @@ def main():
     print(f"Total Tests Run: {total_passed + total_failed:,}")
     print(f"Passed:          {total_passed:,} ({(total_passed/(total_passed+total_failed) if total_passed+total_failed else 0)*100:.1f}%)")
     print(f"Failed:          {total_failed:,}")
+    if args.budget is not None:
+        print(f"Elapsed:         {time.perf_counter() - start:.1f}s of {args.budget:g}s budget")
     print(f"{'='*80}\n")
     
     return 0 if total_failed == 0 else 1
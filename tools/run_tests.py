@@ -60,47 +60,48 @@ def print_row(opcode, operation, total, passed, failed):
 # --- Hardware Model ---
 
 class ALU8Bit:
-    """Software simulation of 8-bit ALU (Golden Model)"""
+    """Software simulation of the ALU (Golden Model), 8-bit unless `width` says otherwise"""
     
-    def __init__(self):
-        self.width = 8
+    def __init__(self, width: int = 8):
+        self.width = width
         self.mask = (1 << self.width) - 1
+        self.sign = 1 << (self.width - 1)
         
     def _flags(self, result: int, carry: bool = False, overflow: bool = False) -> Dict[str, bool]:
-        result_8bit = result & self.mask
+        result_masked = result & self.mask
         return {
             'carry': carry,
-            'zero': result_8bit == 0,
+            'zero': result_masked == 0,
             'overflow': overflow,
-            'negative': bool(result_8bit & 0x80)
+            'negative': bool(result_masked & self.sign)
         }
     
     def add(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         result = a + b
         carry = result > self.mask
-        overflow = ((a & 0x80) == (b & 0x80)) and ((a & 0x80) != (result & 0x80))
+        overflow = ((a & self.sign) == (b & self.sign)) and ((a & self.sign) != (result & self.sign))
         return result & self.mask, self._flags(result, carry, overflow)
     
     def sub(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         result = a - b
         carry = result >= 0
-        overflow = ((a & 0x80) != (b & 0x80)) and ((a & 0x80) != (result & 0x80))
+        overflow = ((a & self.sign) != (b & self.sign)) and ((a & self.sign) != (result & self.sign))
         return result & self.mask, self._flags(result, carry, overflow)
     
     def inc_a(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         result = a + 1
         carry = result > self.mask
-        overflow = (a == 0x7F)
+        overflow = (a == self.sign - 1)
         return result & self.mask, self._flags(result, carry, overflow)
     
     def dec_a(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         result = a - 1
         carry = result >= 0
-        overflow = (a == 0x80)
+        overflow = (a == self.sign)
         return result & self.mask, self._flags(result, carry, overflow)
     
     def lsl(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
-        carry = bool(a & 0x80)
+        carry = bool(a & self.sign)
         result = (a << 1) & self.mask
         return result, self._flags(result, carry, False)
     
@@ -111,15 +112,15 @@ class ALU8Bit:
     
     def asr(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         carry = bool(a & 0x01)
-        sign_bit = a & 0x80
+        sign_bit = a & self.sign
         result = ((a >> 1) | sign_bit) & self.mask
         return result, self._flags(result, carry, False)
     
     def rev_a(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         result = 0
-        for i in range(8):
+        for i in range(self.width):
             if a & (1 << i):
-                result |= (1 << (7 - i))
+                result |= (1 << (self.width - 1 - i))
         return result, self._flags(result, False, False)
     
     def nand(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
@@ -155,7 +156,7 @@ class ALU8Bit:
     def cmp(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
         result = a - b
         carry = result >= 0
-        overflow = ((a & 0x80) != (b & 0x80)) and ((a & 0x80) != (result & 0x80))
+        overflow = ((a & self.sign) != (b & self.sign)) and ((a & self.sign) != (result & self.sign))
         return 0, self._flags(result, carry, overflow)
     
     def not_a(self, a: int, b: int) -> Tuple[int, Dict[str, bool]]:
@@ -167,8 +168,8 @@ class ALU8Bit:
         return result, self._flags(result, False, False)
 
 class SimulatedALUHardware:
-    def __init__(self):
-        self.alu = ALU8Bit()
+    def __init__(self, width: int = 8):
+        self.alu = ALU8Bit(width)
         self.ops = {
             "00000": ("ADD", self.alu.add),
             "00001": ("SUB", self.alu.sub),
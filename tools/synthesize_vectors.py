@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Synthesize a minimal high-coverage vector set for slow hardware runs.
+
+Every vector on the real board costs a GPIO round trip (DELAY_US in
+tools/hardware_test/pico_alu_test.py), so instead of the 1,245,184-vector
+exhaustive suite this picks the smallest set it can that reaches a target
+coverage of the following goals, all computed exhaustively from the golden
+model so only reachable goals count:
+
+Per opcode
+- Every goal of tools/vector_coverage.py: NZCV combinations, carry-chain
+  lengths 0..8 (adder opcodes), input and result bit values. A result bit
+  seen at value x is exactly "OUT[i] stuck-at-(not x) detected".
+- Stuck-at-0/1 on each used A and B input bit: detected when the vector
+  drives the bit to the other value *and* that changes the observed outputs.
+- Stuck-at-0/1 on each flag output (only with --observe flags).
+
+Global
+- Stuck-at-0/1 on each opcode-select bit: detected when the faulty opcode is
+  a valid operation with different observed outputs for the same A/B.
+- Each A, B and opcode-select bit rising and falling between consecutive
+  vectors (closed after selection by ordering and a few appended vectors).
+
+By default only OUT[0..7] counts as observed, matching "Run Vector File" in
+tools/hardware_test/pico_alu_test.py, which does not read the flags. Fault
+goals that only the flags would reveal are reported separately and not
+credited; --observe flags credits them for benches that do check flags.
+
+Selection is lazy greedy set cover over all 1.2M candidate inputs.
+
+Usage:
+    python3 tools/synthesize_vectors.py --json hw.json --bin hw.bin
+    python3 tools/synthesize_vectors.py --target 95
+    python3 tools/synthesize_vectors.py --observe flags
+"""
+
+import argparse
+import heapq
+import math
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from batch_model import FLAG_SHIFT, opcode_table, unpack_outcome
+from exhaustive_vectors import OPERATIONS, operand_dependence
+from vector_coverage import (
+    GOAL_COUNT,
+    INPUT_TOGGLE_BITS,
+    ToggleTracker,
+    close_input_toggles,
+    goal_masks,
+    toggle_word,
+    write_json_vectors,
+)
+from vector_io import write_vectors
+
+# Fault goal layout, above the vector_coverage goals in the per-opcode mask.
+SA_A_BASE = GOAL_COUNT          # 16: A[i] stuck-at-v -> 2*i + v
+SA_B_BASE = GOAL_COUNT + 16     # 16: B[i] stuck-at-v
+SA_FLAG_BASE = GOAL_COUNT + 32  # 8: flag f stuck-at-v (carry, zero, overflow, negative)
+
+# Global goals: OP[k] stuck-at-v -> 2*k + v
+OPCODE_BITS = 5
+
+CATEGORIES = (
+    ("NZCV combinations", 0, 16),
+    ("Carry-chain lengths", 16, 9),
+    ("Input bit values", 25, 32),
+    ("Result bit values / OUT stuck-at", 57, 16),
+    ("A/B stuck-at", SA_A_BASE, 32),
+    ("Flag stuck-at", SA_FLAG_BASE, 8),
+)
+FAULT_CATEGORIES = ("A/B stuck-at", "Flag stuck-at")
+OBSERVE = ("out", "flags")
+
+
+def observed_table(opcode: str, observe_flags: bool):
+    """Outcome table reduced to what the bench compares: the result byte, plus flags if read."""
+    table = opcode_table(opcode)
+    return table if observe_flags else [packed & ((1 << FLAG_SHIFT) - 1) for packed in table]
+
+
+@lru_cache(maxsize=None)
+def fault_masks(opcode: str, observe_flags: bool = False) -> Tuple[int, ...]:
+    """Per-opcode stuck-at goals detected by each (A << 8) | B input."""
+    table = observed_table(opcode, observe_flags)
+    operands = operand_dependence(opcode)
+    masks = [0] * 65536
+
+    for operand, base, shift in (("A", SA_A_BASE, 8), ("B", SA_B_BASE, 0)):
+        if operand not in operands:
+            continue
+        for i in range(8):
+            flip = 1 << (shift + i)
+            # Driving the bit to 1 exposes stuck-at-0 and vice versa
+            stuck_at_0 = 1 << (base + 2 * i)
+            stuck_at_1 = 1 << (base + 2 * i + 1)
+            masks = [
+                mask | (stuck_at_0 if index & flip else stuck_at_1)
+                if table[index] != table[index ^ flip] else mask
+                for index, mask in enumerate(masks)
+            ]
+
+    if not observe_flags:
+        return tuple(masks)
+    flag_goals = [
+        sum(1 << (SA_FLAG_BASE + 2 * bit + (1 - (packed >> (FLAG_SHIFT + bit) & 1)))
+            for bit in range(4))
+        for packed in range(1 << 12)
+    ]
+    return tuple(mask | flag_goals[table[index]] for index, mask in enumerate(masks))
+
+
+@lru_cache(maxsize=None)
+def opcode_fault_masks(opcode: str, observe_flags: bool = False) -> Tuple[int, ...]:
+    """Opcode-select stuck-at goals detected by each (A << 8) | B input."""
+    valid = {code for _, code, _ in OPERATIONS}
+    table = observed_table(opcode, observe_flags)
+    value = int(opcode, 2)
+    masks = [0] * 65536
+    for k in range(OPCODE_BITS):
+        faulty = format(value ^ (1 << k), "05b")
+        if faulty not in valid:
+            continue
+        other = observed_table(faulty, observe_flags)
+        goal = 1 << (2 * k + (1 - (value >> k & 1)))
+        masks = [mask | goal if table[index] != other[index] else mask
+                 for index, mask in enumerate(masks)]
+    return tuple(masks)
+
+
+def candidates(opcode: str, observe_flags: bool = False) -> Dict[Tuple[int, int], int]:
+    """Distinct (local, global) goal masks of an opcode -> first input index."""
+    goals = goal_masks(opcode)
+    faults = fault_masks(opcode, observe_flags)
+    opcode_faults = opcode_fault_masks(opcode, observe_flags)
+    distinct: Dict[Tuple[int, int], int] = {}
+    for index in range(65536):
+        key = (goals[index] | faults[index], opcode_faults[index])
+        distinct.setdefault(key, index)
+    return distinct
+
+
+def flag_only_goals() -> List[Tuple[str, int]]:
+    """Fault goals per category that only a bench reading the flags can detect."""
+    counts = {name: 0 for name in FAULT_CATEGORIES}
+    global_out = global_flags = 0
+    for _, opcode, _ in OPERATIONS:
+        out = flags = 0
+        for mask in fault_masks(opcode, False):
+            out |= mask
+        for mask in fault_masks(opcode, True):
+            flags |= mask
+        for name, base, width in CATEGORIES:
+            if name in counts:
+                window = ((1 << width) - 1) << base
+                counts[name] += (flags & ~out & window).bit_count()
+        for mask in opcode_fault_masks(opcode, False):
+            global_out |= mask
+        for mask in opcode_fault_masks(opcode, True):
+            global_flags |= mask
+    return list(counts.items()) + [("Opcode-select stuck-at", (global_flags & ~global_out).bit_count())]
+
+
+def synthesize(target: float = 100.0,
+               observe_flags: bool = False) -> Tuple[List[Tuple[str, int, int]], Dict]:
+    """
+    Pick vectors by lazy greedy set cover until `target` percent of all
+    reachable goals are covered. Fault goals count only when visible on
+    OUT[0..7], or on the flags too with `observe_flags`. Returns (ordered
+    vectors, coverage stats).
+    """
+    opcodes = [code for _, code, _ in OPERATIONS]
+    pools = [candidates(opcode, observe_flags) for opcode in opcodes]
+
+    missing_local = []
+    missing_global = 0
+    for pool in pools:
+        reachable = 0
+        for local, global_ in pool:
+            reachable |= local
+            missing_global |= global_
+        missing_local.append(reachable)
+    reachable_local = list(missing_local)
+    reachable_global = missing_global
+
+    total = sum(mask.bit_count() for mask in missing_local) + missing_global.bit_count()
+    needed = math.ceil(total * target / 100)
+
+    heap = []
+    for position, pool in enumerate(pools):
+        for (local, global_), index in pool.items():
+            heap.append((-(local.bit_count() + global_.bit_count()), position, index, local, global_))
+    heapq.heapify(heap)
+
+    selected = []
+    covered = 0
+    while heap and covered < needed:
+        _, position, index, local, global_ = heapq.heappop(heap)
+        gain = (local & missing_local[position]).bit_count() + (global_ & missing_global).bit_count()
+        if gain == 0:
+            continue
+        if heap and gain < -heap[0][0]:
+            heapq.heappush(heap, (-gain, position, index, local, global_))
+            continue
+        selected.append((opcodes[position], index >> 8, index & 0xFF))
+        missing_local[position] &= ~local
+        missing_global &= ~global_
+        covered += gain
+
+    # Ascending opcode order toggles the low select bits both ways; the
+    # appended vectors close whatever input toggles remain.
+    selected.sort(key=lambda v: (v[0], v[1], v[2]))
+    toggles = ToggleTracker()
+    for vector in selected:
+        toggles.push(toggle_word(*vector))
+    if selected:
+        selected += close_input_toggles(toggles, selected[-1])
+
+    stats = {"total": total, "covered": covered, "categories": []}
+    for name, base, width in CATEGORIES:
+        if name == "Flag stuck-at" and not observe_flags:
+            continue
+        window = ((1 << width) - 1) << base
+        reach = sum((mask & window).bit_count() for mask in reachable_local)
+        hit = sum(((reach_mask & ~miss) & window).bit_count()
+                  for reach_mask, miss in zip(reachable_local, missing_local))
+        stats["categories"].append((name, hit, reach))
+    stats["categories"].append(("Opcode-select stuck-at",
+                                (reachable_global & ~missing_global).bit_count(),
+                                reachable_global.bit_count()))
+    missing_toggles = [bit for bit, _ in toggles.missing() if bit < INPUT_TOGGLE_BITS]
+    stats["categories"].append(("Input bits rising and falling",
+                                INPUT_TOGGLE_BITS - len(set(missing_toggles)),
+                                INPUT_TOGGLE_BITS))
+    return selected, stats
+
+
+def write_bin_vectors(path: Path, vectors: List[Tuple[str, int, int]]) -> None:
+    """Write (opcode, A, B) vectors with golden expectations in the binary format."""
+    names = {code: name for name, code, _ in OPERATIONS}
+    records = []
+    for opcode, a, b in vectors:
+        result, flags = unpack_outcome(opcode_table(opcode)[(a << 8) | b])
+        records.append({"test_name": names[opcode], "opcode": opcode, "A": a, "B": b,
+                        "expected_result": result, "expected_flags": flags})
+    write_vectors(path, records)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Synthesize a minimal high-coverage ALU vector set.")
+    parser.add_argument("--target", type=float, default=100.0,
+                        help="Percent of reachable goals to cover (default: 100).")
+    parser.add_argument("--json", type=Path, default=None,
+                        help="Write the vectors in the repo JSON schema.")
+    parser.add_argument("--bin", type=Path, default=None,
+                        help="Write the vectors in the compact binary format (test/vector_io.py).")
+    parser.add_argument("--observe", choices=OBSERVE, default="out",
+                        help="Outputs the bench checks: 'out' (result byte only, as on the Pico; "
+                             "default) or 'flags' (result byte and C/Z/V/N).")
+    args = parser.parse_args()
+
+    if not 0 < args.target <= 100:
+        parser.error("--target must be in (0, 100]")
+
+    print(f"Synthesizing vectors for {args.target:g}% of reachable goals...")
+    observe_flags = args.observe == "flags"
+    vectors, stats = synthesize(args.target, observe_flags)
+
+    print(f"\n{'Goal':<34} | {'Covered':>15}")
+    print(f"{'-'*35}+{'-'*17}")
+    for name, hit, reach in stats["categories"]:
+        print(f"{name:<34} | {hit:>6,}/{reach:<6,} {100 * hit / reach if reach else 100:>3.0f}%")
+    print(f"\n{len(vectors):,} vectors (vs 1,245,184 exhaustive) cover "
+          f"{stats['covered']:,}/{stats['total']:,} reachable goals")
+    if not observe_flags:
+        print("\nNot credited: fault goals only the flags reveal (use --observe flags if the bench reads them)")
+        for name, count in flag_only_goals():
+            print(f"  {name:<32} {count:>6,}")
+
+    if args.json is not None:
+        write_json_vectors(args.json, vectors, tag="HW")
+        print(f"Wrote {args.json}")
+    if args.bin is not None:
+        write_bin_vectors(args.bin, vectors)
+        print(f"Wrote {args.bin}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Throughput of an operation stream on the discrete ALU, from PPA.md delays.
+
+Each operation takes its own propagation delay (tools/op_timing.py), so a
+self-timed board finishes a stream in the sum of those delays, while a
+clocked board pays one period per operation. The estimator reports both,
+with the clock set by the slowest operation in the ISA (SUB, 475 ns) and by
+the slowest operation the stream actually uses, and the speedup
+data-dependent timing buys over each.
+
+Inputs are streamed into a per-opcode histogram, so memory does not grow
+with the trace:
+
+    *.txt / -        "OP A B" lines: cpu_sim.py --trace output or an
+                     alu_cli.py --batch file (OP is a CLI mnemonic, a
+                     golden-model name such as INC_A, or opcode bits)
+    *.bin            binary vectors (test/vector_io.py)
+    *.json/.json.gz  repo-schema vector files
+    --program FILE   run an assembly program on tools/cpu_sim.py; non-ALU
+                     instructions cost only --overhead-ns, self-timed and
+                     clocked alike
+
+Usage:
+    python3 tools/cpu_sim.py prog.asm --trace ops.txt
+    python3 tools/throughput_estimate.py ops.txt
+    python3 alu_cli.py --batch ops.txt --quiet     # same trace through the CLI
+    python3 tools/throughput_estimate.py test/vectors/demo.json --overhead-ns 50
+    python3 tools/throughput_estimate.py --program tools/programs/bubble_sort.asm
+"""
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from cpu_sim import (CANONICAL, DEFAULT_MAX_STEPS, MNEMONICS, Machine, assemble, format_time,
+                     parse_register_assignments)
+from op_timing import OP_LATENCY_NS, OPCODE_NAMES, WORST_LATENCY_NS
+from run_vectors import load_vectors
+from vector_io import read_vectors
+
+
+def operation_name(token: str) -> str:
+    """Golden-model name for a CLI mnemonic, golden name or opcode bits."""
+    token = token.upper()
+    name = MNEMONICS.get(token) or OPCODE_NAMES.get(token) or token
+    if name not in OP_LATENCY_NS:
+        raise ValueError(f"Unknown operation: {token}")
+    return name
+
+
+def trace_operations(handle: TextIO, source: str) -> Iterator[str]:
+    """Operation names from "OP A B" lines (blank lines and # comments skipped)."""
+    for number, line in enumerate(handle, 1):
+        fields = line.split("#", 1)[0].split()
+        if not fields:
+            continue
+        try:
+            yield operation_name(fields[0])
+        except ValueError as e:
+            raise ValueError(f"{source}:{number}: {e}") from None
+
+
+def vector_operations(vectors: Iterable[Dict], source: str) -> Iterator[str]:
+    """Operation names of vector records (numbered from 1 in errors)."""
+    for number, vector in enumerate(vectors, 1):
+        opcode = vector.get("opcode")
+        if opcode not in OPCODE_NAMES:
+            raise ValueError(f"{source}: vector {number}: unknown opcode {opcode!r}")
+        yield OPCODE_NAMES[opcode]
+
+
+def histogram(operations: Iterable[str], counts: Optional[Counter] = None) -> Counter:
+    """Count operations into `counts` (streaming; one counter per opcode)."""
+    counts = Counter() if counts is None else counts
+    for operation in operations:
+        counts[operation] += 1
+    return counts
+
+
+def count_file(path: str, counts: Counter) -> None:
+    if path == "-":
+        histogram(trace_operations(sys.stdin, "<stdin>"), counts)
+    elif path.endswith(".bin"):
+        histogram(vector_operations(read_vectors(path), path), counts)
+    elif path.endswith((".json", ".json.gz")):
+        histogram(vector_operations(load_vectors([Path(path)]), path), counts)
+    else:
+        with open(path) as handle:
+            histogram(trace_operations(handle, path), counts)
+
+
+def program_counts(path: Path, registers: Dict[int, int], max_steps: int) -> Tuple[Counter, int]:
+    """(ALU op histogram by golden name, non-ALU instructions) for a program run."""
+    instructions, labels = assemble(path.read_text())
+    machine = Machine(instructions, labels)
+    for index, value in registers.items():
+        machine.regs[index] = value
+    machine.run(max_steps)
+    golden = {mnemonic: name for name, mnemonic in CANONICAL.items()}
+    counts: Counter = Counter()
+    other = 0
+    for mnemonic, count in machine.op_counts().items():
+        name = golden.get(mnemonic, mnemonic)
+        if name in OP_LATENCY_NS:
+            counts[name] += count
+        else:
+            other += count
+    return counts, other
+
+
+def estimate(counts: Counter, other: int = 0, overhead_ns: float = 0.0) -> Dict[str, float]:
+    """
+    Total time in ns self-timed and clocked (ISA worst op, worst op used),
+    for `counts` ALU operations plus `other` non-ALU instructions. Every
+    instruction pays `overhead_ns`; only ALU operations pay an ALU delay
+    (their own, or the clock period's), so `other` costs the same in every
+    column.
+    """
+    alu_ops = sum(counts.values())
+    executed = alu_ops + other
+    used_worst = max((OP_LATENCY_NS[name] for name in counts), default=0.0)
+    return {
+        "executed": executed,
+        "self_timed": sum(OP_LATENCY_NS[name] * count for name, count in counts.items())
+                      + overhead_ns * executed,
+        "clocked_isa": WORST_LATENCY_NS * alu_ops + overhead_ns * executed,
+        "clocked_used": used_worst * alu_ops + overhead_ns * executed,
+        "period_isa": WORST_LATENCY_NS + overhead_ns,
+        "period_used": used_worst + overhead_ns,
+    }
+
+
+def print_report(counts: Counter, other: int, overhead_ns: float) -> None:
+    result = estimate(counts, other, overhead_ns)
+    executed = result["executed"]
+    self_timed = result["self_timed"]
+
+    print(f"{'Op':<6} {'Count':>12} {'Share':>7} {'t_pd (ns)':>9} {'Time':>12} {'Time %':>7}")
+    rows: List[Tuple[str, int, float]] = [
+        (CANONICAL.get(name, name), count, OP_LATENCY_NS[name]) for name, count in counts.items()
+    ]
+    if other:
+        rows.append(("other", other, 0.0))
+    for mnemonic, count, delay in sorted(rows, key=lambda row: -(row[1] * (row[2] + overhead_ns))):
+        time_ns = count * (delay + overhead_ns)
+        print(f"{mnemonic:<6} {count:>12,} {100.0 * count / executed:>6.1f}% {delay:>9.0f} "
+              f"{format_time(time_ns):>12} {100.0 * time_ns / self_timed if self_timed else 0:>6.1f}%")
+
+    print(f"\nOperations: {executed:,} (+{overhead_ns:g} ns/op overhead)")
+    print(f"  {'self-timed (per-op delay)':<44} {format_time(self_timed):>12}  "
+          f"{executed / self_timed * 1e3 if self_timed else 0:>8.2f} Mop/s")
+    for label, total, period in (
+            ("clocked at ISA worst op", result["clocked_isa"], result["period_isa"]),
+            ("clocked at worst op used", result["clocked_used"], result["period_used"])):
+        clock = f"{label} ({period:.0f} ns, {1e3 / period if period else 0:.2f} MHz)"
+        speedup = f"  speedup {total / self_timed:.2f}x" if self_timed else ""
+        print(f"  {clock:<44} {format_time(total):>12}  "
+              f"{executed / total * 1e3 if total else 0:>8.2f} Mop/s{speedup}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Estimate ALU throughput for an operation stream.")
+    parser.add_argument("paths", nargs="*",
+                        help="Traces (OP A B lines, - for stdin), .bin or JSON vector files.")
+    parser.add_argument("--program", type=Path, default=None,
+                        help="Assembly program to run on tools/cpu_sim.py instead.")
+    parser.add_argument("--reg", nargs="+", default=[], metavar="Rn=VALUE",
+                        help="Initial register values for --program.")
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS,
+                        help=f"Instruction limit for --program (default: {DEFAULT_MAX_STEPS:,}).")
+    parser.add_argument("--overhead-ns", type=float, default=0.0,
+                        help="Fixed time added to every operation (fetch, latch), in ns.")
+    args = parser.parse_args()
+
+    if args.paths and args.program:
+        parser.error("give trace/vector files or --program, not both")
+    if not args.paths and not args.program:
+        parser.error("give trace/vector files or --program")
+
+    other = 0
+    try:
+        if args.program:
+            counts, other = program_counts(args.program, parse_register_assignments(args.reg),
+                                           args.max_steps)
+        else:
+            counts = Counter()
+            for path in args.paths:
+                count_file(path, counts)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if not counts and not other:
+        print("No operations found")
+        return 1
+    print_report(counts, other, args.overhead_ns)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
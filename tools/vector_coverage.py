@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Coverage analyzer for ALU vector suites.
+
+Measures how much of the hardware-relevant behaviour a vector set exercises,
+per opcode:
+
+- Operand space:  distinct (A, B) pairs out of the pairs the opcode can tell
+                  apart (256 for unary opcodes, 65,536 otherwise)
+- Carry chains:   longest carry-propagation run (0-8 bits) through the adder,
+                  for every adder-based opcode (ADD, SUB, INC, DEC, CMP),
+                  with a histogram of vectors per chain length
+- NZCV:           every flag combination the opcode can actually produce
+- Bit values:     each used input bit and each result bit seen at 0 and at 1
+
+and, over the whole file in order, toggle coverage: whether every A, B,
+opcode, result and flag bit rises and falls between consecutive vectors.
+
+Gaps are reported against what is *reachable* (computed exhaustively from the
+golden model), and `--propose` greedily picks a small set of extra vectors
+that closes them.
+
+Usage:
+    python3 tools/vector_coverage.py                       # test/vectors/demo.json
+    python3 tools/vector_coverage.py test/add_sub.json test/logic_ops.json
+    python3 tools/vector_coverage.py --propose extra.json
+"""
+
+import argparse
+import copy
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+
+from batch_model import opcode_table
+from exhaustive_vectors import OPERATIONS, compute_alu_operation, operand_dependence
+from run_vectors import load_vectors
+
+# Adder inputs (second operand, carry-in) for opcodes that use the ripple-carry
+# adder. "B" is the B input as given, "~B" its complement; ints are constants.
+ADDER_OPERANDS = {
+    "00000": ("B", 0),      # ADD: A + B
+    "00001": ("~B", 1),     # SUB: A + ~B + 1
+    "00010": (0x00, 1),     # INC: A + 0 + 1
+    "00011": (0xFF, 0),     # DEC: A + 0xFF
+    "10000": ("~B", 1),     # CMP: A + ~B + 1
+}
+
+# Goal bit layout inside a per-opcode coverage mask.
+NZCV_BASE = 0           # 16 goals: flag combination n<<3 | z<<2 | c<<1 | v
+CHAIN_BASE = 16         # 9 goals: carry-chain length 0..8
+A_BIT_BASE = 25         # 16 goals: A bit i seen with value v -> 2*i + v
+B_BIT_BASE = 41         # 16 goals: B bit i seen with value v
+OUT_BIT_BASE = 57       # 16 goals: result bit i seen with value v
+GOAL_COUNT = 73
+
+# Per-value bit goals, so a vector's mask is a handful of lookups.
+_BIT_GOALS = tuple(
+    sum(1 << (2 * i + (value >> i & 1)) for i in range(8)) for value in range(256)
+)
+
+# Signals tracked for toggle coverage, as (name, width) packed LSB first.
+TOGGLE_SIGNALS = (("A", 8), ("B", 8), ("OP", 5), ("OUT", 8), ("C", 1), ("Z", 1), ("V", 1), ("N", 1))
+TOGGLE_WIDTH = sum(width for _, width in TOGGLE_SIGNALS)
+INPUT_TOGGLE_BITS = 21  # A, B and OP: the bits a test bench drives directly
+
+
+def carry_chain_length(opcode: str, a: int, b: int) -> int:
+    """Longest run of consecutive adder bits producing a carry-out (0-8)."""
+    operand, carry_in = ADDER_OPERANDS[opcode]
+    if operand == "B":
+        operand = b
+    elif operand == "~B":
+        operand = ~b & 0xFF
+    carries = ((a + operand + carry_in) ^ a ^ operand) >> 1
+    length = 0
+    while carries:
+        carries &= carries << 1
+        length += 1
+    return length
+
+
+def nzcv_index(flags: Dict[str, bool]) -> int:
+    return (flags["negative"] << 3 | flags["zero"] << 2
+            | flags["carry"] << 1 | flags["overflow"])
+
+
+def format_nzcv(index: int) -> str:
+    return "".join(name if index >> shift & 1 else "-" for name, shift in
+                   (("N", 3), ("Z", 2), ("C", 1), ("V", 0)))
+
+
+def _outcome_goals(packed: int) -> int:
+    """NZCV and result-bit goals of a packed `batch_model` outcome."""
+    carry, zero, overflow, negative = (packed >> 8 & 1, packed >> 9 & 1,
+                                       packed >> 10 & 1, packed >> 11 & 1)
+    nzcv = negative << 3 | zero << 2 | carry << 1 | overflow
+    return 1 << (NZCV_BASE + nzcv) | _BIT_GOALS[packed & 0xFF] << OUT_BIT_BASE
+
+
+def _operand_goals(opcode: str) -> Tuple[List[int], List[int]]:
+    """Input-bit goals per A value and per B value (zero for ignored operands)."""
+    operands = operand_dependence(opcode)
+    a_goals = [_BIT_GOALS[v] << A_BIT_BASE if "A" in operands else 0 for v in range(256)]
+    b_goals = [_BIT_GOALS[v] << B_BIT_BASE if "B" in operands else 0 for v in range(256)]
+    return a_goals, b_goals
+
+
+def vector_goals(opcode: str, a: int, b: int) -> int:
+    """Coverage mask of the static goals one vector hits."""
+    a_goals, b_goals = _operand_goals(opcode)
+    mask = _outcome_goals(opcode_table(opcode)[(a << 8) | b]) | a_goals[a] | b_goals[b]
+    if opcode in ADDER_OPERANDS:
+        mask |= 1 << (CHAIN_BASE + carry_chain_length(opcode, a, b))
+    return mask
+
+
+@lru_cache(maxsize=None)
+def goal_masks(opcode: str) -> Tuple[int, ...]:
+    """Goal mask for every (A << 8) | B input of an opcode."""
+    table = opcode_table(opcode)
+    a_goals, b_goals = _operand_goals(opcode)
+    outcome_goals = {packed: _outcome_goals(packed) for packed in set(table)}
+    masks = [outcome_goals[table[(a << 8) | b]] | a_goals[a] | b_goals[b]
+             for a in range(256) for b in range(256)]
+    if opcode in ADDER_OPERANDS:
+        masks = [mask | 1 << (CHAIN_BASE + carry_chain_length(opcode, index >> 8, index & 0xFF))
+                 for index, mask in enumerate(masks)]
+    return tuple(masks)
+
+
+@lru_cache(maxsize=None)
+def reachable_goals(opcode: str) -> int:
+    reachable = 0
+    for mask in goal_masks(opcode):
+        reachable |= mask
+    return reachable
+
+
+def toggle_word(opcode: str, a: int, b: int) -> int:
+    """Pack every toggle-tracked signal of one vector into a single int."""
+    result, flags = compute_alu_operation(opcode, a, b)
+    return (a | b << 8 | int(opcode, 2) << 16 | result << 21
+            | flags["carry"] << 29 | flags["zero"] << 30
+            | flags["overflow"] << 31 | flags["negative"] << 32)
+
+
+def toggle_bit_names() -> List[str]:
+    names = []
+    for signal, width in TOGGLE_SIGNALS:
+        names.extend([signal] if width == 1 else [f"{signal}[{i}]" for i in range(width)])
+    return names
+
+
+class ToggleTracker:
+    """Rise/fall history of every toggle-tracked bit over a vector sequence."""
+
+    def __init__(self):
+        self.rises = 0
+        self.falls = 0
+        self.last = None
+
+    def push(self, word: int) -> None:
+        if self.last is not None:
+            self.rises |= ~self.last & word
+            self.falls |= self.last & ~word
+        self.last = word
+
+    def missing(self) -> List[Tuple[int, str]]:
+        """(bit, direction) pairs that never occurred."""
+        return [(bit, direction) for bit in range(TOGGLE_WIDTH)
+                for direction, seen in (("rise", self.rises), ("fall", self.falls))
+                if not seen >> bit & 1]
+
+
+class CoverageReport:
+    """Coverage of an ordered vector sequence."""
+
+    def __init__(self):
+        self.vectors: Dict[str, int] = {}
+        self.pairs: Dict[str, set] = {}
+        self.covered: Dict[str, int] = {}
+        self.chains: Dict[str, List[int]] = {}  # adder opcode -> vectors per chain length 0..8
+        self.toggles = ToggleTracker()
+
+    def add(self, opcode: str, a: int, b: int) -> None:
+        a &= 0xFF
+        b &= 0xFF
+        self.vectors[opcode] = self.vectors.get(opcode, 0) + 1
+        self.pairs.setdefault(opcode, set()).add((a, b))
+        self.covered[opcode] = self.covered.get(opcode, 0) | goal_masks(opcode)[(a << 8) | b]
+        if opcode in ADDER_OPERANDS:
+            self.chains.setdefault(opcode, [0] * 9)[carry_chain_length(opcode, a, b)] += 1
+        self.toggles.push(toggle_word(opcode, a, b))
+
+    def gaps(self, opcode: str) -> int:
+        return reachable_goals(opcode) & ~self.covered.get(opcode, 0)
+
+
+def analyze(vectors: Sequence[Dict]) -> CoverageReport:
+    """Coverage of vectors in file order; unknown opcodes are skipped."""
+    known = {code for _, code, _ in OPERATIONS}
+    report = CoverageReport()
+    for vector in vectors:
+        opcode = str(vector.get("opcode", "")).strip()
+        if opcode in known:
+            report.add(opcode, int(vector.get("A", 0)), int(vector.get("B", 0)))
+    return report
+
+
+def _with_input_bit(vector: Tuple[str, int, int], bit: int, value: int) -> Tuple[str, int, int]:
+    """A copy of `vector` with one A/B/opcode toggle bit forced to `value`."""
+    opcode, a, b = vector
+    if bit < 8:
+        return opcode, a & ~(1 << bit) | value << bit, b
+    if bit < 16:
+        return opcode, a, b & ~(1 << (bit - 8)) | value << (bit - 8)
+    shift = bit - 16
+    opcode = next(code for _, code, _ in OPERATIONS if int(code, 2) >> shift & 1 == value)
+    return opcode, a, b
+
+
+def close_input_toggles(toggles: ToggleTracker,
+                        last: Tuple[str, int, int]) -> List[Tuple[str, int, int]]:
+    """
+    Vectors to append after `last` so every A, B and opcode bit both rises and
+    falls; `toggles` is updated as they are added.
+    """
+    extra = []
+    for bit, direction in toggles.missing():
+        if bit >= INPUT_TOGGLE_BITS:
+            continue
+        if (toggles.rises if direction == "rise" else toggles.falls) >> bit & 1:
+            continue  # closed by a vector added for an earlier bit
+        final = 1 if direction == "rise" else 0
+        values = (1 - final, final) if toggle_word(*last) >> bit & 1 == final else (final,)
+        for value in values:
+            last = _with_input_bit(last, bit, value)
+            extra.append(last)
+            toggles.push(toggle_word(*last))
+    return extra
+
+
+def propose_vectors(report: CoverageReport) -> List[Tuple[str, int, int]]:
+    """
+    Extra vectors, appended after the analyzed set, that close its gaps.
+
+    Static goals are closed by greedy set cover: repeatedly add the input that
+    covers the most remaining reachable goals of its opcode. Input toggles
+    still missing afterwards get a vector, or a pair, that drives the bit the
+    missing way. Output/flag toggles are only reported.
+    """
+    proposals = []
+    for _, opcode, _ in OPERATIONS:
+        missing = report.gaps(opcode)
+        masks = goal_masks(opcode)
+        while missing:
+            best_index = max(range(len(masks)), key=lambda i: (masks[i] & missing).bit_count())
+            proposals.append((opcode, best_index >> 8, best_index & 0xFF))
+            missing &= ~masks[best_index]
+
+    toggles = copy.copy(report.toggles)
+    for vector in proposals:
+        toggles.push(toggle_word(*vector))
+    if proposals:
+        last = proposals[-1]
+    elif toggles.last is not None:
+        last = (format(toggles.last >> 16 & 0x1F, "05b"), toggles.last & 0xFF,
+                toggles.last >> 8 & 0xFF)
+    else:
+        return proposals
+    return proposals + close_input_toggles(toggles, last)
+
+
+def print_report(report: CoverageReport) -> None:
+    print(f"{'Opcode':<7} | {'Operation':<9} | {'Vectors':>7} | {'Operands':>9} | "
+          f"{'NZCV':>5} | {'Chains':>6} | {'Bits':>5} | Gaps")
+    print(f"{'-'*8}+{'-'*11}+{'-'*9}+{'-'*11}+{'-'*7}+{'-'*8}+{'-'*7}+{'-'*30}")
+
+    for name, opcode, operands in OPERATIONS:
+        space = 256 * 256 if operands == "AB" else 256
+        if operands == "AB":
+            distinct = len(report.pairs.get(opcode, ()))
+        else:
+            index = 0 if operands == "A" else 1
+            distinct = len({pair[index] for pair in report.pairs.get(opcode, ())})
+        covered = report.covered.get(opcode, 0)
+        reachable = reachable_goals(opcode)
+
+        def ratio(base: int, count: int) -> str:
+            window = ((1 << count) - 1) << base
+            return f"{(covered & window).bit_count()}/{(reachable & window).bit_count()}"
+
+        gaps = report.gaps(opcode)
+        notes = [format_nzcv(i) for i in range(16) if gaps >> (NZCV_BASE + i) & 1]
+        notes += [f"chain={i}" for i in range(9) if gaps >> (CHAIN_BASE + i) & 1]
+        bit_gaps = (gaps >> A_BIT_BASE).bit_count()
+        if bit_gaps:
+            notes.append(f"{bit_gaps} bit value(s)")
+
+        chains = ratio(CHAIN_BASE, 9) if opcode in ADDER_OPERANDS else "-"
+        print(f"{opcode:<7} | {name:<9} | {report.vectors.get(opcode, 0):>7,} | "
+              f"{100 * distinct / space:>8.2f}% | {ratio(NZCV_BASE, 16):>5} | {chains:>6} | "
+              f"{ratio(A_BIT_BASE, 48):>5} | {', '.join(notes) or 'none'}")
+
+    print("\nCarry-chain lengths (vectors per length, '-' = unreachable):")
+    print(f"{'Opcode':<7} | {'Operation':<9} | " + " ".join(f"{length:>5}" for length in range(9)))
+    operation_names = {code: name for name, code, _ in OPERATIONS}
+    for opcode in ADDER_OPERANDS:
+        counts = report.chains.get(opcode, [0] * 9)
+        reachable = reachable_goals(opcode) >> CHAIN_BASE
+        cells = [f"{count:>5,}" if reachable >> length & 1 else f"{'-':>5}"
+                 for length, count in enumerate(counts)]
+        print(f"{opcode:<7} | {operation_names[opcode]:<9} | " + " ".join(cells))
+
+    missing: Dict[int, List[str]] = {}
+    for bit, direction in report.toggles.missing():
+        missing.setdefault(bit, []).append(direction)
+    names = toggle_bit_names()
+    print(f"\nToggle coverage: {TOGGLE_WIDTH - len(missing)}/{TOGGLE_WIDTH} signal bits "
+          f"rise and fall")
+    if missing:
+        print("  Missing: " + ", ".join(
+            f"{names[bit]} ({'/'.join(directions)})" for bit, directions in missing.items()))
+
+
+def write_json_vectors(path: Path, vectors: Sequence[Tuple[str, int, int]],
+                       tag: str = "COV") -> None:
+    """Write (opcode, A, B) vectors with golden expectations in the repo JSON schema."""
+    names = {code: name for name, code, _ in OPERATIONS}
+    tests = []
+    for opcode, a, b in vectors:
+        result, flags = compute_alu_operation(opcode, a, b)
+        tests.append({
+            "test_name": f"{names[opcode]}_{tag}_{a:02X}_{b:02X}",
+            "opcode": opcode,
+            "A": a,
+            "B": b,
+            "expected_result": result,
+            "expected_flags": flags,
+        })
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump({"tests": tests}, handle, indent=2)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Coverage analysis for ALU vector files.")
+    parser.add_argument("paths", nargs="*", type=Path,
+                        help="JSON/JSON.gz vector files (default: test/vectors/demo.json).")
+    parser.add_argument("--propose", type=Path, default=None,
+                        help="Write extra vectors closing all reachable gaps to this JSON file.")
+    args = parser.parse_args()
+
+    paths = args.paths or [ROOT / "test" / "vectors" / "demo.json"]
+    vectors = load_vectors(paths)
+    print(f"Coverage of {len(vectors):,} vectors from {len(paths)} file(s)\n")
+
+    report = analyze(vectors)
+    print_report(report)
+
+    proposals = propose_vectors(report)
+    print(f"\nClosing all reachable gaps needs {len(proposals)} extra vector(s).")
+    if args.propose is not None:
+        write_json_vectors(args.propose, proposals)
+        print(f"Wrote {args.propose}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
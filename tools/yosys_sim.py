@@ -0,0 +1,737 @@
+#!/usr/bin/env python3
+"""
+Bit-parallel simulator for the Yosys netlist of the formal ALU.
+
+The formal flow (sim/FPGA/formal/alu/model/design.ys) writes design.json with
+`write_jny -no-connections`, which is metadata only, so the netlist is read
+from the RTLIL it writes next to it (design.il). The hierarchy is flattened
+into single-bit nets, the word-level cells are levelized, and each net holds
+one lane word: a Python int whose bit i is the net's value for vector i.
+Every cell then costs a handful of big-int operations for a whole batch.
+
+The exhaustive sweep runs one 65,536-lane batch per opcode, lane (A << 8) | B
+as in `batch_model.opcode_table`, so the inputs are fixed bit patterns and
+the golden table is compared as lane words too, in-process with no external
+simulator. The design's own formal assertions ($check cells) are evaluated
+over the same lanes.
+
+Known ALU.sv differences (CMP Result, constant Overflow) are reported as in
+tools/rtl_cosim.py and only fail the run with --strict.
+
+Usage:
+    python3 tools/yosys_sim.py                          # all opcodes
+    python3 tools/yosys_sim.py --opcodes ADD SUB CMP --strict
+    python3 tools/yosys_sim.py --design other.il --top alu_formal --stats
+"""
+
+import argparse
+import re
+import sys
+import time
+from array import array
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "test"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from batch_model import FLAG_ORDER, opcode_table
+from exhaustive_vectors import OPERATIONS
+from export_hdl_vectors import resolve_opcodes
+from rtl_cosim import NAMES, is_known_difference
+
+DEFAULT_DESIGN = ROOT / "sim" / "FPGA" / "formal" / "alu" / "model" / "design.il"
+
+LANES = 1 << 16
+LANE_MASK = (1 << LANES) - 1
+
+# Golden-model field -> RTL signal (same pairing as rtl_cosim.unpack_response)
+FIELD_SIGNALS = {"result": "Result", "carry": "CarryOut", "zero": "Zero",
+                 "overflow": "Overflow", "negative": "Negative"}
+CHECK_CELLS = {"$check", "$assert", "$assume", "$cover"}
+
+Bit = object  # (wire name, index) before flattening, or a constant 0/1
+
+
+# ---------------------------------------------------------------------------
+# RTLIL reader
+# ---------------------------------------------------------------------------
+
+class Wire:
+    def __init__(self, name: str, width: int, offset: int, direction: Optional[str]):
+        self.name = name
+        self.width = width
+        self.offset = offset
+        self.direction = direction
+
+
+class Cell:
+    def __init__(self, kind: str, name: str):
+        self.kind = kind
+        self.name = name
+        self.params: Dict[str, object] = {}
+        self.connections: Dict[str, List[Bit]] = {}
+
+
+class Module:
+    def __init__(self, name: str):
+        self.name = name
+        self.top = False
+        self.wires: Dict[str, Wire] = {}
+        self.cells: List[Cell] = []
+        self.connections: List[Tuple[List[Bit], List[Bit]]] = []
+
+
+SIG_TOKEN = re.compile(r"\{|\}|\[\d+(?::\d+)?\]|\S+")
+CONSTANT = re.compile(r"(s?)(\d+)'([01xzm-]*)$")
+
+
+def parse_constant(token: str) -> List[int]:
+    """`8'10110000` (MSB first) or a plain 32-bit integer -> LSB-first bits; x/z read as 0."""
+    match = CONSTANT.match(token)
+    if match:
+        digits = match.group(3)
+        return [1 if digit == "1" else 0 for digit in reversed(digits)]
+    value = int(token)
+    return [value >> i & 1 for i in range(32)]
+
+
+def parse_sigspec(text: str, wires: Dict[str, Wire]) -> List[Bit]:
+    """RTLIL signal spec -> LSB-first list of (wire, index) and constant bits."""
+    tokens = SIG_TOKEN.findall(text)
+    position = 0
+
+    def parse_one() -> List[Bit]:
+        nonlocal position
+        token = tokens[position]
+        position += 1
+        if token == "{":
+            parts: List[List[Bit]] = []
+            while tokens[position] != "}":
+                parts.append(parse_one())
+            position += 1
+            # Concatenation lists the MSB part first
+            return [bit for part in reversed(parts) for bit in part]
+        if token[0] in "\\$":
+            wire = wires.get(token)
+            if wire is None:
+                raise ValueError(f"Unknown wire {token}")
+            bits: List[Bit] = [(token, i) for i in range(wire.width)]
+            if position < len(tokens) and tokens[position][0] == "[":
+                select = tokens[position][1:-1].split(":")
+                position += 1
+                high = int(select[0]) - wire.offset
+                low = int(select[-1]) - wire.offset
+                bits = bits[low:high + 1]
+            return bits
+        return list(parse_constant(token))
+
+    bits: List[Bit] = []
+    while position < len(tokens):
+        bits.extend(parse_one())
+    return bits
+
+
+def parse_param(text: str) -> object:
+    text = text.strip()
+    if text.startswith('"'):
+        return text[1:-1]
+    bits = parse_constant(text.split()[-1])
+    return sum(bit << i for i, bit in enumerate(bits))
+
+
+def parse_rtlil(text: str) -> Dict[str, Module]:
+    """Parse `write_rtlil` output into modules. Processes and memories are not supported."""
+    modules: Dict[str, Module] = {}
+    module: Optional[Module] = None
+    cell: Optional[Cell] = None
+    top_attribute = False
+    for number, line in enumerate(text.splitlines(), 1):
+        words = line.split(None, 1)
+        if not words or words[0].startswith("#"):
+            continue
+        keyword, rest = words[0], words[1] if len(words) > 1 else ""
+        if keyword == "attribute":
+            top_attribute = top_attribute or (module is None and rest.split()[0] == "\\top")
+        elif keyword == "module":
+            module = modules[rest.strip()] = Module(rest.strip())
+            module.top, top_attribute = top_attribute, False
+        elif module is None or keyword == "autoidx":
+            continue
+        elif keyword == "wire":
+            options = rest.split()
+            name, width, offset, direction = options[-1], 1, 0, None
+            for i, option in enumerate(options[:-1]):
+                if option == "width":
+                    width = int(options[i + 1])
+                elif option == "offset":
+                    offset = int(options[i + 1])
+                elif option in ("input", "output", "inout"):
+                    direction = option
+            module.wires[name] = Wire(name, width, offset, direction)
+        elif keyword == "cell":
+            kind, name = rest.split()
+            cell = Cell(kind, name)
+        elif keyword == "parameter" and cell is not None:
+            name, value = rest.split(None, 1)
+            if name in ("signed", "real"):
+                name, value = value.split(None, 1)
+            cell.params[name] = parse_param(value)
+        elif keyword == "connect":
+            if cell is not None:
+                port, spec = rest.split(None, 1)
+                cell.connections[port] = parse_sigspec(spec, module.wires)
+            else:
+                tokens = SIG_TOKEN.findall(rest)
+                split = _split_point(tokens)
+                module.connections.append((
+                    parse_sigspec(" ".join(tokens[:split]), module.wires),
+                    parse_sigspec(" ".join(tokens[split:]), module.wires)))
+        elif keyword == "end":
+            if cell is not None:
+                module.cells.append(cell)
+                cell = None
+            else:
+                module = None
+        elif keyword in ("process", "memory", "switch", "sync"):
+            raise ValueError(f"line {number}: '{keyword}' is not supported "
+                             "(run proc/memory before write_rtlil)")
+    return modules
+
+
+def _split_point(tokens: List[str]) -> int:
+    """Index where the second sigspec of a module-level `connect` starts."""
+    depth = 0
+    for i, token in enumerate(tokens):
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+        if depth == 0 and i + 1 < len(tokens) and tokens[i + 1][0] != "[":
+            return i + 1
+    raise ValueError(f"Malformed connect: {' '.join(tokens)}")
+
+
+# ---------------------------------------------------------------------------
+# Cell semantics on lane words
+# ---------------------------------------------------------------------------
+
+Lanes = List[int]
+
+
+def extend(bits: Lanes, width: int, signed: bool) -> Lanes:
+    if len(bits) >= width:
+        return bits[:width]
+    fill = bits[-1] if signed and bits else 0
+    return bits + [fill] * (width - len(bits))
+
+
+def ripple_add(a: Lanes, b: Lanes, carry: int) -> Lanes:
+    total = []
+    for x, y in zip(a, b):
+        half = x ^ y
+        total.append(half ^ carry)
+        carry = (x & y) | (carry & half)
+    return total
+
+
+def any_set(bits: Lanes) -> int:
+    word = 0
+    for bit in bits:
+        word |= bit
+    return word
+
+
+def _signed(p: dict, *ports: str) -> bool:
+    return all(p.get(f"\\{port}_SIGNED", 0) for port in ports)
+
+
+def _operands(p: dict, ins: Dict[str, Lanes], width: int) -> Tuple[Lanes, Lanes]:
+    signed = _signed(p, "A", "B")
+    return extend(ins["\\A"], width, signed), extend(ins["\\B"], width, signed)
+
+
+def _flag(word: int, width: int) -> Lanes:
+    return [word] + [0] * (width - 1)
+
+
+def _less(p: dict, ins: Dict[str, Lanes], mask: int) -> int:
+    """Lanes where A < B: sign of A - B computed one bit wider."""
+    width = max(p["\\A_WIDTH"], p["\\B_WIDTH"]) + 1
+    a, b = _operands(p, ins, width)
+    return ripple_add(a, [bit ^ mask for bit in b], mask)[-1]
+
+
+def _greater(p: dict, ins: Dict[str, Lanes], mask: int) -> int:
+    return _less(p, {"\\A": ins["\\B"], "\\B": ins["\\A"]}, mask)
+
+
+def _equal(p: dict, ins: Dict[str, Lanes], mask: int) -> int:
+    a, b = _operands(p, ins, max(p["\\A_WIDTH"], p["\\B_WIDTH"]))
+    return any_set([x ^ y for x, y in zip(a, b)]) ^ mask
+
+
+def _bitwise(op: Callable[[int, int], int], invert: bool = False):
+    def evaluate(p, ins, mask):
+        a, b = _operands(p, ins, p["\\Y_WIDTH"])
+        return [op(x, y) ^ mask if invert else op(x, y) for x, y in zip(a, b)]
+    return evaluate
+
+
+def _reduce(op: Callable[[int, int], int], start: int, invert: bool = False):
+    def evaluate(p, ins, mask):
+        word = mask if start else 0
+        for bit in ins["\\A"]:
+            word = op(word, bit)
+        return _flag(word ^ mask if invert else word, p["\\Y_WIDTH"])
+    return evaluate
+
+
+def _arith(subtract: bool):
+    def evaluate(p, ins, mask):
+        a, b = _operands(p, ins, p["\\Y_WIDTH"])
+        if subtract:
+            return ripple_add(a, [bit ^ mask for bit in b], mask)
+        return ripple_add(a, b, 0)
+    return evaluate
+
+
+def _mux(p, ins, mask):
+    select = ins["\\S"][0]
+    keep = select ^ mask
+    return [(x & keep) | (y & select) for x, y in zip(ins["\\A"], ins["\\B"])]
+
+
+def _pmux(p, ins, mask):
+    width, selects, cases = p["\\WIDTH"], ins["\\S"], ins["\\B"]
+    keep = any_set(selects) ^ mask
+    out = []
+    for j, default in enumerate(ins["\\A"]):
+        word = default & keep
+        for i, select in enumerate(selects):
+            word |= cases[i * width + j] & select
+        out.append(word)
+    return out
+
+
+def _compare(fn: Callable[[dict, Dict[str, Lanes], int], int], invert: bool = False):
+    def evaluate(p, ins, mask):
+        word = fn(p, ins, mask)
+        return _flag(word ^ mask if invert else word, p["\\Y_WIDTH"])
+    return evaluate
+
+
+CELL_TYPES: Dict[str, Callable[[dict, Dict[str, Lanes], int], Lanes]] = {
+    "$not": lambda p, ins, mask: [bit ^ mask for bit in
+                                  extend(ins["\\A"], p["\\Y_WIDTH"], _signed(p, "A"))],
+    "$pos": lambda p, ins, mask: extend(ins["\\A"], p["\\Y_WIDTH"], _signed(p, "A")),
+    "$neg": lambda p, ins, mask: ripple_add(
+        [0] * p["\\Y_WIDTH"],
+        [bit ^ mask for bit in extend(ins["\\A"], p["\\Y_WIDTH"], _signed(p, "A"))], mask),
+    "$and": _bitwise(lambda x, y: x & y),
+    "$or": _bitwise(lambda x, y: x | y),
+    "$xor": _bitwise(lambda x, y: x ^ y),
+    "$xnor": _bitwise(lambda x, y: x ^ y, invert=True),
+    "$add": _arith(subtract=False),
+    "$sub": _arith(subtract=True),
+    "$eq": _compare(_equal),
+    "$eqx": _compare(_equal),
+    "$ne": _compare(_equal, invert=True),
+    "$nex": _compare(_equal, invert=True),
+    "$lt": _compare(_less),
+    "$ge": _compare(_less, invert=True),
+    "$gt": _compare(_greater),
+    "$le": _compare(_greater, invert=True),
+    "$reduce_and": _reduce(lambda w, b: w & b, start=1),
+    "$reduce_or": _reduce(lambda w, b: w | b, start=0),
+    "$reduce_bool": _reduce(lambda w, b: w | b, start=0),
+    "$reduce_xor": _reduce(lambda w, b: w ^ b, start=0),
+    "$reduce_xnor": _reduce(lambda w, b: w ^ b, start=0, invert=True),
+    "$logic_not": _reduce(lambda w, b: w | b, start=0, invert=True),
+    "$logic_and": lambda p, ins, mask: _flag(any_set(ins["\\A"]) & any_set(ins["\\B"]),
+                                             p["\\Y_WIDTH"]),
+    "$logic_or": lambda p, ins, mask: _flag(any_set(ins["\\A"]) | any_set(ins["\\B"]),
+                                            p["\\Y_WIDTH"]),
+    "$mux": _mux,
+    "$pmux": _pmux,
+}
+
+
+# ---------------------------------------------------------------------------
+# Flattened, levelized netlist
+# ---------------------------------------------------------------------------
+
+def display_name(name: str) -> str:
+    return name[1:] if name.startswith("\\") else name
+
+
+class Netlist:
+    """
+    A flattened design: single-bit nets (0 and 1 are the constants), cells in
+    level order, and the formal check cells. `signals` maps hierarchical
+    names ("Result", "u_alu.temp_result") to LSB-first net lists.
+    """
+
+    def __init__(self, modules: Dict[str, Module], top: Optional[str] = None):
+        if top is None:
+            tops = [m for m in modules.values() if m.top] or list(modules.values())[-1:]
+            if not tops:
+                raise ValueError("No modules in design")
+            top_module = tops[0]
+        else:
+            top_module = modules.get(top) or modules.get("\\" + top)
+            if top_module is None:
+                raise ValueError(f"Unknown module {top}")
+        self.top = display_name(top_module.name)
+        self.modules = modules
+        self._parent: List[int] = [0, 1]
+        self.signals: Dict[str, List[int]] = {}
+        self.inputs: Dict[str, List[int]] = {}
+        raw_cells: List[Tuple[str, Cell, Dict[str, List[int]]]] = []
+        self._instantiate(top_module, "", None, raw_cells)
+
+        find = self._find
+        self.signals = {name: [find(n) for n in nets] for name, nets in self.signals.items()}
+        self.inputs = {name: [find(n) for n in nets] for name, nets in self.inputs.items()}
+        self.cells: List[Tuple[str, Cell, Dict[str, List[int]]]] = []
+        self.checks: List[Tuple[str, str, int, int]] = []
+        for path, cell, ports in raw_cells:
+            ports = {port: [find(n) for n in nets] for port, nets in ports.items()}
+            if cell.kind in CHECK_CELLS:
+                flavor = cell.params.get("\\FLAVOR", cell.kind[1:])
+                self.checks.append((path, flavor, ports["\\A"][0], ports["\\EN"][0]))
+            elif cell.kind not in CELL_TYPES:
+                raise ValueError(f"Unsupported cell type {cell.kind} ({path})")
+            else:
+                self.cells.append((path, cell, ports))
+        self.net_count = len(self._parent)
+        self.levels = self._levelize()
+
+    # -- flattening --------------------------------------------------------
+
+    def _new_net(self) -> int:
+        self._parent.append(len(self._parent))
+        return len(self._parent) - 1
+
+    def _find(self, net: int) -> int:
+        parent = self._parent
+        while parent[net] != net:
+            parent[net] = parent[parent[net]]
+            net = parent[net]
+        return net
+
+    def _union(self, a: int, b: int) -> None:
+        a, b = self._find(a), self._find(b)
+        if a != b:
+            if a <= 1 and b <= 1:
+                raise ValueError("Constant 0 shorted to constant 1")
+            # The lower id wins, so a constant stays the root of its set
+            self._parent[max(a, b)] = min(a, b)
+
+    def _instantiate(self, module: Module, prefix: str,
+                     ports: Optional[Dict[str, List[int]]], cells: list) -> None:
+        nets: Dict[str, List[int]] = {}
+        for name, wire in module.wires.items():
+            nets[name] = [self._new_net() for _ in range(wire.width)]
+            self.signals[prefix + display_name(name)] = nets[name]
+            if ports is None and wire.direction == "input":
+                self.inputs[display_name(name)] = nets[name]
+            if ports is not None and name in ports:
+                for inner, outer in zip(nets[name], ports[name]):
+                    self._union(inner, outer)
+
+        def resolve(bits: List[Bit]) -> List[int]:
+            return [bit if isinstance(bit, int) else nets[bit[0]][bit[1]] for bit in bits]
+
+        for lhs, rhs in module.connections:
+            for a, b in zip(resolve(lhs), resolve(rhs)):
+                self._union(a, b)
+        for cell in module.cells:
+            path = prefix + display_name(cell.name)
+            connections = {port: resolve(bits) for port, bits in cell.connections.items()}
+            child = self.modules.get(cell.kind)
+            if child is not None:
+                self._instantiate(child, path + ".", connections, cells)
+            else:
+                cells.append((path, cell, connections))
+
+    # -- levelization ------------------------------------------------------
+
+    def _levelize(self) -> int:
+        """Order cells so every input is computed first; returns the logic depth."""
+        driver: Dict[int, int] = {}
+        for index, (path, _, ports) in enumerate(self.cells):
+            for net in ports["\\Y"]:
+                if net <= 1 or net in driver:
+                    raise ValueError(f"Net driven twice or constant driven by {path}")
+                driver[net] = index
+        waiting = [0] * len(self.cells)
+        readers: Dict[int, List[int]] = defaultdict(list)
+        for index, (_, _, ports) in enumerate(self.cells):
+            sources = {driver[net] for port, nets in ports.items() if port != "\\Y"
+                       for net in nets if net in driver}
+            waiting[index] = len(sources)
+            for source in sources:
+                readers[source].append(index)
+
+        level = [0] * len(self.cells)
+        ready = [index for index, count in enumerate(waiting) if count == 0]
+        order = []
+        while ready:
+            index = ready.pop()
+            order.append(index)
+            for reader in readers[index]:
+                level[reader] = max(level[reader], level[index] + 1)
+                waiting[reader] -= 1
+                if waiting[reader] == 0:
+                    ready.append(reader)
+        if len(order) != len(self.cells):
+            stuck = next(i for i, count in enumerate(waiting) if count)
+            raise ValueError(f"Combinational loop through {self.cells[stuck][0]}")
+        order.sort(key=level.__getitem__)
+        self.cells = [self.cells[index] for index in order]
+        driven = set(driver)
+        inputs = {net for nets in self.inputs.values() for net in nets}
+        self.undriven = sorted(
+            name for name, nets in self.signals.items()
+            if any(net > 1 and net not in driven and net not in inputs for net in nets))
+        return max(level, default=-1) + 1
+
+    # -- evaluation --------------------------------------------------------
+
+    def evaluate(self, inputs: Dict[str, Sequence[int]], mask: int) -> List[int]:
+        """
+        Evaluate one batch. `inputs` gives an LSB-first list of lane words per
+        input port; `mask` has one bit per lane. Undriven nets read as 0.
+        Returns the lane word of every net.
+        """
+        values = [0] * self.net_count
+        values[1] = mask
+        for name, nets in self.inputs.items():
+            words = inputs.get(name)
+            if words is None:
+                raise ValueError(f"No value for input {name}")
+            for net, word in zip(nets, words):
+                values[net] = word
+        for _, cell, ports in self.cells:
+            ins = {port: [values[net] for net in nets]
+                   for port, nets in ports.items() if port != "\\Y"}
+            for net, word in zip(ports["\\Y"], CELL_TYPES[cell.kind](cell.params, ins, mask)):
+                values[net] = word
+        return values
+
+    def signal(self, values: List[int], name: str) -> List[int]:
+        nets = self.signals.get(name)
+        if nets is None:
+            raise ValueError(f"No signal named {name}")
+        return [values[net] for net in nets]
+
+    def failed_checks(self, values: List[int], mask: int) -> Dict[str, int]:
+        """Lanes violating each assertion (lanes failing an assumption excluded)."""
+        allowed = mask
+        for _, flavor, a, enable in self.checks:
+            if flavor == "assume":
+                allowed &= ~(values[enable] & ~values[a])
+        return {path: values[enable] & ~values[a] & allowed
+                for path, flavor, a, enable in self.checks if flavor == "assert"}
+
+
+def load_netlist(path: Path, top: Optional[str] = None) -> Netlist:
+    return Netlist(parse_rtlil(path.read_text()), top)
+
+
+# ---------------------------------------------------------------------------
+# Exhaustive comparison with the golden model
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _bit_tables(bit: int) -> Tuple[bytes, ...]:
+    return tuple(bytes((value >> bit & 1) << r for value in range(256)) for r in range(8))
+
+
+def lane_word(data: bytes, bit: int) -> int:
+    """Lane word whose bit i is bit `bit` of data[i] (8 strided translates, no per-lane loop)."""
+    word = 0
+    for r, table in enumerate(_bit_tables(bit)):
+        word |= int.from_bytes(data[r::8].translate(table), "little")
+    return word
+
+
+@lru_cache(maxsize=None)
+def operand_lanes() -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """A and B lane words for the (A << 8) | B lane order."""
+    a_bytes = b"".join(bytes([a]) * 256 for a in range(256))
+    b_bytes = bytes(range(256)) * 256
+    return (tuple(lane_word(a_bytes, k) for k in range(8)),
+            tuple(lane_word(b_bytes, k) for k in range(8)))
+
+
+def golden_lanes(opcode: str) -> Dict[str, List[int]]:
+    """Golden outcome table of one opcode as lane words per field."""
+    table = opcode_table(opcode)
+    if sys.byteorder == "big":
+        table = array("H", table)
+        table.byteswap()
+    raw = table.tobytes()
+    low, high = raw[0::2], raw[1::2]
+    fields = {"result": [lane_word(low, k) for k in range(8)]}
+    for i, flag in enumerate(FLAG_ORDER):
+        fields[flag] = [lane_word(high, i)]
+    return fields
+
+
+def lane_value(words: Sequence[int], lane: int) -> int:
+    return sum((word >> lane & 1) << k for k, word in enumerate(words))
+
+
+class SimReport:
+    """Per-opcode mismatch counts per field, assertion failures and examples."""
+
+    def __init__(self, strict: bool = False, max_examples: int = 20):
+        self.strict = strict
+        self.max_examples = max_examples
+        self.vectors: Dict[int, int] = {}
+        self.mismatches: Dict[int, Dict[str, int]] = defaultdict(dict)
+        self.check_failures: Dict[str, int] = defaultdict(int)
+        self.failures = 0
+        self.examples: List[Tuple[int, int, int, int, int, List[str]]] = []
+
+    def add(self, opcode: int, expected: Dict[str, List[int]],
+            actual: Dict[str, List[int]], checks: Dict[str, int]) -> None:
+        self.vectors[opcode] = LANES
+        failing_lanes = 0
+        diffs = {}
+        for field in FIELD_SIGNALS:
+            diffs[field] = any_set([x ^ y for x, y in zip(expected[field], actual[field])])
+            self.mismatches[opcode][field] = diffs[field].bit_count()
+            if self.strict or not is_known_difference(opcode, field):
+                failing_lanes |= diffs[field]
+        for path, lanes in checks.items():
+            self.check_failures[path] += lanes.bit_count()
+            failing_lanes |= lanes
+        self.failures += failing_lanes.bit_count()
+
+        while failing_lanes and len(self.examples) < self.max_examples:
+            lane = (failing_lanes & -failing_lanes).bit_length() - 1
+            failing_lanes &= failing_lanes - 1
+            fields = [field for field, diff in diffs.items() if diff >> lane & 1]
+            fields += [display_name(path) for path, lanes in checks.items() if lanes >> lane & 1]
+            self.examples.append((opcode, lane >> 8, lane & 0xFF,
+                                  self._pack(expected, lane), self._pack(actual, lane), fields))
+
+    @staticmethod
+    def _pack(fields: Dict[str, List[int]], lane: int) -> int:
+        word = lane_value(fields["result"], lane)
+        for i, flag in enumerate(FLAG_ORDER):
+            word |= (fields[flag][0] >> lane & 1) << (8 + i)
+        return word
+
+    @property
+    def total(self) -> int:
+        return sum(self.vectors.values())
+
+
+def simulate(netlist: Netlist, opcodes: Optional[set], report: SimReport) -> None:
+    """Run every selected opcode as one 65,536-lane batch and record it in `report`."""
+    a_lanes, b_lanes = operand_lanes()
+    for _, code, _ in OPERATIONS:
+        if opcodes is not None and code not in opcodes:
+            continue
+        opcode = int(code, 2)
+        values = netlist.evaluate({
+            "A": a_lanes, "B": b_lanes,
+            "Opcode": [LANE_MASK if opcode >> k & 1 else 0 for k in range(5)],
+        }, LANE_MASK)
+        actual = {field: netlist.signal(values, name) for field, name in FIELD_SIGNALS.items()}
+        report.add(opcode, golden_lanes(code), actual, netlist.failed_checks(values, LANE_MASK))
+
+
+def print_report(netlist: Netlist, report: SimReport, elapsed: float) -> None:
+    fields = list(FIELD_SIGNALS)
+    print(f"\n{'Opcode':<8} {'Vectors':>9}  " + "  ".join(f"{f:>9}" for f in fields))
+    for opcode in sorted(report.vectors):
+        counts = report.mismatches[opcode]
+        cells = []
+        for field in fields:
+            count = counts.get(field, 0)
+            mark = "*" if count and is_known_difference(opcode, field) else " "
+            cells.append(f"{count:>8}{mark}")
+        print(f"{NAMES.get(opcode, format(opcode, '05b')):<8} {report.vectors[opcode]:>9,}  "
+              + "  ".join(cells))
+    print("  * known ALU.sv difference" + (" (counted: --strict)" if report.strict else ""))
+
+    asserts = sum(1 for _, flavor, _, _ in netlist.checks if flavor == "assert")
+    violated = {path: count for path, count in report.check_failures.items() if count}
+    print(f"\nAssertions: {asserts} evaluated, {len(violated)} violated")
+    for path, count in sorted(violated.items()):
+        print(f"  {display_name(path)}: {count:,} vectors")
+
+    for opcode, a, b, expected, actual, failing in report.examples:
+        print(f"[FAIL] {NAMES.get(opcode, opcode)} A=0x{a:02X} B=0x{b:02X}: "
+              f"{', '.join(failing)} (expected 0x{expected:03X}, RTL 0x{actual:03X})")
+
+    rate = report.total / elapsed if elapsed else 0.0
+    print(f"\nChecked: {report.total:,} in {elapsed:.2f}s ({rate:,.0f} vectors/s)")
+    print(f"Passed:  {report.total - report.failures:,}")
+    print(f"Failed:  {report.failures:,}")
+
+
+def print_stats(netlist: Netlist) -> None:
+    kinds: Dict[str, int] = defaultdict(int)
+    for _, cell, _ in netlist.cells:
+        kinds[cell.kind] += 1
+    print(f"Top: {netlist.top}  nets: {netlist.net_count:,}  cells: {len(netlist.cells)}  "
+          f"levels: {netlist.levels}  checks: {len(netlist.checks)}")
+    print("  " + ", ".join(f"{kind} {count}" for kind, count in sorted(kinds.items())))
+    if netlist.undriven:
+        print(f"  undriven (read as 0): {', '.join(netlist.undriven)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Simulate the Yosys ALU netlist against the golden model.")
+    parser.add_argument("--design", type=Path, default=DEFAULT_DESIGN,
+                        help="RTLIL netlist (default: formal model design.il).")
+    parser.add_argument("--top", default=None, help="Top module (default: the design's top).")
+    parser.add_argument("--opcodes", nargs="+", default=None,
+                        help="Only these opcodes (names like ADD or codes like 00000).")
+    parser.add_argument("--strict", action="store_true",
+                        help="Count known ALU.sv differences as failures.")
+    parser.add_argument("--max-failures", type=int, default=20,
+                        help="Failing vectors to print (default: 20).")
+    parser.add_argument("--stats", action="store_true", help="Print netlist statistics.")
+    args = parser.parse_args()
+
+    try:
+        opcodes = resolve_opcodes(args.opcodes)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        start = time.perf_counter()
+        netlist = load_netlist(args.design, args.top)
+        loaded = time.perf_counter() - start
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    print(f"Netlist: {args.design} (top {netlist.top}, {len(netlist.cells)} cells, "
+          f"{netlist.levels} levels, loaded in {loaded * 1000:.0f} ms)")
+    if args.stats:
+        print_stats(netlist)
+    missing = [name for name in FIELD_SIGNALS.values() if name not in netlist.signals]
+    missing += [name for name in ("A", "B", "Opcode") if name not in netlist.inputs]
+    if missing:
+        print(f"Error: design has no {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    report = SimReport(strict=args.strict, max_examples=args.max_failures)
+    start = time.perf_counter()
+    simulate(netlist, opcodes, report)
+    print_report(netlist, report, time.perf_counter() - start)
+    return 0 if report.failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())